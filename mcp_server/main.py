@@ -35,6 +35,7 @@ from shared.airport_tools import (
     find_airports_near_location as shared_find_airports_near_location,
     get_airport_details as shared_get_airport_details,
     get_notification_for_airport as shared_get_notification_for_airport,
+    plan_multi_stop_route as shared_plan_multi_stop_route,
     answer_rules_question as shared_answer_rules_question,
     browse_rules as shared_browse_rules,
     compare_rules_between_countries as shared_compare_rules_between_countries,
@@ -77,24 +78,30 @@ def _require_tool_context() -> ToolContext:
         raise RuntimeError("Tool context not initialized. Server not started properly.")
     return _tool_context
 
-# ---- Server with lifespan to manage resources --------------------------------
-@asynccontextmanager
-async def lifespan(app: FastMCP):
+def _install_tool_context(context: ToolContext) -> None:
+    """Make a ToolContext current; tools already running keep the one they read."""
     global _model
     global _tool_context
+    from shared.aviation_agent.config import use_tool_context
 
+    _tool_context = context
+    _model = context.model
+    use_tool_context(context)
+
+# ---- Server with lifespan to manage resources --------------------------------
+@asynccontextmanager
+async def lifespan(app: FastMCP):
     # Use centralized config to get paths
-    from shared.aviation_agent.config import get_settings
+    from shared.reload_manager import ReloadManager, watched_data_files
     from shared.tool_context import get_tool_context_settings
 
-    settings = get_settings()
     tool_context_settings = get_tool_context_settings()
     logger.info(f"Loading model from database at '{tool_context_settings.airports_db}'")
     logger.info(f"Loading rules from '{tool_context_settings.rules_json}'")
 
-    # Use ToolContext.create() for consistent initialization
-    _tool_context = settings.build_tool_context(load_rules=True)
-    _model = _tool_context.model
+    # Use ToolContext.create() for consistent initialization; not the agent's
+    # cached build_tool_context(), which would pin the first snapshot after a reload
+    _install_tool_context(ToolContext.create(load_rules=True))
     
     if _tool_context.notification_service:
         logger.info(f"NotificationService initialized")
@@ -106,11 +113,19 @@ async def lifespan(app: FastMCP):
     else:
         logger.info("GAFriendlinessService not configured (GA_PERSONA_DB not set)")
 
+    # Hot reload when tools/data_update.py rewrites the data files
+    reload_manager = ReloadManager(
+        watched_data_files(tool_context_settings),
+        load=lambda: ToolContext.create(load_rules=True),
+        install=_install_tool_context,
+        poll_seconds=tool_context_settings.data_reload_interval,
+    )
+    reload_manager.start()
+
     try:
         yield
     finally:
-        # Add teardown if needed
-        pass
+        await reload_manager.stop()
 
 mcp = FastMCP(
     name="euro_aip",
@@ -199,6 +214,36 @@ def get_notification_for_airport(
     return shared_get_notification_for_airport(context, icao, day_of_week)
 
 
+@mcp.tool(name="plan_multi_stop_route", description=_desc(shared_plan_multi_stop_route))
+def plan_multi_stop_route(
+    from_location: str,
+    to_location: str,
+    max_leg_time_hours: Optional[float] = None,
+    cruise_speed_kts: Optional[float] = None,
+    aircraft_type: Optional[str] = None,
+    max_leg_distance_nm: Optional[float] = None,
+    filters: Optional[Dict[str, Any]] = None,
+    max_hours_notice: Optional[int] = None,
+    max_stops: Optional[int] = None,
+    optimize: str = "fewest_stops",
+    ctx: Context = None,
+) -> Dict[str, Any]:
+    context = _require_tool_context()
+    return shared_plan_multi_stop_route(
+        context,
+        from_location,
+        to_location,
+        max_leg_time_hours=max_leg_time_hours,
+        cruise_speed_kts=cruise_speed_kts,
+        aircraft_type=aircraft_type,
+        max_leg_distance_nm=max_leg_distance_nm,
+        filters=filters,
+        max_hours_notice=max_hours_notice,
+        max_stops=max_stops,
+        optimize=optimize,
+    )
+
+
 @mcp.tool(name="answer_rules_question", description=_desc(shared_answer_rules_question))
 def answer_rules_question(
     country_code: str,
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+AIP Change Feed
+===============
+
+Incremental consumer of the change-tracking tables that euro_aip's
+DatabaseStorage records in airports.db (aip_entries_changes,
+procedures_changes, runways_changes, airports_changes; see tools/aipchange.py).
+
+Each derived database (ga_notifications.db, ga_persona.db) keeps its own
+high-water mark -- the latest ``changed_at`` it has been synced to -- in a
+small ``change_feed_state`` table, so the mark lives and dies with the data
+it describes (a deleted or replaced derived DB gets a full rebuild). A sync
+reads only changes after the mark, narrowed to the std_field_ids the consumer
+derives data from, and reprocesses just those airports.
+
+Changes are read with ``changed_at > mark``: recorded updates are expected
+to finish before a sync starts (as in tools/data_update.py), so nothing can
+later appear with a timestamp at or before the mark.
+
+Usage:
+    from shared.aip_change_feed import AIPChangeFeed, ChangeFeedState
+
+    feed = AIPChangeFeed(airports_db)
+    state = ChangeFeedState(notifications_db, "notifications")
+    changes = feed.changes(state.get(), std_field_ids=[302], procedures=False, runways=False)
+    process(changes.icaos(std_field_ids=[302]))
+    state.set(changes.until)
+"""
+from __future__ import annotations
+
+import logging
+import sqlite3
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+AIP_CHANGES_TABLE = "aip_entries_changes"
+PROCEDURES_CHANGES_TABLE = "procedures_changes"
+RUNWAYS_CHANGES_TABLE = "runways_changes"
+AIRPORTS_CHANGES_TABLE = "airports_changes"
+CHANGE_TABLES = (
+    AIP_CHANGES_TABLE, PROCEDURES_CHANGES_TABLE, RUNWAYS_CHANGES_TABLE, AIRPORTS_CHANGES_TABLE
+)
+
+
+@dataclass
+class ChangeSet:
+    """Airports changed in (since, until], by kind of change."""
+
+    since: str
+    until: str
+    aip_fields: Dict[str, Set[int]] = field(default_factory=dict)
+    procedures: Set[str] = field(default_factory=set)
+    runways: Set[str] = field(default_factory=set)
+    airports: Set[str] = field(default_factory=set)  # Airport-level fields (name, position...)
+
+    def icaos(
+        self,
+        std_field_ids: Optional[Iterable[int]] = None,
+        procedures: bool = False,
+        runways: bool = False,
+        airports: bool = False,
+    ) -> List[str]:
+        """
+        Sorted ICAOs with relevant changes.
+
+        Args:
+            std_field_ids: AIP fields that count (None = any AIP change)
+            procedures: Include airports with procedure changes
+            runways: Include airports with runway changes
+            airports: Include airports with airport-level field changes
+        """
+        wanted = set(std_field_ids) if std_field_ids is not None else None
+        result = {
+            icao for icao, fields in self.aip_fields.items()
+            if wanted is None or fields & wanted
+        }
+        if procedures:
+            result |= self.procedures
+        if runways:
+            result |= self.runways
+        if airports:
+            result |= self.airports
+        return sorted(result)
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.aip_fields or self.procedures or self.runways or self.airports)
+
+
+class AIPChangeFeed:
+    """Reads the change-tracking tables of an airports.db."""
+
+    def __init__(self, airports_db: Path):
+        self.airports_db = Path(airports_db)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(f"file:{self.airports_db}?mode=ro", uri=True)
+
+    @staticmethod
+    def _existing_tables(conn: sqlite3.Connection) -> Set[str]:
+        rows = conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+        return {row[0] for row in rows}
+
+    def latest(self) -> Optional[str]:
+        """Latest changed_at across the change tables (None if no changes)."""
+        conn = self._connect()
+        try:
+            tables = self._existing_tables(conn)
+            marks = [
+                conn.execute(f"SELECT MAX(changed_at) FROM {table}").fetchone()[0]
+                for table in CHANGE_TABLES
+                if table in tables
+            ]
+        finally:
+            conn.close()
+        marks = [mark for mark in marks if mark is not None]
+        return max(marks) if marks else None
+
+    def changes(
+        self,
+        since: str,
+        std_field_ids: Optional[Iterable[int]] = None,
+        procedures: bool = True,
+        runways: bool = True,
+        airports: bool = True,
+        until: Optional[str] = None,
+    ) -> ChangeSet:
+        """
+        Changes recorded after `since`.
+
+        Only distinct (airport, std_field_id) pairs are read, not the
+        old/new values. ``until`` on the result is the mark to store once
+        the changes are processed; changes recorded while processing stay
+        after it for the next sync.
+
+        Args:
+            since: High-water mark from a previous sync
+            std_field_ids: Restrict AIP changes to these fields (None = all)
+            procedures: Read procedures_changes
+            runways: Read runways_changes
+            airports: Read airports_changes
+            until: Upper bound (default: latest change)
+        """
+        until = until or self.latest() or since
+        result = ChangeSet(since=since, until=max(since, until))
+        if until <= since:
+            return result
+
+        conn = self._connect()
+        try:
+            tables = self._existing_tables(conn)
+            if AIP_CHANGES_TABLE in tables:
+                query = (
+                    f"SELECT DISTINCT airport_icao, std_field_id FROM {AIP_CHANGES_TABLE} "
+                    "WHERE changed_at > ? AND changed_at <= ?"
+                )
+                params: list = [since, until]
+                if std_field_ids is not None:
+                    ids = list(std_field_ids)
+                    query += f" AND std_field_id IN ({','.join('?' for _ in ids)})"
+                    params.extend(ids)
+                for icao, std_field_id in conn.execute(query, params):
+                    result.aip_fields.setdefault(icao.upper(), set()).add(std_field_id)
+
+            for wanted, table, target in (
+                (procedures, PROCEDURES_CHANGES_TABLE, result.procedures),
+                (runways, RUNWAYS_CHANGES_TABLE, result.runways),
+                (airports, AIRPORTS_CHANGES_TABLE, result.airports),
+            ):
+                if wanted and table in tables:
+                    rows = conn.execute(
+                        f"SELECT DISTINCT airport_icao FROM {table} "
+                        "WHERE changed_at > ? AND changed_at <= ?",
+                        (since, until),
+                    )
+                    target.update(row[0].upper() for row in rows)
+        finally:
+            conn.close()
+
+        logger.info(
+            f"Change feed ({since} .. {until}]: {len(result.aip_fields)} airports with AIP "
+            f"changes, {len(result.procedures)} with procedure changes, "
+            f"{len(result.runways)} with runway changes, "
+            f"{len(result.airports)} with airport field changes"
+        )
+        return result
+
+
+class ChangeFeedState:
+    """High-water mark of one consumer, stored in its derived database."""
+
+    def __init__(self, db_path: Path, consumer: str):
+        self.db_path = Path(db_path)
+        self.consumer = consumer
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path)
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS change_feed_state (
+                consumer TEXT PRIMARY KEY,
+                high_water TEXT,
+                updated_utc TEXT
+            )
+            """
+        )
+        return conn
+
+    def get(self) -> Optional[str]:
+        """Stored mark, or None if this consumer has never synced."""
+        if not self.db_path.exists():
+            return None
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT high_water FROM change_feed_state WHERE consumer = ?",
+                (self.consumer,),
+            ).fetchone()
+        finally:
+            conn.close()
+        return row[0] if row else None
+
+    def set(self, mark: Optional[str]) -> None:
+        """Store a mark (None clears it, forcing a full sync next time)."""
+        conn = self._connect()
+        try:
+            with conn:
+                if mark is None:
+                    conn.execute(
+                        "DELETE FROM change_feed_state WHERE consumer = ?", (self.consumer,)
+                    )
+                else:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO change_feed_state (consumer, high_water, updated_utc) "
+                        "VALUES (?, ?, ?)",
+                        (self.consumer, mark, datetime.now(timezone.utc).isoformat()),
+                    )
+        finally:
+            conn.close()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Airport Row Projection
+======================
+
+The flat AirportSummary and NotificationSummary fields the precompiled
+databases store per airport. The serving database (shared/serving_db.py)
+and the offline bundles (shared/offline_bundle.py) both project airports
+and notification info through these helpers, so the two stay in step with
+each other and with the web API.
+
+Usage:
+    values = airport_summary_values(airport)   # in AIRPORT_SUMMARY_FIELDS order
+    fields = notification_summary_values(info, max_summary_chars=100)
+"""
+from __future__ import annotations
+
+import logging
+from typing import Any, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# AirportSummary fields, in column order; the first is the ICAO code
+AIRPORT_SUMMARY_FIELDS = [
+    "ident", "name", "latitude_deg", "longitude_deg", "iso_country", "municipality",
+    "point_of_entry", "has_procedures", "has_runways", "has_aip_data",
+    "has_hard_runway", "has_lighted_runway", "has_soft_runway", "has_water_runway",
+    "has_snow_runway", "longest_runway_length_ft", "procedure_count", "runway_count",
+    "aip_entry_count",
+]
+
+# NotificationSummary fields, in column order
+NOTIFICATION_SUMMARY_FIELDS = [
+    "notification_type", "hours_notice", "is_h24", "is_on_request", "easiness_score", "summary",
+]
+
+
+def airport_summary_values(airport: Any) -> List[Any]:
+    """AirportSummary values of a euro_aip Airport, in AIRPORT_SUMMARY_FIELDS order."""
+    return [
+        airport.ident, airport.name, airport.latitude_deg, airport.longitude_deg,
+        airport.iso_country, airport.municipality, airport.point_of_entry,
+        bool(airport.procedures), bool(airport.runways), bool(airport.aip_entries),
+        airport.has_hard_runway, airport.has_lighted_runway, airport.has_soft_runway,
+        airport.has_water_runway, airport.has_snow_runway, airport.longest_runway_length_ft,
+        len(airport.procedures), len(airport.runways), len(airport.aip_entries),
+    ]
+
+
+def notification_summary_values(info: Any, max_summary_chars: Optional[int] = None) -> List[Any]:
+    """
+    NotificationSummary values of a NotificationInfo, in NOTIFICATION_SUMMARY_FIELDS order.
+
+    Args:
+        info: NotificationInfo
+        max_summary_chars: Truncate the summary text (with "...") beyond this length
+    """
+    summary = info.summary
+    if max_summary_chars is not None and len(summary) > max_summary_chars:
+        summary = summary[:max_summary_chars] + "..."
+    return [
+        info.notification_type,
+        info.hours_notice,
+        info.is_h24(),
+        info.notification_type == "on_request",
+        round(info.get_easiness_score(), 1),
+        summary,
+    ]
@@ -13,6 +13,7 @@ AIRPORT TOOLS (Section 5):
     - get_airport_details: Get comprehensive airport information
     - get_notification_for_airport: Customs notification requirements
     - calculate_flight_distance: Calculate distance and flight time between airports
+    - plan_multi_stop_route: Plan range-constrained stop sequences between airports
 
 RULES TOOLS (Section 6):
     - answer_rules_question: Answer specific questions about rules for a country (RAG-based)
@@ -42,6 +43,9 @@ from euro_aip.models.navpoint import NavPoint
 from .aircraft_speeds import resolve_cruise_speed, get_aircraft_info, format_time
 from .filtering import FilterEngine
 from .prioritization import PriorityEngine
+from .route_corridor import get_route_corridor
+from .route_planner import MAX_LEG_NM, OBJECTIVES as ROUTE_PLAN_OBJECTIVES, StopNode, get_reachability_graph
+from .rules_manager import MIN_LEXICAL_SCORE
 from .tool_context import ToolContext
 
 
@@ -850,9 +854,11 @@ def find_airports_near_route(
             f"Using nearest airport {to_airport.ident} ({to_airport.name}), {to_result['distance_nm']}nm away."
         )
 
-    results = ctx.model.find_airports_near_route(
+    # Corridor search with the time-based limit pushed down (before filtering/scoring)
+    results = get_route_corridor(ctx.model).find_airports_near_route(
         [from_airport.ident, to_airport.ident],
-        max_distance_nm
+        max_distance_nm,
+        max_enroute_distance_nm=max_enroute_distance_nm,
     )
 
     # Calculate total route distance for position-based sorting
@@ -904,14 +910,6 @@ def find_airports_near_route(
             summary["notification"] = result.notification_infos[airport.ident].to_summary_dict()
         airports.append(summary)
 
-    # Filter by max enroute distance (time-based constraint)
-    if max_enroute_distance_nm is not None:
-        airports = [
-            a for a in airports
-            if a.get("enroute_distance_nm") is not None
-            and a["enroute_distance_nm"] <= max_enroute_distance_nm
-        ]
-
     total_count = len(airports)
     airports_for_llm = airports[:max_results]
 
@@ -1221,6 +1219,225 @@ def calculate_flight_distance(
     return response
 
 
+# -----------------------------------------------------------------------------
+# Multi-Stop Route Planning
+# -----------------------------------------------------------------------------
+
+def plan_multi_stop_route(
+    ctx: ToolContext,
+    from_location: str,
+    to_location: str,
+    max_leg_time_hours: Optional[float] = None,
+    cruise_speed_kts: Optional[float] = None,
+    aircraft_type: Optional[str] = None,
+    max_leg_distance_nm: Optional[float] = None,
+    filters: Optional[Dict[str, Any]] = None,
+    max_hours_notice: Optional[int] = None,
+    max_stops: Optional[int] = None,
+    optimize: str = "fewest_stops",
+    include_large_airports: bool = False,
+    **kwargs: Any,  # Accept _persona_id injected by ToolRunner (not used by this tool)
+) -> Dict[str, Any]:
+    """
+    Plan a multi-stop route between two locations where no leg exceeds the aircraft's range.
+
+    **USE THIS TOOL when the trip is longer than one leg and user asks for a sequence of stops**
+    (fuel stops, customs stops) with a leg time or range limit.
+
+    Examples:
+    - "Plan EGTF to LGAV with fuel stops, max 3h legs in my C172" → max_leg_time_hours=3, aircraft_type="C172", filters={'has_avgas': True}
+    - "Customs stops from Paris to Reykjavik, legs under 400nm" → max_leg_distance_nm=400, filters={'point_of_entry': True}
+    - "Fewest stops from EGKB to LEMG at 140 knots, 2.5h per leg" → max_leg_time_hours=2.5, cruise_speed_kts=140
+
+    **Leg range:** max_leg_distance_nm, or max_leg_time_hours with cruise_speed_kts / aircraft_type.
+    If only time is given without speed/aircraft, the tool returns missing_info asking for speed.
+
+    **Filters** apply to intermediate stops only (departure/destination are always allowed):
+    has_avgas, has_jet_a, point_of_entry, has_hard_runway, has_procedures, country, hotel, restaurant.
+    max_hours_notice limits stops to airports requiring at most that many hours of notice.
+
+    optimize: "fewest_stops" (default, ties broken by distance) or "shortest_distance".
+    """
+    kwargs.pop("_persona_id", None)
+
+    if optimize not in ROUTE_PLAN_OBJECTIVES:
+        optimize = "fewest_stops"
+
+    # Resolve leg range (explicit distance wins over time * speed)
+    resolved_speed, speed_source = resolve_cruise_speed(cruise_speed_kts, aircraft_type)
+    max_leg_nm: Optional[float] = max_leg_distance_nm
+    if max_leg_nm is None and max_leg_time_hours is not None and resolved_speed:
+        max_leg_nm = max_leg_time_hours * resolved_speed
+
+    if max_leg_nm is None:
+        if max_leg_time_hours is not None:
+            reason = f"Required to calculate {max_leg_time_hours}h leg range"
+        else:
+            reason = "Required to know how far each leg can be"
+        return {
+            "found": False,
+            "count": 0,
+            "airports": [],
+            "missing_info": [{
+                "key": "cruise_speed" if max_leg_time_hours is not None else "leg_range",
+                "reason": reason,
+                "prompt": (
+                    "What's your cruise speed or aircraft type?"
+                    if max_leg_time_hours is not None
+                    else "What's the longest leg you want to fly (hours with aircraft type, or nautical miles)?"
+                ),
+                "examples": ["120 knots", "Cessna 172", "SR22"]
+                if max_leg_time_hours is not None else ["3 hours in a C172", "400nm"],
+            }],
+            "filter_profile": {"max_leg_time_hours": max_leg_time_hours} if max_leg_time_hours is not None else {},
+        }
+
+    # Longer legs than the planner supports still give a valid (conservative) plan
+    leg_range_capped = max_leg_nm > MAX_LEG_NM
+    max_leg_nm = min(max_leg_nm, MAX_LEG_NM)
+
+    from_result = _find_nearest_airport_in_db(ctx, from_location)
+    to_result = _find_nearest_airport_in_db(ctx, to_location)
+    if not from_result:
+        return {
+            "found": False,
+            "error": f"Could not find or geocode departure location '{from_location}'.",
+            "pretty": f"Could not find airport or location '{from_location}'.",
+            "missing_info": [],
+        }
+    if not to_result:
+        return {
+            "found": False,
+            "error": f"Could not find or geocode destination location '{to_location}'.",
+            "pretty": f"Could not find airport or location '{to_location}'.",
+            "missing_info": [],
+        }
+
+    from_airport = from_result["airport"]
+    to_airport = to_result["airport"]
+
+    # Stop criteria: same defaults as the search tools (no large airports unless asked)
+    stop_filters: Dict[str, Any] = {}
+    if not include_large_airports:
+        stop_filters["exclude_large_airports"] = True
+    if filters:
+        stop_filters.update(filters)
+
+    graph = get_reachability_graph(
+        ctx, max_leg_nm, filters=stop_filters, max_hours_notice=max_hours_notice
+    )
+    plan = graph.plan(
+        StopNode.from_airport(from_airport),
+        StopNode.from_airport(to_airport),
+        objective=optimize,
+        max_stops=max_stops,
+    )
+
+    filter_profile = _build_filter_profile({}, filters, max_hours_notice)
+    filter_profile["max_leg_distance_nm"] = round(max_leg_nm, 1)
+    if leg_range_capped:
+        filter_profile["max_leg_distance_capped"] = True
+    if max_leg_time_hours is not None and resolved_speed is not None:
+        filter_profile["max_leg_time_hours"] = max_leg_time_hours
+        filter_profile["cruise_speed_kts"] = resolved_speed
+        filter_profile["cruise_speed_source"] = speed_source
+
+    substitutions: Optional[Dict[str, Any]] = None
+    if from_result["was_geocoded"] or to_result["was_geocoded"]:
+        substitutions = {
+            "from": {
+                "original": from_location,
+                "resolved": from_airport.ident,
+                "was_geocoded": True,
+                "geocoded_location": from_result.get("geocoded_location"),
+                "distance_nm": from_result.get("distance_nm", 0.0),
+            } if from_result["was_geocoded"] else None,
+            "to": {
+                "original": to_location,
+                "resolved": to_airport.ident,
+                "was_geocoded": True,
+                "geocoded_location": to_result.get("geocoded_location"),
+                "distance_nm": to_result.get("distance_nm", 0.0),
+            } if to_result["was_geocoded"] else None,
+        }
+
+    if plan is None:
+        return {
+            "found": False,
+            "count": 0,
+            "airports": [],
+            "filter_profile": filter_profile,
+            "missing_info": [],
+            "substitutions": substitutions,
+            "pretty": (
+                f"No route from {from_airport.ident} to {to_airport.ident} with legs of at most "
+                f"{max_leg_nm:.0f}nm through airports matching the stop criteria"
+                + (f" and at most {max_stops} stop(s)" if max_stops is not None else "")
+                + ". Try a longer leg or fewer stop filters."
+            ),
+        }
+
+    # Build legs and stop summaries
+    legs: List[Dict[str, Any]] = []
+    cumulative_nm = 0.0
+    stops: List[Dict[str, Any]] = []
+    for i, distance_nm in enumerate(plan.leg_distances_nm):
+        leg_from, leg_to = plan.nodes[i], plan.nodes[i + 1]
+        leg: Dict[str, Any] = {
+            "from": leg_from.ident,
+            "to": leg_to.ident,
+            "distance_nm": round(distance_nm, 1),
+        }
+        if resolved_speed:
+            leg["time_hours"] = round(distance_nm / resolved_speed, 2)
+            leg["time_formatted"] = format_time(distance_nm / resolved_speed)
+        legs.append(leg)
+        cumulative_nm += distance_nm
+        if i + 1 < len(plan.nodes) - 1:
+            summary = _airport_summary(leg_to.airport)
+            summary["stop_number"] = i + 1
+            summary["enroute_distance_nm"] = round(cumulative_nm, 1)
+            summary["stop_attributes"] = leg_to.attributes()
+            stops.append(summary)
+
+    total_nm = plan.total_distance_nm
+    _, direct_nm = from_airport.navpoint.haversine_distance(to_airport.navpoint)
+
+    def _endpoint(a: Airport) -> Dict[str, Any]:
+        return {
+            "icao": a.ident,
+            "name": a.name,
+            "municipality": a.municipality,
+            "lat": getattr(a, "latitude_deg", None),
+            "lon": getattr(a, "longitude_deg", None),
+        }
+
+    return {
+        "found": True,
+        "count": len(stops),
+        "airports": stops,
+        "legs": legs,
+        "route": [node.ident for node in plan.nodes],
+        "total_distance_nm": round(total_nm, 1),
+        "direct_distance_nm": round(direct_nm, 1),
+        "estimated_time_hours": round(total_nm / resolved_speed, 2) if resolved_speed else None,
+        "estimated_time_formatted": format_time(total_nm / resolved_speed) if resolved_speed else None,
+        "optimize": optimize,
+        "filter_profile": filter_profile,
+        "missing_info": [],
+        "substitutions": substitutions,
+        "visualization": {
+            "type": "route_with_markers",
+            "route": {
+                "from": _endpoint(from_airport),
+                "to": _endpoint(to_airport),
+                "waypoints": [node.ident for node in plan.nodes],
+            },
+            "markers": stops,
+        },
+    }
+
+
 # =============================================================================
 # SECTION 6: RULES TOOLS
 # =============================================================================
@@ -1244,12 +1461,14 @@ def answer_rules_question(
         country_code: ISO-2 country code (e.g., FR, GB)
         question: The user's actual question
         tags: Optional tags to filter results (used as fallback if RAG unavailable)
-        use_rag: Use RAG semantic search (default: True). Falls back to tags if False or RAG unavailable.
+        use_rag: Use RAG semantic search (default: True). Falls back to lexical search, then tags,
+            if False or RAG unavailable.
     """
     country_code = country_code.upper()
     rules_manager = ctx.ensure_rules_manager()
 
     # Try RAG-based retrieval first
+    rag_searched = False
     if use_rag and ctx.rules_rag:
         try:
             results = ctx.rules_rag.retrieve_rules(
@@ -1258,6 +1477,7 @@ def answer_rules_question(
                 top_k=5,
                 similarity_threshold=0.3,
             )
+            rag_searched = True
 
             if results:
                 # Format results for display
@@ -1280,7 +1500,42 @@ def answer_rules_question(
             import logging
             logging.getLogger(__name__).warning(f"RAG retrieval failed, falling back to tags: {e}")
 
-    # Fallback to tag-based retrieval
+    # Lexical (BM25) search when RAG is unavailable or found nothing;
+    # only matches scoring above the floor count as answers
+    lexical_results = rules_manager.search_rules(
+        question,
+        countries=[country_code],
+        top_k=20 if tags else 5,
+        min_score=MIN_LEXICAL_SCORE,
+    )
+    if tags:
+        tagged = set(rules_manager.get_questions_by_tags(tags))
+        lexical_results = [r for r in lexical_results if r["question_id"] in tagged][:5]
+    if lexical_results:
+        formatted_lines = [
+            f"**Q: {r.get('question_text', '')}**\nA: {r.get('answer_html', '')}"
+            for r in lexical_results
+        ]
+        return {
+            "found": True,
+            "country_code": country_code,
+            "count": len(lexical_results),
+            "retrieval_mode": "lexical",
+            "rules": lexical_results,
+            "formatted_text": "\n\n".join(formatted_lines),
+        }
+    if rag_searched:
+        # RAG and lexical search both found nothing relevant: say so rather
+        # than listing loosely related rules
+        return {
+            "found": False,
+            "country_code": country_code,
+            "count": 0,
+            "retrieval_mode": "lexical",
+            "message": f"No rules for {country_code} match this question.",
+        }
+
+    # Fallback to tag-based retrieval when RAG is unavailable
     rules = rules_manager.get_rules_for_country(
         country_code=country_code,
         tags=tags
@@ -1416,6 +1671,7 @@ def compare_rules_between_countries(
                 "total_questions": result.total_questions,
                 "questions_analyzed": result.questions_analyzed,
                 "filtered_by_embedding": result.filtered_by_embedding,
+                "pair_scores": result.pair_scores,  # Overall difference per country pair (precomputed)
                 "differences": differences,
                 "rules_context": "\n".join(rules_context_lines),  # For formatter synthesis
                 "total_differences": len(differences),
@@ -1499,6 +1755,7 @@ def _build_shared_tool_specs() -> OrderedDictType[str, ToolSpec]:
     - get_airport_details
     - get_notification_for_airport
     - calculate_flight_distance
+    - plan_multi_stop_route
 
     RULES TOOLS:
     - answer_rules_question
@@ -1736,6 +1993,68 @@ def _build_shared_tool_specs() -> OrderedDictType[str, ToolSpec]:
                 "expose_to_llm": True,
             },
         ),
+        (
+            "plan_multi_stop_route",
+            {
+                "name": "plan_multi_stop_route",
+                "handler": plan_multi_stop_route,
+                "description": _get_tool_description(plan_multi_stop_route, "plan_multi_stop_route"),
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "from_location": {
+                            "type": "string",
+                            "description": "Departure location - ICAO code (e.g., 'EGTF') or location name with country (e.g., 'Paris, France').",
+                        },
+                        "to_location": {
+                            "type": "string",
+                            "description": "Destination location - ICAO code (e.g., 'LGAV') or location name with country (e.g., 'Athens, Greece').",
+                        },
+                        "max_leg_time_hours": {
+                            "type": "number",
+                            "description": "Maximum flight time per leg in hours. Requires cruise_speed_kts or aircraft_type.",
+                        },
+                        "cruise_speed_kts": {
+                            "type": "number",
+                            "description": "Cruise speed in knots (e.g., '140 knots').",
+                        },
+                        "aircraft_type": {
+                            "type": "string",
+                            "description": "Aircraft type for speed lookup (e.g., 'C172', 'SR22', 'PA28').",
+                        },
+                        "max_leg_distance_nm": {
+                            "type": "number",
+                            "description": "Maximum distance per leg in nautical miles. Use when user gives a range instead of a time.",
+                        },
+                        "filters": {
+                            "type": "object",
+                            "description": "Criteria every intermediate stop must meet. Examples: {'has_avgas': True} for fuel stops, {'point_of_entry': True} for customs stops.",
+                        },
+                        "max_hours_notice": {
+                            "type": "integer",
+                            "description": "Only stop at airports requiring at most this many hours of prior notice.",
+                        },
+                        "max_stops": {
+                            "type": "integer",
+                            "description": "Maximum number of intermediate stops.",
+                        },
+                        "optimize": {
+                            "type": "string",
+                            "enum": list(ROUTE_PLAN_OBJECTIVES),
+                            "description": "fewest_stops (default) or shortest_distance.",
+                            "default": "fewest_stops",
+                        },
+                        "include_large_airports": {
+                            "type": "boolean",
+                            "description": "Allow large commercial airports as stops. Default False.",
+                            "default": False,
+                        },
+                    },
+                    "required": ["from_location", "to_location"],
+                },
+                "expose_to_llm": True,
+            },
+        ),
         # -----------------------------------------------------------------
         # RULES
         # -----------------------------------------------------------------
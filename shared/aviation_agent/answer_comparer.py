@@ -7,13 +7,19 @@ using answer embeddings stored in ChromaDB. It supports:
 - Pairwise country comparison (find differences between two countries)
 - Outlier detection (find countries with unusual rules for a question)
 - Batch comparison for multiple questions with embedding-based filtering
+
+All answer embeddings can be loaded once into a (questions x countries x dim)
+tensor (AnswerTensor); pairwise-difference and outlier scores for a whole set
+of questions are then computed with batched matrix products.
 """
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import numpy as np
 
@@ -67,6 +73,287 @@ class ComparisonResult:
     synthesis: Optional[str] = None  # LLM-generated summary
 
 
+# Side-store directory (relative to the vector DB path) for precomputed tables
+COMPARISON_TABLES_DIR = "comparison_tables"
+
+
+def answers_hash(answers: Iterable[Tuple[str, str, str]]) -> str:
+    """
+    Content hash of (question_id, country_code, answer_text) triples.
+
+    Order-independent, so the tables and the collection they were built from
+    hash the same; any edited, added or removed answer changes it.
+    """
+    digest = hashlib.sha256()
+    for entry in sorted({(q, c.upper(), text or "") for q, c, text in answers}):
+        digest.update(json.dumps(entry, ensure_ascii=False).encode("utf-8"))
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+def _lookup_indices(
+    question_index: Dict[str, int],
+    country_index: Dict[str, int],
+    question_ids: List[str],
+    countries: List[str],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Row/column indices for a selection, plus a validity mask for unknown entries."""
+    q_rows = np.array([question_index.get(q, -1) for q in question_ids], dtype=np.int64)
+    c_cols = np.array([country_index.get(c.upper(), -1) for c in countries], dtype=np.int64)
+    valid = (q_rows >= 0)[:, None] & (c_cols >= 0)[None, :]
+    return np.maximum(q_rows, 0), np.maximum(c_cols, 0), valid
+
+
+@dataclass
+class AnswerTensor:
+    """All answer embeddings as a dense (questions x countries x dim) tensor with a presence mask."""
+
+    question_ids: List[str]
+    countries: List[str]
+    embeddings: np.ndarray  # (Q, C, D) float32, zeros where no answer
+    mask: np.ndarray  # (Q, C) bool, True where an answer embedding exists
+    texts: Dict[Tuple[str, str], str] = field(default_factory=dict)  # (question_id, country) -> answer
+
+    def __post_init__(self) -> None:
+        self._question_index = {qid: i for i, qid in enumerate(self.question_ids)}
+        self._country_index = {cc: i for i, cc in enumerate(self.countries)}
+
+    def __contains__(self, question_id: str) -> bool:
+        return question_id in self._question_index
+
+    @classmethod
+    def from_rows(cls, rows: List[Tuple[str, str, Any, str]]) -> "AnswerTensor":
+        """Build from (question_id, country_code, embedding, answer_text) rows."""
+        question_ids = sorted({r[0] for r in rows})
+        countries = sorted({r[1].upper() for r in rows})
+        q_index = {q: i for i, q in enumerate(question_ids)}
+        c_index = {c: i for i, c in enumerate(countries)}
+        dim = len(rows[0][2]) if rows else 0
+
+        embeddings = np.zeros((len(question_ids), len(countries), dim), dtype=np.float32)
+        mask = np.zeros((len(question_ids), len(countries)), dtype=bool)
+        texts: Dict[Tuple[str, str], str] = {}
+        for question_id, country, emb, document in rows:
+            country = country.upper()
+            qi, ci = q_index[question_id], c_index[country]
+            embeddings[qi, ci] = emb
+            mask[qi, ci] = True
+            texts[(question_id, country)] = document
+        return cls(question_ids, countries, embeddings, mask, texts)
+
+    def select(self, question_ids: List[str], countries: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Sub-tensor for the given questions and countries (in that order).
+
+        Unknown questions or countries get an all-False mask.
+
+        Returns:
+            (embeddings (Q, C, D), mask (Q, C))
+        """
+        if not self.question_ids or not self.countries:
+            dim = self.embeddings.shape[2] if self.embeddings.ndim == 3 else 0
+            return (
+                np.zeros((len(question_ids), len(countries), dim), dtype=np.float32),
+                np.zeros((len(question_ids), len(countries)), dtype=bool),
+            )
+        rows, cols, valid = _lookup_indices(self._question_index, self._country_index, question_ids, countries)
+        mask = self.mask[np.ix_(rows, cols)] & valid
+        embeddings = self.embeddings[rows][:, cols] * mask[..., None]
+        return embeddings, mask
+
+    def select_gram(self, question_ids: List[str], countries: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Gram matrices (answer dot products) for a selection: ((Q, C, C), mask (Q, C))."""
+        embeddings, mask = self.select(question_ids, countries)
+        return gram_matrices(embeddings), mask
+
+
+@dataclass
+class ComparisonTables:
+    """
+    Cross-country comparison tables precomputed at vector-DB build time.
+
+    Stores, per question, the Gram matrix of answer embeddings (from which
+    pairwise differences and centroid outliers for any country subset follow
+    exactly), plus the full-set difference matrix, outlier distances and the
+    per-country-pair mean difference. Persisted next to the Chroma collection.
+    """
+
+    FILE_ARRAYS = "tables.npz"
+    FILE_INDEX = "index.json"
+
+    question_ids: List[str]
+    countries: List[str]
+    gram: np.ndarray  # (Q, C, C) answer dot products
+    mask: np.ndarray  # (Q, C) presence mask
+    difference: np.ndarray  # (Q, C, C) 1 - cos between country answers (0 where missing)
+    outlier_distance: np.ndarray  # (Q, C) distance from the all-country centroid
+    mean_distance: np.ndarray  # (Q,) mean outlier distance
+    pair_scores: np.ndarray  # (C, C) mean difference per country pair across questions
+    texts: Dict[Tuple[str, str], str] = field(default_factory=dict)
+    answer_count: int = 0  # Number of answers in the source collection
+    source_hash: str = ""  # answers_hash() of the source answers (staleness check)
+
+    def __post_init__(self) -> None:
+        self._question_index = {qid: i for i, qid in enumerate(self.question_ids)}
+        self._country_index = {cc: i for i, cc in enumerate(self.countries)}
+
+    def __contains__(self, question_id: str) -> bool:
+        return question_id in self._question_index
+
+    @classmethod
+    def from_tensor(cls, tensor: AnswerTensor) -> "ComparisonTables":
+        """Compute all tables from an AnswerTensor."""
+        gram = gram_matrices(tensor.embeddings)
+        mask = tensor.mask
+        difference = np.where(mask[:, :, None] & mask[:, None, :], 1.0 - cosine_from_gram(gram), 0.0)
+        outlier_distance, mean_distance = outlier_distances(gram, mask)
+
+        both = (mask[:, :, None] & mask[:, None, :]).astype(np.float64)  # (Q, C, C)
+        pair_counts = both.sum(axis=0)
+        pair_scores = np.where(pair_counts > 0, (difference * both).sum(axis=0) / np.maximum(pair_counts, 1), np.nan)
+
+        return cls(
+            question_ids=list(tensor.question_ids),
+            countries=list(tensor.countries),
+            gram=gram.astype(np.float32),
+            mask=mask.copy(),
+            difference=difference.astype(np.float32),
+            outlier_distance=outlier_distance.astype(np.float32),
+            mean_distance=mean_distance.astype(np.float32),
+            pair_scores=pair_scores.astype(np.float32),
+            texts=dict(tensor.texts),
+            answer_count=int(mask.sum()),
+            source_hash=answers_hash((q, c, text) for (q, c), text in tensor.texts.items()),
+        )
+
+    def select_gram(self, question_ids: List[str], countries: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Gram sub-matrices for a selection: ((Q, C, C), mask (Q, C))."""
+        rows, cols, valid = _lookup_indices(self._question_index, self._country_index, question_ids, countries)
+        if not self.question_ids or not self.countries:
+            return np.zeros((len(question_ids), len(countries), len(countries))), np.zeros(valid.shape, dtype=bool)
+        mask = self.mask[np.ix_(rows, cols)] & valid
+        gram = self.gram[rows][:, cols][:, :, cols].astype(np.float64)
+        return gram * (mask[:, :, None] & mask[:, None, :]), mask
+
+    def pair_difference(self, country_a: str, country_b: str) -> Optional[float]:
+        """Mean difference between two countries across all questions (None if never both answered)."""
+        a = self._country_index.get(country_a.upper())
+        b = self._country_index.get(country_b.upper())
+        if a is None or b is None or np.isnan(self.pair_scores[a, b]):
+            return None
+        return float(self.pair_scores[a, b])
+
+    def save(self, directory: Path | str) -> Path:
+        """Write tables to a directory (arrays in .npz, ids and texts in JSON)."""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        np.savez_compressed(
+            directory / self.FILE_ARRAYS,
+            gram=self.gram,
+            mask=self.mask,
+            difference=self.difference,
+            outlier_distance=self.outlier_distance,
+            mean_distance=self.mean_distance,
+            pair_scores=self.pair_scores,
+        )
+        index = {
+            "question_ids": self.question_ids,
+            "countries": self.countries,
+            "answer_count": self.answer_count,
+            "source_hash": self.source_hash,
+            "texts": [[qid, cc, text] for (qid, cc), text in self.texts.items()],
+        }
+        with open(directory / self.FILE_INDEX, "w", encoding="utf-8") as f:
+            json.dump(index, f, ensure_ascii=False)
+        return directory
+
+    @classmethod
+    def load(cls, directory: Path | str) -> Optional["ComparisonTables"]:
+        """Load tables from a directory, or None if not present."""
+        directory = Path(directory)
+        if not (directory / cls.FILE_ARRAYS).exists() or not (directory / cls.FILE_INDEX).exists():
+            return None
+        with open(directory / cls.FILE_INDEX, "r", encoding="utf-8") as f:
+            index = json.load(f)
+        with np.load(directory / cls.FILE_ARRAYS) as arrays:
+            return cls(
+                question_ids=index["question_ids"],
+                countries=index["countries"],
+                gram=arrays["gram"],
+                mask=arrays["mask"],
+                difference=arrays["difference"],
+                outlier_distance=arrays["outlier_distance"],
+                mean_distance=arrays["mean_distance"],
+                pair_scores=arrays["pair_scores"],
+                texts={(qid, cc): text for qid, cc, text in index["texts"]},
+                answer_count=index.get("answer_count", 0),
+                source_hash=index.get("source_hash", ""),
+            )
+
+
+def gram_matrices(embeddings: np.ndarray) -> np.ndarray:
+    """Per-question Gram matrices of answer embeddings: (Q, C, D) -> (Q, C, C)."""
+    embeddings = embeddings.astype(np.float64, copy=False)
+    return embeddings @ embeddings.transpose(0, 2, 1)
+
+
+def cosine_from_gram(gram: np.ndarray) -> np.ndarray:
+    """Cosine similarity matrices from Gram matrices (0 where a vector has zero norm)."""
+    norms = np.sqrt(np.clip(np.diagonal(gram, axis1=1, axis2=2), 0.0, None))  # (Q, C)
+    products = norms[:, :, None] * norms[:, None, :]
+    return np.where(products > 0, gram / np.where(products > 0, products, 1.0), 0.0)
+
+
+def pairwise_difference_scores(gram: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    """
+    Mean pairwise cosine difference across countries, for every question at once.
+
+    Args:
+        gram: (Q, C, C) Gram matrices of answer embeddings
+        mask: (Q, C) presence mask
+
+    Returns:
+        (Q,) scores: mean of 1 - cos over present country pairs (0.0 if fewer than 2)
+    """
+    if gram.size == 0:
+        return np.zeros(mask.shape[0], dtype=np.float64)
+    similarities = cosine_from_gram(gram)
+    n_countries = mask.shape[1]
+    pairs = mask[:, :, None] & mask[:, None, :] & np.triu(np.ones((n_countries, n_countries), dtype=bool), k=1)
+    counts = pairs.sum(axis=(1, 2))
+    totals = ((1.0 - similarities) * pairs).sum(axis=(1, 2))
+    return np.where(counts > 0, totals / np.maximum(counts, 1), 0.0)
+
+
+def outlier_distances(gram: np.ndarray, mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Cosine distance of each country's answer from the question's mean answer.
+
+    Uses e_i . sum(e_j) = sum_j G_ij and |sum(e_j)|^2 = sum_jk G_jk, so any
+    country subset's centroid follows from the Gram matrix alone.
+
+    Args:
+        gram: (Q, C, C) Gram matrices of answer embeddings
+        mask: (Q, C) presence mask
+
+    Returns:
+        (distances (Q, C), valid for masked entries only; mean distance per question (Q,))
+    """
+    counts = mask.sum(axis=1)
+    if gram.size == 0:
+        return np.zeros(mask.shape, dtype=np.float64), np.zeros(mask.shape[0], dtype=np.float64)
+    pair_mask = mask[:, :, None] & mask[:, None, :]
+    masked = np.where(pair_mask, gram, 0.0)
+    dots_to_sum = masked.sum(axis=2)  # (Q, C)
+    sum_norm = np.sqrt(np.clip(masked.sum(axis=(1, 2)), 0.0, None))  # (Q,)
+    own_norm = np.sqrt(np.clip(np.diagonal(gram, axis1=1, axis2=2), 0.0, None))  # (Q, C)
+    products = own_norm * sum_norm[:, None]
+    similarities = np.where(products > 0, dots_to_sum / np.where(products > 0, products, 1.0), 0.0)
+    distances = np.where(mask, 1.0 - similarities, 0.0)
+    mean_distance = np.where(counts > 0, distances.sum(axis=1) / np.maximum(counts, 1), 0.0)
+    return distances, mean_distance
+
+
 def cosine_similarity(a: np.ndarray, b: np.ndarray) -> float:
     """Compute cosine similarity between two vectors."""
     dot_product = np.dot(a, b)
@@ -94,6 +381,7 @@ class AnswerComparer:
         self,
         chromadb_client: Any,
         rules_manager: Optional[Any] = None,
+        tables: Optional[ComparisonTables] = None,
     ):
         """
         Initialize AnswerComparer.
@@ -101,11 +389,15 @@ class AnswerComparer:
         Args:
             chromadb_client: ChromaDB client instance
             rules_manager: Optional RulesManager for question metadata lookups
+            tables: Optional precomputed ComparisonTables (from build_vector_db)
         """
         self.client = chromadb_client
         self.rules_manager = rules_manager
+        self.tables = tables
         self._collection = None
         self._initialized = False
+        self._tensor: Optional[AnswerTensor] = None
+        self._tensor_loaded = False
 
     def _ensure_initialized(self) -> bool:
         """Lazy initialization of collection."""
@@ -119,6 +411,12 @@ class AnswerComparer:
             )
             doc_count = self._collection.count()
             logger.info(f"✓ AnswerComparer initialized with {doc_count} answer embeddings")
+            if self.tables is not None and self.tables.source_hash != self._collection_answers_hash(doc_count):
+                logger.warning(
+                    "Comparison tables are stale (answers changed since they were built), "
+                    "computing from embeddings instead"
+                )
+                self.tables = None
             self._initialized = True
             return True
         except Exception as e:
@@ -128,6 +426,87 @@ class AnswerComparer:
             self._initialized = True
             return False
 
+    def _collection_answers_hash(self, total: int, page_size: int = 1000) -> str:
+        """answers_hash() of the answers collection (documents only, no embeddings)."""
+        answers: List[Tuple[str, str, str]] = []
+        for offset in range(0, total, page_size):
+            page = self._collection.get(include=["documents", "metadatas"], limit=page_size, offset=offset)
+            if not page or not page.get("ids"):
+                break
+            page_metadatas = page.get("metadatas") or []
+            page_documents = page.get("documents") or []
+            for i in range(len(page["ids"])):
+                metadata = (page_metadatas[i] if i < len(page_metadatas) else None) or {}
+                question_id, country = metadata.get("question_id"), metadata.get("country_code")
+                if question_id and country:
+                    answers.append((question_id, country, page_documents[i] if i < len(page_documents) else ""))
+        return answers_hash(answers)
+
+    def load_answer_tensor(self, refresh: bool = False, page_size: int = 1000) -> Optional[AnswerTensor]:
+        """
+        Load every answer embedding once into an AnswerTensor (cached).
+
+        Args:
+            refresh: Reload even if already loaded
+            page_size: Number of answers fetched per request
+
+        Returns:
+            AnswerTensor, or None if the collection is unavailable or empty
+        """
+        if self._tensor_loaded and not refresh:
+            return self._tensor
+        self._tensor_loaded = True
+        self._tensor = None
+
+        if not self._ensure_initialized():
+            return None
+
+        try:
+            rows: List[Tuple[str, str, Any, str]] = []
+            total = self._collection.count()
+            for offset in range(0, total, page_size):
+                page = self._collection.get(
+                    include=["embeddings", "documents", "metadatas"],
+                    limit=page_size,
+                    offset=offset,
+                )
+                if not page or not page.get("ids"):
+                    break
+                page_embeddings = page.get("embeddings")
+                page_metadatas = page.get("metadatas") or []
+                page_documents = page.get("documents") or []
+                for i in range(len(page["ids"])):
+                    metadata = page_metadatas[i] if i < len(page_metadatas) else {}
+                    emb = page_embeddings[i] if page_embeddings is not None and i < len(page_embeddings) else None
+                    question_id = (metadata or {}).get("question_id")
+                    country = (metadata or {}).get("country_code")
+                    if question_id and country and emb is not None and len(emb) > 0:
+                        document = page_documents[i] if i < len(page_documents) else ""
+                        rows.append((question_id, country.upper(), emb, document or ""))
+
+            if not rows:
+                logger.info("No answer embeddings returned in bulk, using per-question lookups")
+                return None
+
+            self._tensor = AnswerTensor.from_rows(rows)
+            logger.info(
+                f"✓ Answer tensor loaded: {len(self._tensor.question_ids)} questions x "
+                f"{len(self._tensor.countries)} countries x {self._tensor.embeddings.shape[2]} dims"
+            )
+        except Exception as e:
+            logger.warning(f"Bulk answer load failed, using per-question lookups: {e}")
+            self._tensor = None
+
+        return self._tensor
+
+    def _score_source(self) -> Optional[ComparisonTables | AnswerTensor]:
+        """Precomputed tables if available, else the bulk-loaded answer tensor."""
+        if not self._ensure_initialized():
+            return None
+        if self.tables is not None:
+            return self.tables
+        return self.load_answer_tensor()
+
     def get_answer_embeddings(
         self,
         question_id: str,
@@ -146,6 +525,12 @@ class AnswerComparer:
         if not self._ensure_initialized():
             return {}
 
+        tensor = self.load_answer_tensor()
+        if tensor is not None and question_id in tensor:
+            country_list = [c.upper() for c in countries] if countries else tensor.countries
+            embs, mask = tensor.select([question_id], country_list)
+            return {cc: embs[0, i] for i, cc in enumerate(country_list) if mask[0, i]}
+
         try:
             if countries:
                 # Get specific countries
@@ -209,6 +594,14 @@ class AnswerComparer:
         if not self._ensure_initialized():
             return {}
 
+        source = self._score_source()
+        if source is not None and question_id in source:
+            return {
+                cc.upper(): source.texts[(question_id, cc.upper())]
+                for cc in countries
+                if (question_id, cc.upper()) in source.texts
+            }
+
         try:
             ids = [
                 f"{question_id}_{cc.upper()}_answer".replace(" ", "_")
@@ -252,6 +645,10 @@ class AnswerComparer:
             Difference score: 0.0 = identical, 1.0 = completely different
             Returns 0.0 if embeddings are not available.
         """
+        if self._ensure_initialized() and self.tables is not None and question_id in self.tables:
+            gram, mask = self.tables.select_gram([question_id], [country_a, country_b])
+            return float(pairwise_difference_scores(gram, mask)[0])
+
         embeddings = self.get_answer_embeddings(
             question_id,
             [country_a.upper(), country_b.upper()]
@@ -308,6 +705,28 @@ class AnswerComparer:
 
         return float(np.mean(differences)) if differences else 0.0
 
+    def country_pair_scores(self, countries: List[str]) -> Dict[str, float]:
+        """
+        Overall difference for each country pair, from precomputed tables.
+
+        Args:
+            countries: Country codes
+
+        Returns:
+            Dict mapping "A-B" to mean difference across all questions
+            (empty when no comparison tables are loaded)
+        """
+        if not self._ensure_initialized() or self.tables is None:
+            return {}
+        countries = [c.upper() for c in countries]
+        scores = {}
+        for i, country_a in enumerate(countries):
+            for country_b in countries[i + 1:]:
+                score = self.tables.pair_difference(country_a, country_b)
+                if score is not None:
+                    scores[f"{country_a}-{country_b}"] = round(score, 3)
+        return scores
+
     def find_most_different_questions(
         self,
         question_ids: List[str],
@@ -336,12 +755,17 @@ class AnswerComparer:
             logger.warning("Need at least 2 countries to compare")
             return []
 
-        # Compute differences for all questions
-        differences = []
+        # Compute differences for all questions (one vectorized pass over tables or tensor)
+        source = self._score_source()
+        if source is not None:
+            scores = pairwise_difference_scores(*source.select_gram(question_ids, countries))
+        else:
+            scores = [self.compute_multi_country_difference(qid, countries) for qid in question_ids]
 
-        for qid in question_ids:
-            diff_score = self.compute_multi_country_difference(qid, countries)
+        differences = []
 
+        for qid, diff_score in zip(question_ids, scores):
+            diff_score = float(diff_score)
             if diff_score < min_difference:
                 continue
 
@@ -384,6 +808,73 @@ class AnswerComparer:
 
         return result
 
+    def find_outliers(
+        self,
+        question_ids: List[str],
+        countries: Optional[List[str]] = None,
+        top_n: int = 3,
+    ) -> List[OutlierResult]:
+        """
+        Find outlier countries for many questions in one vectorized pass.
+
+        Args:
+            question_ids: Question IDs to analyze
+            countries: Optional list of countries. If None, uses all available.
+            top_n: Number of top outliers to return per question
+
+        Returns:
+            OutlierResult per question (same order as question_ids)
+        """
+        source = self._score_source()
+        if source is None:
+            return [self.find_outliers_for_question(qid, countries, top_n) for qid in question_ids]
+
+        country_list = [c.upper() for c in countries] if countries else source.countries
+        gram, mask = source.select_gram(question_ids, country_list)
+        distances, mean_distances = outlier_distances(gram, mask)
+
+        results = []
+        for qi, question_id in enumerate(question_ids):
+            present = [ci for ci in range(len(country_list)) if mask[qi, ci]]
+            if len(present) < 2:
+                results.append(OutlierResult(
+                    question_id=question_id,
+                    question_text="",
+                    countries_analyzed=[],
+                    outliers=[],
+                    mean_distance=0.0,
+                ))
+                continue
+
+            outliers = sorted(
+                (
+                    {
+                        "country": country_list[ci],
+                        "distance": round(float(distances[qi, ci]), 3),
+                        "answer": source.texts.get((question_id, country_list[ci]), ""),
+                    }
+                    for ci in present
+                ),
+                key=lambda x: x["distance"],
+                reverse=True,
+            )
+            results.append(OutlierResult(
+                question_id=question_id,
+                question_text=self._question_text(question_id),
+                countries_analyzed=[country_list[ci] for ci in present],
+                outliers=outliers[:top_n],
+                mean_distance=float(mean_distances[qi]),
+            ))
+        return results
+
+    def _question_text(self, question_id: str) -> str:
+        """Question text from RulesManager, or empty string."""
+        if not self.rules_manager:
+            return ""
+        if not self.rules_manager.loaded:
+            self.rules_manager.load_rules()
+        return self.rules_manager.question_map.get(question_id, {}).get("question_text", "")
+
     def find_outliers_for_question(
         self,
         question_id: str,
@@ -404,6 +895,10 @@ class AnswerComparer:
         Returns:
             OutlierResult with outlier countries sorted by distance
         """
+        source = self._score_source()
+        if source is not None and question_id in source:
+            return self.find_outliers([question_id], countries, top_n)[0]
+
         embeddings = self.get_answer_embeddings(question_id, countries)
 
         if len(embeddings) < 2:
@@ -531,6 +1026,7 @@ def create_answer_comparer(
     vector_db_path: Optional[str] = None,
     vector_db_url: Optional[str] = None,
     rules_manager: Optional[Any] = None,
+    comparison_tables_path: Optional[str] = None,
 ) -> Optional[AnswerComparer]:
     """
     Factory function to create an AnswerComparer.
@@ -539,6 +1035,8 @@ def create_answer_comparer(
         vector_db_path: Path to ChromaDB storage (local mode)
         vector_db_url: URL to ChromaDB service (takes precedence)
         rules_manager: Optional RulesManager instance
+        comparison_tables_path: Directory of precomputed ComparisonTables.
+            Defaults to <vector_db_path>/comparison_tables in local mode.
 
     Returns:
         AnswerComparer instance or None if initialization fails
@@ -566,7 +1064,21 @@ def create_answer_comparer(
             logger.error("Either vector_db_path or vector_db_url required")
             return None
 
-        return AnswerComparer(client, rules_manager)
+        tables = None
+        if comparison_tables_path is None and vector_db_path and not vector_db_url:
+            comparison_tables_path = str(Path(vector_db_path) / COMPARISON_TABLES_DIR)
+        if comparison_tables_path:
+            try:
+                tables = ComparisonTables.load(comparison_tables_path)
+                if tables is not None:
+                    logger.info(
+                        f"✓ Loaded comparison tables: {len(tables.question_ids)} questions x "
+                        f"{len(tables.countries)} countries"
+                    )
+            except Exception as e:
+                logger.warning(f"Could not load comparison tables from {comparison_tables_path}: {e}")
+
+        return AnswerComparer(client, rules_manager, tables=tables)
 
     except Exception as e:
         logger.error(f"Failed to create AnswerComparer: {e}")
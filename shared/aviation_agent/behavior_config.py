@@ -44,6 +44,10 @@ class RetrievalConfig(BaseModel):
     top_k: int = Field(default=5, gt=0, le=100)
     similarity_threshold: float = Field(default=0.3, ge=0.0, le=1.0)
     rerank_candidates_multiplier: int = Field(default=2, gt=0)
+    mode: Literal["vector", "hybrid"] = "vector"  # "hybrid" (opt-in) fuses BM25 (RulesManager) with vector scores
+    lexical_weight: float = Field(default=0.3, ge=0.0, le=1.0)
+    semantic_cache_size: int = Field(default=256, ge=0)  # Cached retrievals; 0 disables the cache
+    semantic_cache_threshold: float = Field(default=0.97, ge=0.0, le=1.0)  # Cosine to reuse a cached query
 
 
 class RAGConfig(BaseModel):
@@ -148,6 +152,12 @@ class ComparisonConfig(BaseModel):
         ge=0.0,
         le=2.0
     )
+    synthesis_concurrency: int = Field(
+        default=8,
+        gt=0,
+        le=64,
+        description="Maximum concurrent LLM synthesis calls for topic-wide analysis."
+    )
 
 
 class PromptsConfig(BaseModel):
@@ -11,9 +11,16 @@ Supports two main use cases:
 """
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
 import logging
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+import os
+import tempfile
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.runnables import Runnable
@@ -83,6 +90,7 @@ class SynthesizedComparison:
     total_questions: int
     questions_analyzed: int
     filtered_by_embedding: bool  # Whether embedding filtering was applied
+    pair_scores: Dict[str, float] = field(default_factory=dict)  # "FR-DE" -> mean difference (precomputed)
 
 
 @dataclass
@@ -96,6 +104,112 @@ class SynthesizedOutlierAnalysis:
     countries_analyzed: List[str]
 
 
+def _hash_text(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+def _llm_model_name(llm: Any) -> str:
+    """Best-effort model identifier for cache keys."""
+    return str(getattr(llm, "model_name", None) or getattr(llm, "model", None) or type(llm).__name__)
+
+
+class SynthesisCache:
+    """
+    Deterministic cache for LLM synthesis results.
+
+    Keys hash the question id, every prompt input (question text, countries, each
+    outlier's answer and distance, mean distance), the prompt version and the model,
+    so any change to what the LLM would see produces a new entry. Optionally
+    persisted as a JSON file so CLI runs reuse earlier results.
+    """
+
+    def __init__(self, path: Optional[Path | str] = None):
+        self.path = Path(path) if path else None
+        self._entries: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        if self.path and self.path.exists():
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    self._entries = json.load(f)
+            except Exception as e:
+                logger.warning(f"Could not load synthesis cache {self.path}: {e}")
+
+    @staticmethod
+    def make_key(
+        question_id: str,
+        inputs: Dict[str, Any],
+        prompt_version: str,
+        model: str,
+    ) -> str:
+        payload = {
+            "question_id": question_id,
+            "inputs": inputs,
+            "prompt_version": prompt_version,
+            "model": model,
+        }
+        return _hash_text(json.dumps(payload, sort_keys=True, default=str))
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        with self._lock:
+            self._entries[key] = value
+
+    def save(self) -> None:
+        """Write entries to a temp file and rename it over the cache file (no-op without a path)."""
+        if not self.path:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            entries = dict(self._entries)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entries, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Event loop shared by all sync entry points (started on first use)
+_sync_loop: Optional[asyncio.AbstractEventLoop] = None
+_sync_loop_lock = threading.Lock()
+
+
+def _get_sync_loop() -> asyncio.AbstractEventLoop:
+    global _sync_loop
+    with _sync_loop_lock:
+        if _sync_loop is None:
+            _sync_loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_sync_loop.run_forever, name="comparison-sync-loop", daemon=True
+            ).start()
+        return _sync_loop
+
+
+def _run_sync(coro):
+    """
+    Run a coroutine from sync code, even when called inside a running event loop.
+
+    Every call runs on one long-lived background loop, so async LLM clients
+    (and their connection pools) are bound to a single loop and reused.
+    """
+    return asyncio.run_coroutine_threadsafe(coro, _get_sync_loop()).result()
+
+
 class RulesComparisonService:
     """
     High-level service for cross-country rule comparison.
@@ -111,6 +225,7 @@ class RulesComparisonService:
         config: Optional[ComparisonConfig] = None,
         comparison_prompt: Optional[str] = None,
         outlier_prompt: Optional[str] = None,
+        cache: Optional[SynthesisCache] = None,
     ):
         """
         Initialize RulesComparisonService.
@@ -121,10 +236,13 @@ class RulesComparisonService:
             config: Optional ComparisonConfig for parameters
             comparison_prompt: Optional custom comparison prompt
             outlier_prompt: Optional custom outlier analysis prompt
+            cache: Optional SynthesisCache (default: in-memory)
         """
         self.answer_comparer = answer_comparer
         self.llm = llm
         self.config = config or ComparisonConfig()
+        self.cache = cache if cache is not None else SynthesisCache()
+        self.outlier_prompt_version = _hash_text(outlier_prompt or DEFAULT_OUTLIER_PROMPT)
 
         # Build prompt templates
         self.comparison_template = ChatPromptTemplate.from_messages([
@@ -191,6 +309,7 @@ class RulesComparisonService:
             total_questions=comparison.total_questions,
             questions_analyzed=comparison.questions_compared,
             filtered_by_embedding=filtered_by_embedding,
+            pair_scores=self.answer_comparer.country_pair_scores(countries),
         )
 
     def analyze_outliers(
@@ -231,6 +350,30 @@ class RulesComparisonService:
             countries_analyzed=outlier_result.countries_analyzed,
         )
 
+    def _topic_question_ids(
+        self,
+        tag: Optional[str],
+        category: Optional[str],
+        max_questions: int,
+    ) -> List[str]:
+        """Question IDs for a tag/category (or all questions), capped at max_questions."""
+        if not self.answer_comparer.rules_manager:
+            logger.error("RulesManager required for topic outlier analysis")
+            return []
+
+        rm = self.answer_comparer.rules_manager
+        if not rm.loaded:
+            rm.load_rules()
+
+        if tag:
+            question_ids = rm.get_questions_by_tag(tag)
+        elif category:
+            question_ids = rm.get_questions_by_category(category)
+        else:
+            question_ids = list(rm.question_map.keys())
+
+        return question_ids[:max_questions]
+
     def analyze_topic_outliers(
         self,
         tag: Optional[str] = None,
@@ -241,6 +384,8 @@ class RulesComparisonService:
         """
         Find outliers across multiple questions in a topic.
 
+        Synthesis calls run concurrently (see aanalyze_topic_outliers).
+
         Args:
             tag: Tag to filter questions
             category: Category to filter questions
@@ -250,36 +395,81 @@ class RulesComparisonService:
         Returns:
             List of outlier analyses for each question
         """
-        if not self.answer_comparer.rules_manager:
-            logger.error("RulesManager required for topic outlier analysis")
-            return []
+        return _run_sync(self.aanalyze_topic_outliers(
+            tag=tag,
+            category=category,
+            countries=countries,
+            max_questions=max_questions,
+        ))
 
-        # Get question IDs
-        rm = self.answer_comparer.rules_manager
-        if not rm.loaded:
-            rm.load_rules()
+    async def aanalyze_topic_outliers(
+        self,
+        tag: Optional[str] = None,
+        category: Optional[str] = None,
+        countries: Optional[List[str]] = None,
+        max_questions: int = 5,
+        top_n: int = 5,
+    ) -> List[SynthesizedOutlierAnalysis]:
+        """
+        Async topic outlier analysis; results keep question order.
 
-        if tag:
-            question_ids = rm.get_questions_by_tag(tag)
-        elif category:
-            question_ids = rm.get_questions_by_category(category)
-        else:
-            question_ids = list(rm.question_map.keys())
+        Outliers for all questions are computed in one batch, then synthesis
+        runs with at most config.synthesis_concurrency LLM calls in flight.
+        """
+        question_ids = self._topic_question_ids(tag, category, max_questions)
+        results: Dict[str, SynthesizedOutlierAnalysis] = {}
+        async for analysis in self.astream_topic_outliers(question_ids, countries=countries, top_n=top_n):
+            results[analysis.question_id] = analysis
+        return [results[qid] for qid in question_ids if qid in results]
 
-        # Limit to max_questions
-        question_ids = question_ids[:max_questions]
+    async def astream_topic_outliers(
+        self,
+        question_ids: List[str],
+        countries: Optional[List[str]] = None,
+        top_n: int = 5,
+        max_concurrency: Optional[int] = None,
+    ) -> AsyncIterator[SynthesizedOutlierAnalysis]:
+        """
+        Yield synthesized outlier analyses as each one completes.
 
-        results = []
-        for qid in question_ids:
-            analysis = self.analyze_outliers(
-                question_id=qid,
-                countries=countries,
-                synthesize=True,
-            )
-            if analysis.outliers:
-                results.append(analysis)
+        Questions without outliers are skipped. Cached syntheses are yielded
+        without an LLM call.
 
-        return results
+        Args:
+            question_ids: Questions to analyze
+            countries: Countries to analyze (None = all)
+            top_n: Number of top outliers per question
+            max_concurrency: Override config.synthesis_concurrency
+        """
+        outlier_results = [
+            r for r in self.answer_comparer.find_outliers(question_ids, countries, top_n)
+            if r.outliers
+        ]
+        semaphore = asyncio.Semaphore(max_concurrency or self.config.synthesis_concurrency)
+
+        async def run(outlier_result: OutlierResult) -> SynthesizedOutlierAnalysis:
+            async with semaphore:
+                synthesis = await self._asynthesize_outliers(outlier_result)
+            return self._outlier_analysis(outlier_result, synthesis)
+
+        tasks = [asyncio.ensure_future(run(r)) for r in outlier_results]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+            self.cache.save()
+
+    @staticmethod
+    def _outlier_analysis(outlier_result: OutlierResult, synthesis: str) -> SynthesizedOutlierAnalysis:
+        return SynthesizedOutlierAnalysis(
+            question_id=outlier_result.question_id,
+            question_text=outlier_result.question_text,
+            synthesis=synthesis,
+            outliers=outlier_result.outliers,
+            countries_analyzed=outlier_result.countries_analyzed,
+        )
 
     def _synthesize_comparison(
         self,
@@ -318,9 +508,8 @@ class RulesComparisonService:
             logger.error(f"Synthesis failed: {e}")
             return f"Error generating synthesis: {e}"
 
-    def _synthesize_outliers(self, outlier_result: OutlierResult) -> str:
-        """Generate LLM synthesis for outlier analysis."""
-        # Build outliers context
+    def _outlier_inputs(self, outlier_result: OutlierResult) -> Dict[str, Any]:
+        """Prompt inputs for outlier synthesis."""
         outliers_lines = []
         for i, outlier in enumerate(outlier_result.outliers, 1):
             outliers_lines.append(
@@ -329,18 +518,54 @@ class RulesComparisonService:
             outliers_lines.append(f"   Answer: {outlier['answer']}")
             outliers_lines.append("")
 
-        outliers_context = "\n".join(outliers_lines)
+        return {
+            "question_text": outlier_result.question_text,
+            "countries": ", ".join(outlier_result.countries_analyzed),
+            "outliers_context": "\n".join(outliers_lines),
+            "mean_distance": outlier_result.mean_distance,
+        }
+
+    def _outlier_cache_key(self, outlier_result: OutlierResult, inputs: Dict[str, Any]) -> str:
+        return SynthesisCache.make_key(
+            outlier_result.question_id,
+            inputs,
+            self.outlier_prompt_version,
+            _llm_model_name(self.llm),
+        )
+
+    def _synthesize_outliers(self, outlier_result: OutlierResult) -> str:
+        """Generate LLM synthesis for outlier analysis."""
+        inputs = self._outlier_inputs(outlier_result)
+        key = self._outlier_cache_key(outlier_result, inputs)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
 
         try:
             chain = self.outlier_template | self.llm
-            result = chain.invoke({
-                "question_text": outlier_result.question_text,
-                "countries": ", ".join(outlier_result.countries_analyzed),
-                "outliers_context": outliers_context,
-                "mean_distance": outlier_result.mean_distance,
-            })
+            result = chain.invoke(inputs)
+            synthesis = result.content if hasattr(result, "content") else str(result)
+            self.cache.set(key, synthesis)
+            return synthesis
 
-            return result.content if hasattr(result, "content") else str(result)
+        except Exception as e:
+            logger.error(f"Outlier synthesis failed: {e}")
+            return f"Error generating synthesis: {e}"
+
+    async def _asynthesize_outliers(self, outlier_result: OutlierResult) -> str:
+        """Async variant of _synthesize_outliers (shares the cache)."""
+        inputs = self._outlier_inputs(outlier_result)
+        key = self._outlier_cache_key(outlier_result, inputs)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        try:
+            chain = self.outlier_template | self.llm
+            result = await chain.ainvoke(inputs)
+            synthesis = result.content if hasattr(result, "content") else str(result)
+            self.cache.set(key, synthesis)
+            return synthesis
 
         except Exception as e:
             logger.error(f"Outlier synthesis failed: {e}")
@@ -205,6 +205,9 @@ class AviationAgentSettings(BaseSettings):
     ) -> ToolContext:
         """
         Build or retrieve cached ToolContext.
+
+        Returns the server's ToolContext instead if one was installed with
+        use_tool_context().
         
         ToolContext is expensive to create (loads entire airport database + rules),
         so we cache it at the module level. The cache key includes load flags
@@ -215,6 +218,8 @@ class AviationAgentSettings(BaseSettings):
             load_notifications: Load notification service (default: True)
             load_ga_friendliness: Load GA friendliness service (default: True)
         """
+        if _shared_tool_context is not None:
+            return _shared_tool_context
         return _cached_tool_context(
             load_rules=load_rules,
             load_notifications=load_notifications,
@@ -222,6 +227,22 @@ class AviationAgentSettings(BaseSettings):
         )
 
 
+# ToolContext installed by a server (web, MCP); replaced on data reload
+_shared_tool_context: Optional[ToolContext] = None
+
+
+def use_tool_context(context: Optional[ToolContext]) -> None:
+    """
+    Make build_tool_context() return the server's ToolContext.
+
+    The servers load their own ToolContext and swap it on data reload
+    (shared/reload_manager.py); agents built afterwards use the same snapshot
+    instead of loading and caching a second copy.
+    """
+    global _shared_tool_context
+    _shared_tool_context = context
+
+
 @lru_cache(maxsize=1)
 def _cached_tool_context(
     load_rules: bool,
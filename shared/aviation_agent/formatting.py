@@ -123,6 +123,7 @@ def build_ui_payload(
         "find_airports_near_route",
         "find_airports_near_location",
         "calculate_flight_distance",
+        "plan_multi_stop_route",
     }:
         base_payload["departure"] = (
             plan.arguments.get("from_location") or
@@ -199,6 +200,7 @@ def _determine_kind(tool_name: str) -> str | None:
         "find_airports_near_route",
         "find_airports_near_location",
         "calculate_flight_distance",
+        "plan_multi_stop_route",
     }:
         return "route"
 
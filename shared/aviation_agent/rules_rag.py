@@ -7,14 +7,21 @@ enabling efficient retrieval of relevant rules based on natural language queries
 """
 from __future__ import annotations
 
+import atexit
+import copy
 import json
 import logging
 import os
+import tempfile
+import threading
+import weakref
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
 import chromadb
+import numpy as np
 from chromadb.config import Settings
 
 logger = logging.getLogger(__name__)
@@ -95,15 +102,107 @@ class QueryReformulator:
     "What are the customs clearance requirements?"
     """
     
-    def __init__(self, llm: Optional[Any] = None):
+    def __init__(
+        self,
+        llm: Optional[Any] = None,
+        cache_size: int = 512,
+        cache_path: Optional[Path | str] = None,
+        save_every: int = 20,
+    ):
         """
         Initialize query reformulator.
-        
+
+        The cache is shared by request threads. The JSON file is rewritten
+        atomically every `save_every` new reformulations, on flush() and at exit.
+
         Args:
             llm: Optional LLM instance for reformulation. If None, uses environment.
+            cache_size: Max reformulations kept in the exact-match LRU (0 disables)
+            cache_path: Optional JSON file persisting reformulations across runs
+            save_every: New reformulations between writes of cache_path
         """
         self.llm = llm
         self._initialized = False
+        self.cache_size = cache_size
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.save_every = max(1, save_every)
+        self.version: Optional[str] = None  # rules.json version the cache belongs to
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._unsaved = 0
+        self.hits = 0
+        self.misses = 0
+        self._load_cache()
+        if self.cache_path:
+            atexit.register(_flush_reformulator, weakref.ref(self))
+
+    @staticmethod
+    def _cache_key(query: str) -> str:
+        return " ".join(query.lower().split())
+
+    def _load_cache(self) -> None:
+        if not self.cache_path or not self.cache_path.exists() or self.cache_size <= 0:
+            return
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            self.version = data.get("version")
+            self._cache = OrderedDict(list(data.get("entries", {}).items())[-self.cache_size:])
+        except Exception as e:
+            logger.warning(f"Could not load reformulation cache {self.cache_path}: {e}")
+
+    def _save_cache(self) -> None:
+        """Write the cache to a temp file and rename it over cache_path."""
+        if not self.cache_path:
+            return
+        with self._lock:
+            data = {"version": self.version, "entries": dict(self._cache)}
+            self._unsaved = 0
+        with self._save_lock:
+            try:
+                self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(
+                    dir=self.cache_path.parent, prefix=f".{self.cache_path.name}.", suffix=".tmp"
+                )
+                try:
+                    with os.fdopen(fd, "w", encoding="utf-8") as f:
+                        json.dump(data, f, ensure_ascii=False)
+                    os.replace(tmp_path, self.cache_path)
+                except BaseException:
+                    os.unlink(tmp_path)
+                    raise
+            except Exception as e:
+                logger.warning(f"Could not save reformulation cache {self.cache_path}: {e}")
+
+    def flush(self) -> None:
+        """Write reformulations not yet saved to cache_path."""
+        if self._unsaved:
+            self._save_cache()
+
+    def set_version(self, version: Optional[str]) -> None:
+        """Drop cached reformulations made against a different rules.json version."""
+        with self._lock:
+            if version == self.version:
+                return
+            if self._cache:
+                logger.info(f"Rules version changed ({self.version} → {version}); clearing reformulation cache")
+            self.version = version
+            self._cache.clear()
+        self._save_cache()
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for the reformulation cache."""
+        with self._lock:
+            size = len(self._cache)
+        total = self.hits + self.misses
+        return {
+            "size": size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+            "version": self.version,
+        }
     
     def _ensure_llm(self):
         """Lazy initialization of LLM."""
@@ -151,12 +250,39 @@ class QueryReformulator:
         Returns:
             Reformulated formal question, or original if reformulation fails
         """
+        # Context changes the answer, so only context-free reformulations are cached
+        key = self._cache_key(query) if self.cache_size > 0 and not context else None
+        if key is not None:
+            with self._lock:
+                cached = self._cache.get(key)
+                if cached is not None:
+                    self._cache.move_to_end(key)
+                    self.hits += 1
+                    return cached
+                self.misses += 1
+
+        reformulated = self._reformulate(query)
+        if reformulated is None:
+            return query  # Failures are not cached
+        if key is not None:
+            with self._lock:
+                self._cache[key] = reformulated
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+                self._unsaved += 1
+                save = self._unsaved >= self.save_every
+            if save:
+                self._save_cache()
+        return reformulated
+
+    def _reformulate(self, query: str) -> Optional[str]:
+        """Uncached LLM reformulation; None if no LLM is available or the call fails."""
         self._ensure_llm()
-        
+
         if self.llm is None:
             logger.debug("No LLM available, using original query")
-            return query
-        
+            return None
+
         try:
             prompt = f"""Reformulate this aviation query into a formal question that would appear in official aviation regulations or documentation.
 
@@ -181,7 +307,7 @@ Formal question:"""
                 
         except Exception as e:
             logger.warning(f"Query reformulation failed: {e}")
-            return query
+            return None
 
 
 class OpenAIReranker:
@@ -378,6 +504,268 @@ class Reranker:
             return documents
 
 
+class InMemoryVectorIndex:
+    """
+    Read-only in-process copy of a ChromaDB collection for fast top-k queries.
+
+    The rules corpus is small and static, so the whole collection fits in one
+    contiguous float32 matrix. A query is a single matrix-vector product over
+    the rows selected by a precomputed per-country mask, instead of a ChromaDB
+    round trip. ChromaDB remains the store the index is built from.
+
+    ``query()`` mirrors ``Collection.query()`` (same result shape and distance
+    semantics for the collection's ``hnsw:space``), so callers can switch
+    between the two transparently.
+    """
+
+    SUPPORTED_SPACES = ("l2", "cosine", "ip")
+
+    def __init__(
+        self,
+        ids: List[str],
+        embeddings: Any,
+        documents: List[Optional[str]],
+        metadatas: List[Optional[Dict[str, Any]]],
+        space: str = "l2",
+    ):
+        """
+        Initialize index from exported collection data.
+
+        Args:
+            ids: Document IDs
+            embeddings: Embedding vectors (N x D)
+            documents: Document texts
+            metadatas: Metadata dicts (must contain country_code for country filtering)
+            space: Distance space of the source collection ("l2", "cosine" or "ip")
+        """
+        if space not in self.SUPPORTED_SPACES:
+            raise ValueError(f"Unsupported distance space: {space}")
+
+        self.ids = list(ids)
+        self.documents = list(documents)
+        self.metadatas = [m or {} for m in metadatas]
+        self.space = space
+
+        matrix = np.asarray(embeddings, dtype=np.float32)
+        if matrix.ndim != 2 or len(matrix) != len(self.ids):
+            raise ValueError("Embeddings must be a 2-D array with one row per document")
+        if space == "cosine":
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            matrix = matrix / np.where(norms > 0, norms, 1.0)
+        self._matrix = np.ascontiguousarray(matrix)
+        self._sq_norms = np.einsum("ij,ij->i", self._matrix, self._matrix)
+
+        # Row indices per country for the where={"country_code": ...} filter
+        by_country: Dict[str, List[int]] = {}
+        for i, metadata in enumerate(self.metadatas):
+            code = metadata.get("country_code")
+            if code:
+                by_country.setdefault(str(code).upper(), []).append(i)
+        self._country_rows = {code: np.array(rows, dtype=np.int64) for code, rows in by_country.items()}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def dimension(self) -> int:
+        return int(self._matrix.shape[1]) if len(self._matrix) else 0
+
+    @classmethod
+    def from_collection(cls, collection: Any, page_size: int = 1000) -> "InMemoryVectorIndex":
+        """
+        Export a ChromaDB collection into an in-memory index.
+
+        Args:
+            collection: ChromaDB collection
+            page_size: Number of documents fetched per request
+
+        Returns:
+            InMemoryVectorIndex with the collection's embeddings and metadata
+        """
+        ids: List[str] = []
+        documents: List[Optional[str]] = []
+        metadatas: List[Optional[Dict[str, Any]]] = []
+        embeddings: List[Any] = []
+
+        total = collection.count()
+        for offset in range(0, total, page_size):
+            page = collection.get(
+                include=["embeddings", "documents", "metadatas"],
+                limit=page_size,
+                offset=offset,
+            )
+            ids.extend(page["ids"])
+            documents.extend(page["documents"])
+            metadatas.extend(page["metadatas"])
+            embeddings.extend(page["embeddings"])
+
+        space = (getattr(collection, "metadata", None) or {}).get("hnsw:space", "l2")
+        matrix = np.asarray(embeddings, dtype=np.float32) if ids else np.zeros((0, 0), dtype=np.float32)
+        return cls(ids, matrix, documents, metadatas, space)
+
+    def _rows_for(self, where: Optional[Dict[str, Any]]) -> Optional[np.ndarray]:
+        """Resolve a country where-filter to row indices (None = all rows)."""
+        if not where:
+            return None
+        if set(where) != {"country_code"}:
+            raise ValueError(f"Unsupported where filter for in-memory index: {where}")
+
+        condition = where["country_code"]
+        if isinstance(condition, dict):
+            if "$in" in condition:
+                codes = condition["$in"]
+            elif "$eq" in condition:
+                codes = [condition["$eq"]]
+            else:
+                raise ValueError(f"Unsupported country_code operator: {condition}")
+        else:
+            codes = [condition]
+
+        parts = [self._country_rows[c.upper()] for c in codes if c and c.upper() in self._country_rows]
+        if not parts:
+            return np.zeros(0, dtype=np.int64)
+        return np.unique(np.concatenate(parts)) if len(parts) > 1 else parts[0]
+
+    def query(
+        self,
+        query_embeddings: List[List[float]],
+        n_results: int = 10,
+        where: Optional[Dict[str, Any]] = None,
+        include: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Top-k query with the same result shape as ChromaDB ``Collection.query()``.
+
+        Args:
+            query_embeddings: List of query vectors
+            n_results: Number of results per query
+            where: Optional country filter ({"country_code": "FR"} or {"country_code": {"$in": [...]}})
+            include: Accepted for compatibility; documents, metadatas and distances are always returned
+
+        Returns:
+            Dict with ids, documents, metadatas, distances (one list per query)
+        """
+        rows = self._rows_for(where)
+        queries = np.asarray(query_embeddings, dtype=np.float32).reshape(len(query_embeddings), -1)
+        if self.space == "cosine":
+            norms = np.linalg.norm(queries, axis=1, keepdims=True)
+            queries = queries / np.where(norms > 0, norms, 1.0)
+
+        matrix = self._matrix if rows is None else self._matrix[rows]
+        dots = queries @ matrix.T  # (Q, N)
+        if self.space == "l2":
+            sq_norms = self._sq_norms if rows is None else self._sq_norms[rows]
+            distances = sq_norms[None, :] - 2.0 * dots + np.einsum("ij,ij->i", queries, queries)[:, None]
+            np.maximum(distances, 0.0, out=distances)
+        else:
+            distances = 1.0 - dots
+
+        result: Dict[str, Any] = {"ids": [], "documents": [], "metadatas": [], "distances": []}
+        k = min(n_results, distances.shape[1])
+        for q in range(len(queries)):
+            if k <= 0:
+                top = np.zeros(0, dtype=np.int64)
+            else:
+                top = np.argpartition(distances[q], k - 1)[:k] if k < distances.shape[1] else np.arange(distances.shape[1])
+                top = top[np.argsort(distances[q][top], kind="stable")]
+            positions = top if rows is None else rows[top]
+            result["ids"].append([self.ids[i] for i in positions])
+            result["documents"].append([self.documents[i] for i in positions])
+            result["metadatas"].append([self.metadatas[i] for i in positions])
+            result["distances"].append([float(d) for d in distances[q][top]])
+        return result
+
+
+def _flush_reformulator(ref: "weakref.ref[QueryReformulator]") -> None:
+    """atexit hook: save a reformulator's pending cache entries if it still exists."""
+    reformulator = ref()
+    if reformulator is not None:
+        reformulator.flush()
+
+
+class SemanticQueryCache:
+    """
+    Cache of retrieval results keyed by query embedding.
+
+    A query whose embedding is within `threshold` cosine similarity of a cached
+    one, with the same retrieval parameters (countries, top_k, mode, ...), reuses
+    the cached results instead of running the vector search and reranking again.
+    Entries are evicted least-recently-used and cleared when the rules version
+    changes. Safe to share between request threads.
+    """
+
+    def __init__(self, threshold: float = 0.97, max_entries: int = 256):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.version: Optional[str] = None
+        self._entries: "OrderedDict[int, Tuple[Tuple, np.ndarray, List[Dict[str, Any]]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._next_id = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _normalize(embedding: List[float]) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    def lookup(self, embedding: List[float], key: Tuple) -> Optional[List[Dict[str, Any]]]:
+        """Cached results for the nearest same-key query above the threshold, or None."""
+        query = self._normalize(embedding)
+        with self._lock:
+            candidates = [(entry_id, entry) for entry_id, entry in self._entries.items() if entry[0] == key]
+            if candidates:
+                similarities = np.stack([entry[1] for _, entry in candidates]) @ query
+                best = int(np.argmax(similarities))
+                if similarities[best] >= self.threshold:
+                    entry_id, entry = candidates[best]
+                    self._entries.move_to_end(entry_id)
+                    self.hits += 1
+                    results = entry[2]
+                else:
+                    results = None
+            else:
+                results = None
+            if results is None:
+                self.misses += 1
+                return None
+        return copy.deepcopy(results)
+
+    def store(self, embedding: List[float], key: Tuple, results: List[Dict[str, Any]]) -> None:
+        if self.max_entries <= 0:
+            return
+        entry = (key, self._normalize(embedding), copy.deepcopy(results))
+        with self._lock:
+            self._entries[self._next_id] = entry
+            self._next_id += 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def set_version(self, version: Optional[str]) -> None:
+        """Drop cached results retrieved against a different rules.json version."""
+        with self._lock:
+            if version != self.version:
+                self.version = version
+                self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for the semantic cache."""
+        with self._lock:
+            size = len(self._entries)
+        total = self.hits + self.misses
+        return {
+            "size": size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+            "version": self.version,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
 class RulesRAG:
     """
     RAG system for aviation rules retrieval.
@@ -398,6 +786,8 @@ class RulesRAG:
         retrieval_config: Optional[Any] = None,
         llm: Optional[Any] = None,
         rules_manager: Optional[Any] = None,
+        in_memory_index: bool = True,
+        reformulation_cache_path: Optional[Path | str] = None,
     ):
         """
         Initialize RAG system.
@@ -413,6 +803,10 @@ class RulesRAG:
             retrieval_config: RetrievalConfig object with retrieval parameters (top_k, similarity_threshold, rerank_candidates_multiplier)
             llm: Optional LLM instance for reformulation
             rules_manager: Optional RulesManager instance for multi-country lookups
+            in_memory_index: Serve queries from an in-process copy of the collection
+                (falls back to ChromaDB queries if the export fails)
+            reformulation_cache_path: JSON file persisting reformulations. Defaults to
+                <vector_db_path>/reformulations.json in local mode.
         """
         self.vector_db_path = Path(vector_db_path) if vector_db_path else None
         self.vector_db_url = vector_db_url
@@ -424,7 +818,9 @@ class RulesRAG:
         # Initialize query reformulator
         self.enable_reformulation = enable_reformulation
         if enable_reformulation:
-            self.reformulator = QueryReformulator(llm)
+            if reformulation_cache_path is None and self.vector_db_path and not vector_db_url:
+                reformulation_cache_path = self.vector_db_path / "reformulations.json"
+            self.reformulator = QueryReformulator(llm, cache_path=reformulation_cache_path)
         else:
             self.reformulator = None
         
@@ -452,8 +848,15 @@ class RulesRAG:
         else:
             self.reranker = None
         
-        # Store rules manager for multi-country lookups
+        # Store rules manager for multi-country lookups and lexical (BM25) search
         self.rules_manager = rules_manager
+        self.retrieval_mode = getattr(retrieval_config, "mode", "vector") if retrieval_config else "vector"
+        self.lexical_weight = getattr(retrieval_config, "lexical_weight", 0.3) if retrieval_config else 0.3
+
+        # Semantic cache of retrieval results (keyed by query embedding)
+        cache_size = getattr(retrieval_config, "semantic_cache_size", 256) if retrieval_config else 256
+        cache_threshold = getattr(retrieval_config, "semantic_cache_threshold", 0.97) if retrieval_config else 0.97
+        self.semantic_cache = SemanticQueryCache(cache_threshold, cache_size) if cache_size > 0 else None
         
         # Initialize ChromaDB - use service mode if URL is provided, otherwise local mode
         if self.vector_db_url:
@@ -493,6 +896,52 @@ class RulesRAG:
             logger.error(f"Failed to load collection: {e}")
             logger.error("Run build_vector_db() to create the vector database")
             self.collection = None
+
+        # Export collection into an in-process index (ChromaDB stays the build-time store)
+        self.index: Optional[InMemoryVectorIndex] = None
+        if in_memory_index and self.collection is not None:
+            self.refresh_index()
+
+    def refresh_index(self) -> None:
+        """(Re)build the in-memory index from the ChromaDB collection."""
+        try:
+            self.index = InMemoryVectorIndex.from_collection(self.collection)
+            logger.info(f"✓ In-memory index: {len(self.index)} vectors, dim {self.index.dimension}, space {self.index.space}")
+        except Exception as e:
+            logger.warning(f"In-memory index unavailable, querying ChromaDB directly: {e}")
+            self.index = None
+
+    def _sync_cache_version(self, rules_mgr: Optional[Any]) -> None:
+        """Invalidate caches when the rules.json content changes."""
+        version = getattr(rules_mgr, "version", None) if rules_mgr is not None else None
+        if version is None:
+            return
+        if self.reformulator is not None:
+            self.reformulator.set_version(version)
+        if self.semantic_cache is not None:
+            self.semantic_cache.set_version(version)
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Hit-rate metrics for the reformulation and semantic caches."""
+        return {
+            "reformulation": self.reformulator.cache_stats() if self.reformulator else None,
+            "semantic": self.semantic_cache.stats() if self.semantic_cache else None,
+        }
+
+    def _remember(self, query_embedding: List[float], cache_key: Tuple, matches: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        if self.semantic_cache is not None:
+            self.semantic_cache.store(query_embedding, cache_key, matches)
+        return matches
+
+    def _query(self, query_embedding: List[float], n_results: int, where: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Run a top-k query against the in-memory index, or ChromaDB if not available."""
+        source = self.index if self.index is not None else self.collection
+        return source.query(
+            query_embeddings=[query_embedding],
+            n_results=n_results,
+            where=where,
+            include=["documents", "metadatas", "distances"]
+        )
     
     @staticmethod
     def _parse_json_field(value: Any, default: Any = []) -> Any:
@@ -508,6 +957,111 @@ class RulesRAG:
             return value
         return default
     
+    @staticmethod
+    def _lexical_question_matches(
+        rules_mgr: Any, query: str, countries: List[str], limit: int
+    ) -> List[Dict[str, Any]]:
+        """BM25 matches aggregated per question, with scores normalized to 0-1."""
+        best: Dict[str, Dict[str, Any]] = {}
+        for entry in rules_mgr.search_rules(query, countries=countries, top_k=limit):
+            question_id = entry["question_id"]
+            if question_id not in best or entry["lexical_score"] > best[question_id]["lexical_score"]:
+                best[question_id] = {
+                    "question_id": question_id,
+                    "question_text": entry.get("question_text", ""),
+                    "lexical_score": entry["lexical_score"],
+                    "category": entry.get("category"),
+                    "tags": entry.get("tags") or [],
+                }
+        matches = sorted(best.values(), key=lambda m: m["lexical_score"], reverse=True)
+        top_score = matches[0]["lexical_score"] if matches else 0.0
+        for match in matches:
+            match["similarity"] = match["lexical_score"] / top_score if top_score > 0 else 0.0
+        return matches
+
+    def _fuse_scores(
+        self,
+        vector_matches: List[Dict[str, Any]],
+        lexical_matches: List[Dict[str, Any]],
+        similarity_threshold: float,
+    ) -> List[Dict[str, Any]]:
+        """
+        Fuse vector similarity and normalized BM25 score per question (weighted sum).
+
+        vector_matches are unfiltered; the threshold applies to the fused score,
+        so lexical-only matches and vector matches compete on the same scale.
+        """
+        weight = self.lexical_weight
+        lexical_by_id = {m["question_id"]: m for m in lexical_matches}
+        fused: Dict[str, Dict[str, Any]] = {}
+        for match in vector_matches:
+            lexical = lexical_by_id.get(match["question_id"])
+            lexical_norm = lexical["similarity"] if lexical else 0.0
+            fused[match["question_id"]] = dict(
+                match,
+                vector_similarity=match["similarity"],
+                similarity=(1 - weight) * match["similarity"] + weight * lexical_norm,
+            )
+        for question_id, lexical in lexical_by_id.items():
+            if question_id not in fused:
+                fused[question_id] = dict(lexical, vector_similarity=0.0, similarity=weight * lexical["similarity"])
+        kept = [m for m in fused.values() if m["similarity"] >= similarity_threshold]
+        return sorted(kept, key=lambda m: m["similarity"], reverse=True)
+
+    def _expand_to_countries(
+        self, question_matches: List[Dict[str, Any]], countries: List[str], rules_mgr: Any
+    ) -> List[Dict[str, Any]]:
+        """Expand question-level matches into per-country answers using RulesManager."""
+        # Ensure rules manager is loaded
+        if not rules_mgr.loaded:
+            rules_mgr.load_rules()
+        
+        matches = []
+        countries_upper = [c.upper() for c in countries] if countries else []
+        
+        for q_match in question_matches:
+            question_id = q_match["question_id"]
+            question_info = rules_mgr.question_map.get(question_id)
+            
+            if not question_info:
+                logger.warning(f"Question ID {question_id} not found in RulesManager")
+                continue
+            
+            answers_by_country = question_info.get("answers_by_country", {})
+            
+            # Get answers for all requested countries
+            for country_code in countries_upper:
+                answer_data = answers_by_country.get(country_code)
+                
+                if not answer_data:
+                    # Skip if no answer for this country
+                    continue
+                
+                # Parse links
+                links = answer_data.get("links", [])
+                if isinstance(links, str):
+                    try:
+                        links = json.loads(links)
+                    except (json.JSONDecodeError, TypeError):
+                        links = []
+                elif not isinstance(links, list):
+                    links = []
+                
+                matches.append({
+                    "id": f"{question_id}_{country_code}",
+                    "question_id": question_id,
+                    "question_text": q_match["question_text"],
+                    "similarity": round(q_match["similarity"], 3),
+                    "country_code": country_code,
+                    "category": q_match["category"],
+                    "tags": q_match["tags"],
+                    "answer_html": answer_data.get("answer_html", ""),
+                    "links": links,
+                    "last_reviewed": answer_data.get("last_reviewed"),
+                })
+        
+        return matches
+
     def retrieve_rules(
         self,
         query: str,
@@ -516,6 +1070,7 @@ class RulesRAG:
         similarity_threshold: float = 0.3,
         reformulate: Optional[bool] = None,
         rules_manager: Optional[Any] = None,
+        mode: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """
         Retrieve relevant rules using semantic search.
@@ -523,6 +1078,11 @@ class RulesRAG:
         For multiple countries: queries the first country to get top questions,
         then uses RulesManager to get answers for those questions across all countries.
         For single country: returns results directly from vector DB metadata.
+
+        In hybrid mode (requires RulesManager and countries), vector similarities are
+        fused with BM25 scores from RulesManager and the threshold applies to the
+        fused score. Exact-term queries (a rule ID or a glossary term such as "PPR")
+        are answered from the lexical index alone, without an embedding call.
         
         Args:
             query: User query text
@@ -531,6 +1091,7 @@ class RulesRAG:
             similarity_threshold: Minimum similarity score (0-1)
             reformulate: Override default reformulation setting
             rules_manager: Optional RulesManager instance (uses self.rules_manager if not provided)
+            mode: "vector" or "hybrid" (defaults to the configured retrieval mode)
         
         Returns:
             List of matching rules with metadata, sorted by similarity score.
@@ -542,9 +1103,19 @@ class RulesRAG:
         
         # Use provided rules_manager or fall back to instance variable
         rules_mgr = rules_manager or self.rules_manager
-        
+        self._sync_cache_version(rules_mgr)
+
         # Determine if we have multiple countries
         has_multiple_countries = countries and len(countries) > 1
+
+        # Lexical side of hybrid retrieval (on the user's own wording)
+        use_hybrid = (mode or self.retrieval_mode) == "hybrid" and rules_mgr is not None and bool(countries)
+        lexical_matches: List[Dict[str, Any]] = []
+        if use_hybrid:
+            lexical_matches = self._lexical_question_matches(rules_mgr, query, countries, top_k * 3)
+            if lexical_matches and rules_mgr.is_exact_term_query(query):
+                logger.info(f"Exact-term query '{query}': answered from lexical index")
+                return self._expand_to_countries(lexical_matches[:top_k], countries, rules_mgr)
         
         # Query reformulation
         original_query = query
@@ -560,6 +1131,17 @@ class RulesRAG:
         except Exception as e:
             logger.error(f"Failed to generate query embedding: {e}")
             return []
+
+        # Near-duplicate of a recent query with the same parameters: reuse its results
+        cache_key = (
+            tuple(sorted(c.upper() for c in countries)) if countries else None,
+            top_k, similarity_threshold, bool(reformulate), mode or self.retrieval_mode, id(rules_mgr),
+        )
+        if self.semantic_cache is not None:
+            cached = self.semantic_cache.lookup(query_embedding, cache_key)
+            if cached is not None:
+                logger.info(f"Semantic cache hit for '{original_query}' ({len(cached)} rules)")
+                return cached
         
         # For multiple countries: query WITHOUT country filter to get globally best questions
         # Then use RulesManager to expand those questions to all requested countries
@@ -579,14 +1161,9 @@ class RulesRAG:
         
         # Search collection
         try:
-            results = self.collection.query(
-                query_embeddings=[query_embedding],
-                n_results=n_results,
-                where=where_filter,
-                include=["documents", "metadatas", "distances"]
-            )
+            results = self._query(query_embedding, n_results, where_filter)
         except Exception as e:
-            logger.error(f"ChromaDB query failed: {e}")
+            logger.error(f"Vector query failed: {e}")
             return []
         
         # Extract top question IDs and their similarity scores
@@ -600,7 +1177,8 @@ class RulesRAG:
                 # maps distance to a usable similarity range.
                 similarity = max(0, 1 - (distance / 2))
                 
-                if similarity < similarity_threshold:
+                # Hybrid mode thresholds the fused score instead
+                if similarity < similarity_threshold and not use_hybrid:
                     continue
                 
                 metadata = results['metadatas'][0][i]
@@ -622,6 +1200,8 @@ class RulesRAG:
         
         # Sort by similarity and take candidates for reranking
         question_matches.sort(key=lambda x: x['similarity'], reverse=True)
+        if use_hybrid:
+            question_matches = self._fuse_scores(question_matches, lexical_matches, similarity_threshold)
         
         # If reranking enabled, get more candidates and rerank
         if self.enable_reranking and self.reranker:
@@ -644,10 +1224,10 @@ class RulesRAG:
         
         if not question_matches:
             logger.info(f"No matching rules found for query: '{query}'")
-            return []
+            return self._remember(query_embedding, cache_key, [])
         
-        # For multiple countries: use RulesManager to get answers for all countries
-        if has_multiple_countries:
+        # For multiple countries (or hybrid): use RulesManager to get answers for all countries
+        if has_multiple_countries or use_hybrid:
             if not rules_mgr:
                 logger.warning(
                     "Multiple countries requested but RulesManager not available. "
@@ -655,60 +1235,13 @@ class RulesRAG:
                 )
                 # Fall through to single-country logic below
             else:
-                # Ensure rules manager is loaded
-                if not rules_mgr.loaded:
-                    rules_mgr.load_rules()
-                
-                matches = []
-                countries_upper = [c.upper() for c in countries] if countries else []
-                
-                for q_match in question_matches:
-                    question_id = q_match["question_id"]
-                    question_info = rules_mgr.question_map.get(question_id)
-                    
-                    if not question_info:
-                        logger.warning(f"Question ID {question_id} not found in RulesManager")
-                        continue
-                    
-                    answers_by_country = question_info.get("answers_by_country", {})
-                    
-                    # Get answers for all requested countries
-                    for country_code in countries_upper:
-                        answer_data = answers_by_country.get(country_code)
-                        
-                        if not answer_data:
-                            # Skip if no answer for this country
-                            continue
-                        
-                        # Parse links
-                        links = answer_data.get("links", [])
-                        if isinstance(links, str):
-                            try:
-                                links = json.loads(links)
-                            except (json.JSONDecodeError, TypeError):
-                                links = []
-                        elif not isinstance(links, list):
-                            links = []
-                        
-                        matches.append({
-                            "id": f"{question_id}_{country_code}",
-                            "question_id": question_id,
-                            "question_text": q_match["question_text"],
-                            "similarity": round(q_match["similarity"], 3),
-                            "country_code": country_code,
-                            "category": q_match["category"],
-                            "tags": q_match["tags"],
-                            "answer_html": answer_data.get("answer_html", ""),
-                            "links": links,
-                            "last_reviewed": answer_data.get("last_reviewed"),
-                        })
-                
-                log_msg = f"Retrieved {len(question_matches)} questions for {len(countries_upper)} countries"
+                matches = self._expand_to_countries(question_matches, countries, rules_mgr)
+                log_msg = f"Retrieved {len(question_matches)} questions for {len(countries)} countries"
                 if query != original_query:
                     log_msg += f" (reformulated: '{original_query}' → '{query}')"
                 logger.info(log_msg)
-                
-                return matches
+
+                return self._remember(query_embedding, cache_key, matches)
         
         # For single country: return results directly from metadata
         matches = []
@@ -767,8 +1300,8 @@ class RulesRAG:
         if countries:
             log_msg += f" for {countries}"
         logger.info(log_msg)
-        
-        return matches[:top_k]
+
+        return self._remember(query_embedding, cache_key, matches[:top_k])
 
 
 def build_vector_db(
@@ -779,6 +1312,7 @@ def build_vector_db(
     batch_size: int = 100,
     force_rebuild: bool = False,
     build_answer_embeddings: bool = True,
+    comparison_tables_path: Optional[Path | str] = None,
 ) -> int | Dict[str, int]:
     """
     Build vector database from rules.json.
@@ -795,6 +1329,9 @@ def build_vector_db(
         batch_size: Number of documents to process per batch
         force_rebuild: If True, rebuild even if collection exists
         build_answer_embeddings: If True, also build answer embeddings collection
+            and precompute the cross-country ComparisonTables from them
+        comparison_tables_path: Where to write ComparisonTables. Defaults to
+            <vector_db_path>/comparison_tables; required in service mode.
 
     Returns:
         If build_answer_embeddings=False: Number of documents added (int)
@@ -1017,6 +1554,9 @@ def build_vector_db(
         if answer_documents:
             logger.info(f"Processing {len(answer_documents)} answer embeddings in batches of {batch_size}")
 
+            # Rows kept for the comparison tables: (question_id, country, embedding, text)
+            table_rows: List[Tuple[str, str, Any, str]] = []
+
             # Add answer documents in batches
             for i in range(0, len(answer_documents), batch_size):
                 batch_docs = answer_documents[i:i + batch_size]
@@ -1039,6 +1579,10 @@ def build_vector_db(
                         ids=batch_ids
                     )
                     answers_added += len(batch_docs)
+                    table_rows.extend(
+                        (meta["question_id"], meta["country_code"], emb, doc)
+                        for meta, emb, doc in zip(batch_metas, embeddings, batch_docs)
+                    )
                     batch_num = i // batch_size + 1
                     logger.info(f"Added answers batch {batch_num}: {len(batch_docs)} documents")
                 except Exception as e:
@@ -1046,6 +1590,7 @@ def build_vector_db(
                     continue
 
             logger.info(f"✓ Answers collection built with {answers_added} documents")
+            _write_comparison_tables(table_rows, vector_db_path, comparison_tables_path)
         else:
             logger.warning("No valid answer documents to add")
 
@@ -1059,6 +1604,35 @@ def build_vector_db(
     return total_added
 
 
+def _write_comparison_tables(
+    rows: List[Tuple[str, str, Any, str]],
+    vector_db_path: Optional[Path | str],
+    comparison_tables_path: Optional[Path | str],
+) -> Optional[Path]:
+    """Precompute ComparisonTables from freshly embedded answers and save them."""
+    from .answer_comparer import COMPARISON_TABLES_DIR, AnswerTensor, ComparisonTables
+
+    if comparison_tables_path is None:
+        if not vector_db_path:
+            logger.info("No comparison_tables_path in service mode; skipping comparison tables")
+            return None
+        comparison_tables_path = Path(vector_db_path) / COMPARISON_TABLES_DIR
+    if not rows:
+        return None
+
+    try:
+        tables = ComparisonTables.from_tensor(AnswerTensor.from_rows(rows))
+        path = tables.save(comparison_tables_path)
+        logger.info(
+            f"✓ Comparison tables saved to {path}: "
+            f"{len(tables.question_ids)} questions x {len(tables.countries)} countries"
+        )
+        return path
+    except Exception as e:
+        logger.error(f"Failed to build comparison tables: {e}")
+        return None
+
+
 if __name__ == "__main__":
     # Simple test when run directly
     import sys
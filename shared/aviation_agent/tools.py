@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import copy
 import inspect
 import json
 from dataclasses import dataclass
@@ -9,8 +10,12 @@ from shared.airport_tools import (
     ToolSpec,
     get_shared_tool_specs,
 )
+from shared.single_flight import SingleFlight
 from shared.tool_context import ToolContext
 
+# Coalesces identical concurrent tool calls (e.g. popular chat prompts)
+_tool_calls = SingleFlight("aviation_agent.tools")
+
 
 @dataclass(frozen=True)
 class AviationTool:
@@ -75,7 +80,15 @@ class AviationToolClient:
             if "_persona_id" in filtered_args and not (accepts_kwargs or has_persona_param):
                 filtered_args = {k: v for k, v in filtered_args.items() if k != "_persona_id"}
             
-            return tool.handler(self._context, **filtered_args)
+            # Same tool, arguments and data snapshot: share the call in flight
+            key = (
+                tool_name,
+                json.dumps(filtered_args, sort_keys=True, default=str),
+                id(self._context),
+            )
+            result, shared = _tool_calls.do(key, lambda: tool.handler(self._context, **filtered_args))
+            # Callers may post-process results in place; give each its own copy
+            return copy.deepcopy(result) if shared else result
         except Exception as exc:  # pragma: no cover - surface entire exception message
             raise AviationToolInvocationError(f"Tool '{tool_name}' failed: {exc}") from exc
 
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Change Log
+==========
+
+Row-level change tracking for the derived databases (ga_notifications.db,
+ga_persona.db), complementing the ``*_changes`` tables euro_aip records in
+airports.db.
+
+install_change_log() adds SQLite triggers to a table keyed by ICAO. Every
+insert, update or delete that actually changes a row's content appends
+(seq, source, icao) to a ``data_changes`` table; rewriting a row with
+identical values (INSERT OR REPLACE during a rebuild) is not logged, so a
+full rebuild only logs the airports whose data differs. Columns such as
+timestamps can be excluded from the comparison.
+
+Readers track a position (epoch, seq). The epoch is a random id created
+with the log: a deleted and rebuilt database starts a new epoch, telling
+readers their position is meaningless and they must resync fully.
+
+Usage:
+    install_change_log(conn, "ga_notification_requirements", ignore_columns=["id", "created_utc"])
+
+    epoch, seq = change_log_head(conn)
+    icaos = changed_keys(conn, since_seq=client_seq, until_seq=seq)
+"""
+from __future__ import annotations
+
+import sqlite3
+import uuid
+from typing import Iterable, Optional, Set, Tuple
+
+CHANGE_LOG_TABLE = "data_changes"
+CHANGE_LOG_EPOCH_TABLE = "data_changes_epoch"
+
+
+def _ensure_log_tables(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS {CHANGE_LOG_TABLE} (
+            seq         INTEGER PRIMARY KEY AUTOINCREMENT,
+            source      TEXT NOT NULL,
+            icao        TEXT NOT NULL,
+            changed_utc TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%SZ', 'now'))
+        )
+        """
+    )
+    conn.execute(f"CREATE TABLE IF NOT EXISTS {CHANGE_LOG_EPOCH_TABLE} (epoch TEXT NOT NULL)")
+    if conn.execute(f"SELECT COUNT(*) FROM {CHANGE_LOG_EPOCH_TABLE}").fetchone()[0] == 0:
+        conn.execute(
+            f"INSERT INTO {CHANGE_LOG_EPOCH_TABLE} (epoch) VALUES (?)", (uuid.uuid4().hex[:8],)
+        )
+
+
+def install_change_log(
+    conn: sqlite3.Connection,
+    table: str,
+    key: str = "icao",
+    ignore_columns: Iterable[str] = (),
+) -> None:
+    """
+    (Re)create the change-tracking triggers on `table`.
+
+    Idempotent; call it again after adding columns so they are compared too.
+    The caller commits.
+
+    Args:
+        conn: Connection to the derived database
+        table: Table with one or more rows per `key`
+        key: ICAO column logged for each change
+        ignore_columns: Columns whose changes alone are not logged
+            (row ids, write timestamps)
+    """
+    _ensure_log_tables(conn)
+    ignored = set(ignore_columns) | {key}
+    columns = [row[1] for row in conn.execute(f"PRAGMA table_info({table})") if row[1] not in ignored]
+
+    same_as_new = " AND ".join([f"{key} = NEW.{key}"] + [f"{c} IS NEW.{c}" for c in columns])
+    differs = " OR ".join([f"OLD.{key} IS NOT NEW.{key}"] + [f"OLD.{c} IS NOT NEW.{c}" for c in columns])
+    log = f"INSERT INTO {CHANGE_LOG_TABLE} (source, icao) VALUES ('{table}', "
+
+    for event in ("insert", "update", "delete"):
+        conn.execute(f"DROP TRIGGER IF EXISTS {table}_log_{event}")
+    # BEFORE INSERT still sees the row an INSERT OR REPLACE is about to replace
+    conn.execute(
+        f"""
+        CREATE TRIGGER {table}_log_insert BEFORE INSERT ON {table}
+        WHEN NOT EXISTS (SELECT 1 FROM {table} WHERE {same_as_new})
+        BEGIN {log}NEW.{key}); END
+        """
+    )
+    conn.execute(
+        f"""
+        CREATE TRIGGER {table}_log_update AFTER UPDATE ON {table}
+        WHEN {differs}
+        BEGIN {log}NEW.{key}); END
+        """
+    )
+    conn.execute(
+        f"""
+        CREATE TRIGGER {table}_log_delete AFTER DELETE ON {table}
+        BEGIN {log}OLD.{key}); END
+        """
+    )
+
+
+def change_log_head(conn: sqlite3.Connection) -> Tuple[Optional[str], int]:
+    """(epoch, latest seq) of the database's change log; (None, 0) without one."""
+    try:
+        epoch_row = conn.execute(f"SELECT epoch FROM {CHANGE_LOG_EPOCH_TABLE} LIMIT 1").fetchone()
+        seq = conn.execute(f"SELECT MAX(seq) FROM {CHANGE_LOG_TABLE}").fetchone()[0]
+    except sqlite3.OperationalError:
+        return None, 0
+    return (epoch_row[0] if epoch_row else None), seq or 0
+
+
+def changed_keys(
+    conn: sqlite3.Connection,
+    since_seq: int,
+    until_seq: Optional[int] = None,
+    sources: Optional[Iterable[str]] = None,
+) -> Set[str]:
+    """
+    ICAOs with logged changes in (since_seq, until_seq].
+
+    Args:
+        sources: Only changes of these tables (None = all)
+    """
+    query = f"SELECT DISTINCT icao FROM {CHANGE_LOG_TABLE} WHERE seq > ?"
+    params: list = [since_seq]
+    if until_seq is not None:
+        query += " AND seq <= ?"
+        params.append(until_seq)
+    if sources is not None:
+        sources = list(sources)
+        query += f" AND source IN ({','.join('?' for _ in sources)})"
+        params.extend(sources)
+    try:
+        return {row[0].upper() for row in conn.execute(query, params)}
+    except sqlite3.OperationalError:
+        return set()
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Data Delta
+==========
+
+Versioned change sets across the databases the web API serves, for client
+delta sync (web/server/api/sync.py).
+
+A DataVersion is a position in three change logs:
+
+- airports.db: ``changed_at`` high-water mark of euro_aip's ``*_changes``
+  tables (read through AIPChangeFeed).
+- ga_persona.db, ga_notifications.db: (epoch, seq) of their change logs
+  (see shared/change_log.py).
+
+Clients hold the version token returned with their data and ask for the
+airports changed since then. If a position cannot be continued (a derived
+database was rebuilt, or the client is ahead of the server's data) the
+delta says ``reset`` and the client reloads in full.
+
+The airports.db position is the mark of the data the server has loaded,
+taken *before* loading: changes recorded while loading are sent again on
+the next sync instead of being skipped.
+
+Usage:
+    source = DeltaSource(airports_db, airports_mark, ga_persona_db, notifications_db)
+    token = source.current_version().encode()
+    delta = source.changes_since(DataVersion.decode(token))
+"""
+from __future__ import annotations
+
+import base64
+import binascii
+import logging
+import sqlite3
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional, Set
+
+from shared.aip_change_feed import AIPChangeFeed
+from shared.change_log import change_log_head, changed_keys
+
+logger = logging.getLogger(__name__)
+
+# Version token format; bump when the encoded fields change
+TOKEN_FORMAT = "1"
+
+
+@dataclass(frozen=True)
+class LogPosition:
+    """Position in a derived database's change log."""
+
+    epoch: Optional[str] = None
+    seq: int = 0
+
+
+@dataclass(frozen=True)
+class DataVersion:
+    """Position in all served change logs; opaque to clients (encode/decode)."""
+
+    airports: Optional[str] = None
+    ga: LogPosition = LogPosition()
+    notifications: LogPosition = LogPosition()
+
+    def encode(self) -> str:
+        raw = "|".join([
+            self.airports or "",
+            self.ga.epoch or "", str(self.ga.seq),
+            self.notifications.epoch or "", str(self.notifications.seq),
+        ])
+        return f"{TOKEN_FORMAT}.{base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii').rstrip('=')}"
+
+    @classmethod
+    def decode(cls, token: str) -> "DataVersion":
+        """Parse a token from encode(); raises ValueError if malformed."""
+        try:
+            fmt, _, payload = token.partition(".")
+            if fmt != TOKEN_FORMAT:
+                raise ValueError(fmt)
+            raw = base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)).decode("utf-8")
+            airports, ga_epoch, ga_seq, n_epoch, n_seq = raw.split("|")
+            return cls(
+                airports=airports or None,
+                ga=LogPosition(ga_epoch or None, int(ga_seq)),
+                notifications=LogPosition(n_epoch or None, int(n_seq)),
+            )
+        except (ValueError, binascii.Error, UnicodeDecodeError):
+            raise ValueError(f"Invalid data version: {token!r}") from None
+
+
+@dataclass
+class Delta:
+    """Airports changed between two versions, per kind of data."""
+
+    version: DataVersion
+    reset: bool = False  # Client must reload in full (its version cannot be continued)
+    airports: Set[str] = field(default_factory=set)
+    ga: Set[str] = field(default_factory=set)
+    notifications: Set[str] = field(default_factory=set)
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.reset or self.airports or self.ga or self.notifications)
+
+
+class DeltaSource:
+    """Computes deltas from airports.db and the derived databases' change logs."""
+
+    def __init__(
+        self,
+        airports_db: Path,
+        airports_mark: Optional[str],
+        ga_persona_db: Optional[Path] = None,
+        notifications_db: Optional[Path] = None,
+    ):
+        """
+        Args:
+            airports_db: airports.db the served model was loaded from
+            airports_mark: AIPChangeFeed.latest() read before loading the model
+            ga_persona_db: ga_persona.db (None = not served)
+            notifications_db: ga_notifications.db (None = not served)
+        """
+        self.feed = AIPChangeFeed(airports_db)
+        self.airports_mark = airports_mark
+        self.ga_persona_db = Path(ga_persona_db) if ga_persona_db else None
+        self.notifications_db = Path(notifications_db) if notifications_db else None
+
+    @staticmethod
+    def _connect(db_path: Optional[Path]) -> Optional[sqlite3.Connection]:
+        if db_path is None or not db_path.exists():
+            return None
+        return sqlite3.connect(f"file:{db_path.resolve()}?mode=ro", uri=True)
+
+    def _head(self, db_path: Optional[Path]) -> LogPosition:
+        conn = self._connect(db_path)
+        if conn is None:
+            return LogPosition()
+        try:
+            return LogPosition(*change_log_head(conn))
+        finally:
+            conn.close()
+
+    def _changed(self, db_path: Optional[Path], since: LogPosition, until: LogPosition) -> Set[str]:
+        if until.seq <= since.seq:
+            return set()
+        conn = self._connect(db_path)
+        if conn is None:
+            return set()
+        try:
+            return changed_keys(conn, since.seq, until.seq)
+        finally:
+            conn.close()
+
+    def current_version(self) -> DataVersion:
+        return DataVersion(
+            airports=self.airports_mark,
+            ga=self._head(self.ga_persona_db),
+            notifications=self._head(self.notifications_db),
+        )
+
+    def changes_since(self, since: DataVersion) -> Delta:
+        """Airports changed after `since`, up to the current version."""
+        current = self.current_version()
+        reasons = []
+        if since.airports and (not current.airports or since.airports > current.airports):
+            reasons.append("airports ahead of served data")
+        for name, old, new in (
+            ("ga", since.ga, current.ga),
+            ("notifications", since.notifications, current.notifications),
+        ):
+            if old.epoch != new.epoch or old.seq > new.seq:
+                reasons.append(f"{name} log restarted")
+        if reasons:
+            logger.info(f"Delta from {since} needs a full reload: {', '.join(reasons)}")
+            return Delta(version=current, reset=True)
+
+        delta = Delta(version=current)
+        if current.airports and current.airports != since.airports:
+            changes = self.feed.changes(since.airports or "", until=current.airports)
+            delta.airports = set(changes.icaos(procedures=True, runways=True, airports=True))
+        delta.ga = self._changed(self.ga_persona_db, since.ga, current.ga)
+        delta.notifications = self._changed(self.notifications_db, since.notifications, current.notifications)
+        return delta
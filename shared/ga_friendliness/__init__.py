@@ -104,6 +104,7 @@ from .database import (
 # --- Storage ---
 from .storage import (
     GAMetaStorage,
+    BatchWriter,
     parse_timestamp,
 )
 
@@ -137,7 +138,7 @@ from .ui_config import (
 )
 
 # --- Cache ---
-from .cache import CachedDataLoader
+from .cache import CachedDataLoader, LLMResultCache, content_hash
 
 # --- Sources ---
 from .sources import (
@@ -215,6 +216,7 @@ __all__ = [
     "attach_euro_aip",
     # Storage
     "GAMetaStorage",
+    "BatchWriter",
     "parse_timestamp",
     # Interfaces
     "ReviewSource",
@@ -237,6 +239,8 @@ __all__ = [
     "validate_config_consistency",
     # Cache
     "CachedDataLoader",
+    "LLMResultCache",
+    "content_hash",
     # Sources
     "CSVReviewSource",
     "AirfieldDirectorySource",
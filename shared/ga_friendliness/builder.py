@@ -5,16 +5,22 @@ Coordinates all components to build ga_persona.db from review sources.
 """
 
 import logging
+import multiprocessing
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 
+from .cache import LLMResultCache
 from .config import GAFriendlinessSettings, get_default_ontology, get_default_personas
 from .exceptions import BuildError, StorageError
 from .features import (
     FeatureMapper,
     aggregate_fees_by_band,
     compute_aip_ifr_score,
+    compute_aip_ifr_score_from_approach_types,
     compute_aip_night_available,
     parse_hospitality_text_to_int,
 )
@@ -27,6 +33,7 @@ from .models import (
     OntologyConfig,
     PersonasConfig,
     RawReview,
+    ReviewExtraction,
 )
 from .ontology import OntologyManager
 from .personas import PersonaManager
@@ -43,6 +50,267 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+def aip_fields_from_airport(airport: Any) -> Dict[str, Any]:
+    """
+    AIP-derived fields from a euro_aip Airport.
+    
+    Returns dict with aip_ifr_available, aip_night_available,
+    aip_hotel_info and aip_restaurant_info.
+    """
+    # Get IFR permitted field (std_field_id=207) if available
+    ifr_permitted_text = None
+    for entry in airport.aip_entries:
+        if entry.std_field_id == 207:
+            ifr_permitted_text = entry.value
+            break
+
+    fields: Dict[str, Any] = {
+        "aip_ifr_available": compute_aip_ifr_score(airport.procedures, ifr_permitted_text),
+        "aip_night_available": compute_aip_night_available(),
+        "aip_hotel_info": None,  # 0=unknown, 1=vicinity, 2=at_airport
+        "aip_restaurant_info": None,
+    }
+
+    # Parse hospitality text fields
+    # Hotel: std_field_id = 501
+    # Restaurant: std_field_id = 502
+    for entry in airport.aip_entries:
+        if entry.std_field_id == 501:  # Hotels
+            fields["aip_hotel_info"] = parse_hospitality_text_to_int(entry.value)
+        elif entry.std_field_id == 502:  # Restaurants
+            fields["aip_restaurant_info"] = parse_hospitality_text_to_int(entry.value)
+    return fields
+
+
+def aip_fields_from_data(aip_fields: Dict[int, Optional[str]], approach_types: Set[str]) -> Dict[str, Any]:
+    """
+    AIP-derived fields from preloaded AIP data (AirportsDatabaseSource.get_aip_data).
+    
+    Same fields as aip_fields_from_airport; where several sources have an
+    entry, the highest source_priority one is used.
+    """
+    ifr = AirportsDatabaseSource.STD_FIELD_IFR_VFR
+    hotel = AirportsDatabaseSource.STD_FIELD_HOTEL
+    restaurant = AirportsDatabaseSource.STD_FIELD_RESTAURANT
+    fields: Dict[str, Any] = {
+        "aip_ifr_available": compute_aip_ifr_score_from_approach_types(approach_types, aip_fields.get(ifr)),
+        "aip_night_available": compute_aip_night_available(),
+        "aip_hotel_info": None,  # 0=unknown, 1=vicinity, 2=at_airport
+        "aip_restaurant_info": None,
+    }
+    if hotel in aip_fields:
+        fields["aip_hotel_info"] = parse_hospitality_text_to_int(aip_fields[hotel])
+    if restaurant in aip_fields:
+        fields["aip_restaurant_info"] = parse_hospitality_text_to_int(aip_fields[restaurant])
+    return fields
+
+
+@dataclass
+class _AirportTask:
+    """Picklable inputs for computing one airport's record."""
+
+    icao: str
+    reviews: List[RawReview]
+    extractions: Optional[List[ReviewExtraction]]  # Raw extractor output (None = no extractor)
+    fee_bands: Dict[str, Optional[float]]
+    fee_currency: str = "EUR"
+    fee_last_updated: Optional[str] = None
+
+
+@dataclass
+class _AirportRecord:
+    """Computed rows for one airport, ready to write."""
+
+    stats: AirportStats
+    extractions: List[ReviewExtraction]  # Filtered by ontology
+    extraction_count: int = 0
+
+
+@dataclass
+class _AirportComputer:
+    """
+    CPU-bound per-airport work: ontology filtering, aggregation, feature
+    mapping and AIP metadata. Holds no storage, so it can run in worker
+    processes (see _init_worker).
+    """
+
+    ontology_manager: OntologyManager
+    feature_mapper: FeatureMapper
+    aggregator: Optional[Any]
+    confidence_threshold: float
+    source_version: str
+    scoring_version: str
+    airports_db: Optional[AirportsDatabaseSource] = None
+
+    def aip_fields(self, icao: str) -> Optional[Dict[str, Any]]:
+        """
+        AIP fields for an airport, or None if it is not in airports.db.
+
+        Reads the preloaded maps of airports_db (loaded once per process),
+        not the euro_aip model.
+        """
+        if self.airports_db is None:
+            return None
+        data = self.airports_db.get_aip_data(icao)
+        if data is None:
+            return None
+        return aip_fields_from_data(*data)
+
+    def compute(self, task: _AirportTask) -> _AirportRecord:
+        """Build the AirportStats row and filtered extractions for one airport."""
+        icao = task.icao
+        reviews = task.reviews
+        
+        # Filter by ontology
+        extractions = [
+            self.ontology_manager.filter_extraction(
+                e, confidence_threshold=self.confidence_threshold
+            )
+            for e in (task.extractions or [])
+        ]
+        
+        # Aggregate tags
+        distributions = {}
+        if self.aggregator and extractions:
+            distributions, context = self.aggregator.aggregate_tags(extractions)
+        
+        # Get airport metadata from airports.db (IFR score, hotel, restaurant)
+        aip_fields: Dict[str, Any] = {
+            "aip_ifr_available": 0,  # Default: IFR not available
+            "aip_night_available": 0,  # Default: not available
+            "aip_hotel_info": None,
+            "aip_restaurant_info": None,
+        }
+        aip_data = {}  # For AIP feature computation
+        try:
+            fields = self.aip_fields(icao)
+            if fields:
+                aip_fields = fields
+                aip_data = {
+                    "aip_ifr_available": fields["aip_ifr_available"],
+                    "aip_hotel_info": fields["aip_hotel_info"],
+                    "aip_restaurant_info": fields["aip_restaurant_info"],
+                }
+        except Exception as e:
+            logger.warning(f"Failed to get AIP metadata for {icao}: {e}")
+
+        # Compute review-derived feature scores
+        review_feature_scores = self.feature_mapper.compute_review_feature_scores(
+            icao=icao,
+            distributions=distributions,
+        )
+
+        # Compute AIP-derived feature scores
+        aip_feature_scores = self.feature_mapper.compute_aip_feature_scores(
+            icao=icao,
+            aip_data=aip_data,
+        )
+        
+        # Compute rating stats
+        ratings = [r.rating for r in reviews if r.rating is not None]
+        rating_avg = sum(ratings) / len(ratings) if ratings else None
+        rating_count = len(ratings)
+        
+        # Get last review timestamp
+        timestamps = [r.timestamp for r in reviews if r.timestamp]
+        last_review = max(timestamps) if timestamps else None
+        
+        fee_bands = task.fee_bands
+        stats = AirportStats(
+            icao=icao,
+            rating_avg=rating_avg,
+            rating_count=rating_count,
+            last_review_utc=last_review,
+            fee_band_0_749kg=fee_bands.get("fee_band_0_749kg"),
+            fee_band_750_1199kg=fee_bands.get("fee_band_750_1199kg"),
+            fee_band_1200_1499kg=fee_bands.get("fee_band_1200_1499kg"),
+            fee_band_1500_1999kg=fee_bands.get("fee_band_1500_1999kg"),
+            fee_band_2000_3999kg=fee_bands.get("fee_band_2000_3999kg"),
+            fee_band_4000_plus_kg=fee_bands.get("fee_band_4000_plus_kg"),
+            fee_currency=task.fee_currency,
+            fee_last_updated_utc=task.fee_last_updated,
+            aip_ifr_available=aip_fields["aip_ifr_available"],
+            aip_night_available=aip_fields["aip_night_available"],
+            aip_hotel_info=aip_fields["aip_hotel_info"],
+            aip_restaurant_info=aip_fields["aip_restaurant_info"],
+            review_cost_score=review_feature_scores.get("review_cost_score"),
+            review_hassle_score=review_feature_scores.get("review_hassle_score"),
+            review_review_score=review_feature_scores.get("review_review_score"),
+            review_ops_ifr_score=review_feature_scores.get("review_ops_ifr_score"),
+            review_ops_vfr_score=review_feature_scores.get("review_ops_vfr_score"),
+            review_access_score=review_feature_scores.get("review_access_score"),
+            review_fun_score=review_feature_scores.get("review_fun_score"),
+            review_hospitality_score=review_feature_scores.get("review_hospitality_score"),
+            aip_ops_ifr_score=aip_feature_scores.get("aip_ops_ifr_score"),
+            aip_hospitality_score=aip_feature_scores.get("aip_hospitality_score"),
+            source_version=self.source_version,
+            scoring_version=self.scoring_version,
+        )
+        return _AirportRecord(
+            stats=stats,
+            extractions=extractions,
+            extraction_count=len(extractions) if task.extractions is not None else 0,
+        )
+
+    def aip_update(self, icao: str) -> Optional[Dict[str, Any]]:
+        """Fields for GAMetaStorage.upsert_aip_only, or None if the airport is unknown."""
+        fields = self.aip_fields(icao)
+        if fields is None:
+            return None
+        aip_feature_scores = self.feature_mapper.compute_aip_feature_scores(
+            icao=icao,
+            aip_data={
+                "aip_ifr_available": fields["aip_ifr_available"],
+                "aip_hotel_info": fields["aip_hotel_info"],
+                "aip_restaurant_info": fields["aip_restaurant_info"],
+            },
+        )
+        return {
+            **fields,
+            "aip_ops_ifr_score": aip_feature_scores.get("aip_ops_ifr_score"),
+            "aip_hospitality_score": aip_feature_scores.get("aip_hospitality_score"),
+        }
+
+
+# --- Worker process entry points (ProcessPoolExecutor) ---
+
+_worker_computer: Optional[_AirportComputer] = None
+
+
+def _init_worker(computer: _AirportComputer, airports_db_path: Optional[str]) -> None:
+    """Give each worker process its own computer and airports.db handle."""
+    global _worker_computer
+    if airports_db_path:
+        computer = replace(computer, airports_db=AirportsDatabaseSource(Path(airports_db_path)))
+    _worker_computer = computer
+
+
+def _compute_in_worker(task: _AirportTask) -> _AirportRecord:
+    return _worker_computer.compute(task)
+
+
+def _aip_update_chunk(icaos: List[str]) -> List[Tuple[str, Optional[Dict[str, Any]], Optional[str]]]:
+    results = []
+    for icao in icaos:
+        try:
+            results.append((icao, _worker_computer.aip_update(icao), None))
+        except Exception as e:
+            results.append((icao, None, str(e)))
+    return results
+
+
+@dataclass
+class _AirportPlan:
+    """What build() will do for one airport, decided before any writes."""
+
+    icao: str
+    action: str  # "skip", "fees_only" or "process"
+    reviews: List[RawReview]
+    fee_data: Optional[Dict[str, Any]] = None
+    error: Optional[Exception] = None
+    extractions: Optional["Future[List[ReviewExtraction]]"] = None
+
+
 class GAFriendlinessBuilder:
     """
     Main pipeline orchestrator for building GA friendliness data.
@@ -59,6 +327,15 @@ class GAFriendlinessBuilder:
         - Resume capability (continue from last successful airport)
         - Configurable failure handling
         - LLM usage tracking
+        - Persistent LLM result cache (unchanged reviews/tag sets cost no tokens)
+        - Extraction for upcoming airports overlaps with processing of the
+          current one; storage writes stay sequential in sorted ICAO order
+        - Parallel mode (build_workers > 1): per-airport computation fans out
+          to a process pool; results are written in order by the calling
+          thread (the single writer)
+        - Writes are buffered (GAMetaStorage.batch_writer) and flushed every
+          write_batch_size airports in one transaction under the build
+          PRAGMA profile (WAL, synchronous=NORMAL)
     """
 
     def __init__(
@@ -105,6 +382,9 @@ class GAFriendlinessBuilder:
             ) if HAS_REVIEW_AGENT else None
         )
         self._summarizer = summarizer
+        self._llm_cache: Optional[LLMResultCache] = None
+        self._uncommitted_airports = 0
+        self._writer: Optional[Any] = None  # Storage batch writer during build()
         
         # Feature mapper
         self.feature_mapper = FeatureMapper(ontology=self.ontology)
@@ -119,6 +399,14 @@ class GAFriendlinessBuilder:
             self._storage = GAMetaStorage(self.settings.ga_meta_db_path)
         return self._storage
 
+    @property
+    def llm_cache(self) -> Optional[LLMResultCache]:
+        """Get or create the LLM result cache (None when disabled)."""
+        if self._llm_cache is None and self.settings.llm_cache_enabled:
+            path = self.settings.llm_cache_path or (self.settings.cache_dir / "llm_cache.sqlite")
+            self._llm_cache = LLMResultCache(path)
+        return self._llm_cache
+
     @property
     def extractor(self) -> Any:
         """Get or create extractor instance."""
@@ -130,6 +418,10 @@ class GAFriendlinessBuilder:
                 api_key=self.settings.llm_api_key,
                 max_retries=self.settings.llm_max_retries,
                 mock_llm=self.settings.use_mock_llm,
+                max_concurrency=self.settings.llm_concurrency,
+                requests_per_minute=self.settings.llm_requests_per_minute,
+                pack_size=self.settings.llm_pack_reviews,
+                cache=self.llm_cache,
             )
         return self._extractor
 
@@ -142,6 +434,7 @@ class GAFriendlinessBuilder:
                 llm_temperature=self.settings.llm_temperature + 0.3,  # Slightly higher
                 api_key=self.settings.llm_api_key,
                 mock_llm=self.settings.use_mock_llm,
+                cache=self.llm_cache,
             )
         return self._summarizer
 
@@ -169,6 +462,9 @@ class GAFriendlinessBuilder:
             BuildResult with metrics and status
         """
         self._metrics = BuildMetrics(start_time=datetime.now(timezone.utc))
+        self._uncommitted_airports = 0
+        cache_hits_before = self._llm_cache.hits if self._llm_cache else 0
+        cache_misses_before = self._llm_cache.misses if self._llm_cache else 0
         
         try:
             # Get airports to process
@@ -201,107 +497,35 @@ class GAFriendlinessBuilder:
             # Process each airport
             failure_mode = FailureMode(self.settings.failure_mode)
             
-            with self.storage:
-                for icao in airports_to_process_list:
-                    try:
-                        # Get reviews for this airport
-                        reviews = review_source.get_reviews_for_icao(icao)
-                        
-                        # Check for fee data availability (even if no reviews)
-                        fee_data = None
-                        has_fee_data = False
-                        if hasattr(review_source, "get_fee_data"):
-                            fee_data = review_source.get_fee_data(icao)
-                            has_fee_data = fee_data is not None
-                        elif isinstance(review_source, AirfieldDirectorySource):
-                            airport_data = review_source.get_airport_data(icao)
-                            if airport_data and "aerops" in airport_data:
-                                # Parse fee data for comparison
-                                aerops = airport_data.get("aerops", {})
-                                if isinstance(aerops, dict) and "landing_fees" in aerops:
-                                    # Convert to fee_data format for comparison
-                                    fee_data = {
-                                        "currency": aerops.get("currency", "EUR"),
-                                        "fees_last_changed": aerops.get("fees_last_changed"),
-                                        "bands": aggregate_fees_by_band(aerops),
-                                    }
-                                    has_fee_data = True
-                        
-                        # Check if airport has any data to process
-                        has_data_to_process = (
-                            len(reviews) > 0  # Has reviews
-                            or has_fee_data  # Has fee data
-                            or airports_db is not None  # Can get AIP data
-                        )
-                        
-                        if not has_data_to_process:
-                            self._metrics.skipped_airports += 1
-                            logger.debug(f"Skipping {icao}: no reviews, no fees, no AIP data source")
-                            continue
-                        
-                        # Check for changes if incremental
-                        review_changes = False
-                        fee_changes = False
-                        
-                        if incremental:
-                            if reviews:
-                                review_changes = self.storage.has_changes(icao, reviews, since)
-                            
-                            if fee_data:
-                                fee_changes = self.storage.has_fee_changes(icao, fee_data)
-                            
-                            # If neither reviews nor fees changed, skip
-                            if not review_changes and not fee_changes:
-                                self._metrics.skipped_airports += 1
-                                continue
-                            
-                            # If only fees changed (and no reviews), update fees only
-                            if not review_changes and fee_changes:
-                                logger.info(f"Updating fees only for {icao} (no reviews or reviews unchanged)")
-                                if fee_data:
-                                    # Check if airport exists in DB, if not we need full processing
-                                    existing_stats = self.storage.get_airfield_stats(icao)
-                                    if existing_stats is not None:
-                                        self.storage.update_fees_only(icao, fee_data)
-                                        self._metrics.successful_airports += 1
-                                    else:
-                                        # New airport with fees only, do full processing
-                                        logger.info(f"Processing new airport {icao} with fees but no reviews")
-                                        self._process_airport(icao, reviews, review_source, airports_db)
-                                        self._metrics.successful_airports += 1
-                                        self._metrics.total_reviews += len(reviews)
-                                else:
-                                    # Should not happen, but handle gracefully
-                                    continue
-                                # Track progress for resume
-                                self.storage.set_last_successful_icao(icao)
-                                continue
-                        
-                        # Process airport (reviews changed, or full processing)
-                        # This handles: airports with reviews, airports with fees but no reviews,
-                        # and airports with AIP data but no reviews
-                        if not reviews:
-                            logger.info(f"Processing {icao} with fees/AIP data but no reviews")
-                        
-                        self._process_airport(icao, reviews, review_source, airports_db)
-                        
-                        self._metrics.successful_airports += 1
-                        self._metrics.total_reviews += len(reviews)
-                        
-                        # Track progress for resume
-                        self.storage.set_last_successful_icao(icao)
-                        
-                    except Exception as e:
-                        self._metrics.failed_airports += 1
-                        self._metrics.errors.append(f"{icao}: {str(e)}")
-                        
-                        logger.error(f"Airport {icao} processing failed: {e}")
-                        
-                        if failure_mode == FailureMode.FAIL_FAST:
-                            raise BuildError(f"Failed processing {icao}: {e}")
-                        elif failure_mode == FailureMode.SKIP:
-                            continue
-                        # CONTINUE: log and continue
+            prefetch = self.settings.llm_concurrency if self.extractor else 0
+            pool = ThreadPoolExecutor(max_workers=prefetch) if prefetch > 1 else None
+            computer = self._make_computer(airports_db)
+            processes = self._make_process_pool(computer, airports_db)
+            # Airports computed ahead of the writer when running in parallel
+            window_size = 2 * self.settings.build_workers if processes is not None else 0
+            
+            with self.storage.build_profile(), self.storage, self.storage.batch_writer() as writer:
+                self._writer = writer
+                try:
+                    plans = self._plan_airports(
+                        airports_to_process_list, review_source, incremental, since,
+                        airports_db, pool, lookahead=prefetch,
+                    )
+                    window: deque = deque()
+                    for plan in plans:
+                        window.append((plan, self._submit_compute(plan, review_source, processes)))
+                        if len(window) > window_size:
+                            self._execute_plan(
+                                *window.popleft(), review_source, computer, failure_mode
+                            )
+                    while window:
+                        self._execute_plan(*window.popleft(), review_source, computer, failure_mode)
+                finally:
+                    if pool is not None:
+                        pool.shutdown(wait=True, cancel_futures=True)
+                    if processes is not None:
+                        processes.shutdown(wait=True, cancel_futures=True)
+                    self._writer = None
                 
                 # Store build metadata
                 self._store_build_metadata()
@@ -310,6 +534,9 @@ class GAFriendlinessBuilder:
             self._metrics.duration_seconds = (
                 self._metrics.end_time - self._metrics.start_time
             ).total_seconds()
+            if self._llm_cache is not None:
+                self._metrics.llm_cache_hits = self._llm_cache.hits - cache_hits_before
+                self._metrics.llm_cache_misses = self._llm_cache.misses - cache_misses_before
             
             logger.info(
                 f"Build completed: {self._metrics.successful_airports} successful, "
@@ -339,106 +566,268 @@ class GAFriendlinessBuilder:
                 output_db_path=str(self.settings.ga_meta_db_path),
             )
 
-    def _process_airport(
+    def _get_fee_data(self, icao: str, review_source: ReviewSource) -> Optional[Dict[str, Any]]:
+        """Fee data for an airport from the review source, if it provides any."""
+        if hasattr(review_source, "get_fee_data"):
+            return review_source.get_fee_data(icao)
+        if isinstance(review_source, AirfieldDirectorySource):
+            airport_data = review_source.get_airport_data(icao)
+            if airport_data and "aerops" in airport_data:
+                # Parse fee data for comparison
+                aerops = airport_data.get("aerops", {})
+                if isinstance(aerops, dict) and "landing_fees" in aerops:
+                    # Convert to fee_data format for comparison
+                    return {
+                        "currency": aerops.get("currency", "EUR"),
+                        "fees_last_changed": aerops.get("fees_last_changed"),
+                        "bands": aggregate_fees_by_band(aerops),
+                    }
+        return None
+
+    def _plan_airport(
         self,
         icao: str,
-        reviews: List[RawReview],
-        source: ReviewSource,
-        airports_db: Optional[AirportsDatabaseSource] = None,
-    ) -> None:
+        review_source: ReviewSource,
+        incremental: bool,
+        since: Optional[datetime],
+        airports_db: Optional[AirportsDatabaseSource],
+    ) -> _AirportPlan:
+        """Decide whether an airport is skipped, fee-updated or fully processed."""
+        try:
+            # Get reviews for this airport
+            reviews = review_source.get_reviews_for_icao(icao)
+            
+            # Check for fee data availability (even if no reviews)
+            fee_data = self._get_fee_data(icao, review_source)
+            
+            # Check if airport has any data to process
+            has_data_to_process = (
+                len(reviews) > 0  # Has reviews
+                or fee_data is not None  # Has fee data
+                or airports_db is not None  # Can get AIP data
+            )
+            
+            if not has_data_to_process:
+                logger.debug(f"Skipping {icao}: no reviews, no fees, no AIP data source")
+                return _AirportPlan(icao, "skip", reviews, fee_data)
+            
+            # Check for changes if incremental
+            if incremental:
+                review_changes = bool(reviews) and self.storage.has_changes(icao, reviews, since)
+                fee_changes = bool(fee_data) and self.storage.has_fee_changes(icao, fee_data)
+                
+                # If neither reviews nor fees changed, skip
+                if not review_changes and not fee_changes:
+                    return _AirportPlan(icao, "skip", reviews, fee_data)
+                
+                # If only fees changed (and no reviews), update fees only
+                if not review_changes and fee_changes:
+                    return _AirportPlan(icao, "fees_only", reviews, fee_data)
+            
+            return _AirportPlan(icao, "process", reviews, fee_data)
+        except Exception as e:
+            return _AirportPlan(icao, "process", [], error=e)
+
+    def _plan_airports(
+        self,
+        icaos: List[str],
+        review_source: ReviewSource,
+        incremental: bool,
+        since: Optional[datetime],
+        airports_db: Optional[AirportsDatabaseSource],
+        pool: Optional[ThreadPoolExecutor],
+        lookahead: int = 0,
+    ) -> Iterator[_AirportPlan]:
         """
-        Process a single airport's reviews.
+        Yield airport plans in order, extracting reviews up to `lookahead`
+        airports ahead on `pool` while the caller writes the current one.
         
-        Pipeline:
-            1. Extract tags from reviews
-            2. Aggregate tags into distributions
-            3. Map distributions to feature scores
-            4. Get airport metadata from airports.db (if available)
-            5. Generate summary
-            6. Write to database
+        Planning reads storage but never writes it; all writes happen in the
+        caller, in order, so resume checkpoints stay exact.
         """
-        logger.debug(f"Processing airport {icao} with {len(reviews)} reviews")
-        
-        # Extract tags
-        extractions = []
-        if self.extractor:
-            review_data = [
-                (r.review_text, r.review_id, r.timestamp)
-                for r in reviews
-            ]
-            extractions = self.extractor.extract_batch(review_data)
-            
-            # Filter by ontology
-            extractions = [
-                self.ontology_manager.filter_extraction(
-                    e, confidence_threshold=self.settings.confidence_threshold
-                )
-                for e in extractions
-            ]
-            
-            self._metrics.total_extractions += len(extractions)
+        pending: deque = deque()
+        remaining = iter(icaos)
         
-        # Aggregate tags
-        distributions = {}
-        if self._aggregator and extractions:
-            distributions, context = self._aggregator.aggregate_tags(extractions)
+        def fill() -> None:
+            while len(pending) <= lookahead:
+                icao = next(remaining, None)
+                if icao is None:
+                    return
+                plan = self._plan_airport(icao, review_source, incremental, since, airports_db)
+                if pool is not None and plan.action == "process" and plan.error is None and plan.reviews:
+                    plan.extractions = pool.submit(self._extract_reviews, plan.reviews)
+                pending.append(plan)
         
-        # Get airport metadata from euro_aip (IFR score, hotel, restaurant)
-        aip_ifr_available = 0  # Default: IFR not available
-        aip_night_available = 0  # Default: not available
-        aip_hotel_info = None  # 0=unknown, 1=vicinity, 2=at_airport
-        aip_restaurant_info = None  # 0=unknown, 1=vicinity, 2=at_airport
-        aip_data = {}  # For AIP feature computation
+        fill()
+        while pending:
+            plan = pending.popleft()
+            fill()
+            yield plan
 
-        if airports_db:
-            try:
-                # Get euro_aip Airport object
-                airport = airports_db.get_airport(icao)
-                if airport:
-                    # Compute IFR score from procedures
-                    # Get IFR permitted field (std_field_id=207) if available
-                    ifr_permitted_text = None
-                    for entry in airport.aip_entries:
-                        if entry.std_field_id == 207:
-                            ifr_permitted_text = entry.value
-                            break
-
-                    aip_ifr_available = compute_aip_ifr_score(
-                        airport.procedures, ifr_permitted_text
-                    )
-                    aip_night_available = compute_aip_night_available()
-
-                    # Parse hospitality text fields
-                    # Hotel: std_field_id = 501
-                    # Restaurant: std_field_id = 502
-                    for entry in airport.aip_entries:
-                        if entry.std_field_id == 501:  # Hotels
-                            aip_hotel_info = parse_hospitality_text_to_int(entry.value)
-                        elif entry.std_field_id == 502:  # Restaurants
-                            aip_restaurant_info = parse_hospitality_text_to_int(entry.value)
-
-                    # Prepare AIP data for feature computation
-                    aip_data = {
-                        "aip_ifr_available": aip_ifr_available,
-                        "aip_hotel_info": aip_hotel_info,
-                        "aip_restaurant_info": aip_restaurant_info,
-                    }
-            except Exception as e:
-                logger.warning(f"Failed to get euro_aip metadata for {icao}: {e}")
+    def _make_computer(self, airports_db: Optional[AirportsDatabaseSource]) -> _AirportComputer:
+        return _AirportComputer(
+            ontology_manager=self.ontology_manager,
+            feature_mapper=self.feature_mapper,
+            aggregator=self._aggregator,
+            confidence_threshold=self.settings.confidence_threshold,
+            source_version=self.settings.source_version,
+            scoring_version=self.settings.scoring_version,
+            airports_db=airports_db,
+        )
 
-        # Compute review-derived feature scores
-        review_feature_scores = self.feature_mapper.compute_review_feature_scores(
-            icao=icao,
-            distributions=distributions,
+    def _make_process_pool(
+        self,
+        computer: _AirportComputer,
+        airports_db: Optional[AirportsDatabaseSource],
+    ) -> Optional[ProcessPoolExecutor]:
+        """Worker processes for per-airport computation (None = in-process)."""
+        workers = self.settings.build_workers
+        if workers <= 1:
+            return None
+        airports_db_path = str(airports_db.db_path) if airports_db is not None else None
+        return ProcessPoolExecutor(
+            max_workers=workers,
+            # spawn: workers must not inherit LLM threads or sqlite handles
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(replace(computer, airports_db=None), airports_db_path),
         )
 
-        # Compute AIP-derived feature scores
-        aip_feature_scores = self.feature_mapper.compute_aip_feature_scores(
+    def _make_task(
+        self,
+        icao: str,
+        reviews: List[RawReview],
+        source: ReviewSource,
+        extractions: Optional[List[ReviewExtraction]] = None,
+    ) -> _AirportTask:
+        """Gather LLM extractions and fee data (main process) for one airport."""
+        if self.extractor:
+            if extractions is None:
+                extractions = self._extract_reviews(reviews)
+        else:
+            extractions = None
+        fee_bands, fee_currency, fee_last_updated = self._fee_fields(icao, source)
+        return _AirportTask(
             icao=icao,
-            aip_data=aip_data,
+            reviews=reviews,
+            extractions=extractions,
+            fee_bands=fee_bands,
+            fee_currency=fee_currency,
+            fee_last_updated=fee_last_updated,
         )
+
+    def _submit_compute(
+        self,
+        plan: _AirportPlan,
+        source: ReviewSource,
+        processes: Optional[ProcessPoolExecutor],
+    ) -> Optional["Future[_AirportRecord]"]:
+        """Start computing a planned airport in a worker process (parallel mode only)."""
+        if processes is None or plan.action != "process" or plan.error is not None:
+            return None
+        try:
+            extractions = plan.extractions.result() if plan.extractions is not None else None
+            task = self._make_task(plan.icao, plan.reviews, source, extractions)
+            return processes.submit(_compute_in_worker, task)
+        except Exception as e:
+            # Surface the error when the writer reaches this airport
+            failed: Future = Future()
+            failed.set_exception(e)
+            return failed
+
+    @property
+    def _out(self) -> Any:
+        """Where airport rows go: the build's batch writer, else storage."""
+        return self._writer if self._writer is not None else self.storage
+
+    def _checkpoint(self) -> None:
+        """Flush and commit once write_batch_size airports have been written."""
+        self._uncommitted_airports += 1
+        if self._uncommitted_airports >= self.settings.write_batch_size:
+            if self._writer is not None:
+                self._writer.flush()
+            self.storage.commit()
+            self._uncommitted_airports = 0
+
+    def _execute_plan(
+        self,
+        plan: _AirportPlan,
+        record_future: Optional["Future[_AirportRecord]"],
+        review_source: ReviewSource,
+        computer: _AirportComputer,
+        failure_mode: FailureMode,
+    ) -> None:
+        """Apply one airport plan to storage and update metrics."""
+        icao = plan.icao
+        if plan.action == "skip":
+            self._metrics.skipped_airports += 1
+            return
         
-        # Get fee data if source supports it
+        try:
+            if plan.error is not None:
+                raise plan.error
+            
+            reviews = plan.reviews
+            if plan.action == "fees_only":
+                logger.info(f"Updating fees only for {icao} (no reviews or reviews unchanged)")
+                # Check if airport exists in DB, if not we need full processing
+                existing_stats = self.storage.get_airfield_stats(icao)
+                if existing_stats is not None:
+                    self.storage.update_fees_only(icao, plan.fee_data)
+                    self._metrics.successful_airports += 1
+                else:
+                    # New airport with fees only, do full processing
+                    logger.info(f"Processing new airport {icao} with fees but no reviews")
+                    self._write_record(computer.compute(self._make_task(icao, reviews, review_source)))
+                    self._metrics.successful_airports += 1
+                    self._metrics.total_reviews += len(reviews)
+                # Track progress for resume
+                self._out.set_last_successful_icao(icao)
+                self._checkpoint()
+                return
+            
+            # Process airport (reviews changed, or full processing)
+            # This handles: airports with reviews, airports with fees but no reviews,
+            # and airports with AIP data but no reviews
+            if not reviews:
+                logger.info(f"Processing {icao} with fees/AIP data but no reviews")
+            
+            if record_future is not None:
+                record = record_future.result()
+            else:
+                extractions = plan.extractions.result() if plan.extractions is not None else None
+                record = computer.compute(self._make_task(icao, reviews, review_source, extractions))
+            self._write_record(record)
+            
+            self._metrics.successful_airports += 1
+            self._metrics.total_reviews += len(reviews)
+            
+            # Track progress for resume
+            self._out.set_last_successful_icao(icao)
+            self._checkpoint()
+            
+        except Exception as e:
+            self._metrics.failed_airports += 1
+            self._metrics.errors.append(f"{icao}: {str(e)}")
+            
+            logger.error(f"Airport {icao} processing failed: {e}")
+            
+            if failure_mode == FailureMode.FAIL_FAST:
+                raise BuildError(f"Failed processing {icao}: {e}")
+            # SKIP / CONTINUE: log and continue
+
+    def _extract_reviews(self, reviews: List[RawReview]) -> List[ReviewExtraction]:
+        """Run the extractor over an airport's reviews (safe to call off-thread)."""
+        review_data = [
+            (r.review_text, r.review_id, r.timestamp)
+            for r in reviews
+        ]
+        return self.extractor.extract_batch(review_data)
+
+    def _fee_fields(
+        self, icao: str, source: ReviewSource
+    ) -> Tuple[Dict[str, Optional[float]], str, Optional[str]]:
+        """Fee bands, currency and last-changed date from the source, if supported."""
         fee_bands: Dict[str, Optional[float]] = {}
         fee_currency = "EUR"  # Default
         fee_last_updated = None
@@ -462,63 +851,33 @@ class GAFriendlinessBuilder:
             if airport_data and "aerops" in airport_data:
                 fee_bands = aggregate_fees_by_band(airport_data["aerops"])
         
-        # Compute rating stats
-        ratings = [r.rating for r in reviews if r.rating is not None]
-        rating_avg = sum(ratings) / len(ratings) if ratings else None
-        rating_count = len(ratings)
-        
-        # Get last review timestamp
-        timestamps = [r.timestamp for r in reviews if r.timestamp]
-        last_review = max(timestamps) if timestamps else None
+        return fee_bands, fee_currency, fee_last_updated
+
+    def _write_record(self, record: _AirportRecord) -> None:
+        """Write one airport's computed rows and summary to storage."""
+        stats = record.stats
+        icao = stats.icao
+        extractions = record.extractions
+        self._metrics.total_extractions += record.extraction_count
         
-        # Build airport stats
-        stats = AirportStats(
-            icao=icao,
-            rating_avg=rating_avg,
-            rating_count=rating_count,
-            last_review_utc=last_review,
-            fee_band_0_749kg=fee_bands.get("fee_band_0_749kg"),
-            fee_band_750_1199kg=fee_bands.get("fee_band_750_1199kg"),
-            fee_band_1200_1499kg=fee_bands.get("fee_band_1200_1499kg"),
-            fee_band_1500_1999kg=fee_bands.get("fee_band_1500_1999kg"),
-            fee_band_2000_3999kg=fee_bands.get("fee_band_2000_3999kg"),
-            fee_band_4000_plus_kg=fee_bands.get("fee_band_4000_plus_kg"),
-            fee_currency=fee_currency,
-            fee_last_updated_utc=fee_last_updated,
-            aip_ifr_available=aip_ifr_available,
-            aip_night_available=aip_night_available,
-            aip_hotel_info=aip_hotel_info,
-            aip_restaurant_info=aip_restaurant_info,
-            review_cost_score=review_feature_scores.get("review_cost_score"),
-            review_hassle_score=review_feature_scores.get("review_hassle_score"),
-            review_review_score=review_feature_scores.get("review_review_score"),
-            review_ops_ifr_score=review_feature_scores.get("review_ops_ifr_score"),
-            review_ops_vfr_score=review_feature_scores.get("review_ops_vfr_score"),
-            review_access_score=review_feature_scores.get("review_access_score"),
-            review_fun_score=review_feature_scores.get("review_fun_score"),
-            review_hospitality_score=review_feature_scores.get("review_hospitality_score"),
-            aip_ops_ifr_score=aip_feature_scores.get("aip_ops_ifr_score"),
-            aip_hospitality_score=aip_feature_scores.get("aip_hospitality_score"),
-            source_version=self.settings.source_version,
-            scoring_version=self.settings.scoring_version,
-        )
+        out = self._out
         
         # Write to database
-        self.storage.write_airfield_stats(stats)
+        out.write_airfield_stats(stats)
         
         # Write review tags
         if extractions:
-            self.storage.write_review_tags(icao, extractions)
+            out.write_review_tags(icao, extractions)
         
         # Generate and store summary
         if self.summarizer and extractions:
             summary_text, tags = self.summarizer.generate_summary(
                 icao, extractions, stats
             )
-            self.storage.write_review_summary(icao, summary_text, tags)
+            out.write_review_summary(icao, summary_text, tags)
         
         # Update last processed timestamp
-        self.storage.update_last_processed_timestamp(
+        out.update_last_processed_timestamp(
             icao, datetime.now(timezone.utc)
         )
 
@@ -548,6 +907,7 @@ class GAFriendlinessBuilder:
             BuildResult with metrics and status
         """
         self._metrics = BuildMetrics(start_time=datetime.now(timezone.utc))
+        self._uncommitted_airports = 0
 
         try:
             # Get list of airports to process
@@ -567,61 +927,17 @@ class GAFriendlinessBuilder:
             inserted_count = 0
             updated_count = 0
 
-            with self.storage:
-                for icao in airports_sorted:
+            with self.storage.build_profile(), self.storage:
+                for icao, fields, error in self._iter_aip_updates(airports_sorted, airports_db):
                     try:
-                        # Get AIP data for this airport
-                        airport = airports_db.get_airport(icao)
-                        if not airport:
+                        if error is not None:
+                            raise BuildError(error)
+                        if fields is None:
                             self._metrics.skipped_airports += 1
                             continue
 
-                        # Extract AIP fields
-                        aip_ifr_available = 0
-                        aip_night_available = 0
-                        aip_hotel_info = None
-                        aip_restaurant_info = None
-
-                        # Get IFR permitted field (std_field_id=207)
-                        ifr_permitted_text = None
-                        for entry in airport.aip_entries:
-                            if entry.std_field_id == 207:
-                                ifr_permitted_text = entry.value
-                                break
-
-                        aip_ifr_available = compute_aip_ifr_score(
-                            airport.procedures, ifr_permitted_text
-                        )
-                        aip_night_available = compute_aip_night_available()
-
-                        # Parse hospitality fields
-                        for entry in airport.aip_entries:
-                            if entry.std_field_id == 501:  # Hotels
-                                aip_hotel_info = parse_hospitality_text_to_int(entry.value)
-                            elif entry.std_field_id == 502:  # Restaurants
-                                aip_restaurant_info = parse_hospitality_text_to_int(entry.value)
-
-                        # Compute AIP feature scores
-                        aip_data = {
-                            "aip_ifr_available": aip_ifr_available,
-                            "aip_hotel_info": aip_hotel_info,
-                            "aip_restaurant_info": aip_restaurant_info,
-                        }
-                        aip_feature_scores = self.feature_mapper.compute_aip_feature_scores(
-                            icao=icao,
-                            aip_data=aip_data,
-                        )
-
                         # Upsert to database
-                        was_inserted = self.storage.upsert_aip_only(
-                            icao=icao,
-                            aip_ifr_available=aip_ifr_available,
-                            aip_night_available=aip_night_available,
-                            aip_hotel_info=aip_hotel_info,
-                            aip_restaurant_info=aip_restaurant_info,
-                            aip_ops_ifr_score=aip_feature_scores.get("aip_ops_ifr_score"),
-                            aip_hospitality_score=aip_feature_scores.get("aip_hospitality_score"),
-                        )
+                        was_inserted = self.storage.upsert_aip_only(icao=icao, **fields)
 
                         if was_inserted:
                             inserted_count += 1
@@ -629,6 +945,7 @@ class GAFriendlinessBuilder:
                             updated_count += 1
 
                         self._metrics.successful_airports += 1
+                        self._checkpoint()
 
                     except Exception as e:
                         self._metrics.failed_airports += 1
@@ -671,6 +988,36 @@ class GAFriendlinessBuilder:
                 output_db_path=str(self.settings.ga_meta_db_path),
             )
 
+    def _iter_aip_updates(
+        self,
+        icaos: List[str],
+        airports_db: AirportsDatabaseSource,
+    ) -> Iterator[Tuple[str, Optional[Dict[str, Any]], Optional[str]]]:
+        """
+        Yield (icao, upsert fields or None, error or None) in input order.
+        
+        With build_workers > 1, chunks of airports are computed in worker
+        processes; no LLM is involved, so this scales with cores.
+        """
+        computer = self._make_computer(airports_db)
+        processes = self._make_process_pool(computer, airports_db)
+        if processes is None:
+            for icao in icaos:
+                try:
+                    yield icao, computer.aip_update(icao), None
+                except Exception as e:
+                    yield icao, None, str(e)
+            return
+
+        workers = self.settings.build_workers
+        chunk_size = max(1, min(200, len(icaos) // (workers * 4) or 1))
+        chunks = [icaos[i:i + chunk_size] for i in range(0, len(icaos), chunk_size)]
+        try:
+            for results in processes.map(_aip_update_chunk, chunks):
+                yield from results
+        finally:
+            processes.shutdown(wait=True, cancel_futures=True)
+
     def _store_build_metadata(self) -> None:
         """Store build metadata in ga_meta_info."""
         now = datetime.now(timezone.utc).isoformat()
@@ -689,4 +1036,7 @@ class GAFriendlinessBuilder:
         """Clean up resources."""
         if self._storage:
             self._storage.close()
+        if self._llm_cache:
+            self._llm_cache.close()
+            self._llm_cache = None
 
@@ -1,16 +1,21 @@
 """
 Caching utility for remote data sources.
 
-Provides caching for JSON data to avoid repeated downloads/processing.
+Provides caching for JSON data to avoid repeated downloads/processing,
+and a content-hash cache for LLM results.
 """
 
 import gzip
+import hashlib
 import json
 import logging
+import sqlite3
+import threading
 from abc import ABC, abstractmethod
-from datetime import datetime, timedelta
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Optional, Tuple
+from typing import Any, Dict, Iterable, Optional, Tuple
 
 from .exceptions import CacheError
 
@@ -114,6 +119,38 @@ class CachedDataLoader(ABC):
         except Exception as e:
             raise CacheError(f"Failed to save to cache: {e}")
 
+    def _get_validators_file(self, key: str) -> Path:
+        """HTTP validators (ETag/Last-Modified) stored next to a cache entry."""
+        return self._get_cache_file(key, "validators.json")
+
+    def _load_validators(self, key: str) -> Dict[str, str]:
+        """Validators saved for a cache entry (empty if none)."""
+        validators_file = self._get_validators_file(key)
+        if not validators_file.exists():
+            return {}
+        try:
+            with open(validators_file, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable validators for {key}: {e}")
+            return {}
+
+    def _save_validators(self, key: str, validators: Dict[str, str]) -> None:
+        """Save validators for a cache entry (removes stale ones if empty)."""
+        validators_file = self._get_validators_file(key)
+        try:
+            if validators:
+                with open(validators_file, "w", encoding="utf-8") as f:
+                    json.dump(validators, f)
+            elif validators_file.exists():
+                validators_file.unlink()
+        except OSError as e:
+            raise CacheError(f"Failed to save validators: {e}")
+
+    def _touch_cache(self, key: str, ext: str = "json") -> None:
+        """Mark a cache entry as fresh (e.g. after 304 Not Modified)."""
+        self._get_cache_file(key, ext).touch()
+
     def _load_from_cache(self, key: str, ext: str = "json") -> Any:
         """Load data from cache."""
         cache_file = self._get_cache_file(key, ext)
@@ -191,7 +228,7 @@ class CachedDataLoader(ABC):
         """
         if key:
             # Clear specific key
-            for ext in ["json", "json.gz"]:
+            for ext in ["json", "json.gz", "validators.json"]:
                 cache_file = self._get_cache_file(key, ext)
                 if cache_file.exists():
                     cache_file.unlink()
@@ -220,3 +257,194 @@ class CachedDataLoader(ABC):
             "age_days": (datetime.now() - datetime.fromtimestamp(stat.st_mtime)).days,
         }
 
+
+
+def content_hash(*parts: Any) -> str:
+    """Stable SHA-256 hex digest of JSON-serializable parts."""
+    payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMResultCache:
+    """
+    Persistent content-addressed cache for LLM results.
+    
+    Entries are JSON values stored in SQLite under (kind, key), where the
+    key is a content hash of everything that determines the LLM output
+    (input text, ontology, prompt, model). Identical inputs therefore never
+    cost tokens twice, across builds. Safe to share between threads.
+
+    Optionally keeps recently used values in an in-memory LRU in front of
+    SQLite and buffers writes into one transaction per `flush_every` values
+    (call flush() or close() to commit the rest). INSERT OR REPLACE makes
+    concurrent writers to a shared file only race on identical values.
+    
+    Usage:
+        cache = LLMResultCache(Path("cache/ga_friendliness/llm_cache.sqlite"))
+        key = content_hash(review_text, ontology_version, prompt_version, model)
+        value = cache.get("extraction", key)
+        if value is None:
+            value = call_llm(...)
+            cache.set("extraction", key, value)
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        max_memory_entries: int = 0,
+        flush_every: int = 1,
+    ):
+        """
+        Initialize cache, creating the database if needed.
+        
+        Args:
+            db_path: SQLite file path (None = memory only, bounded by
+                max_memory_entries)
+            max_memory_entries: Values kept in memory before evicting the
+                least recently used (0 = no memory level)
+            flush_every: Buffered writes committed to disk in one
+                transaction (1 = commit on every set)
+        """
+        self.db_path = Path(db_path) if db_path else None
+        self.max_memory_entries = max_memory_entries
+        self.flush_every = max(1, flush_every)
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[Tuple[str, str], Any]" = OrderedDict()
+        # (kind, key) -> (JSON value, created_at), not yet committed
+        self._pending: Dict[Tuple[str, str], Tuple[str, str]] = {}
+        self._conn: Optional[sqlite3.Connection] = None
+        self.hits = 0
+        self.misses = 0
+        if self.db_path is None:
+            return
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=30)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS llm_cache (
+                    kind TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    PRIMARY KEY (kind, key)
+                )
+                """
+            )
+            self._conn.commit()
+        except sqlite3.Error as e:
+            raise CacheError(f"Failed to open LLM cache {self.db_path}: {e}")
+
+    def _remember(self, entry: Tuple[str, str], value: Any) -> None:
+        if self.max_memory_entries <= 0:
+            return
+        self._memory[entry] = value
+        self._memory.move_to_end(entry)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, kind: str, key: str) -> Optional[Any]:
+        """Cached value for (kind, key), or None."""
+        return self.get_many(kind, [key]).get(key)
+
+    def get_many(self, kind: str, keys: Iterable[str]) -> Dict[str, Any]:
+        """
+        Cached values for the keys that are present.
+
+        Memory misses are looked up with one SQL query per 500 keys; values
+        found on disk are promoted to memory.
+        """
+        keys = list(dict.fromkeys(keys))
+        found: Dict[str, Any] = {}
+        with self._lock:
+            missing = []
+            for key in keys:
+                entry = (kind, key)
+                if entry in self._memory:
+                    self._memory.move_to_end(entry)
+                    found[key] = self._memory[entry]
+                elif entry in self._pending:
+                    found[key] = json.loads(self._pending[entry][0])
+                else:
+                    missing.append(key)
+            if self._conn is not None:
+                for start in range(0, len(missing), 500):
+                    chunk = missing[start:start + 500]
+                    placeholders = ",".join("?" * len(chunk))
+                    rows = self._conn.execute(
+                        f"SELECT key, value FROM llm_cache WHERE kind = ? AND key IN ({placeholders})",
+                        [kind, *chunk],
+                    ).fetchall()
+                    for k, v in rows:
+                        found[k] = json.loads(v)
+                        self._remember((kind, k), found[k])
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        return found
+
+    def set(self, kind: str, key: str, value: Any) -> None:
+        """Store a value (overwrites any existing entry)."""
+        self.set_many(kind, {key: value})
+
+    def set_many(self, kind: str, items: Dict[str, Any]) -> None:
+        """Store several values (committed together once flush_every are buffered)."""
+        if not items:
+            return
+        now = datetime.now(timezone.utc).isoformat()
+        with self._lock:
+            for k, v in items.items():
+                self._remember((kind, k), v)
+                if self._conn is not None:
+                    self._pending[(kind, k)] = (json.dumps(v, ensure_ascii=False), now)
+            full = len(self._pending) >= self.flush_every
+        if full:
+            self.flush()
+
+    def flush(self) -> None:
+        """Commit buffered writes to the SQLite file."""
+        with self._lock:
+            if not self._pending or self._conn is None:
+                return
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO llm_cache (kind, key, value, created_at) VALUES (?, ?, ?, ?)",
+                [(kind, k, value, created) for (kind, k), (value, created) in self._pending.items()],
+            )
+            self._conn.commit()
+            self._pending = {}
+
+    def clear(self, kind: Optional[str] = None) -> None:
+        """Remove all entries, or only those of one kind."""
+        with self._lock:
+            for store in (self._memory, self._pending):
+                for entry in [e for e in store if not kind or e[0] == kind]:
+                    del store[entry]
+            if self._conn is None:
+                return
+            if kind:
+                self._conn.execute("DELETE FROM llm_cache WHERE kind = ?", (kind,))
+            else:
+                self._conn.execute("DELETE FROM llm_cache")
+            self._conn.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and entry counts per kind."""
+        self.flush()
+        with self._lock:
+            if self._conn is None:
+                counts: Dict[str, int] = {}
+                for kind, _ in self._memory:
+                    counts[kind] = counts.get(kind, 0) + 1
+            else:
+                counts = dict(self._conn.execute(
+                    "SELECT kind, COUNT(*) FROM llm_cache GROUP BY kind"
+                ).fetchall())
+        return {"hits": self.hits, "misses": self.misses, "entries": counts}
+
+    def close(self) -> None:
+        """Commit buffered writes and close the database connection."""
+        self.flush()
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
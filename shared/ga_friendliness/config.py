@@ -54,12 +54,33 @@ class GAFriendlinessSettings(BaseSettings):
         default=False, description="Use mock LLM for testing (ignores API key)"
     )
     llm_max_retries: int = Field(default=3, ge=1, description="Max LLM retry attempts")
+    llm_concurrency: int = Field(
+        default=4, ge=1, description="Max concurrent LLM extraction calls"
+    )
+    llm_requests_per_minute: Optional[float] = Field(
+        default=None, gt=0, description="LLM rate limit (None = unlimited)"
+    )
+    llm_pack_reviews: int = Field(
+        default=1, ge=1, description="Short reviews packed per LLM call (1 = no packing)"
+    )
+    llm_cache_enabled: bool = Field(
+        default=True, description="Reuse cached extractions/summaries for unchanged inputs"
+    )
+    llm_cache_path: Optional[Path] = Field(
+        default=None, description="LLM result cache file (default: <cache_dir>/llm_cache.sqlite)"
+    )
 
     # Processing settings
     confidence_threshold: float = Field(
         default=0.5, ge=0.0, le=1.0, description="Min confidence for tag inclusion"
     )
     batch_size: int = Field(default=50, ge=1, description="Reviews per LLM batch")
+    build_workers: int = Field(
+        default=1, ge=1, description="Processes for per-airport computation (1 = in-process)"
+    )
+    write_batch_size: int = Field(
+        default=100, ge=1, description="Airports written per storage transaction"
+    )
 
     # Time decay settings (disabled by default)
     enable_time_decay: bool = Field(
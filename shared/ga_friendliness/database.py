@@ -9,10 +9,20 @@ import sqlite3
 from pathlib import Path
 from typing import Optional
 
+from shared.change_log import install_change_log
+
 from .exceptions import StorageError
 
 # Current schema version
-SCHEMA_VERSION = "2.0"  # Major version bump: breaking schema changes (renamed fields, removed persona scores)
+SCHEMA_VERSION = "2.1"  # 2.1: change log for delta sync (see _install_change_logs)
+
+# Tables whose per-airport rows feed the GA summaries served to clients,
+# with columns that do not count as a change
+CHANGE_LOGGED_TABLES = {
+    "ga_airfield_stats": [],
+    "ga_review_summary": ["last_updated_utc"],
+    "ga_aip_rule_summary": ["last_updated_utc"],
+}
 
 
 def get_schema_version(conn: sqlite3.Connection) -> Optional[str]:
@@ -45,6 +55,7 @@ def create_schema(conn: sqlite3.Connection) -> None:
         - ga_meta_info (versioning metadata)
         - ga_notification_requirements (AIP notification rules, optional)
         - ga_aip_rule_summary (AIP rule summaries, optional)
+        - data_changes (change log of the summary tables, see shared/change_log.py)
     """
     cursor = conn.cursor()
 
@@ -228,6 +239,8 @@ def create_schema(conn: sqlite3.Connection) -> None:
         ON ga_notification_requirements(icao, weekday_start, weekday_end)
     """)
 
+    _install_change_logs(conn)
+
     # Set schema version
     cursor.execute("""
         INSERT OR REPLACE INTO ga_meta_info (key, value)
@@ -237,6 +250,12 @@ def create_schema(conn: sqlite3.Connection) -> None:
     conn.commit()
 
 
+def _install_change_logs(conn: sqlite3.Connection) -> None:
+    """Log airports whose GA summary inputs change (delta sync for clients)."""
+    for table, ignore_columns in CHANGE_LOGGED_TABLES.items():
+        install_change_log(conn, table, ignore_columns=ignore_columns)
+
+
 def migrate_schema(
     conn: sqlite3.Connection,
     from_version: str,
@@ -255,7 +274,7 @@ def migrate_schema(
     """
     # Define migration paths
     migrations = {
-        # ("1.0", "1.1"): _migrate_1_0_to_1_1,
+        ("2.0", "2.1"): _install_change_logs,
     }
 
     # Build migration path
@@ -6,7 +6,7 @@ Maps label distributions to normalized feature scores [0, 1].
 
 import logging
 import re
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 from .exceptions import FeatureMappingError
 from .models import (
@@ -191,40 +191,49 @@ def compute_aip_ifr_score(
 
     # IFR is permitted, now check for approach procedures
     # Filter for approach procedures only
-    approaches = [
-        p for p in procedures
+    approach_types = {
+        (p.approach_type.upper() if hasattr(p, 'approach_type') and p.approach_type else '')
+        for p in procedures
         if hasattr(p, 'procedure_type') and p.procedure_type.lower() == 'approach'
-    ]
+    }
+    return compute_aip_ifr_score_from_approach_types(approach_types, ifr_permitted_field)
+
+
+def compute_aip_ifr_score_from_approach_types(
+    approach_types: Set[str],
+    ifr_permitted_field: Optional[str] = None,
+) -> int:
+    """
+    Compute IFR capability score from the approach types of an airport.
+
+    Same scoring as compute_aip_ifr_score, for callers that have the
+    distinct approach types instead of Procedure objects (see
+    AirportsDatabaseSource.get_aip_data).
+
+    Args:
+        approach_types: Upper-case approach types of the airport's approach
+            procedures, "" for an approach without a type
+        ifr_permitted_field: Value from AIP field 207 ("IFR", "VFR/IFR", "VFR", or None)
+
+    Returns:
+        IFR score from 0 to 4, as compute_aip_ifr_score
+    """
+    if not ifr_permitted_field or 'IFR' not in ifr_permitted_field.strip().upper():
+        return 0  # VFR only
 
-    if not approaches:
+    if not approach_types:
         return 1  # IFR permitted but no published procedures
 
     # Check for ILS (highest precision)
-    has_ils = any(
-        hasattr(p, 'approach_type') and p.approach_type and p.approach_type.upper() == 'ILS'
-        for p in approaches
-    )
-    if has_ils:
+    if 'ILS' in approach_types:
         return 4
 
     # Check for RNP/RNAV
-    has_rnp_rnav = any(
-        hasattr(p, 'approach_type') and p.approach_type and p.approach_type.upper() in ['RNP', 'RNAV']
-        for p in approaches
-    )
-    if has_rnp_rnav:
+    if approach_types & {'RNP', 'RNAV'}:
         return 3
 
-    # Check for non-precision approaches (VOR, NDB, LOC, LDA, SDF)
-    non_precision_types = {'VOR', 'NDB', 'LOC', 'LDA', 'SDF'}
-    has_non_precision = any(
-        hasattr(p, 'approach_type') and p.approach_type and p.approach_type.upper() in non_precision_types
-        for p in approaches
-    )
-    if has_non_precision:
-        return 2
-
-    # Has approaches but unknown/unrecognized type - treat as non-precision
+    # Non-precision approaches (VOR, NDB, LOC, LDA, SDF), or approaches of
+    # unknown/unrecognized type - treat as non-precision
     return 2
 
 
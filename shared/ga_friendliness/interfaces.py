@@ -6,9 +6,10 @@ They enable dependency injection and testing with mocks.
 """
 
 from abc import ABC, abstractmethod
+from contextlib import nullcontext
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional, Set
+from typing import Any, ContextManager, Dict, Iterator, List, Optional, Set
 
 from .models import (
     AirportStats,
@@ -150,6 +151,22 @@ class StorageInterface(ABC):
         """Close database connection and cleanup resources."""
         pass
 
+    def commit(self) -> None:
+        """Commit pending writes inside a transaction (checkpoint)."""
+        pass
+
+    def build_profile(self) -> ContextManager[Any]:
+        """Context for write-heavy builds (no-op unless overridden)."""
+        return nullcontext(self)
+
+    def batch_writer(self) -> Any:
+        """
+        Buffered writer with the storage write methods plus flush().
+        
+        The default writes straight through to this storage.
+        """
+        return _WriteThrough(self)
+
     # --- Airport Stats Operations ---
 
     @abstractmethod
@@ -422,3 +439,22 @@ class SummaryGeneratorInterface(ABC):
         """
         pass
 
+
+
+class _WriteThrough:
+    """Default batch writer: forwards writes to the storage immediately."""
+
+    def __init__(self, storage: StorageInterface):
+        self._storage = storage
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._storage, name)
+
+    def __enter__(self) -> "_WriteThrough":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        pass
+
+    def flush(self) -> None:
+        pass
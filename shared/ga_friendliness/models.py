@@ -595,6 +595,8 @@ class BuildMetrics(BaseModel):
     llm_tokens_input: int = Field(default=0, description="Total input tokens")
     llm_tokens_output: int = Field(default=0, description="Total output tokens")
     llm_cost_usd: float = Field(default=0.0, description="Estimated LLM cost in USD")
+    llm_cache_hits: int = Field(default=0, description="LLM results served from cache")
+    llm_cache_misses: int = Field(default=0, description="LLM cache lookups that missed")
 
     # Timing
     start_time: Optional[datetime] = Field(default=None)
@@ -9,7 +9,7 @@ all query functionality.
 """
 
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 import logging
 import sqlite3
 import re
@@ -439,6 +439,18 @@ class GAFriendlinessService:
             return set()
         return self.storage.get_icaos_by_hospitality(hotel=hotel, restaurant=restaurant)
 
+    def get_hospitality_info(self) -> Dict[str, Tuple[Optional[int], Optional[int]]]:
+        """
+        Get hotel and restaurant codes of all airports.
+
+        Returns:
+            Dict mapping ICAO -> (aip_hotel_info, aip_restaurant_info).
+            Empty dict if service disabled.
+        """
+        if not self._enabled or not self.storage:
+            return {}
+        return self.storage.get_hospitality_info()
+
     def get_landing_fee_by_weight(
         self,
         icao: str,
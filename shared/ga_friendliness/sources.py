@@ -5,17 +5,31 @@ Provides different sources of review data that can be used by the pipeline.
 """
 
 import csv
+import io
 import json
 import logging
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional, Set
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Set, Tuple
+from urllib.parse import urlsplit
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from .cache import CachedDataLoader
 from .interfaces import ReviewSource
 from .models import RawReview
+from .ratelimit import TokenBucket
+from .streaming import (
+    ReviewOffsetIndex,
+    decompressed_copy,
+    file_signature,
+    iter_csv_records,
+    iter_json_members,
+    read_range,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +45,10 @@ class CSVReviewSource(ReviewSource):
         - rating: Optional numeric rating
         - timestamp: Optional ISO format timestamp
         - language: Optional language code
+    
+    With streaming=True the file is never loaded whole: one pass writes a
+    per-ICAO byte-offset index (SQLite sidecar, reused until the CSV
+    changes) and each airport's rows are read back on demand.
     """
 
     def __init__(
@@ -43,6 +61,8 @@ class CSVReviewSource(ReviewSource):
         timestamp_column: Optional[str] = "timestamp",
         language_column: Optional[str] = "language",
         source_name: str = "csv",
+        streaming: bool = False,
+        index_path: Optional[Path] = None,
     ):
         """
         Initialize CSV review source.
@@ -56,8 +76,10 @@ class CSVReviewSource(ReviewSource):
             timestamp_column: Name of column containing timestamps (optional)
             language_column: Name of column containing language codes (optional)
             source_name: Name to identify this source
+            streaming: Read reviews per airport via an offset index
+            index_path: Offset index location (default: <csv_path>.idx.sqlite)
         """
-        self.csv_path = csv_path
+        self.csv_path = Path(csv_path)
         self.icao_column = icao_column
         self.text_column = text_column
         self.review_id_column = review_id_column
@@ -65,9 +87,76 @@ class CSVReviewSource(ReviewSource):
         self.timestamp_column = timestamp_column
         self.language_column = language_column
         self.source_name = source_name
+        self.streaming = streaming
+        self.index_path = index_path or self.csv_path.with_name(self.csv_path.name + ".idx.sqlite")
         
         self._reviews: Optional[List[RawReview]] = None
         self._reviews_by_icao: Optional[Dict[str, List[RawReview]]] = None
+        self._index: Optional[ReviewOffsetIndex] = None
+        self._fieldnames: Optional[List[str]] = None
+
+    def _row_to_review(self, row: Dict[str, Any]) -> Optional[RawReview]:
+        """Build a review from a CSV row (None if ICAO or text is missing)."""
+        icao = (row.get(self.icao_column) or "").strip().upper()
+        text = (row.get(self.text_column) or "").strip()
+        
+        if not icao or not text:
+            return None
+
+        return RawReview(
+            icao=icao,
+            review_text=text,
+            review_id=row.get(self.review_id_column) if self.review_id_column else None,
+            rating=float(row.get(self.rating_column)) if self.rating_column and row.get(self.rating_column) else None,
+            timestamp=row.get(self.timestamp_column) if self.timestamp_column else None,
+            language=row.get(self.language_column) if self.language_column else None,
+            source=self.source_name,
+        )
+
+    @staticmethod
+    def _split_record(raw: bytes) -> List[str]:
+        return next(csv.reader(io.StringIO(raw.decode("utf-8"))), [])
+
+    def _parse_record(self, raw: bytes) -> Optional[RawReview]:
+        values = self._split_record(raw)
+        return self._row_to_review(dict(zip(self._fieldnames or [], values)))
+
+    def _ensure_index(self) -> ReviewOffsetIndex:
+        """Open the offset index, rebuilding it if the CSV changed."""
+        if self._index is not None:
+            return self._index
+
+        index = ReviewOffsetIndex(self.index_path)
+        signature = file_signature(self.csv_path)
+        if index.is_current(signature):
+            self._fieldnames = json.loads(index.get_meta("fieldnames") or "[]")
+        else:
+            with open(self.csv_path, "rb") as f:
+                records = iter_csv_records(f)
+                header = next(records, None)
+                self._fieldnames = self._split_record(header[1]) if header else []
+
+                def entries() -> Iterator[Tuple[str, str, int, int]]:
+                    for offset, raw in records:
+                        review = self._parse_record(raw)
+                        if review is not None:
+                            yield "reviews", review.icao, offset, len(raw)
+
+                count = index.rebuild(
+                    signature, entries(), meta={"fieldnames": json.dumps(self._fieldnames)}
+                )
+            logger.info(f"Indexed {count} reviews from {self.csv_path} into {self.index_path}")
+
+        self._index = index
+        return index
+
+    def _read_reviews(self, f: Any, icao: str) -> List[RawReview]:
+        reviews = []
+        for offset, length in self._ensure_index().ranges("reviews", icao.upper()):
+            review = self._parse_record(read_range(f, offset, length))
+            if review is not None:
+                reviews.append(review)
+        return reviews
 
     def _load_reviews(self) -> None:
         """Load reviews from CSV if not already loaded."""
@@ -81,21 +170,10 @@ class CSVReviewSource(ReviewSource):
             reader = csv.DictReader(f)
             
             for row in reader:
-                icao = row.get(self.icao_column, "").strip().upper()
-                text = row.get(self.text_column, "").strip()
-                
-                if not icao or not text:
+                review = self._row_to_review(row)
+                if review is None:
                     continue
-
-                review = RawReview(
-                    icao=icao,
-                    review_text=text,
-                    review_id=row.get(self.review_id_column) if self.review_id_column else None,
-                    rating=float(row.get(self.rating_column)) if self.rating_column and row.get(self.rating_column) else None,
-                    timestamp=row.get(self.timestamp_column) if self.timestamp_column else None,
-                    language=row.get(self.language_column) if self.language_column else None,
-                    source=self.source_name,
-                )
+                icao = review.icao
                 
                 self._reviews.append(review)
                 
@@ -107,19 +185,44 @@ class CSVReviewSource(ReviewSource):
 
     def get_reviews(self) -> List[RawReview]:
         """Get all reviews from the source."""
+        if self.streaming:
+            return [r for _, reviews in self.iter_reviews_by_icao() for r in reviews]
         self._load_reviews()
         return self._reviews or []
 
     def get_reviews_for_icao(self, icao: str) -> List[RawReview]:
         """Get reviews for a specific airport."""
+        if self.streaming:
+            with open(self.csv_path, "rb") as f:
+                return self._read_reviews(f, icao)
         self._load_reviews()
         return self._reviews_by_icao.get(icao.upper(), [])
 
     def get_icaos(self) -> Set[str]:
         """Get all ICAO codes in the source."""
+        if self.streaming:
+            return set(self._ensure_index().keys("reviews"))
         self._load_reviews()
         return set(self._reviews_by_icao.keys()) if self._reviews_by_icao else set()
 
+    def iter_reviews_by_icao(self) -> Iterator[Tuple[str, List[RawReview]]]:
+        """Iterate over reviews grouped by ICAO (sorted, one group in memory when streaming)."""
+        if not self.streaming:
+            yield from super().iter_reviews_by_icao()
+            return
+        index = self._ensure_index()
+        with open(self.csv_path, "rb") as f:
+            for icao in index.keys("reviews"):
+                reviews = self._read_reviews(f, icao)
+                if reviews:
+                    yield icao, reviews
+
+    def close(self) -> None:
+        """Close the offset index (streaming mode)."""
+        if self._index is not None:
+            self._index.close()
+            self._index = None
+
     def get_source_name(self) -> str:
         """Get the name/identifier of this source."""
         return self.source_name
@@ -133,6 +236,13 @@ class AirfieldDirectorySource(ReviewSource, CachedDataLoader):
         - Local JSON export file
         - Cached downloads from S3
         - Individual airport JSON fetches
+    
+    With streaming=True the export is never parsed whole: one incremental
+    pass records the byte range of each airport's pireps and airport entry
+    in an on-disk index (in cache_dir, reused until the export changes), and
+    lookups decode only those ranges. Peak memory is bounded by the largest
+    single airport, not the export size. A .gz export is decompressed once
+    into cache_dir, since seeking in a gzip stream re-reads it from the start.
     """
 
     # Aircraft type to MTOW mapping for fee band assignment
@@ -175,6 +285,7 @@ class AirfieldDirectorySource(ReviewSource, CachedDataLoader):
         filter_ai_generated: bool = True,
         preferred_language: str = "EN",
         max_cache_age_days: int = 7,
+        streaming: bool = False,
     ):
         """
         Initialize airfield.directory source.
@@ -185,6 +296,7 @@ class AirfieldDirectorySource(ReviewSource, CachedDataLoader):
             filter_ai_generated: Whether to filter out AI-generated reviews
             preferred_language: Preferred language for reviews
             max_cache_age_days: Maximum age of cached data in days
+            streaming: Parse the export incrementally via an offset index
         """
         CachedDataLoader.__init__(self, cache_dir)
         
@@ -192,10 +304,13 @@ class AirfieldDirectorySource(ReviewSource, CachedDataLoader):
         self.filter_ai_generated = filter_ai_generated
         self.preferred_language = preferred_language
         self.max_cache_age_days = max_cache_age_days
+        self.streaming = streaming
         
         self._data: Optional[Dict] = None
         self._reviews: Optional[List[RawReview]] = None
         self._reviews_by_icao: Optional[Dict[str, List[RawReview]]] = None
+        self._index: Optional[ReviewOffsetIndex] = None
+        self._stream_path: Optional[Path] = None
 
     def fetch_data(self, key: str, **kwargs: Any) -> Any:
         """
@@ -228,6 +343,41 @@ class AirfieldDirectorySource(ReviewSource, CachedDataLoader):
         with open(self.export_path, "r", encoding="utf-8") as f:
             self._data = json.load(f)
 
+    def _pirep_reviews(self, icao: str, pireps_dict: Dict[str, Any]) -> List[RawReview]:
+        """Convert one airport's pireps into reviews."""
+        reviews = []
+        for pirep_id, pirep in pireps_dict.items():
+            # Filter AI-generated reviews if configured
+            if self.filter_ai_generated and pirep.get("ai_generated", False):
+                continue
+
+            # Get the review text (may be in different languages)
+            content = pirep.get("content", {})
+            
+            # Try preferred language first, then English, then any available
+            text = content.get(self.preferred_language) or content.get("EN") or ""
+            if not text and content:
+                # Get first available language
+                text = next(iter(content.values()), "")
+            
+            text = text.strip()
+            language = pirep.get("language", self.preferred_language)
+            
+            if not text:
+                continue
+
+            reviews.append(RawReview(
+                icao=icao,
+                review_text=text,
+                review_id=pirep.get("id", pirep_id),
+                rating=pirep.get("rating"),
+                timestamp=pirep.get("created_at") or pirep.get("updated_at"),
+                language=language,
+                ai_generated=pirep.get("ai_generated", False),
+                source="airfield.directory",
+            ))
+        return reviews
+
     def _parse_reviews(self) -> None:
         """Parse reviews from loaded data."""
         if self._reviews is not None:
@@ -252,69 +402,126 @@ class AirfieldDirectorySource(ReviewSource, CachedDataLoader):
         
         for icao, pireps_dict in pireps_by_icao.items():
             icao = icao.upper()
+            reviews = self._pirep_reviews(icao, pireps_dict)
+            if not reviews:
+                continue
             
-            for pirep_id, pirep in pireps_dict.items():
-                # Filter AI-generated reviews if configured
-                if self.filter_ai_generated and pirep.get("ai_generated", False):
-                    continue
-
-                # Get the review text (may be in different languages)
-                content = pirep.get("content", {})
-                
-                # Try preferred language first, then English, then any available
-                text = content.get(self.preferred_language) or content.get("EN") or ""
-                if not text and content:
-                    # Get first available language
-                    text = next(iter(content.values()), "")
-                
-                text = text.strip()
-                language = pirep.get("language", self.preferred_language)
-                
-                if not text:
-                    continue
-
-                review = RawReview(
-                    icao=icao,
-                    review_text=text,
-                    review_id=pirep.get("id", pirep_id),
-                    rating=pirep.get("rating"),
-                    timestamp=pirep.get("created_at") or pirep.get("updated_at"),
-                    language=language,
-                    ai_generated=pirep.get("ai_generated", False),
-                    source="airfield.directory",
-                )
-                
-                self._reviews.append(review)
-                
-                if icao not in self._reviews_by_icao:
-                    self._reviews_by_icao[icao] = []
-                self._reviews_by_icao[icao].append(review)
+            self._reviews.extend(reviews)
+            self._reviews_by_icao.setdefault(icao, []).extend(reviews)
 
         logger.info(
             f"Parsed {len(self._reviews)} reviews from {len(self._reviews_by_icao)} airports"
         )
 
+    def _ensure_index(self) -> ReviewOffsetIndex:
+        """Open the export's offset index, rebuilding it if stale."""
+        if self._index is not None:
+            return self._index
+
+        if self.export_path is None:
+            raise ValueError("export_path must be provided")
+
+        if not self.export_path.exists():
+            raise FileNotFoundError(f"Export file not found: {self.export_path}")
+
+        index = ReviewOffsetIndex(self.cache_dir / f"{self.export_path.name}.idx.sqlite")
+        # Filters decide which airports have reviews, so they are part of the signature
+        signature = (
+            f"{file_signature(self.export_path)}|ai={self.filter_ai_generated}"
+            f"|lang={self.preferred_language}"
+        )
+        if not index.is_current(signature):
+            logger.info(f"Indexing airfield.directory export {self.export_path}")
+
+            def entries() -> Iterator[Tuple[str, str, int, int]]:
+                with open(self._seekable_path(), "rb") as f:
+                    for section, key, offset, raw in iter_json_members(f, ("pireps", "airports")):
+                        value = json.loads(raw)
+                        if section == "pireps":
+                            icao = str(key).upper()
+                            if isinstance(value, dict) and self._pirep_reviews(icao, value):
+                                yield section, icao, offset, len(raw)
+                        elif isinstance(value, dict) and value.get("icao"):
+                            yield section, value["icao"].upper(), offset, len(raw)
+
+            count = index.rebuild(signature, entries())
+            logger.info(f"Indexed {count} export entries into {index.db_path}")
+
+        self._index = index
+        return index
+
+    def _seekable_path(self) -> Path:
+        """The export, or its decompressed copy if it is .gz."""
+        if self._stream_path is None:
+            self._stream_path = decompressed_copy(self.export_path, self.cache_dir)
+        return self._stream_path
+
+    def _open_export(self) -> BinaryIO:
+        """Open the export for offset reads (index built first)."""
+        self._ensure_index()
+        return open(self._seekable_path(), "rb")
+
+    def _read_members(self, f: Any, section: str, icao: str) -> Iterator[Any]:
+        for offset, length in self._ensure_index().ranges(section, icao.upper()):
+            yield json.loads(read_range(f, offset, length))
+
+    def _read_reviews(self, f: Any, icao: str) -> List[RawReview]:
+        icao = icao.upper()
+        reviews: List[RawReview] = []
+        for pireps_dict in self._read_members(f, "pireps", icao):
+            reviews.extend(self._pirep_reviews(icao, pireps_dict))
+        return reviews
+
     def get_reviews(self) -> List[RawReview]:
         """Get all reviews from the source."""
+        if self.streaming:
+            return [r for _, reviews in self.iter_reviews_by_icao() for r in reviews]
         self._parse_reviews()
         return self._reviews or []
 
     def get_reviews_for_icao(self, icao: str) -> List[RawReview]:
         """Get reviews for a specific airport."""
+        if self.streaming:
+            with self._open_export() as f:
+                return self._read_reviews(f, icao)
         self._parse_reviews()
         return self._reviews_by_icao.get(icao.upper(), [])
 
     def get_icaos(self) -> Set[str]:
         """Get all ICAO codes in the source."""
+        if self.streaming:
+            return set(self._ensure_index().keys("pireps"))
         self._parse_reviews()
         return set(self._reviews_by_icao.keys()) if self._reviews_by_icao else set()
 
+    def iter_reviews_by_icao(self) -> Iterator[Tuple[str, List[RawReview]]]:
+        """Iterate over reviews grouped by ICAO (sorted, one group in memory when streaming)."""
+        if not self.streaming:
+            yield from super().iter_reviews_by_icao()
+            return
+        index = self._ensure_index()
+        with self._open_export() as f:
+            for icao in index.keys("pireps"):
+                reviews = self._read_reviews(f, icao)
+                if reviews:
+                    yield icao, reviews
+
+    def close(self) -> None:
+        """Close the offset index (streaming mode)."""
+        if self._index is not None:
+            self._index.close()
+            self._index = None
+
     def get_airport_data(self, icao: str) -> Optional[Dict]:
         """
         Get full airport data including fees.
         
         Returns raw airport dict from export file.
         """
+        if self.streaming:
+            with self._open_export() as f:
+                return next(self._read_members(f, "airports", icao), None)
+
         self._load_data()
         
         airports = self._data.get("airports", [])
@@ -654,6 +861,12 @@ class AirfieldDirectoryAPISource(ReviewSource, CachedDataLoader):
         "aerops": { "data": { "landing_fees": {...}, "currency": "EUR" } },
         "pireps": { "data": [ { "id": "...", "content": {...}, ... } ] }
     }
+    
+    Downloads run on up to max_workers threads sharing one pooled
+    requests.Session, throttled per host to requests_per_second. Expired
+    cache entries are revalidated with If-None-Match/If-Modified-Since
+    (validators are stored next to the cache file), so unchanged airports
+    cost a 304 instead of a full download.
     """
     
     # Aircraft type to MTOW mapping for fee band assignment
@@ -708,6 +921,9 @@ class AirfieldDirectoryAPISource(ReviewSource, CachedDataLoader):
         base_url: str = "https://airfield.directory/airfield",
         timeout: int = 30,
         max_retries: int = 3,
+        max_workers: int = 8,
+        requests_per_second: Optional[float] = 10.0,
+        session: Optional[requests.Session] = None,
     ):
         """
         Initialize API source.
@@ -721,6 +937,9 @@ class AirfieldDirectoryAPISource(ReviewSource, CachedDataLoader):
             base_url: Base URL for API (default: https://airfield.directory/airfield)
             timeout: Request timeout in seconds
             max_retries: Maximum number of retry attempts for failed downloads
+            max_workers: Concurrent downloads
+            requests_per_second: Per-host request rate limit (None = unlimited)
+            session: Optional requests.Session to reuse (default: pooled session)
         """
         CachedDataLoader.__init__(self, cache_dir)
         
@@ -731,42 +950,85 @@ class AirfieldDirectoryAPISource(ReviewSource, CachedDataLoader):
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.max_retries = max_retries
+        self.max_workers = max(1, max_workers)
+        self.requests_per_second = requests_per_second
+        self.session = session or self._make_session(self.max_workers)
+        self._host_limiters: Dict[str, TokenBucket] = {}
+        self._limiter_lock = threading.Lock()
         
         self._reviews: Optional[List[RawReview]] = None
         self._reviews_by_icao: Optional[Dict[str, List[RawReview]]] = None
         self._airport_data: Optional[Dict[str, Dict]] = None
         self._fee_data: Optional[Dict[str, Dict]] = None
     
-    def fetch_data(self, key: str, **kwargs: Any) -> Any:
+    @staticmethod
+    def _make_session(pool_size: int) -> requests.Session:
+        """Session with a connection pool sized for the worker threads."""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def _limiter_for(self, url: str) -> Optional[TokenBucket]:
+        """Shared rate limiter for the URL's host."""
+        if not self.requests_per_second:
+            return None
+        host = urlsplit(url).netloc
+        with self._limiter_lock:
+            if host not in self._host_limiters:
+                self._host_limiters[host] = TokenBucket(self.requests_per_second)
+            return self._host_limiters[host]
+
+    @staticmethod
+    def _retry_wait(attempt: int, response: Optional[requests.Response] = None) -> float:
+        """Exponential backoff, or the server's Retry-After if it sent one."""
+        if response is not None:
+            retry_after = response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                return float(retry_after)
+        return float(2 ** attempt)
+
+    def _fetch(
+        self,
+        icao: str,
+        validators: Optional[Dict[str, str]] = None,
+    ) -> Tuple[Optional[Dict], Dict[str, str]]:
         """
-        Fetch airport JSON from API.
+        Download one airport's JSON.
         
-        Keys:
-            - "airport_{ICAO}": Fetch individual airport JSON
-            
         Args:
-            key: Cache key (e.g., "airport_EDAZ")
-            **kwargs: Additional arguments (unused)
-            
+            icao: Airport ICAO code
+            validators: Saved ETag/Last-Modified for a conditional request
+        
         Returns:
-            Parsed JSON dict
-            
+            (data, validators); data is None if the server answered
+            304 Not Modified
+        
         Raises:
             requests.RequestException: On network errors
             ValueError: On invalid response
         """
-        if not key.startswith("airport_"):
-            raise ValueError(f"Invalid key format: {key}")
-        
-        icao = key.replace("airport_", "").upper()
         url = f"{self.base_url}/{icao}.json"
+        headers = {}
+        if validators:
+            if validators.get("etag"):
+                headers["If-None-Match"] = validators["etag"]
+            if validators.get("last_modified"):
+                headers["If-Modified-Since"] = validators["last_modified"]
+        limiter = self._limiter_for(url)
         
         # Retry logic with exponential backoff
         last_exception = None
         for attempt in range(self.max_retries):
+            response = None
             try:
+                if limiter is not None:
+                    limiter.acquire()
                 logger.debug(f"Fetching {url} (attempt {attempt + 1}/{self.max_retries})")
-                response = requests.get(url, timeout=self.timeout)
+                response = self.session.get(url, headers=headers, timeout=self.timeout)
+                if response.status_code == 304:
+                    return None, validators or {}
                 response.raise_for_status()
                 
                 # Parse JSON
@@ -783,7 +1045,12 @@ class AirfieldDirectoryAPISource(ReviewSource, CachedDataLoader):
                         f"ICAO mismatch: requested {icao}, got {airfield_data.get('icao')}"
                     )
                 
-                return data
+                new_validators = {}
+                if response.headers.get("ETag"):
+                    new_validators["etag"] = response.headers["ETag"]
+                if response.headers.get("Last-Modified"):
+                    new_validators["last_modified"] = response.headers["Last-Modified"]
+                return data, new_validators
                 
             except requests.exceptions.HTTPError as e:
                 if e.response.status_code == 404:
@@ -792,7 +1059,7 @@ class AirfieldDirectoryAPISource(ReviewSource, CachedDataLoader):
                     raise
                 last_exception = e
                 if attempt < self.max_retries - 1:
-                    wait_time = 2 ** attempt  # Exponential backoff
+                    wait_time = self._retry_wait(attempt, e.response)
                     logger.debug(f"Retrying in {wait_time}s...")
                     time.sleep(wait_time)
                 else:
@@ -800,7 +1067,7 @@ class AirfieldDirectoryAPISource(ReviewSource, CachedDataLoader):
             except (requests.exceptions.RequestException, ValueError) as e:
                 last_exception = e
                 if attempt < self.max_retries - 1:
-                    wait_time = 2 ** attempt
+                    wait_time = self._retry_wait(attempt)
                     logger.debug(f"Retrying in {wait_time}s...")
                     time.sleep(wait_time)
                 else:
@@ -810,6 +1077,134 @@ class AirfieldDirectoryAPISource(ReviewSource, CachedDataLoader):
         if last_exception:
             raise last_exception
         raise ValueError(f"Failed to fetch {url} after {self.max_retries} attempts")
+
+    def fetch_data(self, key: str, **kwargs: Any) -> Any:
+        """
+        Fetch airport JSON from API.
+        
+        Keys:
+            - "airport_{ICAO}": Fetch individual airport JSON
+            
+        Args:
+            key: Cache key (e.g., "airport_EDAZ")
+            **kwargs: Additional arguments (unused)
+            
+        Returns:
+            Parsed JSON dict
+            
+        Raises:
+            requests.RequestException: On network errors
+            ValueError: On invalid response
+        """
+        if not key.startswith("airport_"):
+            raise ValueError(f"Invalid key format: {key}")
+        
+        icao = key.replace("airport_", "").upper()
+        data, validators = self._fetch(icao)
+        self._save_validators(key, validators)
+        return data
+
+    def _get_airport_json(self, icao: str) -> Tuple[Optional[Dict], str]:
+        """
+        Airport JSON from cache, revalidating or downloading when expired.
+        
+        Returns:
+            (data, how) where how is "cached", "not_modified" or "downloaded"
+        """
+        key = f"airport_{icao}"
+        cache_file = self._get_cache_file(key)
+        is_valid, reason = self._is_cache_valid(cache_file, self.max_cache_age_days)
+        if is_valid:
+            return self._load_from_cache(key), "cached"
+        
+        logger.debug(f"Cache miss for {key}: {reason}")
+        validators = (
+            self._load_validators(key)
+            if cache_file.exists() and not self._force_refresh
+            else {}
+        )
+        data, new_validators = self._fetch(icao, validators)
+        if data is None:
+            self._touch_cache(key)
+            return self._load_from_cache(key), "not_modified"
+        
+        self._save_to_cache(data, key)
+        self._save_validators(key, new_validators)
+        return data, "downloaded"
+
+    def _fetch_all(self) -> Iterator[Tuple[str, Optional[Dict], Optional[str], Optional[Exception]]]:
+        """
+        Fetch all airports concurrently; yields (icao, data, how, error) in
+        input order.
+        """
+        def fetch_one(icao: str) -> Tuple[str, Optional[Dict], Optional[str], Optional[Exception]]:
+            try:
+                data, how = self._get_airport_json(icao)
+                return icao, data, how, None
+            except Exception as e:
+                return icao, None, None, e
+        
+        if self.max_workers == 1 or len(self.icaos) <= 1:
+            for icao in self.icaos:
+                yield fetch_one(icao)
+            return
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            yield from pool.map(fetch_one, self.icaos)
+
+    def _ingest(self, icao: str, data: Dict) -> None:
+        """Parse one airport's JSON into reviews and fee data."""
+        self._airport_data[icao] = data
+        
+        # Parse pireps (reviews)
+        pireps_data = data.get("pireps", {}).get("data", [])
+        for pirep in pireps_data:
+            # Filter AI-generated reviews if configured
+            if self.filter_ai_generated and pirep.get("ai_generated", False):
+                continue
+            
+            # Get the review text
+            content = pirep.get("content", {})
+            if isinstance(content, str):
+                text = content
+            else:
+                # Try preferred language first, then English, then any available
+                text = content.get(self.preferred_language) or content.get("EN") or ""
+                if not text and content:
+                    text = next(iter(content.values()), "")
+            
+            text = text.strip()
+            if not text:
+                continue
+            
+            review = RawReview(
+                icao=icao,
+                review_text=text,
+                review_id=pirep.get("id"),
+                rating=pirep.get("rating"),
+                timestamp=pirep.get("created_at") or pirep.get("updated_at"),
+                language=pirep.get("language", self.preferred_language),
+                ai_generated=pirep.get("ai_generated", False),
+                source="airfield.directory.api",
+            )
+            
+            self._reviews.append(review)
+            
+            if icao not in self._reviews_by_icao:
+                self._reviews_by_icao[icao] = []
+            self._reviews_by_icao[icao].append(review)
+        
+        # Parse aerops fee data
+        aerops = data.get("aerops") or {}
+        aerops_data = aerops.get("data") or {}
+        if aerops_data:
+            fee_data = _parse_aerops_fees(
+                aerops_data,
+                self.AIRCRAFT_MTOW_MAP,
+                self.FEE_BANDS,
+            )
+            if fee_data:
+                self._fee_data[icao] = fee_data
     
     def _load_data(self) -> None:
         """Download and parse all airports."""
@@ -821,81 +1216,31 @@ class AirfieldDirectoryAPISource(ReviewSource, CachedDataLoader):
         self._airport_data = {}
         self._fee_data = {}
         
-        logger.info(f"Downloading {len(self.icaos)} airports from {self.base_url}")
+        logger.info(
+            f"Downloading {len(self.icaos)} airports from {self.base_url} "
+            f"({self.max_workers} workers)"
+        )
         
         successful = 0
         failed = 0
+        fetched = {"cached": 0, "not_modified": 0, "downloaded": 0}
         
-        for icao in self.icaos:
+        for icao, data, how, error in self._fetch_all():
             try:
-                # Use cached data loader to get airport JSON
-                cache_key = f"airport_{icao}"
-                data = self.get_cached(
-                    cache_key,
-                    max_age_days=self.max_cache_age_days,
-                )
+                if error is not None:
+                    raise error
                 
                 if not data:
                     logger.warning(f"No data returned for {icao}")
                     failed += 1
                     continue
                 
-                self._airport_data[icao] = data
-                
-                # Parse pireps (reviews)
-                pireps_data = data.get("pireps", {}).get("data", [])
-                for pirep in pireps_data:
-                    # Filter AI-generated reviews if configured
-                    if self.filter_ai_generated and pirep.get("ai_generated", False):
-                        continue
-                    
-                    # Get the review text
-                    content = pirep.get("content", {})
-                    if isinstance(content, str):
-                        text = content
-                    else:
-                        # Try preferred language first, then English, then any available
-                        text = content.get(self.preferred_language) or content.get("EN") or ""
-                        if not text and content:
-                            text = next(iter(content.values()), "")
-                    
-                    text = text.strip()
-                    if not text:
-                        continue
-                    
-                    review = RawReview(
-                        icao=icao,
-                        review_text=text,
-                        review_id=pirep.get("id"),
-                        rating=pirep.get("rating"),
-                        timestamp=pirep.get("created_at") or pirep.get("updated_at"),
-                        language=pirep.get("language", self.preferred_language),
-                        ai_generated=pirep.get("ai_generated", False),
-                        source="airfield.directory.api",
-                    )
-                    
-                    self._reviews.append(review)
-                    
-                    if icao not in self._reviews_by_icao:
-                        self._reviews_by_icao[icao] = []
-                    self._reviews_by_icao[icao].append(review)
-                
-                # Parse aerops fee data
-                aerops = data.get("aerops") or {}
-                aerops_data = aerops.get("data") or {}
-                if aerops_data:
-                    fee_data = _parse_aerops_fees(
-                        aerops_data,
-                        self.AIRCRAFT_MTOW_MAP,
-                        self.FEE_BANDS,
-                    )
-                    if fee_data:
-                        self._fee_data[icao] = fee_data
-                
+                fetched[how] += 1
+                self._ingest(icao, data)
                 successful += 1
                 
             except requests.exceptions.HTTPError as e:
-                if e.response.status_code == 404:
+                if e.response is not None and e.response.status_code == 404:
                     logger.warning(f"Airport not found: {icao} (404)")
                 else:
                     logger.error(f"HTTP error for {icao}: {e}")
@@ -905,7 +1250,9 @@ class AirfieldDirectoryAPISource(ReviewSource, CachedDataLoader):
                 failed += 1
         
         logger.info(
-            f"Downloaded {successful} airports, {failed} failed. "
+            f"Downloaded {successful} airports, {failed} failed "
+            f"({fetched['downloaded']} downloaded, {fetched['not_modified']} not modified, "
+            f"{fetched['cached']} from cache). "
             f"Parsed {len(self._reviews)} reviews from {len(self._reviews_by_icao)} airports, "
             f"{len(self._fee_data)} airports with fee data"
         )
@@ -1041,6 +1388,12 @@ class AirportsDatabaseSource:
         - Restaurant availability info
     
     This is NOT a ReviewSource - it provides supplementary airport metadata.
+    
+    By default each accessor runs its own query. For whole-database passes
+    call preload() (or pass preload=True): one scan each of airports,
+    aip_entries and (grouped) procedures fill in-memory maps, after which
+    the per-airport accessors are dictionary lookups. get_aip_data() always
+    preloads; the builder uses it instead of loading the euro_aip model.
     """
     
     # Standard field IDs from aip_entries
@@ -1055,17 +1408,28 @@ class AirportsDatabaseSource:
     IFR_SCORE_RNP = 3            # Has RNP/RNAV procedures
     IFR_SCORE_ILS = 4            # Has ILS procedures
     
-    def __init__(self, db_path: Path):
+    # Fields loaded by preload()
+    PRELOAD_FIELDS = (STD_FIELD_IFR_VFR, STD_FIELD_HOTEL, STD_FIELD_RESTAURANT)
+    
+    def __init__(self, db_path: Path, preload: bool = False):
         """
         Initialize airports database source.
 
         Args:
             db_path: Path to airports.db SQLite database
+            preload: Bulk-load AIP fields and approach types on first access
         """
         self.db_path = Path(db_path)
         self._conn = None
         self._cache: Dict[str, Dict] = {}
         self._euro_aip_model = None  # Lazy-loaded EuroAipModel
+        self._preload_requested = preload
+        # Filled by preload(): known ICAOs, icao -> {std_field_id: value},
+        # icao -> {approach types}, icao -> {approach types of approach procedures}
+        self._icaos: Optional[Set[str]] = None
+        self._aip_fields: Optional[Dict[str, Dict[int, Optional[str]]]] = None
+        self._approach_types: Optional[Dict[str, Set[str]]] = None
+        self._approaches: Optional[Dict[str, Set[str]]] = None
     
     def _get_connection(self):
         """Get or create database connection."""
@@ -1083,8 +1447,69 @@ class AirportsDatabaseSource:
             self._conn.close()
             self._conn = None
     
+    @property
+    def is_preloaded(self) -> bool:
+        return self._aip_fields is not None
+
+    def preload(self) -> None:
+        """
+        Bulk-load the AIP fields used for scoring and all approach types.
+        
+        airports is read once (known ICAOs), aip_entries once (only
+        PRELOAD_FIELDS, highest source_priority first) and procedures once
+        (distinct procedure/approach types per airport). Idempotent.
+        """
+        if self.is_preloaded:
+            return
+        conn = self._get_connection()
+        
+        icaos = {row[0] for row in conn.execute("SELECT icao_code FROM airports")}
+        
+        placeholders = ",".join("?" * len(self.PRELOAD_FIELDS))
+        cursor = conn.execute(
+            f"""
+            SELECT airport_icao, std_field_id, value FROM aip_entries
+            WHERE std_field_id IN ({placeholders})
+            ORDER BY airport_icao, std_field_id, source_priority DESC
+            """,
+            self.PRELOAD_FIELDS,
+        )
+        fields: Dict[str, Dict[int, Optional[str]]] = {}
+        for icao, std_field_id, value in cursor:
+            # First row per (airport, field) has the best source_priority
+            fields.setdefault(icao, {}).setdefault(std_field_id, value)
+        
+        cursor = conn.execute(
+            """
+            SELECT airport_icao, LOWER(procedure_type), UPPER(COALESCE(approach_type, ''))
+            FROM procedures
+            GROUP BY 1, 2, 3
+            """
+        )
+        approach_types: Dict[str, Set[str]] = {}
+        approaches: Dict[str, Set[str]] = {}
+        for icao, procedure_type, approach_type in cursor:
+            if approach_type:
+                approach_types.setdefault(icao, set()).add(approach_type)
+            if procedure_type == "approach":
+                # "" marks an approach without a type
+                approaches.setdefault(icao, set()).add(approach_type)
+        
+        self._icaos = icaos
+        self._aip_fields = fields
+        self._approach_types = approach_types
+        self._approaches = approaches
+
+    def _ensure_preloaded(self) -> None:
+        if self._preload_requested and not self.is_preloaded:
+            self.preload()
+
     def _get_aip_field(self, icao: str, std_field_id: int) -> Optional[str]:
         """Get a specific AIP field value for an airport."""
+        self._ensure_preloaded()
+        if self._aip_fields is not None and std_field_id in self.PRELOAD_FIELDS:
+            return self._aip_fields.get(icao.upper(), {}).get(std_field_id)
+        
         conn = self._get_connection()
         cursor = conn.execute(
             """
@@ -1112,15 +1537,19 @@ class AirportsDatabaseSource:
         
         Returns: 'ILS', 'RNP', 'RNAV', 'VOR', 'NDB', 'LOC', or None
         """
-        conn = self._get_connection()
-        cursor = conn.execute(
-            """
-            SELECT DISTINCT approach_type FROM procedures 
-            WHERE airport_icao = ? AND approach_type IS NOT NULL AND approach_type != ''
-            """,
-            (icao.upper(),)
-        )
-        approach_types = {row["approach_type"].upper() for row in cursor}
+        self._ensure_preloaded()
+        if self._approach_types is not None:
+            approach_types = self._approach_types.get(icao.upper(), set())
+        else:
+            conn = self._get_connection()
+            cursor = conn.execute(
+                """
+                SELECT DISTINCT approach_type FROM procedures 
+                WHERE airport_icao = ? AND approach_type IS NOT NULL AND approach_type != ''
+                """,
+                (icao.upper(),)
+            )
+            approach_types = {row["approach_type"].upper() for row in cursor}
         
         if not approach_types:
             return None
@@ -1130,8 +1559,8 @@ class AirportsDatabaseSource:
             return "ILS"
         if "RNP" in approach_types or "RNAV" in approach_types:
             return "RNP"
-        # Return first available
-        return next(iter(approach_types))
+        # Return first available (alphabetically, for stable results)
+        return min(approach_types)
     
     def get_ifr_score(self, icao: str) -> int:
         """
@@ -1172,6 +1601,23 @@ class AirportsDatabaseSource:
         """Get restaurant availability info for an airport."""
         return self._get_aip_field(icao, self.STD_FIELD_RESTAURANT)
     
+    def get_aip_data(self, icao: str) -> Optional[Tuple[Dict[int, Optional[str]], Set[str]]]:
+        """
+        Preloaded AIP data for an airport, without loading the euro_aip model.
+
+        Preloads on first call.
+
+        Returns:
+            ({std_field_id: value} for PRELOAD_FIELDS, approach types of its
+            approach procedures with "" for untyped ones), or None if the
+            airport is not in airports.db
+        """
+        self.preload()
+        icao = icao.upper()
+        if icao not in self._icaos:
+            return None
+        return self._aip_fields.get(icao, {}), self._approaches.get(icao, set())
+
     def _load_euro_aip_model(self):
         """Lazy-load the EuroAipModel (loads entire database)."""
         if self._euro_aip_model is None:
@@ -1263,6 +1709,13 @@ class AirportsDatabaseSource:
         Returns:
             List of ICAO codes (sorted)
         """
+        self._ensure_preloaded()
+        if self._aip_fields is not None:
+            return sorted(
+                icao for icao, fields in self._aip_fields.items()
+                if self.STD_FIELD_HOTEL in fields or self.STD_FIELD_RESTAURANT in fields
+            )
+        
         conn = self._get_connection()
         cursor = conn.execute(
             """
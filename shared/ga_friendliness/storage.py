@@ -5,11 +5,13 @@ Provides all CRUD operations for the GA friendliness database.
 """
 
 import json
+import logging
 import sqlite3
 import threading
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 
 from .database import get_connection
 from .exceptions import StorageError
@@ -22,6 +24,99 @@ from .models import (
     RuleSummary,
 )
 
+logger = logging.getLogger(__name__)
+
+
+# PRAGMAs applied for the duration of a build (see GAMetaStorage.build_profile)
+BUILD_PRAGMAS: Dict[str, Any] = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "temp_store": "MEMORY",
+    "cache_size": -65536,  # 64 MiB
+}
+
+AIRFIELD_STATS_SQL = """
+    INSERT OR REPLACE INTO ga_airfield_stats (
+        icao, rating_avg, rating_count, last_review_utc,
+        fee_band_0_749kg, fee_band_750_1199kg, fee_band_1200_1499kg,
+        fee_band_1500_1999kg, fee_band_2000_3999kg, fee_band_4000_plus_kg,
+        fee_currency, fee_last_updated_utc,
+        aip_ifr_available, aip_night_available,
+        aip_hotel_info, aip_restaurant_info,
+        review_cost_score, review_hassle_score, review_review_score,
+        review_ops_ifr_score, review_ops_vfr_score, review_access_score,
+        review_fun_score, review_hospitality_score,
+        aip_ops_ifr_score, aip_hospitality_score,
+        source_version, scoring_version
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+REVIEW_TAG_SQL = """
+    INSERT INTO ga_review_ner_tags
+    (icao, review_id, aspect, label, confidence, timestamp, created_utc)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+REVIEW_SUMMARY_SQL = """
+    INSERT OR REPLACE INTO ga_review_summary
+    (icao, summary_text, tags_json, last_updated_utc)
+    VALUES (?, ?, ?, ?)
+"""
+
+META_INFO_SQL = """
+    INSERT OR REPLACE INTO ga_meta_info (key, value)
+    VALUES (?, ?)
+"""
+
+
+def _airfield_stats_row(stats: AirportStats) -> tuple:
+    return (
+        stats.icao,
+        stats.rating_avg,
+        stats.rating_count,
+        stats.last_review_utc,
+        stats.fee_band_0_749kg,
+        stats.fee_band_750_1199kg,
+        stats.fee_band_1200_1499kg,
+        stats.fee_band_1500_1999kg,
+        stats.fee_band_2000_3999kg,
+        stats.fee_band_4000_plus_kg,
+        stats.fee_currency,
+        stats.fee_last_updated_utc,
+        stats.aip_ifr_available,
+        stats.aip_night_available,
+        stats.aip_hotel_info,
+        stats.aip_restaurant_info,
+        stats.review_cost_score,
+        stats.review_hassle_score,
+        stats.review_review_score,
+        stats.review_ops_ifr_score,
+        stats.review_ops_vfr_score,
+        stats.review_access_score,
+        stats.review_fun_score,
+        stats.review_hospitality_score,
+        stats.aip_ops_ifr_score,
+        stats.aip_hospitality_score,
+        stats.source_version,
+        stats.scoring_version,
+    )
+
+
+def _review_tag_rows(icao: str, tags: List[ReviewExtraction], now: str) -> List[tuple]:
+    return [
+        (
+            icao,
+            extraction.review_id,
+            aspect_label.aspect,
+            aspect_label.label,
+            aspect_label.confidence,
+            extraction.timestamp,
+            now,
+        )
+        for extraction in tags
+        for aspect_label in extraction.aspects
+    ]
+
 
 def parse_timestamp(timestamp_str: str) -> datetime:
     """Parse ISO format timestamp string to datetime.
@@ -114,6 +209,58 @@ class GAMetaStorage(StorageInterface):
             conn.rollback()
         self._in_transaction = False
 
+    def commit(self) -> None:
+        """
+        Commit pending writes.
+        
+        Inside a `with storage:` block writes are deferred; long-running
+        builds call this periodically to checkpoint a batch of airports.
+        """
+        self._check_readonly()
+        with self._lock:
+            self._get_connection().commit()
+
+    @contextmanager
+    def build_profile(
+        self, pragmas: Optional[Dict[str, Any]] = None
+    ) -> Iterator["GAMetaStorage"]:
+        """
+        Apply write-optimized PRAGMAs (default BUILD_PRAGMAS) for a build.
+        
+        WAL lets readers (e.g. change detection) proceed while large batches
+        are open; synchronous=NORMAL is durable under WAL except on power
+        loss. Previous settings are restored on exit, including rollback
+        journaling, so read-only deployments can open the file.
+        
+        Usage:
+            with storage.build_profile(), storage:
+                ...
+        """
+        self._check_readonly()
+        conn = self._get_connection()
+        pragmas = BUILD_PRAGMAS if pragmas is None else pragmas
+        previous: Dict[str, Any] = {}
+        try:
+            for name, value in pragmas.items():
+                previous[name] = conn.execute(f"PRAGMA {name}").fetchone()[0]
+                conn.execute(f"PRAGMA {name}={value}")
+        except sqlite3.Error as e:
+            raise StorageError(f"Failed to apply build PRAGMAs: {e}")
+        try:
+            yield self
+        finally:
+            if self.conn is not None:
+                try:
+                    self.conn.commit()
+                    for name, value in reversed(list(previous.items())):
+                        self.conn.execute(f"PRAGMA {name}={value}")
+                except sqlite3.Error as e:
+                    logger.warning(f"Failed to restore PRAGMAs: {e}")
+
+    def batch_writer(self, max_pending: int = 5000) -> "BatchWriter":
+        """Buffered writer for bulk builds (see BatchWriter)."""
+        return BatchWriter(self, max_pending=max_pending)
+
     def close(self) -> None:
         """Close database connection and cleanup resources."""
         if self.conn:
@@ -128,50 +275,7 @@ class GAMetaStorage(StorageInterface):
         with self._lock:
             conn = self._get_connection()
             try:
-                conn.execute("""
-                    INSERT OR REPLACE INTO ga_airfield_stats (
-                        icao, rating_avg, rating_count, last_review_utc,
-                        fee_band_0_749kg, fee_band_750_1199kg, fee_band_1200_1499kg,
-                        fee_band_1500_1999kg, fee_band_2000_3999kg, fee_band_4000_plus_kg,
-                        fee_currency, fee_last_updated_utc,
-                        aip_ifr_available, aip_night_available,
-                        aip_hotel_info, aip_restaurant_info,
-                        review_cost_score, review_hassle_score, review_review_score,
-                        review_ops_ifr_score, review_ops_vfr_score, review_access_score,
-                        review_fun_score, review_hospitality_score,
-                        aip_ops_ifr_score, aip_hospitality_score,
-                        source_version, scoring_version
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    stats.icao,
-                    stats.rating_avg,
-                    stats.rating_count,
-                    stats.last_review_utc,
-                    stats.fee_band_0_749kg,
-                    stats.fee_band_750_1199kg,
-                    stats.fee_band_1200_1499kg,
-                    stats.fee_band_1500_1999kg,
-                    stats.fee_band_2000_3999kg,
-                    stats.fee_band_4000_plus_kg,
-                    stats.fee_currency,
-                    stats.fee_last_updated_utc,
-                    stats.aip_ifr_available,
-                    stats.aip_night_available,
-                    stats.aip_hotel_info,
-                    stats.aip_restaurant_info,
-                    stats.review_cost_score,
-                    stats.review_hassle_score,
-                    stats.review_review_score,
-                    stats.review_ops_ifr_score,
-                    stats.review_ops_vfr_score,
-                    stats.review_access_score,
-                    stats.review_fun_score,
-                    stats.review_hospitality_score,
-                    stats.aip_ops_ifr_score,
-                    stats.aip_hospitality_score,
-                    stats.source_version,
-                    stats.scoring_version,
-                ))
+                conn.execute(AIRFIELD_STATS_SQL, _airfield_stats_row(stats))
                 if not self._in_transaction:
                     conn.commit()
             except sqlite3.Error as e:
@@ -236,39 +340,7 @@ class GAMetaStorage(StorageInterface):
 
     def write_review_tags(self, icao: str, tags: List[ReviewExtraction]) -> None:
         """Write review tags to ga_review_ner_tags."""
-        self._check_readonly()
-        with self._lock:
-            try:
-                now = datetime.now(timezone.utc).isoformat()
-
-                # Delete existing tags for this icao
-                conn = self._get_connection()
-                conn.execute(
-                    "DELETE FROM ga_review_ner_tags WHERE icao = ?", (icao,)
-                )
-
-                # Insert new tags
-                for extraction in tags:
-                    for aspect_label in extraction.aspects:
-                        conn.execute("""
-                            INSERT INTO ga_review_ner_tags
-                            (icao, review_id, aspect, label, confidence, timestamp, created_utc)
-                            VALUES (?, ?, ?, ?, ?, ?, ?)
-                        """, (
-                            icao,
-                            extraction.review_id,
-                            aspect_label.aspect,
-                            aspect_label.label,
-                            aspect_label.confidence,
-                            extraction.timestamp,
-                            now,
-                        ))
-
-                if not self._in_transaction:
-                    conn = self._get_connection()
-                conn.commit()
-            except sqlite3.Error as e:
-                raise StorageError(f"Failed to write review tags: {e}")
+        self.write_review_tags_batch({icao: tags})
 
     def write_review_tags_batch(
         self, tags_by_icao: Dict[str, List[ReviewExtraction]]
@@ -280,32 +352,19 @@ class GAMetaStorage(StorageInterface):
             try:
                 now = datetime.now(timezone.utc).isoformat()
 
-                for icao, extractions in tags_by_icao.items():
-                    # Delete existing tags for this icao
-                    conn.execute(
-                        "DELETE FROM ga_review_ner_tags WHERE icao = ?", (icao,)
-                    )
-
-                    # Insert new tags
-                    for extraction in extractions:
-                        for aspect_label in extraction.aspects:
-                            conn.execute("""
-                                INSERT INTO ga_review_ner_tags 
-                                (icao, review_id, aspect, label, confidence, timestamp, created_utc)
-                                VALUES (?, ?, ?, ?, ?, ?, ?)
-                            """, (
-                                icao,
-                                extraction.review_id,
-                                aspect_label.aspect,
-                                aspect_label.label,
-                                aspect_label.confidence,
-                                extraction.timestamp,
-                                now,
-                            ))
+                # Replace existing tags for these airports
+                conn.executemany(
+                    "DELETE FROM ga_review_ner_tags WHERE icao = ?",
+                    [(icao,) for icao in tags_by_icao],
+                )
+                conn.executemany(REVIEW_TAG_SQL, [
+                    row
+                    for icao, extractions in tags_by_icao.items()
+                    for row in _review_tag_rows(icao, extractions, now)
+                ])
 
                 if not self._in_transaction:
-                    conn = self._get_connection()
-                conn.commit()
+                    conn.commit()
             except sqlite3.Error as e:
                 raise StorageError(f"Failed to write review tags batch: {e}")
 
@@ -332,15 +391,10 @@ class GAMetaStorage(StorageInterface):
             try:
                 now = datetime.now(timezone.utc).isoformat()
                 conn = self._get_connection()
-                conn.execute("""
-                    INSERT OR REPLACE INTO ga_review_summary 
-                    (icao, summary_text, tags_json, last_updated_utc)
-                    VALUES (?, ?, ?, ?)
-                """, (icao, summary_text, json.dumps(tags_json), now))
+                conn.execute(REVIEW_SUMMARY_SQL, (icao, summary_text, json.dumps(tags_json), now))
 
                 if not self._in_transaction:
-                    conn = self._get_connection()
-                conn.commit()
+                    conn.commit()
             except sqlite3.Error as e:
                 raise StorageError(f"Failed to write review summary: {e}")
 
@@ -352,14 +406,10 @@ class GAMetaStorage(StorageInterface):
         with self._lock:
             try:
                 conn = self._get_connection()
-                conn.execute("""
-                    INSERT OR REPLACE INTO ga_meta_info (key, value)
-                    VALUES (?, ?)
-                """, (key, value))
+                conn.execute(META_INFO_SQL, (key, value))
 
                 if not self._in_transaction:
-                    conn = self._get_connection()
-                conn.commit()
+                    conn.commit()
             except sqlite3.Error as e:
                 raise StorageError(f"Failed to write meta info: {e}")
 
@@ -570,8 +620,7 @@ class GAMetaStorage(StorageInterface):
                 ))
                 
                 if not self._in_transaction:
-                    conn = self._get_connection()
-                conn.commit()
+                    conn.commit()
             except sqlite3.Error as e:
                 raise StorageError(f"Failed to update fees for {icao}: {e}")
 
@@ -728,8 +777,7 @@ class GAMetaStorage(StorageInterface):
                     ))
 
                 if not self._in_transaction:
-                    conn = self._get_connection()
-                conn.commit()
+                    conn.commit()
             except sqlite3.Error as e:
                 raise StorageError(f"Failed to write notification requirements: {e}")
 
@@ -753,8 +801,7 @@ class GAMetaStorage(StorageInterface):
                 ))
 
                 if not self._in_transaction:
-                    conn = self._get_connection()
-                conn.commit()
+                    conn.commit()
             except sqlite3.Error as e:
                 raise StorageError(f"Failed to write AIP rule summary: {e}")
 
@@ -889,3 +936,136 @@ class GAMetaStorage(StorageInterface):
         except sqlite3.Error as e:
             raise StorageError(f"Failed to query hospitality filters: {e}")
 
+    def get_hospitality_info(self) -> Dict[str, Tuple[Optional[int], Optional[int]]]:
+        """
+        Get hotel and restaurant codes of all airports.
+
+        Returns:
+            Dict mapping ICAO -> (aip_hotel_info, aip_restaurant_info),
+            each -1=unknown, 0=none, 1=vicinity, 2=at_airport
+        """
+        try:
+            conn = self._get_connection()
+            cursor = conn.execute(
+                "SELECT icao, aip_hotel_info, aip_restaurant_info FROM ga_airfield_stats"
+            )
+            return {
+                row["icao"]: (row["aip_hotel_info"], row["aip_restaurant_info"])
+                for row in cursor
+            }
+        except sqlite3.Error as e:
+            raise StorageError(f"Failed to query hospitality info: {e}")
+
+
+
+class BatchWriter:
+    """
+    Buffers GA persona writes across airports and flushes them with
+    executemany in one transaction.
+    
+    Mirrors the GAMetaStorage write methods used by the builder. Rows are
+    written on flush() (or automatically once max_pending rows are
+    buffered); inside a `with storage:` block the commit is left to the
+    caller so data and resume checkpoints land together.
+    
+    Usage:
+        with storage, storage.batch_writer() as writer:
+            writer.write_airfield_stats(stats)
+            writer.write_review_tags(icao, extractions)
+            writer.set_last_successful_icao(icao)
+            writer.flush()
+            storage.commit()
+    """
+
+    def __init__(self, storage: GAMetaStorage, max_pending: int = 5000):
+        storage._check_readonly()
+        self.storage = storage
+        self.max_pending = max_pending
+        self._stats: Dict[str, tuple] = {}
+        self._tags: Dict[str, List[tuple]] = {}
+        self._summaries: Dict[str, tuple] = {}
+        self._meta: Dict[str, str] = {}
+        self._pending_rows = 0
+
+    def __enter__(self) -> "BatchWriter":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        if exc_type is None:
+            self.flush()
+        else:
+            self.discard()
+
+    def _added(self, rows: int = 1) -> None:
+        self._pending_rows += rows
+        if self._pending_rows >= self.max_pending:
+            self.flush()
+
+    @property
+    def pending(self) -> int:
+        """Number of buffered rows."""
+        return self._pending_rows
+
+    def write_airfield_stats(self, stats: AirportStats) -> None:
+        self._stats[stats.icao] = _airfield_stats_row(stats)
+        self._added()
+
+    def write_review_tags(self, icao: str, tags: List[ReviewExtraction]) -> None:
+        rows = _review_tag_rows(icao, tags, datetime.now(timezone.utc).isoformat())
+        self._tags[icao] = rows
+        self._added(len(rows) + 1)
+
+    def write_review_summary(self, icao: str, summary_text: str, tags_json: List[str]) -> None:
+        now = datetime.now(timezone.utc).isoformat()
+        self._summaries[icao] = (icao, summary_text, json.dumps(tags_json), now)
+        self._added()
+
+    def write_meta_info(self, key: str, value: str) -> None:
+        self._meta[key] = value
+        self._added()
+
+    def update_last_processed_timestamp(self, icao: str, timestamp: datetime) -> None:
+        self.write_meta_info(f"last_processed_{icao}", timestamp.isoformat())
+
+    def set_last_successful_icao(self, icao: str) -> None:
+        self.write_meta_info("last_successful_icao", icao)
+
+    def discard(self) -> None:
+        """Drop buffered rows without writing them."""
+        self._stats.clear()
+        self._tags.clear()
+        self._summaries.clear()
+        self._meta.clear()
+        self._pending_rows = 0
+
+    def flush(self) -> None:
+        """Write all buffered rows (one executemany per table)."""
+        if not self._pending_rows:
+            return
+        storage = self.storage
+        with storage._lock:
+            conn = storage._get_connection()
+            try:
+                if not conn.in_transaction:
+                    conn.execute("BEGIN")
+                if self._stats:
+                    conn.executemany(AIRFIELD_STATS_SQL, list(self._stats.values()))
+                if self._tags:
+                    conn.executemany(
+                        "DELETE FROM ga_review_ner_tags WHERE icao = ?",
+                        [(icao,) for icao in self._tags],
+                    )
+                    conn.executemany(
+                        REVIEW_TAG_SQL, [row for rows in self._tags.values() for row in rows]
+                    )
+                if self._summaries:
+                    conn.executemany(REVIEW_SUMMARY_SQL, list(self._summaries.values()))
+                if self._meta:
+                    conn.executemany(META_INFO_SQL, list(self._meta.items()))
+                if not storage._in_transaction:
+                    conn.commit()
+            except sqlite3.Error as e:
+                if not storage._in_transaction:
+                    conn.rollback()
+                raise StorageError(f"Failed to flush batched writes: {e}")
+        self.discard()
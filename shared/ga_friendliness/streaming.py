@@ -0,0 +1,391 @@
+"""
+Streaming readers and on-disk offset index for large review exports.
+
+Full-Europe airfield.directory exports (and large review CSVs) do not need
+to be loaded into memory: a single pass records where each airport's data
+lives in the file, and later lookups read just those bytes back.
+
+    - iter_json_members: one pass over selected top-level sections of a
+      JSON document, yielding each member's byte offset and raw bytes
+    - iter_csv_records: yields each CSV record's byte offset and raw bytes
+      (quoted multi-line fields are kept together)
+    - ReviewOffsetIndex: SQLite sidecar mapping (section, key) -> byte ranges
+    - decompressed_copy: plain copy of a .gz export to seek in
+"""
+
+import gzip
+import json
+import os
+import re
+import shutil
+import sqlite3
+import threading
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+_WHITESPACE = b" \t\r\n"
+_STRING_SPECIAL = re.compile(rb'["\\]')
+# A complete string, or a lone quote when the string runs past the buffer
+_CONTAINER_TOKEN = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"|"|[\[\]{}]', re.S)
+_SCALAR_END = re.compile(rb"[,\]}\s]")
+
+
+def open_binary(path: Path) -> BinaryIO:
+    """Open a file for binary reading, transparently decompressing .gz."""
+    if path.suffix == ".gz":
+        return gzip.open(path, "rb")
+    return open(path, "rb")
+
+
+def read_range(fp: BinaryIO, offset: int, length: int) -> bytes:
+    """Read `length` bytes at `offset`."""
+    fp.seek(offset)
+    return fp.read(length)
+
+
+def file_signature(path: Path) -> str:
+    """Cheap change detector for a source file (size + mtime)."""
+    stat = path.stat()
+    return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def decompressed_copy(path: Path, cache_dir: Path) -> Path:
+    """
+    Path to seek in for offset lookups: a .gz file is decompressed once.
+
+    Seeking in a GzipFile decompresses again from the start of the file, so
+    per-airport reads from a .gz export cost O(file size) each. The plain
+    copy (<cache_dir>/<name>.plain) is reused until the source changes.
+
+    Returns:
+        path itself if not .gz, else the decompressed copy
+    """
+    if path.suffix != ".gz":
+        return path
+    target = Path(cache_dir) / f"{path.name}.plain"
+    stamp = target.with_name(target.name + ".source")
+    signature = file_signature(path)
+    if target.exists() and stamp.exists() and stamp.read_text() == signature:
+        return target
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_name(target.name + ".tmp")
+    with gzip.open(path, "rb") as src, open(tmp, "wb") as dst:
+        shutil.copyfileobj(src, dst, 1 << 20)
+    os.replace(tmp, target)
+    stamp.write_text(signature)
+    return target
+
+
+class _Scanner:
+    """
+    Minimal byte-level JSON tokenizer over a chunked stream.
+
+    Only tracks structure (strings, brackets); member values are handed back
+    as raw bytes for json.loads, so memory is bounded by the largest member.
+    """
+
+    def __init__(self, fp: BinaryIO, chunk_size: int):
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.buf = b""
+        self.base = 0  # Absolute offset of buf[0]
+        self.pos = 0
+        self.mark: Optional[int] = None  # Keep bytes from here while capturing
+
+    @property
+    def offset(self) -> int:
+        return self.base + self.pos
+
+    def _fill(self) -> bool:
+        chunk = self.fp.read(self.chunk_size)
+        if not chunk:
+            return False
+        keep = self.pos if self.mark is None else self.mark
+        self.buf = self.buf[keep:] + chunk
+        self.base += keep
+        self.pos -= keep
+        if self.mark is not None:
+            self.mark -= keep
+        return True
+
+    def _ensure(self, n: int = 1) -> bool:
+        while len(self.buf) < self.pos + n:
+            if not self._fill():
+                return False
+        return True
+
+    def _error(self, message: str) -> ValueError:
+        return ValueError(f"Invalid JSON at byte {self.offset}: {message}")
+
+    def peek(self) -> Optional[int]:
+        """Next non-whitespace byte (None at EOF)."""
+        while True:
+            if not self._ensure():
+                return None
+            byte = self.buf[self.pos]
+            if byte not in _WHITESPACE:
+                return byte
+            self.pos += 1
+
+    def expect(self, char: bytes) -> None:
+        if self.peek() != char[0]:
+            raise self._error(f"expected {char!r}")
+        self.pos += 1
+
+    def _skip_string(self) -> None:
+        self.pos += 1  # Opening quote
+        while True:
+            match = _STRING_SPECIAL.search(self.buf, self.pos)
+            if match is None:
+                self.pos = len(self.buf)
+                if not self._fill():
+                    raise self._error("unterminated string")
+                continue
+            self.pos = match.end()
+            if match.group() == b'"':
+                return
+            # Escape: skip the escaped byte too
+            if not self._ensure():
+                raise self._error("unterminated string")
+            self.pos += 1
+
+    def read_string(self) -> str:
+        if self.peek() != ord('"'):
+            raise self._error("expected string")
+        self.mark = self.pos
+        self._skip_string()
+        raw = self.buf[self.mark:self.pos]
+        self.mark = None
+        return json.loads(raw)
+
+    def skip_value(self) -> None:
+        byte = self.peek()
+        if byte is None:
+            raise self._error("unexpected end of input")
+        if byte == ord('"'):
+            self._skip_string()
+            return
+        if byte not in b"{[":
+            while True:
+                match = _SCALAR_END.search(self.buf, self.pos)
+                if match is not None:
+                    self.pos = match.start()
+                    return
+                self.pos = len(self.buf)
+                if not self._fill():
+                    return
+        depth = 0
+        while True:
+            match = _CONTAINER_TOKEN.search(self.buf, self.pos)
+            if match is None:
+                self.pos = len(self.buf)
+                if not self._fill():
+                    raise self._error("unterminated container")
+                continue
+            token = match.group()
+            if token == b'"':
+                # String continues past the buffer: read more and retry
+                self.pos = match.start()
+                if not self._fill():
+                    raise self._error("unterminated string")
+                continue
+            self.pos = match.end()
+            if token[0] == ord('"'):
+                continue
+            depth += 1 if token in b"{[" else -1
+            if depth == 0:
+                return
+
+    def capture_value(self) -> Tuple[int, bytes]:
+        """Skip the next value and return (offset, raw bytes)."""
+        self.peek()
+        self.mark = self.pos
+        start = self.offset
+        self.skip_value()
+        raw = self.buf[self.mark:self.pos]
+        self.mark = None
+        return start, raw
+
+    def after_item(self, close: bytes) -> bool:
+        """Consume a separator; False once the container closes."""
+        byte = self.peek()
+        self.pos += 1
+        if byte == ord(","):
+            return True
+        if byte == close[0]:
+            return False
+        raise self._error(f"expected ',' or {close!r}")
+
+
+def iter_json_members(
+    fp: BinaryIO,
+    sections: Sequence[str],
+    chunk_size: int = 1 << 20,
+) -> Iterator[Tuple[str, Union[str, int], int, bytes]]:
+    """
+    Stream the members of selected top-level sections of a JSON object.
+
+    For a section holding an object, yields (section, key, offset, raw) per
+    member; for an array, the key is the element index. Other top-level
+    values are skipped without being decoded.
+
+    Args:
+        fp: Binary file object positioned at the start of the document
+        sections: Top-level keys to stream
+        chunk_size: Bytes read per I/O call
+    """
+    scanner = _Scanner(fp, chunk_size)
+    scanner.expect(b"{")
+    if scanner.peek() == ord("}"):
+        return
+    while True:
+        name = scanner.read_string()
+        scanner.expect(b":")
+        opener = scanner.peek()
+        if name in sections and opener in (ord("{"), ord("[")):
+            close = b"}" if opener == ord("{") else b"]"
+            scanner.pos += 1
+            if scanner.peek() == close[0]:
+                scanner.pos += 1
+            else:
+                index = 0
+                while True:
+                    key: Union[str, int] = index
+                    if close == b"}":
+                        key = scanner.read_string()
+                        scanner.expect(b":")
+                    offset, raw = scanner.capture_value()
+                    yield name, key, offset, raw
+                    index += 1
+                    if not scanner.after_item(close):
+                        break
+        else:
+            scanner.skip_value()
+        if not scanner.after_item(b"}"):
+            return
+
+
+def iter_csv_records(fp: BinaryIO) -> Iterator[Tuple[int, bytes]]:
+    """
+    Yield (offset, raw bytes) for each CSV record.
+
+    Lines are joined while a quoted field is open (odd number of quotes so
+    far), so records with embedded newlines stay intact.
+    """
+    offset = fp.tell()
+    pending: List[bytes] = []
+    quotes = 0
+    for line in fp:
+        pending.append(line)
+        quotes += line.count(b'"')
+        if quotes % 2:
+            continue
+        raw = b"".join(pending)
+        yield offset, raw
+        offset += len(raw)
+        pending = []
+        quotes = 0
+    if pending:
+        yield offset, b"".join(pending)
+
+
+class ReviewOffsetIndex:
+    """
+    On-disk index of where each airport's data lives in an export file.
+
+    Stored as a small SQLite sidecar so neither building nor querying it
+    needs the whole export (or the whole index) in memory. The index is
+    tagged with a signature of the source; a stale index is rebuilt.
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS offsets (
+                section TEXT NOT NULL,
+                key TEXT NOT NULL,
+                start INTEGER NOT NULL,
+                length INTEGER NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_offsets_key ON offsets(section, key);
+            CREATE TABLE IF NOT EXISTS index_meta (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            );
+            """
+        )
+
+    def get_meta(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM index_meta WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def is_current(self, signature: str) -> bool:
+        """True if the index was built from a source with this signature."""
+        return self.get_meta("signature") == signature
+
+    def rebuild(
+        self,
+        signature: str,
+        entries: Iterable[Tuple[str, str, int, int]],
+        meta: Optional[dict] = None,
+    ) -> int:
+        """
+        Replace the index contents.
+
+        Args:
+            signature: Source signature (see file_signature)
+            entries: (section, key, offset, length) tuples, consumed lazily
+            meta: Extra metadata to store alongside the signature
+
+        Returns:
+            Number of entries written
+        """
+        count = 0
+
+        def counted() -> Iterator[Tuple[str, str, int, int]]:
+            nonlocal count
+            for entry in entries:
+                count += 1
+                yield entry
+
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM offsets")
+            self._conn.execute("DELETE FROM index_meta")
+            self._conn.executemany(
+                "INSERT INTO offsets (section, key, start, length) VALUES (?, ?, ?, ?)",
+                counted(),
+            )
+            items = dict(meta or {}, signature=signature)
+            self._conn.executemany(
+                "INSERT INTO index_meta (key, value) VALUES (?, ?)",
+                [(k, str(v)) for k, v in items.items()],
+            )
+        return count
+
+    def keys(self, section: str) -> List[str]:
+        """Sorted distinct keys in a section."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT DISTINCT key FROM offsets WHERE section = ? ORDER BY key",
+                (section,),
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def ranges(self, section: str, key: str) -> List[Tuple[int, int]]:
+        """(offset, length) ranges for a key, in file order."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT start, length FROM offsets WHERE section = ? AND key = ? ORDER BY start",
+                (section, key),
+            ).fetchall()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
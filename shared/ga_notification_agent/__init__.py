@@ -26,6 +26,7 @@ from .models import (
     HassleLevel,
 )
 from .parser import NotificationParser
+from .parse_cache import ParseCache
 from .scorer import NotificationScorer
 from .config import (
     NotificationAgentConfig,
@@ -45,6 +46,7 @@ __all__ = [
     # Parser and scorer
     "NotificationParser",
     "NotificationScorer",
+    "ParseCache",
     # Batch processing
     "NotificationBatchProcessor",
     # Config
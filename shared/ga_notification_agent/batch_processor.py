@@ -11,17 +11,145 @@ For scoring/hassle computation, see scorer.py (writes to ga_persona.db)
 import sqlite3
 import json
 import logging
+import multiprocessing
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Iterable, Optional, List, Set, Tuple
+
+from shared.change_log import install_change_log
 
 from .config import get_notification_config, NotificationAgentConfig
 from .parser import NotificationParser
+from .parse_cache import ParseCache
 from .models import ParsedNotificationRules
 
 logger = logging.getLogger(__name__)
 
+INSERT_REQUIREMENT_SQL = '''
+    INSERT OR REPLACE INTO ga_notification_requirements
+    (icao, rule_type, notification_type, hours_notice,
+     operating_hours_start, operating_hours_end,
+     weekday_rules, schengen_rules, contact_info,
+     summary, raw_text, confidence, extraction_method, created_utc)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+# (icao, parsed, needs_llm, error) from the regex stage
+RegexOutcome = Tuple[str, Optional[ParsedNotificationRules], bool, Optional[str]]
+
+
+def _parse_regex_chunk(
+    parser: NotificationParser, airports: List[Tuple[str, str]]
+) -> List[RegexOutcome]:
+    """Regex stage for a chunk of (icao, text) pairs."""
+    outcomes: List[RegexOutcome] = []
+    for icao, text in airports:
+        try:
+            parsed, needs_llm = parser.parse_without_llm(icao, text)
+            outcomes.append((icao, parsed, needs_llm, None))
+        except Exception as e:
+            outcomes.append((icao, None, False, str(e)))
+    return outcomes
+
+
+# Per-process parser for the regex worker pool
+_worker_parser: Optional[NotificationParser] = None
+
+
+def _init_worker(
+    config: NotificationAgentConfig,
+    use_llm_fallback: bool,
+    cache_path: Optional[Path],
+    use_cache: bool,
+    refresh_cache: bool = False,
+) -> None:
+    global _worker_parser
+    _worker_parser = NotificationParser(
+        config=config,
+        use_llm_fallback=use_llm_fallback,
+        cache=ParseCache(cache_path, refresh=refresh_cache) if cache_path else None,
+        use_cache=use_cache,
+    )
+
+
+def _parse_regex_chunk_in_worker(airports: List[Tuple[str, str]]) -> List[RegexOutcome]:
+    outcomes = _parse_regex_chunk(_worker_parser, airports)
+    if _worker_parser.cache is not None:
+        # No shutdown hook in pool workers: persist per chunk
+        _worker_parser.cache.flush()
+    return outcomes
+
+
+class _CallSpacer:
+    """Spaces call starts at least `interval` seconds apart across threads."""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._next_start = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        if self.interval <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+class _ResultWriter:
+    """Single writer: one connection, INSERT OR REPLACE rows committed in batches."""
+
+    def __init__(self, db_path: Path, batch_size: int):
+        self.batch_size = max(1, batch_size)
+        self.commits = 0
+        self._conn = sqlite3.connect(db_path)
+        self._pending: List[tuple] = []
+
+    def add(self, icao: str, result: Dict[str, Any]) -> None:
+        self._pending.append(_requirement_row(icao, result))
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        with self._conn:
+            self._conn.executemany(INSERT_REQUIREMENT_SQL, self._pending)
+        self.commits += 1
+        self._pending = []
+
+    def close(self) -> None:
+        try:
+            self.flush()
+        finally:
+            self._conn.close()
+
+
+def _requirement_row(icao: str, result: Dict[str, Any]) -> tuple:
+    """DB row for a _parsed_to_db_record() result."""
+    return (
+        icao,
+        result.get("rule_type"),
+        result.get("notification_type"),
+        result.get("hours_notice"),
+        result.get("operating_hours_start"),
+        result.get("operating_hours_end"),
+        json.dumps(result.get("weekday_rules")) if result.get("weekday_rules") else None,
+        json.dumps(result.get("schengen_rules")) if result.get("schengen_rules") else None,
+        json.dumps(result.get("contact_info")) if result.get("contact_info") else None,
+        result.get("summary"),
+        result.get("raw_text"),
+        result.get("confidence"),
+        result.get("extraction_method"),
+        datetime.now(timezone.utc).isoformat()
+    )
+
 
 class NotificationBatchProcessor:
     """
@@ -31,6 +159,10 @@ class NotificationBatchProcessor:
     Stores detailed results in ga_notifications.db for the NotificationService to query.
 
     Configuration is loaded from configs/ga_notification_agent/default.json.
+
+    Pipelined mode (workers > 1 or llm_concurrency > 1): regex parsing fans
+    out to a process pool, LLM-fallback cases go to a rate-limited thread
+    pool, and a single writer commits results in batches.
     """
 
     def __init__(
@@ -38,6 +170,8 @@ class NotificationBatchProcessor:
         output_db_path: Path,
         config: Optional[NotificationAgentConfig] = None,
         config_name: str = "default",
+        parse_cache: Optional[ParseCache] = None,
+        use_parse_cache: bool = True,
     ):
         """
         Initialize batch processor.
@@ -46,6 +180,9 @@ class NotificationBatchProcessor:
             output_db_path: Path to output database (ga_notifications.db)
             config: Pre-loaded config (optional)
             config_name: Name of config to load if config not provided
+            parse_cache: Parse cache (default: in-memory); one with a
+                db_path is shared with regex worker processes
+            use_parse_cache: Set False to disable parse caching
         """
         if config is None:
             config = get_notification_config(config_name)
@@ -54,7 +191,9 @@ class NotificationBatchProcessor:
         self.output_db_path = Path(output_db_path)
 
         # Initialize parser with config
-        self._parser = NotificationParser(config=config)
+        self._parser = NotificationParser(
+            config=config, cache=parse_cache, use_cache=use_parse_cache
+        )
 
         # Initialize database
         self._init_db()
@@ -89,6 +228,11 @@ class NotificationBatchProcessor:
             conn.execute("ALTER TABLE ga_notification_requirements ADD COLUMN extraction_method TEXT")
             logger.info("Migrated schema: added extraction_method column")
 
+        # Log airports whose requirements change (delta sync for clients)
+        install_change_log(
+            conn, "ga_notification_requirements", ignore_columns=["id", "created_utc"]
+        )
+
         conn.commit()
         conn.close()
 
@@ -179,33 +323,19 @@ class NotificationBatchProcessor:
 
     def save_result(self, icao: str, result: Dict[str, Any]) -> None:
         """Save extraction result to database."""
-        conn = sqlite3.connect(self.output_db_path)
+        self.save_results([(icao, result)])
 
-        conn.execute('''
-            INSERT OR REPLACE INTO ga_notification_requirements
-            (icao, rule_type, notification_type, hours_notice,
-             operating_hours_start, operating_hours_end,
-             weekday_rules, schengen_rules, contact_info,
-             summary, raw_text, confidence, extraction_method, created_utc)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            icao,
-            result.get("rule_type"),
-            result.get("notification_type"),
-            result.get("hours_notice"),
-            result.get("operating_hours_start"),
-            result.get("operating_hours_end"),
-            json.dumps(result.get("weekday_rules")) if result.get("weekday_rules") else None,
-            json.dumps(result.get("schengen_rules")) if result.get("schengen_rules") else None,
-            json.dumps(result.get("contact_info")) if result.get("contact_info") else None,
-            result.get("summary"),
-            result.get("raw_text"),
-            result.get("confidence"),
-            result.get("extraction_method"),
-            datetime.now(timezone.utc).isoformat()
-        ))
-        conn.commit()
-        conn.close()
+    def save_results(self, results: Iterable[Tuple[str, Dict[str, Any]]]) -> None:
+        """Save several extraction results in one transaction."""
+        conn = sqlite3.connect(self.output_db_path)
+        try:
+            with conn:
+                conn.executemany(
+                    INSERT_REQUIREMENT_SQL,
+                    [_requirement_row(icao, result) for icao, result in results],
+                )
+        finally:
+            conn.close()
 
     def _get_existing_data(self) -> Dict[str, str]:
         """Get existing ICAO -> raw_text mapping from output database."""
@@ -218,33 +348,15 @@ class NotificationBatchProcessor:
         conn.close()
         return existing
 
-    def process_airports(
+    def _select_airports(
         self,
         airports_db_path: Path,
-        icao_prefixes: Optional[List[str]] = None,
-        icaos: Optional[List[str]] = None,
-        limit: Optional[int] = None,
-        delay: float = 0.5,
-        mode: str = "full",
-    ) -> Dict[str, Any]:
-        """
-        Process airports from source database.
-
-        Args:
-            airports_db_path: Path to airports.db
-            icao_prefixes: Filter by ICAO prefixes (e.g., ["LF", "EG"] for France, UK)
-            icaos: Specific ICAOs to process (overrides prefixes)
-            limit: Max airports to process
-            delay: Delay between LLM calls (seconds)
-            mode: Processing mode:
-                - "full": Process all matching airports (default)
-                - "incremental": Skip airports already in output DB
-                - "changed": Only process airports where AIP text changed
-                - "force": Process all, even if unchanged (same as full)
-
-        Returns:
-            Dict with processing statistics
-        """
+        icao_prefixes: Optional[List[str]],
+        icaos: Optional[List[str]],
+        limit: Optional[int],
+        mode: str,
+    ) -> Tuple[List[Tuple[str, str]], int]:
+        """(icao, text) pairs to process for the mode, and the unchanged count."""
         # Get airports to process from source
         conn = sqlite3.connect(airports_db_path)
         conn.row_factory = sqlite3.Row
@@ -300,44 +412,222 @@ class NotificationBatchProcessor:
 
         # mode == "full" or "force": process all
 
+        return airports, unchanged_count
+
+    def process_airports(
+        self,
+        airports_db_path: Path,
+        icao_prefixes: Optional[List[str]] = None,
+        icaos: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        delay: float = 0.5,
+        mode: str = "full",
+        workers: int = 1,
+        llm_concurrency: int = 1,
+        batch_size: int = 100,
+    ) -> Dict[str, Any]:
+        """
+        Process airports from source database.
+
+        Args:
+            airports_db_path: Path to airports.db
+            icao_prefixes: Filter by ICAO prefixes (e.g., ["LF", "EG"] for France, UK)
+            icaos: Specific ICAOs to process (overrides prefixes)
+            limit: Max airports to process
+            delay: Delay between LLM calls (seconds); in pipelined mode the
+                minimum spacing between LLM call starts
+            mode: Processing mode:
+                - "full": Process all matching airports (default)
+                - "incremental": Skip airports already in output DB
+                - "changed": Only process airports where AIP text changed
+                - "force": Process all, even if unchanged (same as full)
+            workers: Processes for regex parsing (> 1 enables pipelining)
+            llm_concurrency: Concurrent LLM-fallback calls (> 1 enables pipelining)
+            batch_size: Airports written per commit
+
+        Returns:
+            Dict with processing statistics
+        """
+        airports, unchanged_count = self._select_airports(
+            airports_db_path, icao_prefixes, icaos, limit, mode
+        )
+
         logger.info(f"Processing {len(airports)} airports...")
 
-        success = 0
-        failed = 0
-        skipped = 0
+        stats: Dict[str, Any] = {
+            "total": len(airports),
+            "success": 0,
+            "failed": 0,
+            "skipped": 0,
+            "unchanged": unchanged_count,
+            "llm_calls": 0,
+            "commits": 0,
+        }
+        start = time.monotonic()
+        writer = _ResultWriter(self.output_db_path, batch_size)
+        try:
+            if workers > 1 or llm_concurrency > 1:
+                self._process_pipelined(airports, writer, stats, workers, llm_concurrency, delay)
+            else:
+                self._process_serial(airports, writer, stats, delay)
+        finally:
+            writer.close()
+            if self._parser.cache is not None:
+                self._parser.cache.flush()
+
+        elapsed = time.monotonic() - start
+        stats["commits"] = writer.commits
+        stats["elapsed_seconds"] = round(elapsed, 2)
+        stats["airports_per_second"] = round(len(airports) / elapsed, 2) if elapsed > 0 else 0.0
+        logger.info(
+            f"Processed {len(airports)} airports in {elapsed:.1f}s "
+            f"({stats['airports_per_second']} airports/s, {stats['llm_calls']} LLM calls, "
+            f"{writer.commits} commits)"
+        )
+        return stats
+
+    def _record(
+        self,
+        writer: _ResultWriter,
+        icao: str,
+        parsed: ParsedNotificationRules,
+        stats: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Convert and queue one result, updating success/skipped counts."""
+        result = self._parsed_to_db_record(icao, parsed)
+        writer.add(icao, result)
+        if result.get("confidence", 0) > 0:
+            stats["success"] += 1
+        else:
+            stats["skipped"] += 1
+        return result
 
+    def _process_serial(
+        self,
+        airports: List[Tuple[str, str]],
+        writer: _ResultWriter,
+        stats: Dict[str, Any],
+        delay: float,
+    ) -> None:
+        """Parse airports one after another (original behavior)."""
         for i, (icao, text) in enumerate(airports):
             logger.info(f"[{i+1}/{len(airports)}] {icao}...")
 
             try:
                 # Parse using NotificationParser
-                parsed = self._parser.parse(icao, text)
+                parsed, needs_llm = self._parser.parse_without_llm(icao, text)
+                if needs_llm:
+                    stats["llm_calls"] += 1
+                    parsed = self._parser.complete_with_llm(parsed)
 
-                # Convert to DB record format
-                result = self._parsed_to_db_record(icao, parsed)
-
-                # Save to database
-                self.save_result(icao, result)
+                # Convert to DB record format and queue for writing
+                result = self._record(writer, icao, parsed, stats)
 
                 if result.get("confidence", 0) > 0:
-                    success += 1
                     logger.info(f"  ✓ {result.get('notification_type')} ({result.get('confidence'):.2f})")
                 else:
-                    skipped += 1
                     logger.info(f"  ○ No rules found")
 
             except Exception as e:
-                failed += 1
+                stats["failed"] += 1
                 logger.error(f"  ✗ Failed: {e}")
 
             # Delay between processing (mainly for LLM rate limiting)
             if delay and i < len(airports) - 1:
                 time.sleep(delay)
 
-        return {
-            "total": len(airports),
-            "success": success,
-            "failed": failed,
-            "skipped": skipped,
-            "unchanged": unchanged_count,
-        }
+    def _process_pipelined(
+        self,
+        airports: List[Tuple[str, str]],
+        writer: _ResultWriter,
+        stats: Dict[str, Any],
+        workers: int,
+        llm_concurrency: int,
+        delay: float,
+        progress_every: int = 100,
+    ) -> None:
+        """
+        Regex stage on a process pool, LLM stage on a rate-limited thread
+        pool, all results written by the calling thread.
+        """
+        total = len(airports)
+        start = time.monotonic()
+        done = 0
+        spacer = _CallSpacer(delay)
+
+        def llm_job(parsed: ParsedNotificationRules) -> ParsedNotificationRules:
+            spacer.wait()
+            return self._parser.complete_with_llm(parsed)
+
+        def finished(count: int = 1) -> None:
+            nonlocal done
+            for _ in range(count):
+                done += 1
+                if done % progress_every == 0 or done == total:
+                    elapsed = time.monotonic() - start
+                    rate = done / elapsed if elapsed > 0 else 0.0
+                    eta = (total - done) / rate if rate > 0 else 0.0
+                    logger.info(
+                        f"[{done}/{total}] {rate:.1f} airports/s, "
+                        f"{len(in_flight)} LLM calls pending, ETA {eta:.0f}s"
+                    )
+
+        in_flight: Dict[Future, str] = {}
+
+        def collect(futures: Set[Future]) -> None:
+            for future in futures:
+                icao = in_flight.pop(future)
+                try:
+                    self._record(writer, icao, future.result(), stats)
+                except Exception as e:
+                    stats["failed"] += 1
+                    logger.error(f"{icao}: LLM stage failed: {e}")
+                finished()
+
+        # Small chunks keep workers busy without delaying the first results
+        chunk_size = max(1, min(64, total // (max(workers, 1) * 8) or 1))
+        chunks = [airports[i:i + chunk_size] for i in range(0, total, chunk_size)]
+
+        processes: Optional[ProcessPoolExecutor] = None
+        if workers > 1:
+            processes = ProcessPoolExecutor(
+                max_workers=workers,
+                # spawn: workers must not inherit LLM threads or sqlite handles
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(
+                    self._config,
+                    self._parser.use_llm_fallback,
+                    self._parser.cache.db_path if self._parser.cache is not None else None,
+                    self._parser.cache is not None,
+                    self._parser.cache is not None and self._parser.cache.refresh,
+                ),
+            )
+        llm_pool = ThreadPoolExecutor(max_workers=max(1, llm_concurrency))
+        try:
+            if processes is not None:
+                outcomes = processes.map(_parse_regex_chunk_in_worker, chunks)
+            else:
+                outcomes = (_parse_regex_chunk(self._parser, chunk) for chunk in chunks)
+
+            for chunk_outcomes in outcomes:
+                for icao, parsed, needs_llm, error in chunk_outcomes:
+                    if error is not None:
+                        stats["failed"] += 1
+                        logger.error(f"{icao}: Failed: {error}")
+                        finished()
+                    elif needs_llm:
+                        stats["llm_calls"] += 1
+                        in_flight[llm_pool.submit(llm_job, parsed)] = icao
+                    else:
+                        self._record(writer, icao, parsed, stats)
+                        finished()
+                collect({f for f in in_flight if f.done()})
+
+            while in_flight:
+                completed, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                collect(completed)
+        finally:
+            llm_pool.shutdown(wait=True, cancel_futures=True)
+            if processes is not None:
+                processes.shutdown(wait=True, cancel_futures=True)
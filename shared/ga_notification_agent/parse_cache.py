@@ -0,0 +1,108 @@
+"""
+Content-hash cache for parsed notification rules.
+
+Many airports share identical customs text ("H24", "O/R", national
+boilerplate), and most texts are unchanged between runs. Results are keyed
+by a hash of the text, the field id and the parser fingerprint (parser
+version, regex patterns and parsing/LLM config), so a cached entry is only
+reused when re-parsing would give the same answer. A refresh cache ignores
+entries from earlier runs (forced reprocessing) but still stores new results.
+
+Storage is the GA friendliness LLMResultCache (kind "notification_parse"),
+the same content-addressed cache the review extraction uses.
+"""
+
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+from shared.ga_friendliness.cache import LLMResultCache
+
+PARSE_CACHE_KIND = "notification_parse"
+
+
+class ParseCache:
+    """
+    Two-level cache: a bounded in-memory LRU plus an optional SQLite file.
+
+    Values are opaque JSON strings (see NotificationParser). The SQLite
+    file can be shared between runs and between worker processes; writes
+    are buffered and committed together (flush()).
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        max_memory_entries: int = 50000,
+        flush_every: int = 500,
+        refresh: bool = False,
+    ):
+        """
+        Args:
+            db_path: SQLite file for persistence (None = memory only)
+            max_memory_entries: In-memory entries kept before evicting the
+                least recently used
+            flush_every: Buffered writes committed to disk in one transaction
+            refresh: Only serve entries stored by this instance, so every
+                text is parsed again (results are still written)
+        """
+        self.store = LLMResultCache(
+            db_path, max_memory_entries=max_memory_entries, flush_every=flush_every
+        )
+        self.refresh = refresh
+        # Keys stored by this instance (refresh mode only)
+        self._fresh: Set[str] = set()
+
+    @property
+    def db_path(self) -> Optional[Path]:
+        return self.store.db_path
+
+    @property
+    def hits(self) -> int:
+        return self.store.hits
+
+    @property
+    def misses(self) -> int:
+        return self.store.misses
+
+    def __len__(self) -> int:
+        return self.store.stats()["entries"].get(PARSE_CACHE_KIND, 0)
+
+    def get(self, key: str) -> Optional[str]:
+        """Cached value for key, or None."""
+        if self.refresh and key not in self._fresh:
+            return None
+        return self.store.get(PARSE_CACHE_KIND, key)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, str]:
+        """Look up several keys at once; entries found on disk are promoted to memory."""
+        if self.refresh:
+            keys = [key for key in keys if key in self._fresh]
+        return self.store.get_many(PARSE_CACHE_KIND, keys)
+
+    def set(self, key: str, value: str) -> None:
+        """Store a value."""
+        if self.refresh:
+            self._fresh.add(key)
+        self.store.set(PARSE_CACHE_KIND, key, value)
+
+    def set_many(self, items: Iterable[Tuple[str, str]]) -> None:
+        """Store several values (written to disk on the next flush)."""
+        items = dict(items)
+        if self.refresh:
+            self._fresh.update(items)
+        self.store.set_many(PARSE_CACHE_KIND, items)
+
+    def flush(self) -> None:
+        """Commit buffered writes to the SQLite file."""
+        self.store.flush()
+
+    def clear(self) -> None:
+        """Drop all entries (memory and disk)."""
+        self.store.clear(PARSE_CACHE_KIND)
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters for this instance."""
+        return {"hits": self.hits, "misses": self.misses}
+
+    def close(self) -> None:
+        self.store.close()
@@ -7,13 +7,19 @@ Uses a waterfall approach:
     2. Complexity detection
     3. LLM extraction for complex cases (OpenAI API)
 
+Each text is scanned once (see TextScan) and results are memoized by
+content hash (see parse_cache.py), so repeated texts are parsed once.
+
 Configuration is loaded from configs/ga_notification_agent/default.json.
 See config.py for configuration options.
 """
 
 import re
 import os
+import json
+import hashlib
 import logging
+from functools import cached_property
 from typing import List, Optional, Tuple, Dict, Any, TYPE_CHECKING
 from dataclasses import dataclass
 
@@ -23,6 +29,7 @@ from .models import (
     NotificationType,
     ParsedNotificationRules,
 )
+from .parse_cache import ParseCache
 
 if TYPE_CHECKING:
     from .config import NotificationAgentConfig
@@ -39,6 +46,80 @@ class ParseResult:
     complexity_indicators: List[str]
 
 
+class TextScan:
+    """
+    Pattern-family matches for one text, each family evaluated at most once.
+
+    Whole-word tokens (day names, H24, "schengen", "prohibited") cannot
+    overlap, so they come from a single combined pass. Phrase families can
+    overlap each other, so they keep their own regexes but are evaluated
+    lazily and memoized.
+    """
+
+    def __init__(self, text: str, parser: "NotificationParser"):
+        self.text = text
+        self._parser = parser
+        self.days: List[str] = []
+        self.has_h24 = False
+        self.has_schengen_word = False
+        self.has_prohibited_word = False
+        for match in parser.WORD_TOKEN_PATTERN.finditer(text):
+            kind = match.lastgroup
+            if kind == 'day':
+                self.days.append(match.group().upper())
+            elif kind == 'h24':
+                self.has_h24 = True
+            elif kind == 'schengen':
+                self.has_schengen_word = True
+            else:
+                self.has_prohibited_word = True
+
+    @cached_property
+    def distinct_days(self) -> int:
+        return len(set(self.days))
+
+    @cached_property
+    def has_hours(self) -> bool:
+        return bool(self._parser.HOURS_PATTERN.search(self.text))
+
+    @cached_property
+    def has_on_request(self) -> bool:
+        return bool(self._parser.ON_REQUEST_PATTERN.search(self.text))
+
+    @cached_property
+    def has_as_ad_hours(self) -> bool:
+        return bool(self._parser.AS_AD_HOURS_PATTERN.search(self.text))
+
+    @cached_property
+    def operating_hours(self) -> Optional[re.Match]:
+        return self._parser.OPERATING_HOURS_PATTERN.match(self.text)
+
+    @cached_property
+    def complexity_indicators(self) -> List[str]:
+        indicators = []
+        for name, pattern in self._parser.COMPLEXITY_PATTERNS.items():
+            if name == 'long_text':
+                if len(self.text) > 300:
+                    indicators.append('long_text')
+            elif pattern and pattern.search(self.text):
+                indicators.append(name)
+        if self.distinct_days >= 4:
+            indicators.append('many_day_references')
+        return indicators
+
+    @cached_property
+    def schengen_context(self) -> Tuple[bool, bool]:
+        # Both context phrases contain "schengen" (not always as a whole word)
+        if 'schengen' not in self.text.casefold():
+            return (False, False)
+        is_non_schengen = bool(self._parser.NON_SCHENGEN_PATTERN.search(self.text))
+        is_schengen = bool(self._parser.SCHENGEN_ONLY_PATTERN.search(self.text))
+        # If both are mentioned, it's likely a complex case with separate rules
+        if is_non_schengen and is_schengen:
+            return (False, False)  # Let individual rules handle it
+        return (is_schengen, is_non_schengen)
+
+
 class NotificationParser:
     """
     Parse notification requirements from AIP text using waterfall logic.
@@ -47,7 +128,13 @@ class NotificationParser:
         1. Try quick regex patterns (H24, O/R, simple PPR hours)
         2. Check complexity indicators
         3. If complex and LLM enabled, use OpenAI for extraction
+
+    Results are cached by content hash (in memory by default; pass a
+    ParseCache with a db_path to persist across runs).
     """
+
+    # Bump when parsing logic changes in a way patterns/config don't capture
+    PARSER_VERSION = "1"
     
     # === REGEX PATTERNS ===
     
@@ -145,6 +232,25 @@ class NotificationParser:
         ),
         'long_text': None,  # Checked separately
     }
+
+    # Whole-word tokens found together in one pass (see TextScan)
+    WORD_TOKEN_PATTERN = re.compile(
+        r'\b(?:(?P<day>MON|TUE|WED|THU|FRI|SAT|SUN)|(?P<h24>H24)|'
+        r'(?P<schengen>schengen)|(?P<prohibited>prohibited))\b',
+        re.IGNORECASE
+    )
+
+    # Schengen context: non-Schengen indicators (extra-Schengen, non-Schengen, outside Schengen)
+    NON_SCHENGEN_PATTERN = re.compile(
+        r'\b(?:extra[- ]?schengen|non[- ]?schengen|outside\s+schengen)\b',
+        re.IGNORECASE
+    )
+
+    # Schengen-only indicators (within Schengen, Schengen flights only)
+    SCHENGEN_ONLY_PATTERN = re.compile(
+        r'\b(?:within\s+schengen|schengen\s+(?:flights?\s+)?only)\b',
+        re.IGNORECASE
+    )
     
     # Day name mapping
     DAY_MAP = {
@@ -169,6 +275,8 @@ class NotificationParser:
         llm_api_key: Optional[str] = None,
         config: Optional["NotificationAgentConfig"] = None,
         config_name: str = "default",
+        cache: Optional[ParseCache] = None,
+        use_cache: bool = True,
     ):
         """
         Initialize parser.
@@ -185,6 +293,8 @@ class NotificationParser:
             llm_api_key: API key (defaults to OPENAI_API_KEY env var)
             config: Pre-loaded NotificationAgentConfig (optional)
             config_name: Name of config to load if config not provided (default: "default")
+            cache: Parse cache to use (default: a new in-memory cache)
+            use_cache: Set False to disable caching entirely
         """
         # Load config if not provided
         if config is None:
@@ -205,6 +315,58 @@ class NotificationParser:
         # Store thresholds from config
         self._complexity_threshold = config.parsing.complexity_threshold
         self._confidence = config.parsing.confidence
+
+        if not use_cache:
+            self.cache = None
+        else:
+            self.cache = cache if cache is not None else ParseCache()
+        self.fingerprint = self._compute_fingerprint()
+
+    def _compute_fingerprint(self) -> str:
+        """Hash of everything besides the text that determines a parse result."""
+        patterns = [
+            getattr(self, name).pattern
+            for name in sorted(dir(type(self)))
+            if name.endswith('_PATTERN')
+        ]
+        patterns += [
+            f"{name}={pattern.pattern if pattern else None}"
+            for name, pattern in self.COMPLEXITY_PATTERNS.items()
+        ]
+        material = {
+            "version": self.PARSER_VERSION,
+            "patterns": patterns,
+            "parsing": self._config.parsing.model_dump(mode="json"),
+            "llm_model": self.llm_model,
+            "llm_temperature": self._config.llm.temperature,
+            "llm_prompt": self._config.prompts.parser,
+            "use_llm_fallback": self.use_llm_fallback,
+        }
+        encoded = json.dumps(material, sort_keys=True).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def cache_key(self, text: str, std_field_id: int = 302) -> str:
+        """Content-hash cache key for a text under this parser's fingerprint."""
+        digest = hashlib.sha256()
+        digest.update(f"{self.fingerprint}:{std_field_id}:".encode("utf-8"))
+        digest.update((text or "").strip().encode("utf-8"))
+        return digest.hexdigest()
+
+    def _cache_get(
+        self, icao: str, text: str, std_field_id: int
+    ) -> Optional[ParsedNotificationRules]:
+        if self.cache is None:
+            return None
+        value = self.cache.get(self.cache_key(text, std_field_id))
+        if value is None:
+            return None
+        return ParsedNotificationRules.model_validate(dict(json.loads(value), icao=icao))
+
+    def _cache_set(self, parsed: ParsedNotificationRules) -> None:
+        if self.cache is None:
+            return
+        value = parsed.model_dump_json(exclude={"icao"})
+        self.cache.set(self.cache_key(parsed.raw_text, parsed.source_std_field_id), value)
     
     def parse(self, icao: str, text: str, std_field_id: int = 302) -> ParsedNotificationRules:
         """
@@ -215,18 +377,54 @@ class NotificationParser:
             2. Check complexity indicators
             3. If complex and LLM enabled, use OpenAI
         """
+        parsed, needs_llm = self.parse_without_llm(icao, text, std_field_id)
+        if needs_llm:
+            return self.complete_with_llm(parsed)
+        return parsed
+
+    def parse_without_llm(
+        self, icao: str, text: str, std_field_id: int = 302
+    ) -> Tuple[ParsedNotificationRules, bool]:
+        """
+        Run the regex steps of parse() (1 and 2) only.
+        
+        Cheap and CPU-bound, so batch callers can run it in worker processes
+        and send only the complex cases to the LLM.
+        
+        Returns:
+            (parsed, needs_llm): parsed is what parse() returns when the LLM
+            step is skipped or finds nothing; needs_llm is True if parse()
+            would call the LLM (pass parsed to complete_with_llm()). Cached
+            results (including cached LLM results) come back with needs_llm
+            False.
+        """
         if not text or not text.strip():
             return ParsedNotificationRules(
                 icao=icao,
                 raw_text=text or "",
                 source_std_field_id=std_field_id,
                 parse_warnings=["Empty text"],
-            )
+            ), False
         
         text = text.strip()
-        
+
+        cached = self._cache_get(icao, text, std_field_id)
+        if cached is not None:
+            return cached, False
+
+        parsed, needs_llm = self._parse_regex(icao, text, std_field_id)
+        if not needs_llm:
+            self._cache_set(parsed)
+        return parsed, needs_llm
+
+    def _parse_regex(
+        self, icao: str, text: str, std_field_id: int
+    ) -> Tuple[ParsedNotificationRules, bool]:
+        """Steps 1 and 2 on stripped, non-empty text (uncached)."""
+        scan = TextScan(text, self)
+
         # STEP 1: Try quick regex patterns
-        parse_result = self._try_quick_patterns(text)
+        parse_result = self._try_quick_patterns(text, scan)
 
         # If high confidence and complete, we're done
         complete_threshold = self._confidence.complete_threshold
@@ -237,10 +435,10 @@ class NotificationParser:
                 rules=parse_result.rules,
                 raw_text=text,
                 source_std_field_id=std_field_id,
-            )
+            ), False
 
         # STEP 2: Check complexity
-        complexity_indicators = self._detect_complexity(text)
+        complexity_indicators = self._detect_complexity(text, scan)
         complexity_score = len(complexity_indicators)
         complexity_threshold = self._complexity_threshold
 
@@ -254,20 +452,12 @@ class NotificationParser:
                 raw_text=text,
                 source_std_field_id=std_field_id,
                 parse_warnings=[f"Partial parse (complexity={complexity_score})"],
-            )
+            ), False
 
-        # STEP 3: Use LLM for complex cases
-        if self.use_llm_fallback and complexity_score > complexity_threshold:
-            logger.info(f"{icao}: Using LLM for complex notification (indicators: {complexity_indicators})")
-            llm_rules = self._parse_with_llm(icao, text)
-
-            if llm_rules:
-                return ParsedNotificationRules(
-                    icao=icao,
-                    rules=llm_rules,
-                    raw_text=text,
-                    source_std_field_id=std_field_id,
-                )
+        # STEP 3 (complete_with_llm): Use LLM for complex cases
+        needs_llm = self.use_llm_fallback and complexity_score > complexity_threshold
+        if needs_llm:
+            logger.debug(f"{icao}: Complex notification needs LLM (indicators: {complexity_indicators})")
 
         # Fallback: return whatever we have
         warnings = []
@@ -282,9 +472,30 @@ class NotificationParser:
             raw_text=text,
             source_std_field_id=std_field_id,
             parse_warnings=warnings,
-        )
+        ), needs_llm
+
+    def complete_with_llm(self, parsed: ParsedNotificationRules) -> ParsedNotificationRules:
+        """
+        Run the LLM step of parse() for a result from parse_without_llm().
+        
+        Returns the LLM rules, or `parsed` unchanged if the LLM found none.
+        Only successful LLM results are cached, so failures are retried.
+        """
+        logger.info(f"{parsed.icao}: Using LLM for complex notification")
+        llm_rules = self._parse_with_llm(parsed.icao, parsed.raw_text)
+
+        if llm_rules:
+            result = ParsedNotificationRules(
+                icao=parsed.icao,
+                rules=llm_rules,
+                raw_text=parsed.raw_text,
+                source_std_field_id=parsed.source_std_field_id,
+            )
+            self._cache_set(result)
+            return result
+        return parsed
     
-    def _try_quick_patterns(self, text: str) -> ParseResult:
+    def _try_quick_patterns(self, text: str, scan: Optional[TextScan] = None) -> ParseResult:
         """
         Try quick regex patterns for simple cases.
         
@@ -292,12 +503,13 @@ class NotificationParser:
         Only marks as "complete" if text is short and simple.
         """
         rules: List[NotificationRule] = []
+        scan = scan or TextScan(text, self)
         
         # Pre-check: if text is long or has complexity markers, don't return early
         is_simple_text = len(text) < 100
-        has_multiple_days = len(re.findall(r'\b(MON|TUE|WED|THU|FRI|SAT|SUN)\b', text, re.IGNORECASE)) >= 3
-        has_schengen = bool(re.search(r'\bschengen\b', text, re.IGNORECASE))
-        has_prohibited = bool(re.search(r'\bprohibited\b', text, re.IGNORECASE))
+        has_multiple_days = len(scan.days) >= 3
+        has_schengen = scan.has_schengen_word
+        has_prohibited = scan.has_prohibited_word
         
         text_is_complex = has_multiple_days or has_schengen or has_prohibited or len(text) > 200
         
@@ -305,7 +517,7 @@ class NotificationParser:
         conf = self._confidence
 
         # Check H24 - simplest case (only complete if short text)
-        if self.H24_PATTERN.search(text):
+        if scan.has_h24:
             rules.append(NotificationRule(
                 rule_type=RuleType.CUSTOMS,
                 notification_type=NotificationType.H24,
@@ -316,7 +528,7 @@ class NotificationParser:
             return ParseResult(rules=rules, confidence=conf.h24, is_complete=is_complete, complexity_indicators=[])
 
         # Check simple "on request" (without hours) - only complete if simple text
-        if self.ON_REQUEST_PATTERN.search(text) and not self.HOURS_PATTERN.search(text):
+        if scan.has_on_request and not scan.has_hours:
             # Don't mark as complete if text is complex
             if not text_is_complex:
                 rules.append(NotificationRule(
@@ -329,7 +541,7 @@ class NotificationParser:
             # Text is complex - don't return early, continue to more detailed parsing
 
         # Check "as AD hours" - only complete if simple text
-        if self.AS_AD_HOURS_PATTERN.search(text) and not self.HOURS_PATTERN.search(text):
+        if scan.has_as_ad_hours and not scan.has_hours:
             if not text_is_complex:
                 rules.append(NotificationRule(
                     rule_type=RuleType.CUSTOMS,
@@ -341,8 +553,8 @@ class NotificationParser:
 
         # Check for operating hours format (e.g., "0800 - 1800") without PPR/PN requirement
         # This indicates service available during those hours with no advance notice needed
-        operating_hours_match = self.OPERATING_HOURS_PATTERN.match(text)
-        if operating_hours_match and not self.HOURS_PATTERN.search(text):
+        operating_hours_match = scan.operating_hours
+        if operating_hours_match and not scan.has_hours:
             hours_start = operating_hours_match.group(1)
             hours_end = operating_hours_match.group(2)
             rules.append(NotificationRule(
@@ -362,7 +574,7 @@ class NotificationParser:
             rules.extend(weekday_rules)
         
         # Try simple hours rules
-        if not rules:
+        if not rules and scan.has_hours:
             hours_rules = self._extract_hours_rules(text)
             if hours_rules:
                 rules.extend(hours_rules)
@@ -373,7 +585,7 @@ class NotificationParser:
             rules.extend(business_rules)
         
         # Apply Schengen context to all rules
-        rules = self._apply_schengen_context(rules, text)
+        rules = self._apply_schengen_context(rules, text, scan)
         
         # Calculate confidence based on what we found
         if rules:
@@ -389,60 +601,28 @@ class NotificationParser:
         
         return ParseResult(rules=[], confidence=0.0, is_complete=False, complexity_indicators=[])
     
-    def _detect_complexity(self, text: str) -> List[str]:
+    def _detect_complexity(self, text: str, scan: Optional[TextScan] = None) -> List[str]:
         """Detect complexity indicators in the text."""
-        indicators = []
-        
-        for name, pattern in self.COMPLEXITY_PATTERNS.items():
-            if name == 'long_text':
-                if len(text) > 300:
-                    indicators.append('long_text')
-            elif pattern and pattern.search(text):
-                indicators.append(name)
-        
-        # Check for multiple distinct day ranges
-        day_mentions = re.findall(
-            r'\b(MON|TUE|WED|THU|FRI|SAT|SUN)\b',
-            text, re.IGNORECASE
-        )
-        if len(set(d.upper() for d in day_mentions)) >= 4:
-            indicators.append('many_day_references')
-        
-        return indicators
+        return list((scan or TextScan(text, self)).complexity_indicators)
     
-    def _detect_schengen_context(self, text: str) -> Tuple[bool, bool]:
+    def _detect_schengen_context(
+        self, text: str, scan: Optional[TextScan] = None
+    ) -> Tuple[bool, bool]:
         """
         Detect Schengen flight context from text.
         
         Returns:
             (schengen_only, non_schengen_only) tuple
         """
-        # Check for non-Schengen indicators (extra-Schengen, non-Schengen, outside Schengen)
-        non_schengen_pattern = re.compile(
-            r'\b(?:extra[- ]?schengen|non[- ]?schengen|outside\s+schengen)\b',
-            re.IGNORECASE
-        )
-        
-        # Check for Schengen-only indicators (within Schengen, Schengen flights only)
-        schengen_pattern = re.compile(
-            r'\b(?:within\s+schengen|schengen\s+(?:flights?\s+)?only)\b',
-            re.IGNORECASE
-        )
-        
-        is_non_schengen = bool(non_schengen_pattern.search(text))
-        is_schengen = bool(schengen_pattern.search(text))
-        
-        # If both are mentioned, it's likely a complex case with separate rules
-        if is_non_schengen and is_schengen:
-            return (False, False)  # Let individual rules handle it
-        
-        return (is_schengen, is_non_schengen)
+        return (scan or TextScan(text, self)).schengen_context
     
     def _apply_schengen_context(
-        self, rules: List[NotificationRule], text: str
+        self, rules: List[NotificationRule], text: str, scan: Optional[TextScan] = None
     ) -> List[NotificationRule]:
         """Apply Schengen context to all rules if detected in text."""
-        schengen_only, non_schengen_only = self._detect_schengen_context(text)
+        if not rules:
+            return rules
+        schengen_only, non_schengen_only = self._detect_schengen_context(text, scan)
         
         if not schengen_only and not non_schengen_only:
             return rules
@@ -707,8 +887,34 @@ Text: {text}"""
         airports: List[Tuple[str, str]],
         std_field_id: int = 302,
     ) -> List[ParsedNotificationRules]:
-        """Parse notification rules for multiple airports."""
-        return [
-            self.parse(icao, text, std_field_id)
-            for icao, text in airports
-        ]
+        """
+        Parse notification rules for multiple airports.
+
+        Each distinct text is parsed once (after one bulk cache lookup) and
+        every airport gets its own copy of the result, in input order.
+        """
+        positions: Dict[str, List[int]] = {}
+        for i, (_, text) in enumerate(airports):
+            positions.setdefault(text or "", []).append(i)
+
+        if self.cache is not None:
+            # Warm the in-memory level with one query for all texts
+            self.cache.get_many(
+                self.cache_key(text, std_field_id) for text in positions if text.strip()
+            )
+
+        results: List[Optional[ParsedNotificationRules]] = [None] * len(airports)
+        for text, indexes in positions.items():
+            first = indexes[0]
+            parsed = self.parse(airports[first][0], text, std_field_id)
+            results[first] = parsed
+            if len(indexes) > 1:
+                # Re-validating a dump builds independent copies much faster than deepcopy
+                dumped = parsed.model_dump()
+                for i in indexes[1:]:
+                    results[i] = ParsedNotificationRules.model_validate(
+                        dict(dumped, icao=airports[i][0])
+                    )
+        if self.cache is not None:
+            self.cache.flush()
+        return results
@@ -6,12 +6,16 @@ Uses LangChain to extract structured aspect-label pairs from free-text reviews.
 
 import json
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Tuple
 
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+from tenacity import Retrying, stop_after_attempt, wait_exponential, retry_if_exception_type
 
+from shared.ga_friendliness.cache import LLMResultCache, content_hash
 from shared.ga_friendliness.exceptions import ReviewExtractionError
 from shared.ga_friendliness.interfaces import ReviewExtractorInterface
+from shared.ga_friendliness.ratelimit import TokenBucket
 from shared.ga_friendliness.models import (
     AspectLabel,
     OntologyConfig,
@@ -47,15 +51,49 @@ Only include aspects that are actually mentioned or clearly implied in the revie
 Be conservative - only extract with high confidence when the text clearly supports it."""
 
 
+# Prompt for several short reviews in one call (pack_size > 1)
+PACKED_EXTRACTION_PROMPT_TEMPLATE = """You are an expert at analyzing aviation reviews and extracting structured information.
+
+Given several numbered reviews of an airfield/airport, extract relevant aspects and labels for EACH review
+independently, according to the ontology below.
+
+{ontology_context}
+
+For each aspect mentioned in a review, assign the most appropriate label.
+Only extract aspects that are clearly mentioned or implied in that review.
+Assign a confidence score (0.0-1.0) based on how certain you are about the extraction.
+
+Reviews to analyze:
+{reviews_block}
+
+Respond with a JSON object in this exact format, with one entry per review index:
+{{
+    "reviews": [
+        {{"index": <review_index>, "aspects": [
+            {{"aspect": "<aspect_name>", "label": "<label>", "confidence": <0.0-1.0>}},
+            ...
+        ]}},
+        ...
+    ]
+}}
+
+Be conservative - only extract with high confidence when the text clearly supports it."""
+
+
 class ReviewExtractor(ReviewExtractorInterface):
     """
     Extracts structured tags from free-text reviews using LLM.
     
     Features:
-        - Retry logic for transient failures
+        - Retry logic with exponential backoff for transient failures
+        - Bounded concurrency and optional token-bucket rate limiting
+        - Optional packing of several short reviews into one prompt
+        - Optional persistent cache keyed by review text, ontology, prompt and model
         - Token usage tracking
         - Error handling with specific exceptions
         - Support for mock LLM for testing
+
+    extract_batch() returns results in input order regardless of concurrency.
     """
 
     def __init__(
@@ -66,6 +104,13 @@ class ReviewExtractor(ReviewExtractorInterface):
         api_key: Optional[str] = None,
         max_retries: int = 3,
         mock_llm: bool = False,
+        max_concurrency: int = 1,
+        requests_per_minute: Optional[float] = None,
+        pack_size: int = 1,
+        pack_max_chars: int = 600,
+        retry_min_wait: float = 2.0,
+        retry_max_wait: float = 10.0,
+        cache: Optional[LLMResultCache] = None,
     ):
         """
         Initialize extractor with LLM.
@@ -77,6 +122,13 @@ class ReviewExtractor(ReviewExtractorInterface):
             api_key: OpenAI API key (uses env var if not provided)
             max_retries: Maximum number of retry attempts for LLM calls
             mock_llm: If True, use mock LLM for testing
+            max_concurrency: Maximum LLM calls in flight (shared across threads)
+            requests_per_minute: Optional rate limit for LLM calls (None = unlimited)
+            pack_size: Reviews packed into one prompt (1 = one call per review)
+            pack_max_chars: Only reviews up to this length are packed
+            retry_min_wait: Minimum backoff between retries (seconds)
+            retry_max_wait: Maximum backoff between retries (seconds)
+            cache: Optional LLMResultCache; cached reviews skip the LLM
         """
         self.ontology = ontology
         self.llm_model = llm_model
@@ -84,6 +136,20 @@ class ReviewExtractor(ReviewExtractorInterface):
         self.api_key = api_key
         self.max_retries = max_retries
         self.mock_llm = mock_llm
+        self.max_concurrency = max(1, max_concurrency)
+        self.pack_size = max(1, pack_size)
+        self.pack_max_chars = pack_max_chars
+        self.retry_min_wait = retry_min_wait
+        self.retry_max_wait = retry_max_wait
+        self._rate_limiter = TokenBucket.per_minute(requests_per_minute) if requests_per_minute else None
+        self._slots = threading.BoundedSemaphore(self.max_concurrency)
+        self._usage_lock = threading.Lock()
+        self.cache = cache
+        
+        # Cache key components: any change invalidates earlier extractions
+        self.prompt_version = content_hash(EXTRACTION_PROMPT_TEMPLATE, PACKED_EXTRACTION_PROMPT_TEMPLATE)[:16]
+        self.ontology_version = f"{ontology.version}:{content_hash(ontology.aspects)[:16]}"
+        self.model_id = "mock" if mock_llm else f"{llm_model}@{llm_temperature}"
         
         # Token usage tracking
         self._token_usage = {
@@ -127,8 +193,9 @@ class ReviewExtractor(ReviewExtractorInterface):
             # Create prompt template
             self._prompt = ChatPromptTemplate.from_template(EXTRACTION_PROMPT_TEMPLATE)
             
-            # Create chain
+            # Create chains
             self._chain = self._prompt | self._llm
+            self._packed_chain = ChatPromptTemplate.from_template(PACKED_EXTRACTION_PROMPT_TEMPLATE) | self._llm
             
         except ImportError as e:
             raise ReviewExtractionError(
@@ -201,37 +268,36 @@ class ReviewExtractor(ReviewExtractorInterface):
         except json.JSONDecodeError as e:
             raise ReviewExtractionError(f"Failed to parse LLM response as JSON: {e}")
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type(Exception),
-        reraise=True,
-    )
-    def _call_llm(self, review_text: str) -> Dict[str, Any]:
-        """Call LLM with retry logic."""
-        if self.mock_llm:
-            return self._mock_extract(review_text)
-        
-        if self._chain is None:
-            raise ReviewExtractionError("LLM chain not initialized")
-        
+    def _with_retry(self, fn, *args):
+        """Call fn with rate limiting, a concurrency slot and exponential-backoff retry."""
+        retrying = Retrying(
+            stop=stop_after_attempt(self.max_retries),
+            wait=wait_exponential(multiplier=1, min=self.retry_min_wait, max=self.retry_max_wait),
+            retry=retry_if_exception_type(Exception),
+            reraise=True,
+        )
+        for attempt in retrying:
+            with attempt:
+                if self._rate_limiter is not None:
+                    self._rate_limiter.acquire()
+                with self._slots:
+                    return fn(*args)
+
+    def _invoke_chain(self, chain: Any, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """Single chain invocation (no retry); tracks token usage."""
         try:
-            # Invoke chain
-            response = self._chain.invoke({
-                "ontology_context": self._ontology_context,
-                "review_text": review_text,
-            })
+            response = chain.invoke(inputs)
             
             # Extract content from AIMessage
             content = response.content if hasattr(response, "content") else str(response)
             
             # Track token usage if available
-            if hasattr(response, "usage_metadata"):
-                usage = response.usage_metadata
-                self._token_usage["input_tokens"] += usage.get("input_tokens", 0)
-                self._token_usage["output_tokens"] += usage.get("output_tokens", 0)
-            
-            self._token_usage["total_calls"] += 1
+            with self._usage_lock:
+                if hasattr(response, "usage_metadata"):
+                    usage = response.usage_metadata
+                    self._token_usage["input_tokens"] += usage.get("input_tokens", 0)
+                    self._token_usage["output_tokens"] += usage.get("output_tokens", 0)
+                self._token_usage["total_calls"] += 1
             
             return self._parse_llm_response(content)
             
@@ -239,6 +305,86 @@ class ReviewExtractor(ReviewExtractorInterface):
             logger.error(f"LLM call failed: {e}")
             raise
 
+    def _call_llm(self, review_text: str) -> Dict[str, Any]:
+        """Call LLM with retry logic."""
+        if self.mock_llm:
+            return self._mock_extract(review_text)
+        
+        if self._chain is None:
+            raise ReviewExtractionError("LLM chain not initialized")
+        
+        return self._with_retry(self._invoke_chain, self._chain, {
+            "ontology_context": self._ontology_context,
+            "review_text": review_text,
+        })
+
+    def _call_llm_packed(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """
+        Extract several reviews in one LLM call.
+        
+        Returns one {"aspects": [...]} dict per text, in order.
+        
+        Raises:
+            ReviewExtractionError: If the response does not cover every review
+        """
+        if self.mock_llm:
+            return [self._mock_extract(text) for text in texts]
+        
+        if self._chain is None:
+            raise ReviewExtractionError("LLM chain not initialized")
+        
+        reviews_block = "\n".join(f'{i}. "{text}"' for i, text in enumerate(texts))
+        result = self._with_retry(self._invoke_chain, self._packed_chain, {
+            "ontology_context": self._ontology_context,
+            "reviews_block": reviews_block,
+        })
+        
+        by_index: Dict[int, Dict[str, Any]] = {}
+        for item in result.get("reviews", []):
+            try:
+                by_index[int(item.get("index"))] = {"aspects": item.get("aspects", [])}
+            except (TypeError, ValueError):
+                continue
+        missing = [i for i in range(len(texts)) if i not in by_index]
+        if missing:
+            raise ReviewExtractionError(f"Packed response missing reviews {missing}")
+        return [by_index[i] for i in range(len(texts))]
+
+    def _to_extraction(
+        self,
+        result: Dict[str, Any],
+        review_text: str,
+        review_id: Optional[str],
+        timestamp: Optional[str],
+    ) -> ReviewExtraction:
+        """Validate parsed LLM output against the ontology."""
+        aspects = []
+        for item in result.get("aspects", []):
+            aspect = item.get("aspect", "")
+            label = item.get("label", "")
+            confidence = float(item.get("confidence", 0.0))
+            
+            # Validate against ontology
+            if not self.ontology.validate_aspect(aspect):
+                logger.warning(f"Unknown aspect '{aspect}' in extraction (review_id={review_id})")
+                continue
+            if not self.ontology.validate_label(aspect, label):
+                logger.warning(f"Invalid label '{label}' for aspect '{aspect}' (review_id={review_id})")
+                continue
+            
+            aspects.append(AspectLabel(
+                aspect=aspect,
+                label=label,
+                confidence=confidence,
+            ))
+        
+        return ReviewExtraction(
+            review_id=review_id,
+            aspects=aspects,
+            raw_text_excerpt=review_text[:200] if len(review_text) > 200 else review_text,
+            timestamp=timestamp,
+        )
+
     def extract(
         self,
         review_text: str,
@@ -261,37 +407,68 @@ class ReviewExtractor(ReviewExtractorInterface):
         """
         try:
             result = self._call_llm(review_text)
-            
-            # Parse aspects
-            aspects = []
-            for item in result.get("aspects", []):
-                aspect = item.get("aspect", "")
-                label = item.get("label", "")
-                confidence = float(item.get("confidence", 0.0))
-                
-                # Validate against ontology
-                if not self.ontology.validate_aspect(aspect):
-                    logger.warning(f"Unknown aspect '{aspect}' in extraction (review_id={review_id})")
-                    continue
-                if not self.ontology.validate_label(aspect, label):
-                    logger.warning(f"Invalid label '{label}' for aspect '{aspect}' (review_id={review_id})")
-                    continue
-                
-                aspects.append(AspectLabel(
-                    aspect=aspect,
-                    label=label,
-                    confidence=confidence,
-                ))
-            
+            return self._to_extraction(result, review_text, review_id, timestamp)
+        except Exception as e:
+            raise ReviewExtractionError(f"Failed to extract from review: {e}")
+
+    def _plan_jobs(self, reviews: List[Tuple[str, Optional[str], Optional[str]]]) -> List[List[int]]:
+        """Group review indices into LLM calls (packs of short reviews, singles otherwise)."""
+        if self.pack_size <= 1:
+            return [[i] for i in range(len(reviews))]
+        
+        jobs: List[List[int]] = []
+        pack: List[int] = []
+        for i, (text, _, _) in enumerate(reviews):
+            if len(text) > self.pack_max_chars:
+                jobs.append([i])
+                continue
+            pack.append(i)
+            if len(pack) == self.pack_size:
+                jobs.append(pack)
+                pack = []
+        if pack:
+            jobs.append(pack)
+        return jobs
+
+    def cache_key(self, review_text: str) -> str:
+        """Cache key for a review under the current ontology, prompt and model."""
+        return content_hash(
+            content_hash(review_text), self.ontology_version, self.prompt_version, self.model_id
+        )
+
+    def _extract_or_empty(
+        self, text: str, review_id: Optional[str], timestamp: Optional[str]
+    ) -> Tuple[ReviewExtraction, bool]:
+        """Extraction plus whether it succeeded (failures are not cached)."""
+        try:
+            return self.extract(text, review_id, timestamp), True
+        except ReviewExtractionError as e:
+            logger.error(f"Failed to extract review {review_id}: {e}")
+            # Return empty extraction for failed reviews
             return ReviewExtraction(
                 review_id=review_id,
-                aspects=aspects,
-                raw_text_excerpt=review_text[:200] if len(review_text) > 200 else review_text,
+                aspects=[],
                 timestamp=timestamp,
-            )
-            
+            ), False
+
+    def _run_job(
+        self,
+        reviews: List[Tuple[str, Optional[str], Optional[str]]],
+        indices: List[int],
+    ) -> List[Tuple[ReviewExtraction, bool]]:
+        if len(indices) == 1:
+            return [self._extract_or_empty(*reviews[indices[0]])]
+        
+        try:
+            results = self._call_llm_packed([reviews[i][0] for i in indices])
+            return [
+                (self._to_extraction(result, *reviews[i]), True)
+                for i, result in zip(indices, results)
+            ]
         except Exception as e:
-            raise ReviewExtractionError(f"Failed to extract from review: {e}")
+            # Fall back to one call per review so a bad pack only costs extra calls
+            logger.warning(f"Packed extraction failed ({e}); retrying {len(indices)} reviews individually")
+            return [self._extract_or_empty(*reviews[i]) for i in indices]
 
     def extract_batch(
         self,
@@ -300,36 +477,64 @@ class ReviewExtractor(ReviewExtractorInterface):
         """
         Extract tags from multiple reviews.
         
+        Calls run concurrently up to max_concurrency; results are always
+        returned in input order. Failed reviews yield empty extractions.
+        With a cache, previously extracted review texts skip the LLM and
+        new successful extractions are stored.
+        
         Args:
             reviews: List of (text, review_id, timestamp) tuples
         
         Returns:
             List of ReviewExtraction objects
         """
-        results = []
-        for text, review_id, timestamp in reviews:
-            try:
-                result = self.extract(text, review_id, timestamp)
-                results.append(result)
-            except ReviewExtractionError as e:
-                logger.error(f"Failed to extract review {review_id}: {e}")
-                # Return empty extraction for failed reviews
-                results.append(ReviewExtraction(
-                    review_id=review_id,
-                    aspects=[],
-                    timestamp=timestamp,
-                ))
-        return results
+        reviews = list(reviews)
+        results: List[Optional[ReviewExtraction]] = [None] * len(reviews)
+        
+        # Serve cached reviews; only misses go to the LLM
+        keys: List[str] = []
+        pending = list(range(len(reviews)))
+        if self.cache is not None:
+            keys = [self.cache_key(text) for text, _, _ in reviews]
+            cached = self.cache.get_many("extraction", keys)
+            for i, key in enumerate(keys):
+                if key in cached:
+                    results[i] = self._to_extraction(cached[key], *reviews[i])
+            pending = [i for i in pending if results[i] is None]
+        
+        misses = [reviews[i] for i in pending]
+        jobs = self._plan_jobs(misses)
+        
+        if self.max_concurrency > 1 and len(jobs) > 1:
+            with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(jobs))) as pool:
+                job_results = list(pool.map(lambda job: self._run_job(misses, job), jobs))
+        else:
+            job_results = [self._run_job(misses, job) for job in jobs]
+        
+        new_entries: Dict[str, Any] = {}
+        for indices, outcomes in zip(jobs, job_results):
+            for j, (extraction, ok) in zip(indices, outcomes):
+                i = pending[j]
+                results[i] = extraction
+                if ok and self.cache is not None:
+                    new_entries[keys[i]] = {
+                        "aspects": [a.model_dump() for a in extraction.aspects],
+                    }
+        if new_entries:
+            self.cache.set_many("extraction", new_entries)
+        return results  # type: ignore[return-value]
 
     def get_token_usage(self) -> Dict[str, int]:
         """Get cumulative token usage stats."""
-        return self._token_usage.copy()
+        with self._usage_lock:
+            return self._token_usage.copy()
 
     def reset_token_usage(self) -> None:
         """Reset token usage counters."""
-        self._token_usage = {
-            "input_tokens": 0,
-            "output_tokens": 0,
-            "total_calls": 0,
-        }
+        with self._usage_lock:
+            self._token_usage = {
+                "input_tokens": 0,
+                "output_tokens": 0,
+                "total_calls": 0,
+            }
 
@@ -10,6 +10,7 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
+from shared.ga_friendliness.cache import LLMResultCache, content_hash
 from shared.ga_friendliness.exceptions import ReviewExtractionError
 from shared.ga_friendliness.interfaces import SummaryGeneratorInterface
 from shared.ga_friendliness.models import (
@@ -55,6 +56,7 @@ class SummaryGenerator(SummaryGeneratorInterface):
         llm_temperature: float = 0.3,  # Slightly higher for more natural text
         api_key: Optional[str] = None,
         mock_llm: bool = False,
+        cache: Optional[LLMResultCache] = None,
     ):
         """
         Initialize summary generator.
@@ -64,11 +66,15 @@ class SummaryGenerator(SummaryGeneratorInterface):
             llm_temperature: LLM temperature
             api_key: OpenAI API key (uses env var if not provided)
             mock_llm: If True, use mock LLM for testing
+            cache: Optional LLMResultCache; unchanged tag sets skip the LLM
         """
         self.llm_model = llm_model
         self.llm_temperature = llm_temperature
         self.api_key = api_key
         self.mock_llm = mock_llm
+        self.cache = cache
+        self.prompt_version = content_hash(SUMMARY_PROMPT_TEMPLATE)[:16]
+        self.model_id = "mock" if mock_llm else f"{llm_model}@{llm_temperature}"
         
         # Token usage tracking
         self._token_usage = {
@@ -251,6 +257,22 @@ class SummaryGenerator(SummaryGeneratorInterface):
             logger.error(f"LLM call failed: {e}")
             raise
 
+    def cache_key(
+        self,
+        icao: str,
+        extractions: List[ReviewExtraction],
+        avg_rating: Optional[float],
+    ) -> str:
+        """Cache key from the sorted extraction set, prompt version and model."""
+        extraction_set = sorted(
+            sorted((a.aspect, a.label) for a in e.aspects)
+            for e in extractions
+        )
+        rating = round(avg_rating, 1) if avg_rating else None
+        return content_hash(
+            icao, content_hash(extraction_set), rating, self.prompt_version, self.model_id
+        )
+
     def generate_summary(
         self,
         icao: str,
@@ -272,8 +294,17 @@ class SummaryGenerator(SummaryGeneratorInterface):
         review_count = len(extractions)
         avg_rating = stats.rating_avg if stats else None
         
+        key = None
+        if self.cache is not None:
+            key = self.cache_key(icao, extractions, avg_rating)
+            cached = self.cache.get("summary", key)
+            if cached is not None:
+                return (cached["summary"], cached["tags"])
+        
         try:
             result = self._call_llm(icao, tags_summary, review_count, avg_rating)
+            if key is not None:
+                self.cache.set("summary", key, {"summary": result["summary"], "tags": result["tags"]})
             return (result["summary"], result["tags"])
         except Exception as e:
             logger.error(f"Failed to generate summary for {icao}: {e}")
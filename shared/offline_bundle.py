@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""
+Offline Bundle
+==============
+
+Compiles the data the mobile apps need offline (airports, runways,
+procedure lines, GA scores for every persona, notification summaries) into
+compact, indexed SQLite bundles: one for all airports and optionally one
+per country, so a client downloads one file instead of making thousands of
+API requests.
+
+Each bundle is built from the loaded EuroAipModel and the derived-data
+services (the same sources as the web API), with:
+
+- ``airports`` plus an R*Tree ``airports_rtree`` (bounding-box queries);
+- ``runways`` and ``procedure_lines`` indexed by ICAO;
+- ``ga_summaries`` and ``ga_persona_scores`` (persona scores precomputed,
+  indexed by persona so "best airports for this persona" is one query);
+- ``notifications``.
+
+Bundles are written as ``<slice>-<sha256 prefix>.db`` next to a
+``manifest.json`` that lists, per slice, the file, its sha256 and size, and
+the data version (shared/data_delta.py) the bundles were built from.
+Bundle content is deterministic, so a slice whose data did not change keeps
+its hash and file name: clients compare hashes and download only changed
+slices, then continue with /api/sync/delta?since=<version>. Files of the
+previous manifest are kept one build longer for clients mid-download.
+
+Usage:
+    rows = collect_airport_rows(model.airports.all(), ga_service, notification_service)
+    manifest = write_bundles(output_dir, rows, version=token, countries=["FR", "GB"])
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .airport_rows import (
+    AIRPORT_SUMMARY_FIELDS,
+    NOTIFICATION_SUMMARY_FIELDS,
+    airport_summary_values,
+    notification_summary_values,
+)
+
+logger = logging.getLogger(__name__)
+
+# Bump when the bundle tables change; clients reject bundles they do not know
+BUNDLE_SCHEMA_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+ALL_SLICE = "all"
+
+# Slice names double as file name prefixes
+SLICE_PATTERN = re.compile(r"^[A-Za-z0-9_]+$")
+BUNDLE_FILE_PATTERN = re.compile(r"^[A-Za-z0-9_]+-[0-9a-f]{12}\.db$")
+
+AIRPORT_COLUMNS = ["icao"] + AIRPORT_SUMMARY_FIELDS[1:]
+RUNWAY_COLUMNS = [
+    "icao", "le_ident", "he_ident", "length_ft", "width_ft", "surface", "lighted", "closed",
+    "le_latitude_deg", "le_longitude_deg", "le_elevation_ft", "le_heading_degT",
+    "le_displaced_threshold_ft", "he_latitude_deg", "he_longitude_deg", "he_elevation_ft",
+    "he_heading_degT", "he_displaced_threshold_ft",
+]
+PROCEDURE_LINE_COLUMNS = [
+    "icao", "runway_end", "procedure_name", "approach_type", "precision_category",
+    "start_lat", "start_lon", "end_lat", "end_lon",
+]
+GA_SUMMARY_COLUMNS = ["icao", "review_count", "last_review_utc", "summary_text", "tags_json", "features_json"]
+GA_PERSONA_SCORE_COLUMNS = ["icao", "persona_id", "score"]
+NOTIFICATION_COLUMNS = ["icao"] + NOTIFICATION_SUMMARY_FIELDS
+
+BUNDLE_SCHEMA = """
+CREATE TABLE bundle_meta (key TEXT PRIMARY KEY, value TEXT) WITHOUT ROWID;
+CREATE TABLE airports (
+    icao TEXT NOT NULL UNIQUE, name TEXT, latitude_deg REAL, longitude_deg REAL,
+    iso_country TEXT, municipality TEXT, point_of_entry INTEGER, has_procedures INTEGER,
+    has_runways INTEGER, has_aip_data INTEGER, has_hard_runway INTEGER,
+    has_lighted_runway INTEGER, has_soft_runway INTEGER, has_water_runway INTEGER,
+    has_snow_runway INTEGER, longest_runway_length_ft INTEGER, procedure_count INTEGER,
+    runway_count INTEGER, aip_entry_count INTEGER
+);
+CREATE VIRTUAL TABLE airports_rtree USING rtree(id, min_lat, max_lat, min_lon, max_lon);
+CREATE TABLE runways (
+    icao TEXT NOT NULL, le_ident TEXT, he_ident TEXT, length_ft INTEGER, width_ft INTEGER,
+    surface TEXT, lighted INTEGER, closed INTEGER, le_latitude_deg REAL, le_longitude_deg REAL,
+    le_elevation_ft INTEGER, le_heading_degT REAL, le_displaced_threshold_ft INTEGER,
+    he_latitude_deg REAL, he_longitude_deg REAL, he_elevation_ft INTEGER,
+    he_heading_degT REAL, he_displaced_threshold_ft INTEGER
+);
+CREATE TABLE procedure_lines (
+    icao TEXT NOT NULL, runway_end TEXT, procedure_name TEXT, approach_type TEXT,
+    precision_category TEXT, start_lat REAL, start_lon REAL, end_lat REAL, end_lon REAL
+);
+CREATE TABLE ga_summaries (
+    icao TEXT PRIMARY KEY, review_count INTEGER, last_review_utc TEXT, summary_text TEXT,
+    tags_json TEXT, features_json TEXT
+) WITHOUT ROWID;
+CREATE TABLE ga_persona_scores (
+    icao TEXT NOT NULL, persona_id TEXT NOT NULL, score REAL,
+    PRIMARY KEY (icao, persona_id)
+) WITHOUT ROWID;
+CREATE TABLE notifications (
+    icao TEXT PRIMARY KEY, notification_type TEXT, hours_notice INTEGER, is_h24 INTEGER,
+    is_on_request INTEGER, easiness_score REAL, summary TEXT
+) WITHOUT ROWID;
+CREATE INDEX idx_airports_country ON airports(iso_country);
+CREATE INDEX idx_runways_icao ON runways(icao);
+CREATE INDEX idx_procedure_lines_icao ON procedure_lines(icao);
+CREATE INDEX idx_ga_persona_scores_persona ON ga_persona_scores(persona_id, score);
+"""
+
+
+@dataclass
+class AirportRows:
+    """Bundle rows of one airport, in the column order of the *_COLUMNS lists."""
+
+    icao: str
+    country: Optional[str]
+    airport: Tuple[Any, ...]
+    runways: List[Tuple[Any, ...]] = field(default_factory=list)
+    procedure_lines: List[Tuple[Any, ...]] = field(default_factory=list)
+    ga_summary: Optional[Tuple[Any, ...]] = None
+    ga_persona_scores: List[Tuple[Any, ...]] = field(default_factory=list)
+    notification: Optional[Tuple[Any, ...]] = None
+
+
+def _procedure_line_rows(airport, distance_nm: float) -> List[Tuple[Any, ...]]:
+    if not airport.procedures:
+        return []
+    try:
+        lines = airport.get_procedure_lines(distance_nm).get("procedure_lines", [])
+    except Exception as e:
+        logger.warning(f"Error getting procedure lines for {airport.ident}: {e}")
+        return []
+    return [
+        (airport.ident, *(line.get(c) for c in PROCEDURE_LINE_COLUMNS[1:]))
+        for line in lines
+    ]
+
+
+def collect_airport_rows(
+    airports: Iterable[Any],
+    ga_service: Optional[Any] = None,
+    notification_service: Optional[Any] = None,
+    procedure_distance_nm: float = 10.0,
+) -> List[AirportRows]:
+    """
+    Bundle rows for the given airports, sorted by ICAO.
+
+    Args:
+        airports: euro_aip Airport objects (e.g. model.airports.all())
+        ga_service: GAFriendlinessService (None = no GA tables)
+        notification_service: NotificationService (None = no notifications)
+        procedure_distance_nm: Length of the procedure lines
+    """
+    rows: Dict[str, AirportRows] = {}
+    for airport in airports:
+        rows[airport.ident] = AirportRows(
+            icao=airport.ident,
+            country=airport.iso_country,
+            airport=tuple(airport_summary_values(airport)),
+            runways=[
+                (airport.ident, *(getattr(runway, c) for c in RUNWAY_COLUMNS[1:]))
+                for runway in airport.runways
+            ],
+            procedure_lines=_procedure_line_rows(airport, procedure_distance_nm),
+        )
+    icaos = sorted(rows)
+
+    if ga_service is not None:
+        for icao, summary in ga_service.get_summaries_batch_dict(icaos).items():
+            if icao not in rows:
+                continue
+            rows[icao].ga_summary = (
+                icao,
+                summary.get("review_count"),
+                summary.get("last_review_utc"),
+                summary.get("summary_text"),
+                json.dumps(summary["tags"]) if summary.get("tags") else None,
+                json.dumps(summary.get("features") or {}, sort_keys=True),
+            )
+            rows[icao].ga_persona_scores = [
+                (icao, persona_id, score)
+                for persona_id, score in sorted((summary.get("persona_scores") or {}).items())
+            ]
+
+    if notification_service is not None:
+        for icao, info in notification_service.get_notification_info_batch(icaos).items():
+            if icao not in rows:
+                continue
+            rows[icao].notification = (icao, *notification_summary_values(info))
+
+    return [rows[icao] for icao in icaos]
+
+
+def _insert(conn: sqlite3.Connection, table: str, columns: Sequence[str], rows: Iterable[Tuple[Any, ...]]) -> None:
+    conn.executemany(
+        f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)})",
+        rows,
+    )
+
+
+def write_bundle_db(path: Path, rows: Sequence[AirportRows], slice_name: str) -> None:
+    """Write one bundle database (path must not exist)."""
+    conn = sqlite3.connect(path)
+    try:
+        conn.executescript(BUNDLE_SCHEMA)
+        _insert(conn, "bundle_meta", ["key", "value"], [
+            ("schema_version", str(BUNDLE_SCHEMA_VERSION)),
+            ("slice", slice_name),
+        ])
+        for r in rows:
+            cursor = conn.execute(
+                f"INSERT INTO airports ({', '.join(AIRPORT_COLUMNS)}) "
+                f"VALUES ({', '.join('?' for _ in AIRPORT_COLUMNS)})",
+                r.airport,
+            )
+            lat, lon = r.airport[2], r.airport[3]
+            if lat is not None and lon is not None:
+                conn.execute(
+                    "INSERT INTO airports_rtree VALUES (?, ?, ?, ?, ?)",
+                    (cursor.lastrowid, lat, lat, lon, lon),
+                )
+        _insert(conn, "runways", RUNWAY_COLUMNS, (row for r in rows for row in r.runways))
+        _insert(conn, "procedure_lines", PROCEDURE_LINE_COLUMNS, (row for r in rows for row in r.procedure_lines))
+        _insert(conn, "ga_summaries", GA_SUMMARY_COLUMNS, (r.ga_summary for r in rows if r.ga_summary))
+        _insert(conn, "ga_persona_scores", GA_PERSONA_SCORE_COLUMNS, (row for r in rows for row in r.ga_persona_scores))
+        _insert(conn, "notifications", NOTIFICATION_COLUMNS, (r.notification for r in rows if r.notification))
+        conn.commit()
+        conn.execute("VACUUM")
+    finally:
+        conn.close()
+
+
+def _sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_manifest(output_dir: Path) -> Optional[Dict[str, Any]]:
+    """The manifest in output_dir, or None if there is none (or it is unreadable)."""
+    path = Path(output_dir) / MANIFEST_NAME
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def _manifest_files(manifest: Optional[Dict[str, Any]]) -> set:
+    if not manifest:
+        return set()
+    return {entry["file"] for entry in manifest.get("bundles", {}).values()}
+
+
+def write_bundles(
+    output_dir: Path,
+    rows: Sequence[AirportRows],
+    version: Optional[str] = None,
+    countries: Optional[Iterable[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Write the "all" bundle and per-country slices, then the manifest.
+
+    Args:
+        output_dir: Bundle directory (created if missing)
+        rows: collect_airport_rows() output
+        version: Data version token the rows were built from
+        countries: ISO country codes to slice (None = no country slices)
+
+    Returns:
+        The new manifest
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    previous = load_manifest(output_dir)
+
+    slices: Dict[str, Sequence[AirportRows]] = {ALL_SLICE: rows}
+    for country in sorted(set(countries or ())):
+        if not SLICE_PATTERN.match(country):
+            raise ValueError(f"Invalid country slice name: {country!r}")
+        slices[country] = [r for r in rows if r.country == country]
+
+    bundles: Dict[str, Dict[str, Any]] = {}
+    for slice_name, slice_rows in slices.items():
+        tmp_path = output_dir / f".{slice_name}.tmp.db"
+        tmp_path.unlink(missing_ok=True)
+        write_bundle_db(tmp_path, slice_rows, slice_name)
+        sha256 = _sha256(tmp_path)
+        file_name = f"{slice_name}-{sha256[:12]}.db"
+        target = output_dir / file_name
+        if target.exists():
+            tmp_path.unlink()  # Same content as an earlier build
+        else:
+            os.replace(tmp_path, target)
+        bundles[slice_name] = {
+            "file": file_name,
+            "sha256": sha256,
+            "bytes": target.stat().st_size,
+            "airports": len(slice_rows),
+        }
+        logger.info(f"Bundle {slice_name}: {len(slice_rows)} airports, {bundles[slice_name]['bytes']} bytes")
+
+    manifest = {
+        "schema_version": BUNDLE_SCHEMA_VERSION,
+        "version": version,
+        "created_utc": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "bundles": bundles,
+    }
+    tmp_manifest = output_dir / f".{MANIFEST_NAME}.tmp"
+    tmp_manifest.write_text(json.dumps(manifest, indent=2))
+    os.replace(tmp_manifest, output_dir / MANIFEST_NAME)
+
+    keep = _manifest_files(manifest) | _manifest_files(previous)
+    for path in output_dir.iterdir():
+        if BUNDLE_FILE_PATTERN.match(path.name) and path.name not in keep:
+            path.unlink()
+            logger.info(f"Removed old bundle {path.name}")
+    return manifest
@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+"""
+Pipeline Runner
+===============
+
+Runs a declarative DAG of steps (used by tools/data_update.py):
+
+- Each Step names the files it reads (inputs) and writes (outputs); a step
+  depends on every step producing one of its inputs, plus any listed in
+  ``after``.
+- Independent steps run in parallel on a thread pool (steps are mostly
+  subprocesses or I/O bound), limited by ``max_workers`` and by named
+  resource limits (e.g. one writer of airports.db at a time).
+- Skip-if-unchanged: a step whose inputs hash the same as at its last
+  successful run (and whose outputs still exist) is skipped. Steps without
+  local inputs that capture what changes (network fetches) set
+  ``always_run``.
+- A JSON run log records per-step status and timing; ``resume=True``
+  continues an unfinished run, treating its completed steps as done.
+
+Usage:
+    runner = PipelineRunner(steps, state_path=Path("tmp/pipeline/run_log.json"),
+                            max_workers=4, resource_limits={"airports_db": 1})
+    report = runner.run("web")
+    print(report.format())
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set
+
+logger = logging.getLogger(__name__)
+
+# Step statuses
+OK = "ok"
+SKIPPED = "skipped"  # Inputs unchanged since the last successful run
+RESUMED = "resumed"  # Completed in the run being resumed
+FAILED = "failed"
+BLOCKED = "blocked"  # An upstream step failed
+DONE_STATUSES = (OK, SKIPPED, RESUMED)
+
+
+@dataclass
+class Step:
+    """One unit of work in a pipeline."""
+
+    name: str
+    action: Callable[[], Any]
+    inputs: Sequence[Path] = ()
+    outputs: Sequence[Path] = ()
+    after: Sequence[str] = ()
+    resources: Sequence[str] = ()
+    always_run: bool = False
+    # Anything besides input contents that changes the result (e.g. arguments)
+    signature: str = ""
+    description: str = ""
+
+
+@dataclass
+class StepResult:
+    name: str
+    status: str
+    seconds: float = 0.0
+    error: Optional[str] = None
+
+
+@dataclass
+class RunReport:
+    """Outcome of PipelineRunner.run()."""
+
+    run_id: str
+    results: Dict[str, StepResult]
+    wall_seconds: float
+    critical_path: List[str] = field(default_factory=list)
+    critical_seconds: float = 0.0
+
+    @property
+    def success(self) -> bool:
+        return all(r.status in DONE_STATUSES for r in self.results.values())
+
+    def format(self) -> str:
+        """Human-readable per-step timing summary."""
+        lines = [f"{'Step':<32} {'Status':<8} {'Time':>9}"]
+        for result in self.results.values():
+            line = f"{result.name:<32} {result.status:<8} {result.seconds:>8.1f}s"
+            if result.error:
+                line += f"  {result.error}"
+            lines.append(line)
+        lines.append(
+            f"Wall time {self.wall_seconds:.1f}s; critical path {self.critical_seconds:.1f}s"
+            + (f" ({' -> '.join(self.critical_path)})" if self.critical_path else "")
+        )
+        return "\n".join(lines)
+
+
+class PipelineError(Exception):
+    """Invalid pipeline definition (unknown dependency, cycle, duplicate name)."""
+
+
+class PipelineRunner:
+    """Executes a list of Steps as a DAG; see module docstring."""
+
+    def __init__(
+        self,
+        steps: Sequence[Step],
+        state_path: Path,
+        max_workers: int = 4,
+        resource_limits: Optional[Dict[str, int]] = None,
+        resume: bool = False,
+        force: bool = False,
+    ):
+        """
+        Args:
+            steps: Steps in preferred start order (ties are started in this order)
+            state_path: JSON run log / skip state
+            max_workers: Steps running at once
+            resource_limits: Max concurrent steps per resource name (default 1)
+            resume: Continue the last unfinished run with the same name
+            force: Run every step even if its inputs are unchanged
+        """
+        self.steps: Dict[str, Step] = {}
+        for step in steps:
+            if step.name in self.steps:
+                raise PipelineError(f"Duplicate step name: {step.name}")
+            self.steps[step.name] = step
+        self.state_path = Path(state_path)
+        self.max_workers = max(1, max_workers)
+        self.resource_limits = dict(resource_limits or {})
+        self.resume = resume
+        self.force = force
+        self.dependencies = self._resolve_dependencies()
+        self.order = self._topological_order()
+        self._state_lock = threading.Lock()
+        self._state = self._load_state()
+        self._hash_cache: Dict[str, str] = {}
+
+    # --- Graph ---
+
+    def _resolve_dependencies(self) -> Dict[str, Set[str]]:
+        producers: Dict[Path, Set[str]] = {}
+        for step in self.steps.values():
+            for path in step.outputs:
+                producers.setdefault(Path(path).resolve(), set()).add(step.name)
+
+        dependencies: Dict[str, Set[str]] = {}
+        for step in self.steps.values():
+            deps = set()
+            for name in step.after:
+                if name not in self.steps:
+                    raise PipelineError(f"Step {step.name} runs after unknown step {name}")
+                deps.add(name)
+            for path in step.inputs:
+                deps |= producers.get(Path(path).resolve(), set())
+            deps.discard(step.name)
+            dependencies[step.name] = deps
+        return dependencies
+
+    def _topological_order(self) -> List[str]:
+        remaining = {name: set(deps) for name, deps in self.dependencies.items()}
+        order: List[str] = []
+        while remaining:
+            ready = [name for name in self.steps if name in remaining and not remaining[name]]
+            if not ready:
+                raise PipelineError(f"Dependency cycle among steps: {sorted(remaining)}")
+            for name in ready:
+                order.append(name)
+                del remaining[name]
+            for deps in remaining.values():
+                deps.difference_update(ready)
+        return order
+
+    # --- State (run log + skip hashes) ---
+
+    def _load_state(self) -> Dict[str, Any]:
+        if self.state_path.exists():
+            try:
+                with open(self.state_path, encoding="utf-8") as f:
+                    state = json.load(f)
+                state.setdefault("steps", {})
+                state.setdefault("runs", [])
+                state.setdefault("file_hashes", {})
+                return state
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable run log {self.state_path}: {e}")
+        return {"steps": {}, "runs": [], "file_hashes": {}}
+
+    def _save_state(self) -> None:
+        """Write the run log atomically (call with _state_lock held)."""
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.state_path.with_suffix(self.state_path.suffix + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._state, f, indent=2)
+        os.replace(tmp_path, self.state_path)
+
+    def _file_hash(self, path: Path) -> str:
+        """Content hash, reused while the file's size and mtime are unchanged."""
+        if not path.exists():
+            return "missing"
+        stat = path.stat()
+        stamp = f"{stat.st_size}:{stat.st_mtime_ns}"
+        key = str(path.resolve())
+        with self._state_lock:
+            known = self._state["file_hashes"].get(key)
+        if known and known.get("stamp") == stamp:
+            return known["sha256"]
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        value = digest.hexdigest()
+        with self._state_lock:
+            self._state["file_hashes"][key] = {"stamp": stamp, "sha256": value}
+        return value
+
+    def input_hash(self, step: Step) -> str:
+        digest = hashlib.sha256(f"{step.name}\0{step.signature}".encode("utf-8"))
+        for path in sorted(str(Path(p).resolve()) for p in step.inputs):
+            digest.update(f"\0{path}\0{self._file_hash(Path(path))}".encode("utf-8"))
+        return digest.hexdigest()
+
+    def _unchanged(self, step: Step, input_hash: str) -> bool:
+        if self.force or step.always_run or not step.inputs:
+            return False
+        with self._state_lock:
+            last = self._state["steps"].get(step.name)
+        return (
+            last is not None
+            and last.get("input_hash") == input_hash
+            and all(Path(p).exists() for p in step.outputs)
+        )
+
+    def _resumable_steps(self, run_name: str) -> Set[str]:
+        runs = self._state["runs"]
+        if not runs:
+            return set()
+        last = runs[-1]
+        if last.get("status") == OK:
+            logger.info("Last run finished; nothing to resume")
+            return set()
+        if last.get("name") != run_name:
+            logger.warning(f"Last run was '{last.get('name')}', not '{run_name}'; not resuming")
+            return set()
+        return {
+            name for name, entry in last.get("steps", {}).items()
+            if entry.get("status") in DONE_STATUSES and name in self.steps
+        }
+
+    # --- Execution ---
+
+    def _execute(self, step: Step, input_hash: str) -> StepResult:
+        start = time.monotonic()
+        logger.info(f"[pipeline] {step.name}: started")
+        try:
+            step.action()
+        except BaseException as e:  # Includes SystemExit from CLI helpers
+            seconds = time.monotonic() - start
+            logger.error(f"[pipeline] {step.name}: failed after {seconds:.1f}s: {e}")
+            return StepResult(step.name, FAILED, seconds, str(e) or type(e).__name__)
+        seconds = time.monotonic() - start
+        logger.info(f"[pipeline] {step.name}: done in {seconds:.1f}s")
+        # Hash inputs as they were when the step started: if the step (or a
+        # concurrent one) changed them, the next run sees the difference
+        with self._state_lock:
+            self._state["steps"][step.name] = {
+                "input_hash": input_hash,
+                "finished_utc": datetime.now(timezone.utc).isoformat(),
+                "seconds": round(seconds, 3),
+            }
+        return StepResult(step.name, OK, seconds)
+
+    def run(self, run_name: str = "") -> RunReport:
+        """Run all steps; returns a report (check report.success)."""
+        run_id = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+        resumed = self._resumable_steps(run_name) if self.resume else set()
+        results: Dict[str, StepResult] = {}
+        run_entry: Dict[str, Any] = {
+            "id": run_id,
+            "name": run_name,
+            "started_utc": datetime.now(timezone.utc).isoformat(),
+            "status": "running",
+            "steps": {},
+        }
+        with self._state_lock:
+            self._state["runs"].append(run_entry)
+            del self._state["runs"][:-20]  # Keep the log bounded
+            self._save_state()
+
+        def record(result: StepResult) -> None:
+            results[result.name] = result
+            with self._state_lock:
+                run_entry["steps"][result.name] = {
+                    "status": result.status,
+                    "seconds": round(result.seconds, 3),
+                    "error": result.error,
+                }
+                self._save_state()
+
+        in_use: Dict[str, int] = {}
+        running: Dict[Future, Step] = {}
+        pending = list(self.order)
+        start = time.monotonic()
+
+        def resources_free(step: Step) -> bool:
+            return all(
+                in_use.get(r, 0) < self.resource_limits.get(r, 1) for r in step.resources
+            )
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            while pending or running:
+                progressed = True
+                while progressed:
+                    progressed = False
+                    for name in list(pending):
+                        step = self.steps[name]
+                        deps = self.dependencies[name]
+                        if any(results.get(d) and results[d].status in (FAILED, BLOCKED) for d in deps):
+                            pending.remove(name)
+                            record(StepResult(name, BLOCKED))
+                            progressed = True
+                            continue
+                        if not all(d in results and results[d].status in DONE_STATUSES for d in deps):
+                            continue
+                        if name in resumed:
+                            pending.remove(name)
+                            record(StepResult(name, RESUMED))
+                            progressed = True
+                            continue
+                        if len(running) >= self.max_workers or not resources_free(step):
+                            continue
+                        input_hash = self.input_hash(step)
+                        if self._unchanged(step, input_hash):
+                            pending.remove(name)
+                            logger.info(f"[pipeline] {name}: inputs unchanged, skipped")
+                            record(StepResult(name, SKIPPED))
+                            progressed = True
+                            continue
+                        pending.remove(name)
+                        for r in step.resources:
+                            in_use[r] = in_use.get(r, 0) + 1
+                        running[pool.submit(self._execute, step, input_hash)] = step
+                        progressed = True
+
+                if not running:
+                    if pending:  # Unreachable unless limits can never be met
+                        raise PipelineError(f"Steps can never start: {pending}")
+                    break
+                completed, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in completed:
+                    step = running.pop(future)
+                    for r in step.resources:
+                        in_use[r] -= 1
+                    record(future.result())
+
+        report = RunReport(
+            run_id=run_id,
+            results={name: results[name] for name in self.order},
+            wall_seconds=time.monotonic() - start,
+        )
+        report.critical_path, report.critical_seconds = self._critical_path(report.results)
+        with self._state_lock:
+            run_entry["status"] = OK if report.success else FAILED
+            run_entry["finished_utc"] = datetime.now(timezone.utc).isoformat()
+            run_entry["wall_seconds"] = round(report.wall_seconds, 3)
+            self._save_state()
+        return report
+
+    def _critical_path(self, results: Dict[str, StepResult]):
+        """Longest chain of step durations through the DAG."""
+        best: Dict[str, float] = {}
+        previous: Dict[str, Optional[str]] = {}
+        for name in self.order:
+            upstream = max(self.dependencies[name], key=lambda d: best[d], default=None)
+            best[name] = results[name].seconds + (best[upstream] if upstream else 0.0)
+            previous[name] = upstream
+        if not best:
+            return [], 0.0
+        node: Optional[str] = max(best, key=best.get)
+        total = best[node]
+        path: List[str] = []
+        while node is not None:
+            path.append(node)
+            node = previous[node]
+        return list(reversed(path)), total
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Data Reload Manager
+===================
+
+Hot reload of the servers' data without a restart.
+
+tools/data_update.py rewrites airports.db, rules.json, ga_persona.db,
+ga_notifications.db, the vector DB and the serving database in place. The
+web and MCP servers load them once at startup, so until now a restart was
+needed to serve the new data, with a gap while the model reloaded.
+
+``ReloadManager`` polls a stat fingerprint of the watched files (size and
+mtime, plus SQLite ``-wal`` files; directories such as the vector DB are
+aggregated over their files). Once a change has settled for one poll
+interval (so a half-written database is not loaded), it builds a new
+snapshot in a worker thread while requests keep using the current one, then
+installs it on the event loop in one step. Handlers read the module globals
+once per request, so in-flight requests finish on the snapshot they started
+with; the old snapshot is released when the last of them is done. Caches
+derived from the model (route graphs, corridors) are keyed weakly by model
+and are rebuilt for the new one.
+
+A failed load keeps the current snapshot and is retried only when the files
+change again. Memory peaks at two snapshots during a reload.
+
+Usage:
+    manager = ReloadManager(
+        watched_data_files(get_tool_context_settings()),
+        load=load_services,          # builds a snapshot (runs in a thread)
+        install=install_services,    # swaps the globals (runs on the loop)
+        poll_seconds=60,
+    )
+    manager.start()   # in the server lifespan, after the initial install
+    ...
+    await manager.stop()
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Generic, Iterable, List, Optional, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+Fingerprint = Tuple[Tuple[str, Optional[Tuple[int, int]]], ...]
+
+# SQLite sidecar files whose changes count as changes of the database
+SQLITE_SIDECARS = ("-wal",)
+
+
+def _stat(path: Path) -> Optional[Tuple[int, int]]:
+    """(size, mtime_ns) of a file, or None if missing."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_size, st.st_mtime_ns)
+
+
+def _path_fingerprint(path: Path) -> Optional[Tuple[int, int]]:
+    """Stat of a file (with its sidecars), or an aggregate over a directory's files."""
+    if path.is_dir():
+        stats = [_stat(p) for p in sorted(path.rglob("*")) if p.is_file()]
+        stats = [s for s in stats if s is not None]
+        if not stats:
+            return (0, 0)
+        return (sum(s[0] for s in stats) + len(stats), max(s[1] for s in stats))
+    base = _stat(path)
+    if base is None:
+        return None
+    size, mtime = base
+    for suffix in SQLITE_SIDECARS:
+        side = _stat(path.with_name(path.name + suffix))
+        if side is not None:
+            size, mtime = size + side[0], max(mtime, side[1])
+    return (size, mtime)
+
+
+def data_fingerprint(paths: Iterable[Path]) -> Fingerprint:
+    """Fingerprint of the watched paths; differs whenever one of them changes."""
+    return tuple((str(p), _path_fingerprint(p)) for p in paths)
+
+
+def watched_data_files(settings: Any) -> List[Path]:
+    """
+    The data files a ToolContext is loaded from.
+
+    Args:
+        settings: ToolContextSettings
+    """
+    candidates = [
+        settings.airports_db,
+        settings.rules_json,
+        settings.ga_meta_db,
+        settings.ga_notifications_db,
+        None if settings.vector_db_url else settings.vector_db_path,
+        settings.serving_db,
+    ]
+    return [Path(p) for p in candidates if p]
+
+
+class ReloadManager(Generic[T]):
+    """
+    Reload a data snapshot when its files change.
+
+    Args:
+        watched: Files and directories the snapshot is loaded from
+        load: Builds a new snapshot; runs in a worker thread
+        install: Makes a snapshot current; runs on the event loop
+        poll_seconds: Interval between fingerprint checks
+    """
+
+    def __init__(
+        self,
+        watched: Iterable[Path],
+        load: Callable[[], T],
+        install: Callable[[T], None],
+        poll_seconds: float = 60.0,
+    ):
+        self.watched = list(watched)
+        self.poll_seconds = poll_seconds
+        self._load = load
+        self._install = install
+        # Fingerprint of the files the current snapshot was loaded from
+        self._loaded = data_fingerprint(self.watched)
+        # Last fingerprint seen by check(), to wait for changes to settle
+        self._seen = self._loaded
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self.generation = 0
+        self.loaded_at = time.time()
+        self.last_error: Optional[str] = None
+
+    async def check(self) -> bool:
+        """
+        Reload if the files changed and have not changed since the last check.
+
+        Returns:
+            True if a new snapshot was installed
+        """
+        current = data_fingerprint(self.watched)
+        settled = current == self._seen
+        self._seen = current
+        if current == self._loaded or not settled:
+            return False
+        return await self.reload(current)
+
+    async def reload(self, fingerprint: Optional[Fingerprint] = None) -> bool:
+        """
+        Build a snapshot in a worker thread and install it.
+
+        On failure the current snapshot stays installed, and the fingerprint
+        is recorded as loaded so the same files are not retried every poll.
+
+        Returns:
+            True if a new snapshot was installed
+        """
+        async with self._lock:
+            if fingerprint is None:
+                fingerprint = data_fingerprint(self.watched)
+            started = time.monotonic()
+            logger.info("Data files changed, loading new snapshot...")
+            try:
+                snapshot = await asyncio.to_thread(self._load)
+                self._install(snapshot)
+            except Exception as e:
+                self._loaded = fingerprint
+                self.last_error = f"{type(e).__name__}: {e}"
+                logger.error(f"Data reload failed, keeping current snapshot: {e}", exc_info=True)
+                return False
+            self._loaded = fingerprint
+            self.generation += 1
+            self.loaded_at = time.time()
+            self.last_error = None
+            logger.info(
+                f"Data reload {self.generation} installed in {time.monotonic() - started:.1f}s"
+            )
+            return True
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.poll_seconds)
+            try:
+                await self.check()
+            except Exception as e:
+                logger.error(f"Data reload check failed: {e}", exc_info=True)
+
+    def start(self) -> None:
+        """Start polling; call from a running event loop."""
+        if self._task is None and self.poll_seconds > 0:
+            self._task = asyncio.create_task(self._run())
+            logger.info(
+                f"Watching {len(self.watched)} data files for changes every {self.poll_seconds:g}s"
+            )
+
+    async def stop(self) -> None:
+        """Stop polling."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def status(self) -> Dict[str, Any]:
+        """Reload state for health checks."""
+        return {
+            "generation": self.generation,
+            "loaded_at": self.loaded_at,
+            "last_error": self.last_error,
+        }
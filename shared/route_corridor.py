@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Route Corridor Engine
+=====================
+
+Fast "airports near a route" search for multi-leg routes.
+
+The engine keeps the airport coordinates of a model in contiguous NumPy arrays,
+sorted by latitude. A query then works leg by leg:
+
+1. Expand the leg's great-circle arc (plus the corridor width) into a lat/lon
+   envelope and prune candidates with a binary search on latitude and a
+   longitude mask.
+2. Compute exact cross-track / along-track distances for the remaining
+   candidates in vectorized form (unit-vector geometry on the sphere).
+3. Keep, for every airport, the closest leg across the whole route.
+
+Enroute limits (e.g. derived from ``max_leg_time_hours``) are applied inside the
+engine so that the filter/priority pipeline only ever sees reachable airports.
+
+Results use the same item shape as ``EuroAipModel.find_airports_near_route``::
+
+    {"airport": Airport, "segment_distance_nm": float,
+     "enroute_distance_nm": float, "closest_segment": [from_id, to_id]}
+
+Usage:
+    from shared.route_corridor import get_route_corridor
+
+    corridor = get_route_corridor(ctx.model)
+    items = corridor.find_airports_near_route(["EGTF", "LFMD", "LIRQ"], 50.0)
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import weakref
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from euro_aip.models.airport import Airport
+    from euro_aip.models.euro_aip_model import EuroAipModel
+    from euro_aip.models.navpoint import NavPoint
+
+logger = logging.getLogger(__name__)
+
+# Mean earth radius in nautical miles
+EARTH_RADIUS_NM = 3440.065
+
+# Number of points used to sample a leg's great-circle arc when computing its envelope
+_ENVELOPE_SAMPLES = 16
+
+RoutePoint = Union[str, "NavPoint"]
+
+
+def unit_vectors(lat_deg: np.ndarray, lon_deg: np.ndarray) -> np.ndarray:
+    """Convert lat/lon in degrees to (N, 3) unit vectors."""
+    lat = np.radians(lat_deg)
+    lon = np.radians(lon_deg)
+    cos_lat = np.cos(lat)
+    return np.column_stack((cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)))
+
+
+def angle_between(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Angle in radians between unit vectors (numerically stable atan2 form)."""
+    cross = np.linalg.norm(np.cross(a, b), axis=-1)
+    dot = np.sum(a * b, axis=-1)
+    return np.arctan2(cross, dot)
+
+
+class RouteCorridor:
+    """
+    Spatial index over a model's airports for corridor (near-route) searches.
+
+    Build once per model with ``get_route_corridor(model)``; queries are
+    read-only and safe to run concurrently.
+    """
+
+    def __init__(self, airports: Sequence["Airport"]):
+        located = [
+            a for a in airports
+            if getattr(a, "navpoint", None) is not None
+            and a.navpoint.latitude is not None
+            and a.navpoint.longitude is not None
+        ]
+        lats = np.array([float(a.navpoint.latitude) for a in located], dtype=np.float64)
+        order = np.argsort(lats, kind="stable")
+
+        self._airports: List["Airport"] = [located[i] for i in order]
+        self._by_ident: Dict[str, int] = {a.ident: i for i, a in enumerate(self._airports)}
+        self._lat = lats[order]
+        self._lon = np.array([float(a.navpoint.longitude) for a in self._airports], dtype=np.float64)
+        self._xyz = unit_vectors(self._lat, self._lon) if len(self._airports) else np.zeros((0, 3))
+
+        logger.debug(f"RouteCorridor indexed {len(self._airports)} airports")
+
+    def __len__(self) -> int:
+        return len(self._airports)
+
+    # -------------------------------------------------------------------------
+    # Route resolution
+    # -------------------------------------------------------------------------
+
+    def _resolve_point(self, point: RoutePoint) -> Optional[Tuple[str, float, float]]:
+        """Resolve an ICAO code or NavPoint to (label, lat, lon)."""
+        if isinstance(point, str):
+            idx = self._by_ident.get(point.strip().upper())
+            if idx is None:
+                return None
+            return self._airports[idx].ident, float(self._lat[idx]), float(self._lon[idx])
+        lat = getattr(point, "latitude", None)
+        lon = getattr(point, "longitude", None)
+        if lat is None or lon is None:
+            return None
+        return getattr(point, "name", None) or f"{lat:.4f},{lon:.4f}", float(lat), float(lon)
+
+    # -------------------------------------------------------------------------
+    # Envelope pruning
+    # -------------------------------------------------------------------------
+
+    def _leg_candidates(self, a: np.ndarray, b: np.ndarray, buffer_nm: float) -> np.ndarray:
+        """Indices of airports inside the lat/lon envelope of the leg a→b."""
+        # Sample the arc (slerp) so the envelope covers the great-circle vertex
+        omega = float(angle_between(a, b))
+        t = np.linspace(0.0, 1.0, _ENVELOPE_SAMPLES + 1)
+        if omega < 1e-12:
+            samples = np.repeat(a[None, :], len(t), axis=0)
+        else:
+            samples = (
+                np.sin((1.0 - t) * omega)[:, None] * a + np.sin(t * omega)[:, None] * b
+            ) / np.sin(omega)
+        lat = np.degrees(np.arcsin(np.clip(samples[:, 2], -1.0, 1.0)))
+        lon = np.degrees(np.arctan2(samples[:, 1], samples[:, 0]))
+
+        # Chord sagitta between samples is tiny, but pad by it anyway
+        sag_nm = EARTH_RADIUS_NM * (1.0 - np.cos(omega / (2 * _ENVELOPE_SAMPLES)))
+        buffer_deg = (buffer_nm + sag_nm) / 60.0
+
+        lat_min = float(lat.min()) - buffer_deg
+        lat_max = float(lat.max()) + buffer_deg
+        lo = int(np.searchsorted(self._lat, lat_min, side="left"))
+        hi = int(np.searchsorted(self._lat, lat_max, side="right"))
+        if hi <= lo:
+            return np.zeros(0, dtype=np.int64)
+
+        # Longitude window widens towards the poles; give up pruning near them
+        # or when the leg straddles the antimeridian.
+        max_abs_lat = max(abs(lat_min), abs(lat_max))
+        if max_abs_lat >= 89.0 or float(lon.max() - lon.min()) > 180.0:
+            return np.arange(lo, hi)
+        lon_buffer = buffer_deg / np.cos(np.radians(max_abs_lat))
+        lon_min = float(lon.min()) - lon_buffer
+        lon_max = float(lon.max()) + lon_buffer
+        band_lon = self._lon[lo:hi]
+        mask = (band_lon >= lon_min) & (band_lon <= lon_max)
+        if lon_min < -180.0:
+            mask |= band_lon >= lon_min + 360.0
+        if lon_max > 180.0:
+            mask |= band_lon <= lon_max - 360.0
+        return lo + np.nonzero(mask)[0]
+
+    # -------------------------------------------------------------------------
+    # Exact distances
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _segment_distances(
+        points: np.ndarray, a: np.ndarray, b: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Distance (radians) from each point to the arc a→b and along-track position.
+
+        Returns:
+            (cross_track, along_track) where along_track is clamped to [0, |ab|]
+        """
+        leg = float(angle_between(a, b))
+        normal = np.cross(a, b)
+        normal_len = np.linalg.norm(normal)
+        if normal_len < 1e-12:
+            # Degenerate leg (single point): distance to the point itself
+            return angle_between(points, a[None, :]), np.zeros(len(points))
+        normal = normal / normal_len
+
+        # Projection of each point onto the great circle through a and b
+        sin_xt = points @ normal
+        projected = points - sin_xt[:, None] * normal[None, :]
+        along = np.arctan2(np.cross(a[None, :], projected) @ normal, projected @ a)
+
+        inside = (along >= 0.0) & (along <= leg)
+        cross = np.abs(np.arcsin(np.clip(sin_xt, -1.0, 1.0)))
+        to_a = angle_between(points, a[None, :])
+        to_b = angle_between(points, b[None, :])
+        off_end = np.where(to_a <= to_b, to_a, to_b)
+        distance = np.where(inside, cross, off_end)
+        along = np.where(inside, along, np.where(to_a <= to_b, 0.0, leg))
+        return distance, along
+
+    # -------------------------------------------------------------------------
+    # Query
+    # -------------------------------------------------------------------------
+
+    def find_airports_near_route(
+        self,
+        route: Sequence[RoutePoint],
+        max_distance_nm: float,
+        max_enroute_distance_nm: Optional[float] = None,
+        max_origin_distance_nm: Optional[float] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Find airports within max_distance_nm of a multi-leg route.
+
+        Args:
+            route: ICAO codes and/or NavPoints defining the route (1+ points)
+            max_distance_nm: Corridor half-width (perpendicular distance from route)
+            max_enroute_distance_nm: If set, keep only airports whose position along
+                the route (from the first point) is within this distance
+            max_origin_distance_nm: If set, keep only airports within this
+                great-circle distance of the first route point
+
+        Returns:
+            List of result items sorted by segment distance (closest first).
+            Unresolvable route points are skipped.
+        """
+        resolved = [r for r in (self._resolve_point(p) for p in route) if r is not None]
+        if not resolved or not len(self._airports):
+            return []
+        if len(resolved) == 1:
+            resolved = resolved * 2  # Single point: corridor degenerates to a radius
+
+        labels = [r[0] for r in resolved]
+        route_xyz = unit_vectors(
+            np.array([r[1] for r in resolved]), np.array([r[2] for r in resolved])
+        )
+        leg_lengths = angle_between(route_xyz[:-1], route_xyz[1:])
+        leg_offsets = np.concatenate(([0.0], np.cumsum(leg_lengths)[:-1]))
+        max_rad = float(max_distance_nm) / EARTH_RADIUS_NM
+
+        idx_parts: List[np.ndarray] = []
+        dist_parts: List[np.ndarray] = []
+        enroute_parts: List[np.ndarray] = []
+        leg_parts: List[np.ndarray] = []
+
+        for leg in range(len(resolved) - 1):
+            a, b = route_xyz[leg], route_xyz[leg + 1]
+            candidates = self._leg_candidates(a, b, float(max_distance_nm))
+            if not len(candidates):
+                continue
+            distance, along = self._segment_distances(self._xyz[candidates], a, b)
+            keep = distance <= max_rad
+            if not keep.any():
+                continue
+            idx_parts.append(candidates[keep])
+            dist_parts.append(distance[keep])
+            enroute_parts.append(leg_offsets[leg] + along[keep])
+            leg_parts.append(np.full(int(keep.sum()), leg, dtype=np.int64))
+
+        if not idx_parts:
+            return []
+
+        idx = np.concatenate(idx_parts)
+        dist = np.concatenate(dist_parts) * EARTH_RADIUS_NM
+        enroute = np.concatenate(enroute_parts) * EARTH_RADIUS_NM
+        legs = np.concatenate(leg_parts)
+
+        # Keep the closest leg per airport: sort by (idx, dist) then take first of each idx
+        order = np.lexsort((dist, idx))
+        idx, dist, enroute, legs = idx[order], dist[order], enroute[order], legs[order]
+        first = np.ones(len(idx), dtype=bool)
+        first[1:] = idx[1:] != idx[:-1]
+        idx, dist, enroute, legs = idx[first], dist[first], enroute[first], legs[first]
+
+        # Push enroute limits down before any per-airport work
+        keep = np.ones(len(idx), dtype=bool)
+        if max_enroute_distance_nm is not None:
+            keep &= enroute <= float(max_enroute_distance_nm)
+        if max_origin_distance_nm is not None:
+            origin = angle_between(self._xyz[idx], route_xyz[0][None, :]) * EARTH_RADIUS_NM
+            keep &= origin <= float(max_origin_distance_nm)
+        idx, dist, enroute, legs = idx[keep], dist[keep], enroute[keep], legs[keep]
+
+        order = np.lexsort((enroute, dist))
+        return [
+            {
+                "airport": self._airports[int(idx[i])],
+                "segment_distance_nm": round(float(dist[i]), 2),
+                "enroute_distance_nm": round(float(enroute[i]), 2),
+                "closest_segment": [labels[int(legs[i])], labels[int(legs[i]) + 1]],
+            }
+            for i in order
+        ]
+
+
+# Engines are cached per model instance (models are large and immutable at runtime)
+_corridors: "weakref.WeakKeyDictionary[Any, RouteCorridor]" = weakref.WeakKeyDictionary()
+_corridors_lock = threading.Lock()
+
+
+def get_route_corridor(model: "EuroAipModel") -> RouteCorridor:
+    """Get (building on first use) the RouteCorridor for a model."""
+    with _corridors_lock:
+        corridor = _corridors.get(model)
+        if corridor is None:
+            corridor = RouteCorridor(list(model.airports))
+            _corridors[model] = corridor
+        return corridor
@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+"""
+Range-Constrained Multi-Stop Route Planner
+==========================================
+
+Plans stop sequences between two airports when a single leg cannot exceed the
+aircraft's range (e.g. "fuel stops within 3 hours with my C172").
+
+The planner works on a sparse reachability graph:
+
+- Nodes are the airports that qualify as stops (after airport filters and the
+  notification constraint). Each node carries the attributes relevant to stop
+  selection (fuel, point of entry, notification hours).
+- Edges connect node pairs whose great-circle distance is within the leg range,
+  stored in CSR form (indptr / indices / distances).
+
+Graphs are built once per (model, stop criteria, leg range) and cached, so
+repeated questions only pay for the search. Leg ranges are capped at
+MAX_LEG_NM, since edge count grows with the square of the range, and the cache
+is bounded by the total size of its graphs. Departure and destination are
+attached at query time, then an A* search finds the optimal sequence either
+for fewest stops (ties broken by distance) or shortest total distance.
+
+Usage:
+    from shared.route_planner import ReachabilityGraph, StopNode
+
+    graph = ReachabilityGraph(nodes, max_leg_nm=360.0)
+    plan = graph.plan(origin_node, destination_node, objective="fewest_stops")
+"""
+from __future__ import annotations
+
+import heapq
+import json
+import logging
+import math
+import threading
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .route_corridor import EARTH_RADIUS_NM, angle_between, unit_vectors
+
+if TYPE_CHECKING:
+    from euro_aip.models.airport import Airport
+    from .tool_context import ToolContext
+
+logger = logging.getLogger(__name__)
+
+OBJECTIVES = ("fewest_stops", "shortest_distance")
+
+# Longest leg the planner accepts. Beyond typical GA legs the graph over
+# ~15k European airports approaches complete (hundreds of millions of edges).
+MAX_LEG_NM = 1000.0
+
+# Total size of the cached graphs per model (one per stop criteria / range combination)
+GRAPH_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+
+@dataclass
+class StopNode:
+    """An airport in the reachability graph with its stop-selection attributes."""
+    ident: str
+    latitude: float
+    longitude: float
+    name: Optional[str] = None
+    avgas: bool = False
+    jet_a: bool = False
+    point_of_entry: bool = False
+    hours_notice: Optional[int] = None
+    airport: Optional[Any] = field(default=None, repr=False, compare=False)
+
+    @classmethod
+    def from_airport(cls, airport: "Airport", hours_notice: Optional[int] = None) -> "StopNode":
+        return cls(
+            ident=airport.ident,
+            latitude=float(airport.navpoint.latitude),
+            longitude=float(airport.navpoint.longitude),
+            name=getattr(airport, "name", None),
+            avgas=bool(getattr(airport, "avgas", False)),
+            jet_a=bool(getattr(airport, "jet_a", False)),
+            point_of_entry=bool(getattr(airport, "point_of_entry", False)),
+            hours_notice=hours_notice,
+            airport=airport,
+        )
+
+    def attributes(self) -> Dict[str, Any]:
+        """Stop attributes for API responses."""
+        return {
+            "avgas": self.avgas,
+            "jet_a": self.jet_a,
+            "point_of_entry": self.point_of_entry,
+            "hours_notice": self.hours_notice,
+        }
+
+
+@dataclass
+class RoutePlan:
+    """Result of a multi-stop search: the full node sequence and leg distances."""
+    nodes: List[StopNode]
+    leg_distances_nm: List[float]
+
+    @property
+    def stops(self) -> List[StopNode]:
+        """Intermediate stops (excludes departure and destination)."""
+        return self.nodes[1:-1]
+
+    @property
+    def total_distance_nm(self) -> float:
+        return float(sum(self.leg_distances_nm))
+
+
+class ReachabilityGraph:
+    """
+    Sparse graph of stop-eligible airports connected when within leg range.
+
+    Immutable once built; ``plan()`` is safe to call concurrently.
+    """
+
+    def __init__(self, nodes: Sequence[StopNode], max_leg_nm: float):
+        if max_leg_nm > MAX_LEG_NM:
+            raise ValueError(f"max_leg_nm {max_leg_nm:.0f} exceeds the {MAX_LEG_NM:.0f}nm limit")
+        self.max_leg_nm = float(max_leg_nm)
+        self._max_leg_rad = self.max_leg_nm / EARTH_RADIUS_NM
+
+        lats = np.array([n.latitude for n in nodes], dtype=np.float64)
+        order = np.argsort(lats, kind="stable")
+        self.nodes: List[StopNode] = [nodes[i] for i in order]
+        self._lat = lats[order]
+        self._lon = np.array([n.longitude for n in self.nodes], dtype=np.float64)
+        self._xyz = unit_vectors(self._lat, self._lon) if self.nodes else np.zeros((0, 3))
+        self._build_edges()
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    @property
+    def edge_count(self) -> int:
+        return int(len(self._indices))
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the graph's arrays."""
+        return int(
+            self._indptr.nbytes + self._indices.nbytes + self._distances.nbytes
+            + self._xyz.nbytes + self._lat.nbytes + self._lon.nbytes
+        )
+
+    def _longitude_window(self, latitude: float) -> float:
+        """Largest longitude difference (degrees) of a point within range, or 180 near the poles."""
+        if abs(latitude) + math.degrees(self._max_leg_rad) >= 90.0:
+            return 180.0
+        ratio = math.sin(self._max_leg_rad) / math.cos(math.radians(latitude))
+        return math.degrees(math.asin(min(1.0, ratio))) + 1e-9
+
+    def _build_edges(self) -> None:
+        """
+        Build CSR adjacency: neighbours within range.
+
+        Candidates are pruned by a latitude band (binary search on the sorted
+        latitudes) and the exact longitude window of the range circle, so
+        great-circle distances are only computed for the bounding box.
+        """
+        band_deg = math.degrees(self._max_leg_rad)
+        indptr = [0]
+        indices: List[np.ndarray] = []
+        distances: List[np.ndarray] = []
+        for i in range(len(self.nodes)):
+            lo = int(np.searchsorted(self._lat, self._lat[i] - band_deg, side="left"))
+            hi = int(np.searchsorted(self._lat, self._lat[i] + band_deg, side="right"))
+            window = self._longitude_window(float(self._lat[i]))
+            candidates = np.arange(lo, hi)
+            if window < 180.0:
+                dlon = np.abs((self._lon[lo:hi] - self._lon[i] + 180.0) % 360.0 - 180.0)
+                candidates = candidates[dlon <= window]
+            angles = angle_between(self._xyz[candidates], self._xyz[i][None, :])
+            mask = (angles <= self._max_leg_rad) & (candidates != i)
+            neighbours = candidates[mask]
+            indices.append(neighbours.astype(np.int32))
+            distances.append((angles[mask] * EARTH_RADIUS_NM).astype(np.float32))
+            indptr.append(indptr[-1] + len(neighbours))
+        self._indptr = np.array(indptr, dtype=np.int64)
+        self._indices = np.concatenate(indices) if indices else np.zeros(0, dtype=np.int32)
+        self._distances = np.concatenate(distances) if distances else np.zeros(0, dtype=np.float32)
+        logger.debug(f"ReachabilityGraph: {len(self.nodes)} nodes, {len(self._indices)} edges @ {self.max_leg_nm:.0f}nm")
+
+    def _distances_to(self, node: StopNode) -> np.ndarray:
+        """Great-circle distance (nm) from every graph node to an arbitrary node."""
+        point = unit_vectors(np.array([node.latitude]), np.array([node.longitude]))
+        return angle_between(self._xyz, point) * EARTH_RADIUS_NM
+
+    def plan(
+        self,
+        origin: StopNode,
+        destination: StopNode,
+        objective: str = "fewest_stops",
+        max_stops: Optional[int] = None,
+    ) -> Optional[RoutePlan]:
+        """
+        Find the optimal stop sequence from origin to destination.
+
+        Args:
+            origin: Departure node (need not satisfy stop criteria)
+            destination: Destination node (need not satisfy stop criteria)
+            objective: "fewest_stops" (ties broken by distance) or "shortest_distance"
+            max_stops: Optional cap on the number of intermediate stops
+
+        Returns:
+            RoutePlan, or None if the destination is unreachable within range
+        """
+        if objective not in OBJECTIVES:
+            raise ValueError(f"Unknown objective '{objective}'. Use one of: {', '.join(OBJECTIVES)}")
+
+        origin_xyz = unit_vectors(np.array([origin.latitude]), np.array([origin.longitude]))[0]
+        dest_xyz = unit_vectors(np.array([destination.latitude]), np.array([destination.longitude]))[0]
+        direct_nm = float(angle_between(origin_xyz, dest_xyz)) * EARTH_RADIUS_NM
+        if direct_nm <= self.max_leg_nm:
+            return RoutePlan(nodes=[origin, destination], leg_distances_nm=[direct_nm])
+        if max_stops == 0 or not self.nodes:
+            return None
+
+        from_origin = self._distances_to(origin)
+        to_dest = self._distances_to(destination)
+        excluded = {origin.ident, destination.ident}
+
+        n = len(self.nodes)
+        source, target = n, n + 1
+        fewest = objective == "fewest_stops"
+
+        def rank(legs: int, dist: float, remaining_nm: float = 0.0) -> Tuple[float, float]:
+            """A* priority: cost so far plus an admissible estimate of the remainder."""
+            est_legs = math.ceil(remaining_nm / self.max_leg_nm - 1e-9) if remaining_nm > 0 else 0
+            if fewest:
+                return (legs + est_legs, dist + remaining_nm)
+            return (dist + remaining_nm, legs + est_legs)
+
+        # Labels are keyed by node, or by (node, legs) when the number of stops is bounded
+        bounded = max_stops is not None
+
+        def label(node: int, legs: int) -> Any:
+            return (node, legs) if bounded else node
+
+        best: Dict[Any, Tuple[float, float]] = {label(source, 0): rank(0, 0.0)}
+        parent: Dict[Any, Any] = {label(source, 0): None}
+        heap: List[Tuple[Tuple[float, float], int, int, float]] = [
+            (rank(0, 0.0, direct_nm), source, 0, 0.0)
+        ]
+        closed = set()
+
+        def relax(from_key: Any, node: int, legs: int, dist: float, remaining_nm: float) -> None:
+            key = label(node, legs)
+            if key in closed:
+                return
+            cost = rank(legs, dist)
+            current = best.get(key)
+            if current is not None and current <= cost:
+                return
+            best[key] = cost
+            parent[key] = from_key
+            heapq.heappush(heap, (rank(legs, dist, remaining_nm), node, legs, dist))
+
+        while heap:
+            _, node, legs, dist = heapq.heappop(heap)
+            key = label(node, legs)
+            if key in closed:
+                continue
+            closed.add(key)
+            if node == target:
+                return self._build_plan(key, parent, origin, destination)
+
+            if node == source:
+                neighbours = np.nonzero(from_origin <= self.max_leg_nm)[0]
+                weights = from_origin[neighbours]
+            else:
+                # Final hop to the destination
+                if to_dest[node] <= self.max_leg_nm:
+                    relax(key, target, legs + 1, dist + float(to_dest[node]), 0.0)
+                start, end = self._indptr[node], self._indptr[node + 1]
+                neighbours, weights = self._indices[start:end], self._distances[start:end]
+
+            # Having flown `legs` legs we have made `legs` stops; another node adds one
+            if bounded and legs >= max_stops:
+                continue
+            for neighbour, weight in zip(neighbours.tolist(), weights.tolist()):
+                if self.nodes[neighbour].ident in excluded:
+                    continue
+                relax(key, neighbour, legs + 1, dist + weight, float(to_dest[neighbour]))
+        return None
+
+    def _build_plan(self, key, parent, origin: StopNode, destination: StopNode) -> RoutePlan:
+        chain = []
+        while key is not None:
+            chain.append(key[0] if isinstance(key, tuple) else key)
+            key = parent[key]
+        chain.reverse()
+        n = len(self.nodes)
+        sequence = [origin] + [self.nodes[i] for i in chain if i < n] + [destination]
+        xyz = unit_vectors(
+            np.array([s.latitude for s in sequence]), np.array([s.longitude for s in sequence])
+        )
+        legs = (angle_between(xyz[:-1], xyz[1:]) * EARTH_RADIUS_NM).tolist()
+        return RoutePlan(nodes=sequence, leg_distances_nm=[float(d) for d in legs])
+
+
+# -----------------------------------------------------------------------------
+# Graph cache (per model)
+# -----------------------------------------------------------------------------
+
+_graphs: "weakref.WeakKeyDictionary[Any, OrderedDict]" = weakref.WeakKeyDictionary()
+_graphs_lock = threading.Lock()
+
+
+def _graph_key(
+    filters: Optional[Dict[str, Any]], max_hours_notice: Optional[int], max_leg_nm: float
+) -> str:
+    return json.dumps(
+        {"filters": filters or {}, "max_hours_notice": max_hours_notice, "max_leg_nm": round(max_leg_nm, 1)},
+        sort_keys=True,
+        default=str,
+    )
+
+
+def get_reachability_graph(
+    ctx: "ToolContext",
+    max_leg_nm: float,
+    filters: Optional[Dict[str, Any]] = None,
+    max_hours_notice: Optional[int] = None,
+) -> ReachabilityGraph:
+    """
+    Get (building on first use) the reachability graph for a stop criteria and range.
+
+    Args:
+        ctx: Tool context (model, notification service, GA service for filters)
+        max_leg_nm: Maximum leg distance in nautical miles
+        filters: FilterEngine filters a stop must satisfy (including exclude_large_airports)
+        max_hours_notice: If set, stops must require at most this many hours notice
+            (airports without notification data are kept, as in the search tools)
+
+    Returns:
+        Cached ReachabilityGraph
+
+    Raises:
+        ValueError: If max_leg_nm exceeds MAX_LEG_NM
+    """
+    from .filtering import FilterEngine
+
+    if max_leg_nm > MAX_LEG_NM:
+        raise ValueError(f"max_leg_nm {max_leg_nm:.0f} exceeds the {MAX_LEG_NM:.0f}nm limit")
+
+    key = _graph_key(filters, max_hours_notice, max_leg_nm)
+    with _graphs_lock:
+        cache = _graphs.setdefault(ctx.model, OrderedDict())
+        graph = cache.get(key)
+        if graph is not None:
+            cache.move_to_end(key)
+            return graph
+
+    airports = [a for a in ctx.model.airports if getattr(a, "navpoint", None) is not None]
+    if filters:
+        airports = FilterEngine(context=ctx).apply(airports, filters)
+
+    notification_infos: Dict[str, Any] = {}
+    if ctx.notification_service and airports:
+        notification_infos = ctx.notification_service.get_notification_info_batch([a.ident for a in airports])
+
+    nodes: List[StopNode] = []
+    for airport in airports:
+        info = notification_infos.get(airport.ident)
+        if max_hours_notice is not None and info is not None and not info.matches_criteria(max_hours_notice=max_hours_notice):
+            continue
+        nodes.append(StopNode.from_airport(airport, getattr(info, "hours_notice", None)))
+
+    graph = ReachabilityGraph(nodes, max_leg_nm)
+    with _graphs_lock:
+        cache = _graphs.setdefault(ctx.model, OrderedDict())
+        cache[key] = graph
+        # Evict least recently used graphs over the size budget (keeping the new one)
+        while len(cache) > 1 and sum(g.nbytes for g in cache.values()) > GRAPH_CACHE_MAX_BYTES:
+            cache.popitem(last=False)
+    return graph
@@ -4,13 +4,18 @@ Rules Manager for Aviation Regulations
 Handles loading, indexing, filtering, and comparing country-specific aviation rules.
 """
 
+import hashlib
+import html
 import json
 import logging
+import math
 import os
 import re
-from typing import Dict, Any, List, Optional, Set
+from typing import Dict, Any, List, Optional, Set, Tuple
 from pathlib import Path
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
@@ -59,6 +64,99 @@ def apply_tag_preferences(tags: List[str]) -> List[str]:
     return [t for t in normalized if t not in suppressed]
 
 
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Function words that carry no signal for rules search
+_STOPWORDS = frozenset("""
+a an and are as at be by can do does for from how i if in is it me my of on or should
+the there to what when where which who will with you your
+""".split())
+
+# Curated glossary of aviation abbreviations used verbatim in the rules.
+# A query made only of these (or a rule ID) is an exact-term query, answered
+# lexically; common words ("fuel", "airport") are not, even if in the rules.
+GLOSSARY_TERMS = frozenset("""
+aip airac atc atis atz cavok ctr cta ctz dabs eta etd fir fis gen ifr ils lvp mtow
+notam pob poe ppr rmz sera sid star tma tmz ulm vac vfr vmc imc
+""".split())
+
+# Minimum BM25 score for a lexical match to stand on its own as an answer
+# (roughly one distinctive query term; matches on common words score lower)
+MIN_LEXICAL_SCORE = 2.0
+
+
+def strip_html(text: str) -> str:
+    """Remove HTML tags and unescape entities."""
+    return html.unescape(_HTML_TAG_RE.sub(" ", text or ""))
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens for lexical search, without stopwords."""
+    return [t for t in _TOKEN_RE.findall((text or "").lower()) if t not in _STOPWORDS]
+
+
+class BM25Index:
+    """
+    Okapi BM25 inverted index over a fixed list of documents.
+
+    Per-posting BM25 weights are precomputed at build time, so a search is a
+    scatter-add of the query terms' posting arrays.
+    """
+
+    def __init__(self, documents: List[str], k1: float = 1.5, b: float = 0.75):
+        """
+        Build index.
+
+        Args:
+            documents: Document texts (already HTML-stripped)
+            k1: Term frequency saturation
+            b: Document length normalization
+        """
+        self.size = len(documents)
+        term_freqs: Dict[str, Dict[int, int]] = {}
+        lengths = np.zeros(self.size, dtype=np.float32)
+        for doc_id, text in enumerate(documents):
+            tokens = tokenize(text)
+            lengths[doc_id] = len(tokens)
+            for token in tokens:
+                postings = term_freqs.setdefault(token, {})
+                postings[doc_id] = postings.get(doc_id, 0) + 1
+
+        avg_length = float(lengths.mean()) if self.size and lengths.mean() > 0 else 1.0
+        self._postings: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        for term, postings in term_freqs.items():
+            doc_ids = np.fromiter(postings.keys(), dtype=np.int64, count=len(postings))
+            tf = np.fromiter(postings.values(), dtype=np.float32, count=len(postings))
+            idf = math.log(1.0 + (self.size - len(postings) + 0.5) / (len(postings) + 0.5))
+            norm = k1 * (1.0 - b + b * lengths[doc_ids] / avg_length)
+            self._postings[term] = (doc_ids, (idf * tf * (k1 + 1.0) / (tf + norm)).astype(np.float32))
+
+    def __contains__(self, term: str) -> bool:
+        return term in self._postings
+
+    def search(self, query: str, top_k: int = 10) -> List[Tuple[int, float]]:
+        """
+        Score documents against a query.
+
+        Returns:
+            List of (document index, BM25 score), best first; only documents
+            matching at least one query term
+        """
+        terms = [t for t in set(tokenize(query)) if t in self._postings]
+        if not terms or not self.size:
+            return []
+        scores = np.zeros(self.size, dtype=np.float32)
+        for term in terms:
+            doc_ids, weights = self._postings[term]
+            scores[doc_ids] += weights
+        matched = np.nonzero(scores)[0]
+        if len(matched) > top_k:
+            matched = matched[np.argpartition(-scores[matched], top_k - 1)[:top_k]]
+        order = matched[np.argsort(-scores[matched], kind="stable")]
+        return [(int(i), float(scores[i])) for i in order]
+
+
 class RulesManager:
     """Manages aviation rules data for multiple countries."""
 
@@ -73,6 +171,10 @@ class RulesManager:
         self.rules = []
         self.rules_index = {}
         self.question_map: Dict[str, Dict[str, Any]] = {}
+        self.lexical_index: Dict[str, BM25Index] = {}
+        self._search_text: Dict[str, List[str]] = {}
+        self._rule_ids: Set[str] = set()  # Lowercase question IDs, for exact-term queries
+        self.version: Optional[str] = None  # Content hash of the loaded rules.json
         self.loaded = False
 
     def load_rules(self) -> bool:
@@ -89,8 +191,9 @@ class RulesManager:
                 logger.warning(f"Rules file not found: {self.rules_json_path}")
                 return False
 
-            with open(rules_path, 'r', encoding='utf-8') as f:
-                rules_data = json.load(f)
+            raw = rules_path.read_bytes()
+            rules_data = json.loads(raw.decode('utf-8'))
+            self.version = hashlib.sha256(raw).hexdigest()[:16]
 
             # Handle both list format and dict format with "questions" key
             if isinstance(rules_data, list):
@@ -190,6 +293,19 @@ class RulesManager:
         for entries in self.rules_index['by_country'].values():
             entries.sort(key=lambda x: x['question_text'].lower())
 
+        self._rule_ids = {qid.lower() for qid in self.question_map}
+
+        # Lexical indexes per country (positions match rules_index['by_country'])
+        self.lexical_index = {}
+        self._search_text = {}
+        for country_code, entries in self.rules_index['by_country'].items():
+            self.lexical_index[country_code] = BM25Index([
+                f"{e['question_text']} {strip_html(e['answer_html'])}" for e in entries
+            ])
+            self._search_text[country_code] = [
+                f"{e['question_text']}\n{e['answer_html'] or ''}".lower() for e in entries
+            ]
+
         country_counts = {c: len(entries) for c, entries in self.rules_index['by_country'].items()}
         logger.info(
             "Built rules index: %d questions, %d countries, %d categories",
@@ -225,6 +341,13 @@ class RulesManager:
 
         country_code = country_code.upper()
         entries = list(self.rules_index.get('by_country', {}).get(country_code, []))
+
+        # Apply search term filter first, against the precomputed lowercase text
+        if search_term:
+            search_lower = search_term.lower()
+            search_text = self._search_text.get(country_code, [])
+            entries = [e for e, text in zip(entries, search_text) if search_lower in text]
+
         logger.debug(
             "Looking up %s in index, found %d rules. Available countries: %s",
             country_code,
@@ -246,17 +369,62 @@ class RulesManager:
                 if any(tag in (r.get('tags') or []) for tag in filtered_tags)
             ]
 
-        # Apply search term filter
-        if search_term:
-            search_lower = search_term.lower()
-            entries = [
-                r for r in entries
-                if search_lower in (r.get('question_text') or '').lower()
-                or search_lower in (r.get('answer_html') or '').lower()
-            ]
-
         return entries
 
+    def search_rules(
+        self,
+        query: str,
+        countries: Optional[List[str]] = None,
+        top_k: int = 10,
+        min_score: float = 0.0,
+    ) -> List[Dict[str, Any]]:
+        """
+        Lexical (BM25) search over question text and answers.
+
+        Args:
+            query: Free-text query (e.g., "PPR", "Jersey customs")
+            countries: ISO-2 codes to search (all countries if None)
+            top_k: Maximum number of results
+            min_score: Drop matches scoring below this (e.g., MIN_LEXICAL_SCORE)
+
+        Returns:
+            Rule entries with an added 'lexical_score', best first
+        """
+        if not self.loaded:
+            self.load_rules()
+        if not self.loaded:
+            return []
+
+        by_country = self.rules_index.get('by_country', {})
+        codes = [c.upper() for c in countries] if countries else list(by_country)
+        scored: List[Tuple[float, Dict[str, Any]]] = []
+        for code in codes:
+            index = self.lexical_index.get(code)
+            if index is None:
+                continue
+            for position, score in index.search(query, top_k):
+                if score >= min_score:
+                    scored.append((score, by_country[code][position]))
+
+        scored.sort(key=lambda item: item[0], reverse=True)
+        return [dict(entry, lexical_score=round(score, 3)) for score, entry in scored[:top_k]]
+
+    def is_exact_term_query(self, query: str, max_terms: int = 2) -> bool:
+        """
+        True if the query is a rule ID, or a few terms that are all glossary terms.
+
+        Such queries (e.g., "PPR", "POE") are answered best by lexical search.
+        Only the curated GLOSSARY_TERMS count, not every word of the rules text.
+        """
+        if not self.loaded:
+            self.load_rules()
+        if query.strip().lower() in self._rule_ids:
+            return True
+        terms = tokenize(query)
+        if not terms or len(terms) > max_terms:
+            return False
+        return all(t in GLOSSARY_TERMS for t in terms)
+
     def compare_rules_between_countries(
         self,
         country1: str,
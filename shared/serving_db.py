@@ -0,0 +1,399 @@
+#!/usr/bin/env python3
+"""
+Serving Database
+================
+
+Denormalized, read-optimized copy of what the airports API returns, compiled
+from airports.db, ga_persona.db and ga_notifications.db
+(tools/build_serving_db.py, run by tools/data_update.py).
+
+Without it the API joins the three databases in Python per request:
+AirportSummary fields from the model, GA summaries (one storage query and
+persona scoring per airport) and notification summaries. The serving
+database has one ``airport_serving`` row per airport with:
+
+- the AirportSummary fields, plus ``avgas``/``jet_a``;
+- hospitality codes (``aip_hotel_info``, ``aip_restaurant_info``);
+- ``max_notice_hours`` (0 for H24, NULL if unknown);
+- one ``score_<persona>`` column per persona;
+- the GA and notification summaries as returned by the API (JSON).
+
+``runway_sort`` (runway length, 0 if unknown) is the list endpoint's sort
+key. Indexes cover its filters, each followed by ``(runway_sort DESC,
+ident)``, so a filtered page is read in order without sorting. The data version (shared/data_delta.py) it was compiled from
+is stored in ``serving_meta``; the web server only uses a serving database
+whose version matches the data it loaded.
+
+Usage:
+    context, version = load_snapshot(airports_db, ga_persona_db, notifications_db)
+    build_serving_db(path, context.model.airports.all(), context.ga_friendliness_service,
+                     context.notification_service, version=version.encode())
+
+    serving = ServingDB(path)
+    rows = serving.query(country="FR", hotel="at_airport", limit=100)
+    ga = serving.ga_summaries(["LFPT"])
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .airport_rows import (
+    AIRPORT_SUMMARY_FIELDS,
+    NOTIFICATION_SUMMARY_FIELDS,
+    airport_summary_values,
+    notification_summary_values,
+)
+
+logger = logging.getLogger(__name__)
+
+# Bump when the table changes; readers ignore databases of another version
+SERVING_SCHEMA_VERSION = 2
+SERVING_TABLE = "airport_serving"
+
+SUMMARY_COLUMNS = AIRPORT_SUMMARY_FIELDS
+FILTER_COLUMNS = ["avgas", "jet_a", "aip_hotel_info", "aip_restaurant_info", "max_notice_hours", "runway_sort"]
+JSON_COLUMNS = ["ga_json", "notification_json"]
+
+# List order: longest runway first (unknown length as 0), ties by ICAO
+ORDER_KEY = "runway_sort DESC, ident"
+
+# Boolean filters that may be NULL (filtered as false): compared and indexed
+# on COALESCE(column, 0) so both true and false filters use the index
+NULLABLE_FLAG_COLUMNS = ["point_of_entry", "has_hard_runway"]
+
+# Hospitality filter value -> minimum code (1=vicinity, 2=at_airport);
+# "vicinity" includes at_airport, as in GAMetaStorage.get_icaos_by_hospitality
+HOSPITALITY_MIN_CODE = {"at_airport": 2, "vicinity": 1, "any": 1}
+
+PERSONA_ID_PATTERN = re.compile(r"^[A-Za-z0-9_]+$")
+
+
+def notification_summary_dict(info: Any) -> Dict[str, Any]:
+    """NotificationSummary fields of a NotificationInfo, as the API returns them."""
+    return dict(zip(NOTIFICATION_SUMMARY_FIELDS, notification_summary_values(info, max_summary_chars=100)))
+
+
+def build_serving_db(
+    path: Path,
+    airports: Iterable[Any],
+    ga_service: Optional[Any] = None,
+    notification_service: Optional[Any] = None,
+    version: Optional[str] = None,
+) -> int:
+    """
+    Compile the serving database, replacing `path` atomically.
+
+    Args:
+        path: Output database
+        airports: euro_aip Airport objects (e.g. model.airports.all())
+        ga_service: GAFriendlinessService (None = no GA data)
+        notification_service: NotificationService (None = no notification data)
+        version: Data version token the inputs correspond to
+
+    Returns:
+        Number of airports written
+    """
+    airports = sorted(airports, key=lambda a: a.ident)
+    icaos = [a.ident for a in airports]
+
+    ga: Dict[str, Dict[str, Any]] = {}
+    hospitality: Dict[str, Tuple[Optional[int], Optional[int]]] = {}
+    personas: List[str] = []
+    if ga_service is not None:
+        ga = ga_service.get_summaries_batch_dict(icaos)
+        hospitality = ga_service.get_hospitality_info()
+        personas = sorted({p for summary in ga.values() for p in summary.get("persona_scores") or {}})
+        invalid = [p for p in personas if not PERSONA_ID_PATTERN.match(p)]
+        if invalid:
+            raise ValueError(f"Persona ids not usable as column names: {invalid}")
+
+    notifications: Dict[str, Any] = {}
+    if notification_service is not None:
+        notifications = notification_service.get_notification_info_batch(icaos)
+
+    score_columns = [f"score_{p}" for p in personas]
+    columns = SUMMARY_COLUMNS + FILTER_COLUMNS + JSON_COLUMNS + score_columns
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    tmp_path.unlink(missing_ok=True)
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.executescript(
+            f"""
+            CREATE TABLE serving_meta (key TEXT PRIMARY KEY, value TEXT) WITHOUT ROWID;
+            CREATE TABLE {SERVING_TABLE} (
+                ident TEXT PRIMARY KEY, name TEXT, latitude_deg REAL, longitude_deg REAL,
+                iso_country TEXT, municipality TEXT, point_of_entry INTEGER,
+                has_procedures INTEGER, has_runways INTEGER, has_aip_data INTEGER,
+                has_hard_runway INTEGER, has_lighted_runway INTEGER, has_soft_runway INTEGER,
+                has_water_runway INTEGER, has_snow_runway INTEGER,
+                longest_runway_length_ft INTEGER, procedure_count INTEGER, runway_count INTEGER,
+                aip_entry_count INTEGER,
+                avgas INTEGER, jet_a INTEGER, aip_hotel_info INTEGER, aip_restaurant_info INTEGER,
+                max_notice_hours INTEGER, runway_sort INTEGER NOT NULL,
+                ga_json TEXT, notification_json TEXT
+                {''.join(f', {c} REAL' for c in score_columns)}
+            );
+            """
+        )
+        rows = []
+        for airport in airports:
+            icao = airport.ident
+            hotel, restaurant = hospitality.get(icao, (None, None))
+            info = notifications.get(icao)
+            max_notice = None
+            if info is not None:
+                max_notice = 0 if info.is_h24() else info.hours_notice
+            summary = ga.get(icao)
+            scores = (summary or {}).get("persona_scores") or {}
+            rows.append(
+                airport_summary_values(airport)
+                + [
+                    bool(getattr(airport, "avgas", False)),
+                    bool(getattr(airport, "jet_a", False)),
+                    hotel,
+                    restaurant,
+                    max_notice,
+                    airport.longest_runway_length_ft or 0,
+                    json.dumps(summary) if summary is not None else None,
+                    json.dumps(notification_summary_dict(info)) if info is not None else None,
+                ]
+                + [scores.get(p) for p in personas]
+            )
+        conn.executemany(
+            f"INSERT INTO {SERVING_TABLE} ({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)})",
+            rows,
+        )
+
+        # Filters lead each index, followed by the list order
+        for name, key in [
+            ("runway", ORDER_KEY),
+            ("country", f"iso_country, {ORDER_KEY}"),
+            ("entry", f"COALESCE(point_of_entry, 0), {ORDER_KEY}"),
+            ("procedures", f"has_procedures, {ORDER_KEY}"),
+            ("aip_data", f"has_aip_data, {ORDER_KEY}"),
+            ("hard_runway", f"COALESCE(has_hard_runway, 0), {ORDER_KEY}"),
+            ("avgas", f"avgas, {ORDER_KEY}"),
+            ("jet_a", f"jet_a, {ORDER_KEY}"),
+            ("hotel", f"aip_hotel_info, {ORDER_KEY}"),
+            ("restaurant", f"aip_restaurant_info, {ORDER_KEY}"),
+            ("notice", f"max_notice_hours, {ORDER_KEY}"),
+            ("position", "latitude_deg, longitude_deg"),
+        ] + [(c, f"{c} DESC") for c in score_columns]:
+            conn.execute(f"CREATE INDEX idx_serving_{name} ON {SERVING_TABLE}({key})")
+
+        conn.executemany("INSERT INTO serving_meta (key, value) VALUES (?, ?)", [
+            ("schema_version", str(SERVING_SCHEMA_VERSION)),
+            ("version", version or ""),
+            ("personas", json.dumps(personas)),
+        ])
+        conn.commit()
+        conn.execute("ANALYZE")
+        conn.execute("VACUUM")
+    finally:
+        conn.close()
+    os.replace(tmp_path, path)
+    logger.info(f"Serving database {path}: {len(rows)} airports, {len(personas)} personas")
+    return len(rows)
+
+
+class ServingDB:
+    """Read-only access to a compiled serving database."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._conn = sqlite3.connect(
+            f"file:{self.path.resolve()}?mode=ro", uri=True, check_same_thread=False
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        meta = dict(self._conn.execute("SELECT key, value FROM serving_meta").fetchall())
+        self.schema_version = int(meta.get("schema_version", 0))
+        self.version: Optional[str] = meta.get("version") or None
+        self.personas: List[str] = json.loads(meta.get("personas", "[]"))
+        if self.schema_version != SERVING_SCHEMA_VERSION:
+            self.close()
+            raise ValueError(
+                f"Serving database {path} has schema {self.schema_version}, expected {SERVING_SCHEMA_VERSION}"
+            )
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def _execute(self, sql: str, params: Sequence[Any] = ()) -> List[sqlite3.Row]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def _by_icao(self, column: str, icaos: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+        result: Dict[str, Dict[str, Any]] = {}
+        icaos = list(icaos)
+        # Stay under SQLite's bound-parameter limit
+        for start in range(0, len(icaos), 500):
+            chunk = icaos[start:start + 500]
+            rows = self._execute(
+                f"SELECT ident, {column} FROM {SERVING_TABLE} "
+                f"WHERE ident IN ({','.join('?' for _ in chunk)}) AND {column} IS NOT NULL",
+                chunk,
+            )
+            result.update((row[0], json.loads(row[1])) for row in rows)
+        return result
+
+    def ga_summaries(self, icaos: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+        """ICAO -> GAFriendlySummary fields (airports with GA data only)."""
+        return self._by_icao("ga_json", icaos)
+
+    def notification_summaries(self, icaos: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+        """ICAO -> NotificationSummary fields (airports with notification data only)."""
+        return self._by_icao("notification_json", icaos)
+
+    def query(
+        self,
+        country: Optional[str] = None,
+        has_procedures: Optional[bool] = None,
+        has_aip_data: Optional[bool] = None,
+        has_hard_runway: Optional[bool] = None,
+        point_of_entry: Optional[bool] = None,
+        fuel_type: Optional[str] = None,
+        hotel: Optional[str] = None,
+        restaurant: Optional[str] = None,
+        bbox: Optional[Tuple[float, float, float, float]] = None,
+        limit: int = 1000,
+        offset: int = 0,
+        include_ga: bool = True,
+        include_notification: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """
+        AirportSummary dicts matching the airports list filters, longest
+        runway first (ties by ICAO).
+
+        Args:
+            bbox: (north, south, east, west) in decimal degrees
+        """
+        sql, params = self._query_sql(
+            country=country,
+            has_procedures=has_procedures,
+            has_aip_data=has_aip_data,
+            has_hard_runway=has_hard_runway,
+            point_of_entry=point_of_entry,
+            fuel_type=fuel_type,
+            hotel=hotel,
+            restaurant=restaurant,
+            bbox=bbox,
+            limit=limit,
+            offset=offset,
+            include_ga=include_ga,
+            include_notification=include_notification,
+        )
+        results = []
+        for row in self._execute(sql, params):
+            item = {c: row[c] for c in SUMMARY_COLUMNS}
+            item["ga"] = json.loads(row["ga_json"]) if include_ga and row["ga_json"] else None
+            item["notification"] = (
+                json.loads(row["notification_json"])
+                if include_notification and row["notification_json"] else None
+            )
+            results.append(item)
+        return results
+
+    def _query_sql(
+        self,
+        country: Optional[str] = None,
+        has_procedures: Optional[bool] = None,
+        has_aip_data: Optional[bool] = None,
+        has_hard_runway: Optional[bool] = None,
+        point_of_entry: Optional[bool] = None,
+        fuel_type: Optional[str] = None,
+        hotel: Optional[str] = None,
+        restaurant: Optional[str] = None,
+        bbox: Optional[Tuple[float, float, float, float]] = None,
+        limit: int = 1000,
+        offset: int = 0,
+        include_ga: bool = True,
+        include_notification: bool = True,
+    ) -> Tuple[str, List[Any]]:
+        """SQL and parameters of query()."""
+        conditions: List[str] = []
+        params: List[Any] = []
+        if country:
+            conditions.append("iso_country = ?")
+            params.append(country)
+        for column, value in (
+            ("has_procedures", has_procedures),
+            ("has_aip_data", has_aip_data),
+            ("has_hard_runway", has_hard_runway),
+            ("point_of_entry", point_of_entry),
+        ):
+            if value is not None:
+                # Model filters treat NULL as false
+                lhs = f"COALESCE({column}, 0)" if column in NULLABLE_FLAG_COLUMNS else column
+                conditions.append(f"{lhs} = ?")
+                params.append(1 if value else 0)
+        if fuel_type in ("avgas", "jet_a"):
+            conditions.append(f"{fuel_type} = 1")
+        for column, value in (("aip_hotel_info", hotel), ("aip_restaurant_info", restaurant)):
+            if value is not None:
+                conditions.append(f"{column} >= ?")
+                params.append(HOSPITALITY_MIN_CODE.get(value, 3))  # Unknown value matches nothing
+        if bbox:
+            north, south, east, west = bbox
+            conditions.append("latitude_deg BETWEEN ? AND ? AND longitude_deg BETWEEN ? AND ?")
+            params.extend([south, north, west, east])
+
+        columns = SUMMARY_COLUMNS + (["ga_json"] if include_ga else []) + (
+            ["notification_json"] if include_notification else []
+        )
+        sql = f"SELECT {', '.join(columns)} FROM {SERVING_TABLE}"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += f" ORDER BY {ORDER_KEY} LIMIT ? OFFSET ?"
+        params.extend([limit, offset])
+        return sql, params
+
+
+def load_snapshot(airports_db: Path, ga_persona_db: Path, notifications_db: Path):
+    """
+    Load the data the web server serves, for compile tools.
+
+    The airports.db mark is read before loading (as the web server does), so
+    a delta from the returned version re-sends anything changed meanwhile.
+
+    GA and notification services are None if their database is missing.
+
+    Returns:
+        (ToolContext without rules/RAG, DataVersion of the loaded data)
+    """
+    from shared.aip_change_feed import AIPChangeFeed
+    from shared.data_delta import DeltaSource
+    from shared.tool_context import ToolContext, ToolContextSettings
+
+    airports_mark = AIPChangeFeed(airports_db).latest()
+    settings = ToolContextSettings(
+        airports_db=airports_db,
+        ga_notifications_db=notifications_db,
+        ga_meta_db=ga_persona_db,
+    )
+    context = ToolContext.create(
+        settings,
+        load_rules=False,
+        load_comparison=False,
+        load_rag=False,
+    )
+    # Same airports as the web server serves
+    context.model.remove_airports_by_country("RU")
+
+    version = DeltaSource(
+        airports_db,
+        airports_mark,
+        ga_persona_db=ga_persona_db if context.ga_friendliness_service else None,
+        notifications_db=notifications_db if context.notification_service else None,
+    ).current_version()
+    return context, version
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Single-Flight Request Coalescing
+================================
+
+Concurrent identical calls share one computation.
+
+When the map first loads (or right after a deploy or data reload) many
+browsers request ``/api/airports/`` with the default filters at the same
+moment, and popular chat prompts run identical tool calls concurrently. Each
+used to compute the same result from scratch. With ``SingleFlight`` the
+first caller for a key computes it; callers arriving with the same key while
+it runs wait for and return its result (or its exception). Nothing is kept
+after the computation finishes: this is not a cache, so results are never
+stale. Keys should include the data version (e.g. the id of the loaded
+model) so calls on different snapshots never coalesce.
+
+``do()`` is for synchronous callers (threads); ``run()`` is for async
+handlers and runs the computation in a worker thread, so waiting callers do
+not block the event loop. Callers must not mutate a result returned with
+``shared=True``; other callers got the same object.
+
+Usage:
+    _airport_lists = SingleFlight("airports.list")
+
+    result, shared = _airport_lists.do(key, lambda: compute(...))
+    result, shared = await _airport_lists.run(key, lambda: compute(...))
+
+    single_flight_stats()  # {"airports.list": {"executions": 3, "coalesced": 41}}
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# All SingleFlight groups by name, for metrics
+_groups: Dict[str, "SingleFlight"] = {}
+
+
+class _Call:
+    """One in-flight computation."""
+
+    def __init__(self) -> None:
+        self.waiters = 0
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.task: Optional[asyncio.Future] = None
+
+
+class SingleFlight:
+    """
+    Group of calls coalesced by key.
+
+    Args:
+        name: Name reported by single_flight_stats()
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._tasks: Dict[Hashable, _Call] = {}
+        self.executions = 0
+        self.coalesced = 0
+        _groups[name] = self
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> Tuple[T, bool]:
+        """
+        Call fn, or wait for the call already running for key.
+
+        Returns:
+            (result, shared) where shared is True if more than one caller
+            received this result object
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.executions += 1
+            else:
+                call.waiters += 1
+                self.coalesced += 1
+
+        if leader:
+            try:
+                call.result = fn()
+            except BaseException as e:
+                call.error = e
+            finally:
+                with self._lock:
+                    del self._calls[key]
+                call.done.set()
+        else:
+            call.done.wait()
+
+        if call.error is not None:
+            raise call.error
+        return call.result, call.waiters > 0
+
+    async def run(self, key: Hashable, fn: Callable[[], T]) -> Tuple[T, bool]:
+        """
+        Run fn in a worker thread, or await the run already in flight for key.
+
+        The computation finishes even if the caller that started it is
+        cancelled (e.g. its client disconnected), so the others still get
+        the result.
+
+        Returns:
+            (result, shared) as for do()
+        """
+        with self._lock:
+            call = self._tasks.get(key)
+            if call is None:
+                call = self._tasks[key] = _Call()
+                call.task = asyncio.ensure_future(asyncio.to_thread(fn))
+                call.task.add_done_callback(lambda task: self._finish(key, call))
+                self.executions += 1
+            else:
+                call.waiters += 1
+                self.coalesced += 1
+
+        result = await asyncio.shield(call.task)
+        return result, call.waiters > 0
+
+    def _finish(self, key: Hashable, call: _Call) -> None:
+        with self._lock:
+            if self._tasks.get(key) is call:
+                del self._tasks[key]
+        if not call.task.cancelled() and call.task.exception() is not None:
+            # Retrieved here so an error nobody awaited anymore is not reported as lost
+            logger.debug(f"{self.name}: shared call failed: {call.task.exception()}")
+
+    def stats(self) -> Dict[str, int]:
+        """Number of computations run and of calls that joined one in flight."""
+        with self._lock:
+            return {"executions": self.executions, "coalesced": self.coalesced}
+
+
+def single_flight_stats() -> Dict[str, Dict[str, int]]:
+    """Coalescing metrics of all SingleFlight groups."""
+    return {name: group.stats() for name, group in sorted(_groups.items())}
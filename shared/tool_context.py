@@ -66,6 +66,21 @@ class ToolContextSettings(BaseSettings):
         description="URL to ChromaDB service. If set, takes precedence over vector_db_path.",
         alias="VECTOR_DB_URL",
     )
+    serving_db: Optional[Path] = Field(
+        default=None,
+        description="Path to the compiled serving database (tools/build_serving_db.py, optional)",
+        alias="SERVING_DB",
+    )
+    offline_bundle_dir: Optional[Path] = Field(
+        default=None,
+        description="Directory of offline data bundles (tools/build_offline_bundle.py) served by the web API",
+        alias="OFFLINE_BUNDLE_DIR",
+    )
+    data_reload_interval: float = Field(
+        default=60.0,
+        description="Seconds between checks of the data files for hot reload in the servers (0 disables)",
+        alias="DATA_RELOAD_INTERVAL",
+    )
 
 
 @lru_cache(maxsize=1)
@@ -9,6 +9,7 @@ Tests cover:
 """
 import json
 import os
+from dataclasses import replace
 from pathlib import Path
 from unittest.mock import Mock, MagicMock, patch
 
@@ -18,7 +19,9 @@ import pytest
 from shared.aviation_agent.answer_comparer import (
     AnswerComparer,
     AnswerDifference,
+    AnswerTensor,
     ComparisonResult,
+    ComparisonTables,
     OutlierResult,
     cosine_similarity,
     create_answer_comparer,
@@ -316,6 +319,197 @@ class TestAnswerComparer:
         assert result.countries == ["FR", "GB"]
 
 
+class _BulkCollection:
+    """In-memory stand-in for the answers collection supporting paged and by-id gets."""
+
+    def __init__(self, rows):
+        self.rows = rows  # [(doc_id, question_id, country, embedding, document)]
+
+    def count(self):
+        return len(self.rows)
+
+    def get(self, ids=None, where=None, include=None, limit=None, offset=0):
+        rows = self.rows
+        if ids is not None:
+            rows = [r for r in rows if r[0] in ids]
+        elif where is not None:
+            rows = [r for r in rows if r[1] == where.get("question_id")]
+        else:
+            rows = rows[offset:offset + limit if limit else None]
+        return {
+            "ids": [r[0] for r in rows],
+            "embeddings": [r[3] for r in rows],
+            "metadatas": [{"question_id": r[1], "country_code": r[2]} for r in rows],
+            "documents": [r[4] for r in rows],
+        }
+
+
+@pytest.fixture
+def bulk_rows():
+    rng = np.random.default_rng(5)
+    countries = ["DE", "ES", "FR", "GB", "IT", "NL"]
+    rows = []
+    for q in range(40):
+        for country in countries:
+            if rng.random() < 0.2:  # Some countries have no answer
+                continue
+            emb = rng.normal(size=16).tolist()
+            rows.append((f"q{q}_{country}_answer", f"q{q}", country, emb, f"answer q{q} {country}"))
+    return rows
+
+
+class TestAnswerTensor:
+    """Tests for bulk tensor loading and vectorized difference/outlier scores."""
+
+    @pytest.fixture
+    def comparers(self, bulk_rows):
+        """Tensor-backed comparer and one forced onto per-question lookups."""
+        def make():
+            client = Mock()
+            client.get_collection.return_value = _BulkCollection(bulk_rows)
+            return AnswerComparer(client)
+
+        bulk, legacy = make(), make()
+        legacy._tensor_loaded = True  # Never load the tensor
+        return bulk, legacy
+
+    def test_tensor_shape_and_mask(self, comparers, bulk_rows):
+        bulk, _ = comparers
+        tensor = bulk.load_answer_tensor()
+        assert isinstance(tensor, AnswerTensor)
+        assert tensor.embeddings.shape == (40, 6, 16)
+        assert tensor.mask.sum() == len(bulk_rows)
+
+    def test_difference_scores_match_per_question(self, comparers):
+        bulk, legacy = comparers
+        questions = [f"q{i}" for i in range(40)] + ["missing"]
+        countries = ["FR", "GB", "DE", "IT"]
+
+        fast = bulk.find_most_different_questions(questions, countries, max_questions=50, min_difference=0.0)
+        slow = legacy.find_most_different_questions(questions, countries, max_questions=50, min_difference=0.0)
+
+        assert [d.question_id for d in fast] == [d.question_id for d in slow]
+        for a, b in zip(fast, slow):
+            assert a.difference_score == pytest.approx(b.difference_score, abs=1e-5)
+            assert a.answers == b.answers
+
+    def test_outliers_match_per_question(self, comparers):
+        bulk, legacy = comparers
+        questions = [f"q{i}" for i in range(10)]
+
+        batch = bulk.find_outliers(questions, ["FR", "GB", "DE", "ES"], top_n=2)
+        for result in batch:
+            expected = legacy.find_outliers_for_question(result.question_id, ["FR", "GB", "DE", "ES"], top_n=2)
+            assert [o["distance"] for o in result.outliers] == pytest.approx([o["distance"] for o in expected.outliers], abs=1e-3)
+            assert set(result.countries_analyzed) == set(expected.countries_analyzed)
+            assert result.mean_distance == pytest.approx(expected.mean_distance, abs=1e-5)
+
+    def test_falls_back_when_bulk_get_empty(self, mock_chromadb_client=None):
+        client = Mock()
+        collection = Mock()
+        collection.count.return_value = 3
+        collection.get.return_value = {"ids": [], "embeddings": [], "metadatas": [], "documents": []}
+        client.get_collection.return_value = collection
+
+        comparer = AnswerComparer(client)
+        assert comparer.load_answer_tensor() is None
+
+
+class TestComparisonTables:
+    """Tests for comparison tables precomputed at build time."""
+
+    @pytest.fixture
+    def tables(self, bulk_rows):
+        tensor = AnswerTensor.from_rows([(r[1], r[2], r[3], r[4]) for r in bulk_rows])
+        return ComparisonTables.from_tensor(tensor)
+
+    def _comparer(self, bulk_rows, tables=None):
+        client = Mock()
+        client.get_collection.return_value = _BulkCollection(bulk_rows)
+        comparer = AnswerComparer(client, tables=tables)
+        if tables is None:
+            comparer._tensor_loaded = True  # Per-question lookups only
+        return comparer
+
+    def test_save_load_roundtrip(self, tables, tmp_path):
+        tables.save(tmp_path / "tables")
+        loaded = ComparisonTables.load(tmp_path / "tables")
+
+        assert loaded.question_ids == tables.question_ids
+        assert loaded.countries == tables.countries
+        assert loaded.texts == tables.texts
+        assert loaded.answer_count == tables.answer_count
+        assert loaded.source_hash == tables.source_hash
+        np.testing.assert_allclose(loaded.gram, tables.gram)
+        assert ComparisonTables.load(tmp_path / "missing") is None
+
+    def test_lookups_match_per_question(self, bulk_rows, tables):
+        fast = self._comparer(bulk_rows, tables)
+        slow = self._comparer(bulk_rows)
+        questions = [f"q{i}" for i in range(40)]
+        countries = ["FR", "GB", "DE", "IT"]
+
+        a = fast.find_most_different_questions(questions, countries, max_questions=50, min_difference=0.0)
+        b = slow.find_most_different_questions(questions, countries, max_questions=50, min_difference=0.0)
+        assert [d.question_id for d in a] == [d.question_id for d in b]
+        assert [d.difference_score for d in a] == pytest.approx([d.difference_score for d in b], abs=1e-4)
+
+        # Subset outliers use the exact subset centroid, not the all-country one
+        for result in fast.find_outliers(questions[:10], ["FR", "GB", "ES"], top_n=3):
+            expected = slow.find_outliers_for_question(result.question_id, ["FR", "GB", "ES"], top_n=3)
+            assert result.mean_distance == pytest.approx(expected.mean_distance, abs=1e-4)
+
+        assert fast.compute_pairwise_difference("q3", "fr", "gb") == pytest.approx(
+            slow.compute_pairwise_difference("q3", "FR", "GB"), abs=1e-4
+        )
+        assert fast._tensor is None  # Never needed the embeddings
+
+    def test_pair_scores(self, bulk_rows, tables):
+        comparer = self._comparer(bulk_rows, tables)
+        fr, gb = tables.countries.index("FR"), tables.countries.index("GB")
+        both = tables.mask[:, fr] & tables.mask[:, gb]
+        expected = float(np.mean(tables.difference[both, fr, gb]))
+
+        assert tables.pair_difference("fr", "gb") == pytest.approx(expected, abs=1e-5)
+        assert comparer.country_pair_scores(["FR", "GB", "XX"]) == {"FR-GB": round(expected, 3)}
+
+    def test_stale_tables_ignored(self, bulk_rows, tables):
+        current = self._comparer(bulk_rows, tables)
+        current._ensure_initialized()
+        assert current.tables is tables
+
+        removed = self._comparer(bulk_rows[:-1], tables)
+        removed._ensure_initialized()
+        assert removed.tables is None
+
+        # Same number of answers, one of them edited
+        doc_id, question_id, country, emb, _ = bulk_rows[0]
+        edited = self._comparer([(doc_id, question_id, country, emb, "revised answer")] + bulk_rows[1:], tables)
+        edited._ensure_initialized()
+        assert edited.tables is None
+
+    def test_build_vector_db_writes_tables(self, sample_rules_json, tmp_path):
+        from shared.aviation_agent.rules_rag import build_vector_db
+
+        class _FakeEmbeddings:
+            def embed_documents(self, texts):
+                return [[float(len(t)), float(t.count("e")), 1.0] for t in texts]
+
+            def embed_query(self, text):
+                return self.embed_documents([text])[0]
+
+        vector_db_path = tmp_path / "test_vector_db"
+        with patch("langchain_openai.OpenAIEmbeddings", return_value=_FakeEmbeddings()):
+            result = build_vector_db(rules_json_path=sample_rules_json, vector_db_path=vector_db_path, force_rebuild=True)
+
+        comparer = create_answer_comparer(vector_db_path=str(vector_db_path))
+        assert comparer._ensure_initialized()
+        assert comparer.tables is not None  # Not stale
+        assert comparer.tables.answer_count == result["answers"]
+        assert "test-q1" in comparer.tables
+        assert comparer.country_pair_scores(["FR", "GB"]).keys() == {"FR-GB"}
+
+
 class TestAnswerDifference:
     """Tests for AnswerDifference dataclass."""
 
@@ -460,6 +654,179 @@ class TestRulesComparisonService:
         assert call_count["count"] == 0, "LLM should not be called when synthesize=False"
 
 
+class TestConcurrentSynthesis:
+    """Tests for concurrent, cached outlier synthesis."""
+
+    @pytest.fixture
+    def outlier_comparer(self, rules_manager):
+        def find_outliers(question_ids, countries=None, top_n=3):
+            return [
+                OutlierResult(
+                    question_id=qid,
+                    question_text=f"Question {qid}?",
+                    countries_analyzed=["FR", "GB", "DE"],
+                    outliers=[{"country": "DE", "distance": 0.4, "answer": f"German {qid}"}],
+                    mean_distance=0.2,
+                )
+                for qid in question_ids
+            ]
+
+        comparer = Mock(spec=AnswerComparer)
+        comparer.rules_manager = rules_manager
+        comparer.find_outliers.side_effect = find_outliers
+        comparer.find_outliers_for_question.side_effect = (
+            lambda question_id, countries=None, top_n=3: find_outliers([question_id], countries, top_n)[0]
+        )
+        return comparer
+
+    @pytest.fixture
+    def slow_llm(self):
+        """LLM whose async call takes 50ms; records every call and peak concurrency."""
+        import asyncio
+        from langchain_core.runnables import RunnableLambda
+
+        calls = []
+        in_flight = {"now": 0, "max": 0}
+
+        class Response:
+            def __init__(self, content):
+                self.content = content
+
+        def invoke(prompt):
+            calls.append(prompt)
+            return Response(f"synthesis {len(calls)}")
+
+        async def ainvoke(prompt):
+            calls.append(prompt)
+            in_flight["now"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            await asyncio.sleep(0.05)
+            in_flight["now"] -= 1
+            return Response(f"synthesis {len(calls)}")
+
+        llm = RunnableLambda(invoke, afunc=ainvoke)
+        llm.calls = calls
+        llm.in_flight = in_flight
+        return llm
+
+    def test_topic_outliers_run_concurrently(self, outlier_comparer, slow_llm):
+        from shared.aviation_agent.comparison_service import RulesComparisonService
+
+        service = RulesComparisonService(answer_comparer=outlier_comparer, llm=slow_llm)
+        results = service.analyze_topic_outliers(max_questions=10)
+
+        question_ids = list(outlier_comparer.rules_manager.question_map.keys())[:10]
+        assert [r.question_id for r in results] == question_ids
+        assert all(r.synthesis.startswith("synthesis") for r in results)
+        assert len(slow_llm.calls) == len(question_ids)
+        # All LLM calls were in flight together
+        assert len(question_ids) > 1
+        assert slow_llm.in_flight["max"] == len(question_ids)
+        # Outliers come from one batched lookup, never per-question comparisons
+        outlier_comparer.find_outliers.assert_called_once()
+        outlier_comparer.find_outliers_for_question.assert_not_called()
+
+    def test_cache_hits_skip_llm(self, outlier_comparer, slow_llm):
+        from shared.aviation_agent.comparison_service import RulesComparisonService
+
+        service = RulesComparisonService(answer_comparer=outlier_comparer, llm=slow_llm)
+        first = service.analyze_topic_outliers(max_questions=10)
+        calls = len(slow_llm.calls)
+        second = service.analyze_topic_outliers(max_questions=10)
+
+        assert len(slow_llm.calls) == calls
+        assert [r.synthesis for r in first] == [r.synthesis for r in second]
+        assert service.cache.hits == len(second)
+        # Sync single-question path shares the cache
+        assert service.analyze_outliers(first[0].question_id).synthesis == first[0].synthesis
+        assert len(slow_llm.calls) == calls
+
+        # A changed non-outlier answer moves the mean distance: new syntheses, not stale hits
+        find_outliers = outlier_comparer.find_outliers.side_effect
+        outlier_comparer.find_outliers.side_effect = lambda *args: [
+            replace(r, mean_distance=0.25) for r in find_outliers(*args)
+        ]
+        service.analyze_topic_outliers(max_questions=10)
+        assert len(slow_llm.calls) == 2 * calls
+
+    def test_sync_calls_share_one_event_loop(self, outlier_comparer):
+        import asyncio
+        from langchain_core.runnables import RunnableLambda
+        from shared.aviation_agent.comparison_service import RulesComparisonService
+
+        loops = set()
+
+        async def ainvoke(prompt):
+            loops.add(asyncio.get_running_loop())
+            return "ok"
+
+        service = RulesComparisonService(
+            answer_comparer=outlier_comparer,
+            llm=RunnableLambda(lambda _: "ok", afunc=ainvoke),
+        )
+        service.analyze_topic_outliers(tag="vfr", max_questions=2)
+        service.analyze_topic_outliers(max_questions=10)
+
+        async def from_running_loop():
+            return service.analyze_topic_outliers(max_questions=10, countries=["FR"])
+
+        assert asyncio.run(from_running_loop())
+        assert len(loops) == 1
+
+    def test_streaming_and_bounded_concurrency(self, outlier_comparer, rules_manager):
+        import asyncio
+        from langchain_core.runnables import RunnableLambda
+        from shared.aviation_agent.comparison_service import RulesComparisonService
+
+        in_flight = {"now": 0, "max": 0}
+
+        async def ainvoke(prompt):
+            in_flight["now"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            await asyncio.sleep(0.01)
+            in_flight["now"] -= 1
+            return "ok"
+
+        service = RulesComparisonService(
+            answer_comparer=outlier_comparer,
+            llm=RunnableLambda(lambda _: "ok", afunc=ainvoke),
+        )
+
+        async def collect():
+            return [r async for r in service.astream_topic_outliers(
+                [f"q{i}" for i in range(12)], max_concurrency=3
+            )]
+
+        results = asyncio.run(collect())
+        assert len(results) == 12
+        assert in_flight["max"] == 3
+
+    def test_cache_key_and_persistence(self, tmp_path):
+        from shared.aviation_agent.comparison_service import SynthesisCache
+
+        inputs = {"question_text": "Q?", "countries": "FR, DE", "outliers_context": "a", "mean_distance": 0.3}
+        key = SynthesisCache.make_key("q1", inputs, "v1", "gpt-4o")
+        assert key == SynthesisCache.make_key("q1", dict(reversed(list(inputs.items()))), "v1", "gpt-4o")
+        for name, value in [("question_text", "Q2?"), ("countries", "FR, DE, BE"),
+                            ("outliers_context", "b"), ("mean_distance", 0.31)]:
+            assert key != SynthesisCache.make_key("q1", {**inputs, name: value}, "v1", "gpt-4o")
+        assert key != SynthesisCache.make_key("q1", inputs, "v2", "gpt-4o")
+        assert key != SynthesisCache.make_key("q1", inputs, "v1", "gpt-4o-mini")
+
+        cache = SynthesisCache(tmp_path / "synthesis.json")
+        cache.set(key, "summary")
+        cache.save()
+        assert SynthesisCache(tmp_path / "synthesis.json").get(key) == "summary"
+
+        # A save that fails mid-write leaves the previous file intact
+        cache.set("other", "text")
+        with patch("shared.aviation_agent.comparison_service.json.dump", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                cache.save()
+        assert SynthesisCache(tmp_path / "synthesis.json").get(key) == "summary"
+        assert [p.name for p in tmp_path.iterdir()] == ["synthesis.json"]
+
+
 class TestIntegration:
     """Integration tests with real ChromaDB (if available)."""
 
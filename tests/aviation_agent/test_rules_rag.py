@@ -5,17 +5,22 @@ Unit tests for RAG system (rules_rag.py).
 import json
 import os
 import tempfile
+import threading
 from pathlib import Path
 from unittest.mock import Mock, patch
 
+import numpy as np
 import pytest
 
 from shared.aviation_agent.rules_rag import (
     EmbeddingProvider,
+    InMemoryVectorIndex,
     QueryReformulator,
     RulesRAG,
+    SemanticQueryCache,
     build_vector_db,
 )
+from shared.aviation_agent.behavior_config import RetrievalConfig
 
 
 @pytest.fixture
@@ -156,6 +161,44 @@ class TestQueryReformulator:
         
         assert result == original
 
+    def test_reformulation_cache(self, tmp_path):
+        """Repeated queries hit the LRU; entries persist and reset on a new rules version."""
+        mock_llm = Mock()
+        mock_llm.invoke.return_value = Mock(content="What are the flight plan filing requirements?")
+        cache_path = tmp_path / "reformulations.json"
+
+        reformulator = QueryReformulator(llm=mock_llm, cache_path=cache_path)
+        reformulator.set_version("v1")
+        first = reformulator.reformulate("Do I need to file a flight plan?")
+        second = reformulator.reformulate("  do I need to FILE a flight plan? ")
+        assert first == second
+        mock_llm.invoke.assert_called_once()
+        assert reformulator.cache_stats()["hits"] == 1
+
+        # Context-dependent reformulations bypass the cache
+        reformulator.reformulate("Do I need to file a flight plan?", context=["Flying to France"])
+        assert mock_llm.invoke.call_count == 2
+
+        # Saved in batches; flush() writes the pending entry
+        assert not cache_path.exists() or "flight plan" not in cache_path.read_text()
+        reformulator.flush()
+
+        reloaded = QueryReformulator(llm=mock_llm, cache_path=cache_path)
+        reloaded.set_version("v1")
+        assert reloaded.reformulate("Do I need to file a flight plan?") == first
+        assert mock_llm.invoke.call_count == 2
+
+        reloaded.set_version("v2")
+        assert reloaded.cache_stats()["size"] == 0
+
+    def test_reformulation_failure_not_cached(self):
+        mock_llm = Mock()
+        mock_llm.invoke.side_effect = [Exception("API error"), Mock(content="Formal question?")]
+
+        reformulator = QueryReformulator(llm=mock_llm)
+        assert reformulator.reformulate("Test query") == "Test query"
+        assert reformulator.reformulate("Test query") == "Formal question?"
+
 
 class TestBuildVectorDB:
     """Tests for build_vector_db function."""
@@ -328,6 +371,276 @@ class TestRulesRAG:
         assert 0 <= result['similarity'] <= 1
 
 
+class _HashEmbeddings:
+    """Deterministic bag-of-words embeddings so tests run without an API key."""
+
+    dim = 64
+
+    def embed_documents(self, texts):
+        return [self.embed_query(t) for t in texts]
+
+    def embed_query(self, text):
+        import numpy as np
+        vec = np.zeros(self.dim)
+        for word in text.lower().split():
+            vec[hash(word.strip("?.,")) % self.dim] += 1.0
+        norm = np.linalg.norm(vec)
+        return (vec / norm if norm else vec).tolist()
+
+
+class TestInMemoryVectorIndex:
+    """Tests for InMemoryVectorIndex (parity with ChromaDB and latency)."""
+
+    @pytest.fixture
+    def random_collection(self, tmp_path):
+        """ChromaDB collection with random unit vectors across several countries."""
+        import chromadb
+        import numpy as np
+        from chromadb.config import Settings
+
+        rng = np.random.default_rng(11)
+        vectors = rng.normal(size=(3000, 64)).astype("float32")
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        countries = ["FR", "GB", "DE", "ES", "IT"]
+
+        client = chromadb.PersistentClient(path=str(tmp_path / "chroma"), settings=Settings(anonymized_telemetry=False))
+        collection = client.create_collection("aviation_rules")
+        for start in range(0, len(vectors), 1000):
+            rows = range(start, start + 1000)
+            collection.add(
+                ids=[f"q{i}_{countries[i % 5]}" for i in rows],
+                embeddings=vectors[start:start + 1000].tolist(),
+                documents=[f"question {i}" for i in rows],
+                metadatas=[{"question_id": f"q{i}", "country_code": countries[i % 5]} for i in rows],
+            )
+        return collection, rng
+
+    def test_parity_with_chroma(self, random_collection):
+        """Top-k IDs and distances match ChromaDB, with and without country filter."""
+        import numpy as np
+
+        collection, rng = random_collection
+        index = InMemoryVectorIndex.from_collection(collection, page_size=700)
+        assert len(index) == 3000
+
+        for where in (None, {"country_code": {"$in": ["FR"]}}, {"country_code": {"$in": ["GB", "IT"]}}):
+            query = rng.normal(size=64)
+            query = (query / np.linalg.norm(query)).tolist()
+            expected = collection.query(query_embeddings=[query], n_results=10, where=where,
+                                        include=["documents", "metadatas", "distances"])
+            actual = index.query(query_embeddings=[query], n_results=10, where=where)
+
+            # HNSW is approximate: require near-complete overlap and identical distances for shared IDs
+            shared = set(expected["ids"][0]) & set(actual["ids"][0])
+            assert len(shared) >= 9
+            exp_dist = dict(zip(expected["ids"][0], expected["distances"][0]))
+            act_dist = dict(zip(actual["ids"][0], actual["distances"][0]))
+            for doc_id in shared:
+                assert act_dist[doc_id] == pytest.approx(exp_dist[doc_id], abs=1e-4)
+            assert actual["distances"][0] == sorted(actual["distances"][0])
+            if where:
+                allowed = set(where["country_code"]["$in"])
+                assert all(m["country_code"] in allowed for m in actual["metadatas"][0])
+
+    def test_unknown_country_returns_empty(self, random_collection):
+        collection, _ = random_collection
+        index = InMemoryVectorIndex.from_collection(collection)
+        result = index.query(query_embeddings=[[0.0] * 64], n_results=5, where={"country_code": {"$in": ["XX"]}})
+        assert result["ids"] == [[]]
+
+    def test_queries_served_from_index(self, sample_rules_json, tmp_path):
+        """With the index loaded, retrieval never queries ChromaDB."""
+        with patch("langchain_openai.OpenAIEmbeddings", return_value=_HashEmbeddings()):
+            vector_db_path = tmp_path / "test_vector_db"
+            build_vector_db(rules_json_path=sample_rules_json, vector_db_path=vector_db_path, force_rebuild=True)
+            rag = RulesRAG(vector_db_path=vector_db_path, enable_reformulation=False)
+            assert rag.index is not None
+
+            with patch.object(rag.collection, "query", side_effect=AssertionError("ChromaDB queried")), \
+                    patch.object(rag.index, "query", wraps=rag.index.query) as index_query:
+                results = rag.retrieve_rules("Is a flight plan required?", countries=["FR"], top_k=3,
+                                             similarity_threshold=0.0)
+            assert results and index_query.call_count == 1
+
+    def test_rules_rag_results_match_chroma(self, sample_rules_json, tmp_path):
+        """RulesRAG returns the same rules whether served from the index or ChromaDB."""
+        with patch("langchain_openai.OpenAIEmbeddings", return_value=_HashEmbeddings()):
+            vector_db_path = tmp_path / "test_vector_db"
+            build_vector_db(rules_json_path=sample_rules_json, vector_db_path=vector_db_path, force_rebuild=True)
+            rag = RulesRAG(vector_db_path=vector_db_path, enable_reformulation=False)
+            assert rag.index is not None and len(rag.index) == 3
+
+            for countries in (["FR"], None):
+                with_index = rag.retrieve_rules("Is a flight plan required?", countries=countries, top_k=3,
+                                                similarity_threshold=0.0)
+                index, rag.index = rag.index, None
+                without_index = rag.retrieve_rules("Is a flight plan required?", countries=countries, top_k=3,
+                                                   similarity_threshold=0.0)
+                rag.index = index
+                assert [r["id"] for r in with_index] == [r["id"] for r in without_index]
+                assert [r["similarity"] for r in with_index] == [r["similarity"] for r in without_index]
+
+
+class TestHybridRetrieval:
+    """Tests for BM25 lexical search (RulesManager) and hybrid RulesRAG retrieval."""
+
+    @pytest.fixture
+    def rules_manager(self, sample_rules_json):
+        from shared.rules_manager import RulesManager
+        manager = RulesManager(str(sample_rules_json))
+        assert manager.load_rules()
+        return manager
+
+    @pytest.fixture
+    def hybrid_rag(self, sample_rules_json, tmp_path, rules_manager):
+        with patch("langchain_openai.OpenAIEmbeddings", return_value=_HashEmbeddings()):
+            vector_db_path = tmp_path / "test_vector_db"
+            build_vector_db(rules_json_path=sample_rules_json, vector_db_path=vector_db_path, force_rebuild=True)
+            yield RulesRAG(
+                vector_db_path=vector_db_path,
+                enable_reformulation=False,
+                rules_manager=rules_manager,
+                retrieval_config=RetrievalConfig(mode="hybrid"),
+            )
+
+    def test_lexical_index_per_country(self, rules_manager):
+        assert set(rules_manager.lexical_index) == {"FR", "GB"}
+        results = rules_manager.search_rules("customs", countries=["FR"])
+        assert [r["question_id"] for r in results] == ["test-q2"]
+        assert results[0]["lexical_score"] > 0
+        # Only GB answers for q1 exist for GB; q2 has no GB answer
+        assert rules_manager.search_rules("customs", countries=["GB"]) == []
+
+    def test_lexical_search_uses_stripped_answers(self, rules_manager):
+        results = rules_manager.search_rules("designated POE")
+        assert results and results[0]["question_id"] == "test-q2"
+        # Stopwords and HTML do not match anything
+        assert rules_manager.search_rules("the of is") == []
+
+    def test_search_term_filter(self, rules_manager):
+        results = rules_manager.get_rules_for_country("FR", search_term="designated")
+        assert [r["question_id"] for r in results] == ["test-q2"]
+
+    def test_hybrid_is_opt_in(self):
+        assert RetrievalConfig().mode == "vector"
+
+    def test_exact_term_vocabulary(self, rules_manager):
+        assert rules_manager.is_exact_term_query("POE")
+        assert rules_manager.is_exact_term_query("test-q1")
+        # Words of the rules text that are not glossary terms or rule IDs
+        assert not rules_manager.is_exact_term_query("customs")
+        assert not rules_manager.is_exact_term_query("designated")
+
+    def test_lexical_min_score(self, rules_manager):
+        assert rules_manager.search_rules("customs", countries=["FR"])
+        assert rules_manager.search_rules("customs", countries=["FR"], min_score=100.0) == []
+
+    def test_threshold_applies_to_fused_score(self, hybrid_rag):
+        vector_matches = [
+            {"question_id": "test-q1", "question_text": "", "similarity": 0.2, "category": None, "tags": []},
+        ]
+        lexical_matches = [
+            {"question_id": "test-q1", "question_text": "", "similarity": 1.0, "category": None, "tags": []},
+            {"question_id": "test-q2", "question_text": "", "similarity": 0.5, "category": None, "tags": []},
+        ]
+        fused = hybrid_rag._fuse_scores(vector_matches, lexical_matches, similarity_threshold=0.4)
+        # test-q1: 0.7 * 0.2 + 0.3 * 1.0 = 0.44 passes; lexical-only test-q2 (0.15) does not
+        assert [m["question_id"] for m in fused] == ["test-q1"]
+        assert fused[0]["similarity"] == pytest.approx(0.44)
+
+    def test_exact_term_query_skips_embedding(self, hybrid_rag):
+        hybrid_rag.embedding_provider.embed_query = Mock(side_effect=AssertionError("embedding called"))
+        results = hybrid_rag.retrieve_rules("POE", countries=["FR"], top_k=3)
+        assert [r["question_id"] for r in results] == ["test-q2"]
+        assert results[0]["country_code"] == "FR"
+
+    def test_hybrid_fuses_scores(self, hybrid_rag):
+        results = hybrid_rag.retrieve_rules("flight plan required", countries=["FR"], top_k=2,
+                                            similarity_threshold=0.0)
+        assert results[0]["question_id"] == "test-q1"
+        assert all(r["country_code"] == "FR" for r in results)
+
+        vector_only = hybrid_rag.retrieve_rules("flight plan required", countries=["FR"], top_k=2,
+                                                similarity_threshold=0.0, mode="vector")
+        assert vector_only[0]["question_id"] == "test-q1"
+
+
+class TestSemanticCache:
+    """Tests for the embedding-keyed retrieval cache in RulesRAG."""
+
+    @pytest.fixture
+    def rules_manager(self, sample_rules_json):
+        from shared.rules_manager import RulesManager
+        manager = RulesManager(str(sample_rules_json))
+        assert manager.load_rules()
+        return manager
+
+    @pytest.fixture
+    def rag(self, sample_rules_json, tmp_path, rules_manager):
+        with patch("langchain_openai.OpenAIEmbeddings", return_value=_HashEmbeddings()):
+            vector_db_path = tmp_path / "test_vector_db"
+            build_vector_db(rules_json_path=sample_rules_json, vector_db_path=vector_db_path, force_rebuild=True)
+            yield RulesRAG(vector_db_path=vector_db_path, enable_reformulation=False, rules_manager=rules_manager)
+
+    def test_repeat_query_served_from_cache(self, rag):
+        first = rag.retrieve_rules("Is a flight plan required?", countries=["FR", "GB"], similarity_threshold=0.0)
+        rag._query = Mock(side_effect=AssertionError("vector search should be skipped"))
+        # Same words, different case/punctuation: identical bag-of-words embedding
+        second = rag.retrieve_rules("is a flight plan required", countries=["GB", "FR"], similarity_threshold=0.0)
+
+        assert first and second == first
+        assert rag.cache_stats()["semantic"]["hits"] == 1
+
+        # Mutating returned results does not corrupt the cache
+        second[0]["question_id"] = "changed"
+        third = rag.retrieve_rules("Is a flight plan required?", countries=["FR", "GB"], similarity_threshold=0.0)
+        assert third == first
+
+    def test_parameters_are_part_of_key(self, rag):
+        rag.retrieve_rules("Is a flight plan required?", countries=["FR"], similarity_threshold=0.0)
+        rag.retrieve_rules("Is a flight plan required?", countries=["GB"], similarity_threshold=0.0)
+        rag.retrieve_rules("Is a flight plan required?", countries=["FR"], top_k=1, similarity_threshold=0.0)
+        assert rag.cache_stats()["semantic"]["hits"] == 0
+        assert len(rag.semantic_cache) == 3
+
+    def test_dissimilar_query_misses(self, rag):
+        rag.retrieve_rules("Is a flight plan required?", countries=["FR"], similarity_threshold=0.0)
+        rag.retrieve_rules("Where do I clear customs?", countries=["FR"], similarity_threshold=0.0)
+        assert rag.cache_stats()["semantic"]["hits"] == 0
+
+    def test_rules_version_invalidates(self, rag, rules_manager):
+        rag.retrieve_rules("Is a flight plan required?", countries=["FR"], similarity_threshold=0.0)
+        assert len(rag.semantic_cache) == 1
+        rules_manager.version = "changed"
+        rag.retrieve_rules("Is a flight plan required?", countries=["FR"], similarity_threshold=0.0)
+        assert rag.cache_stats()["semantic"] == {
+            "size": 1, "hits": 0, "misses": 2, "hit_rate": 0.0, "version": "changed",
+        }
+
+    def test_concurrent_lookup_and_store(self):
+        cache = SemanticQueryCache(threshold=0.99, max_entries=8)
+        errors = []
+
+        def worker(seed):
+            try:
+                rng = np.random.default_rng(seed)
+                for _ in range(200):
+                    embedding = rng.random(16).tolist()
+                    cache.store(embedding, ("FR",), [{"question_id": "q"}])
+                    cache.lookup(embedding, ("FR",))
+            except Exception as e:  # pragma: no cover - reported below
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(seed,)) for seed in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert len(cache) == 8
+
+
 @pytest.mark.integration
 class TestRulesRAGIntegration:
     """Integration tests requiring full rules.json."""
@@ -377,4 +690,3 @@ class TestRulesRAGIntegration:
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
-
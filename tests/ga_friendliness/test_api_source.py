@@ -0,0 +1,240 @@
+"""
+Tests for AirfieldDirectoryAPISource against a local HTTP stand-in.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import Counter
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import pytest
+
+from shared.ga_friendliness import AirfieldDirectoryAPISource
+from shared.ga_friendliness.ratelimit import TokenBucket
+
+
+def _airport_json(icao: str, version: int = 1) -> dict:
+    return {
+        "airfield": {"data": {"icao": icao}},
+        "aerops": {
+            "data": {
+                "currency": "EUR",
+                "landing_fees": {"c172": [{"netPrice": 10 * version}]},
+            }
+        },
+        "pireps": {
+            "data": [
+                {"id": f"{icao}-1", "content": {"EN": f"Nice field v{version}"}, "rating": 4},
+                {"id": f"{icao}-2", "content": {"EN": "Generated"}, "ai_generated": True},
+            ]
+        },
+    }
+
+
+class _StandIn:
+    """In-process airfield.directory stand-in with ETag support and fault injection."""
+
+    def __init__(self):
+        self.versions = {}
+        self.requests = Counter()
+        self.not_modified = Counter()
+        self.fail_next = Counter()  # icao -> number of 503s to send first
+        self.delay = 0.0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+        self.last_modified = formatdate(usegmt=True)
+
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                icao = Path(self.path).stem.upper()
+                with stand_in.lock:
+                    stand_in.requests[icao] += 1
+                    stand_in.in_flight += 1
+                    stand_in.max_in_flight = max(stand_in.max_in_flight, stand_in.in_flight)
+                try:
+                    time.sleep(stand_in.delay)
+                    self._respond(icao)
+                finally:
+                    with stand_in.lock:
+                        stand_in.in_flight -= 1
+
+            def _respond(self, icao):
+                if stand_in.fail_next[icao] > 0:
+                    stand_in.fail_next[icao] -= 1
+                    self._send(503, b"", {"Retry-After": "0"})
+                    return
+                if icao not in stand_in.versions:
+                    self._send(404, b"")
+                    return
+                etag = f'"{icao}-v{stand_in.versions[icao]}"'
+                if self.headers.get("If-None-Match") == etag:
+                    stand_in.not_modified[icao] += 1
+                    self._send(304, b"", {"ETag": etag})
+                    return
+                body = json.dumps(_airport_json(icao, stand_in.versions[icao])).encode()
+                self._send(200, body, {
+                    "ETag": etag,
+                    "Last-Modified": stand_in.last_modified,
+                    "Content-Type": "application/json",
+                })
+
+            def _send(self, status, body, headers=None):
+                self.send_response(status)
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}/airfield"
+        self.thread = threading.Thread(target=self.server.serve_forever, args=(0.05,), daemon=True)
+        self.thread.start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def stand_in():
+    server = _StandIn()
+    yield server
+    server.close()
+
+
+class _FakeClock:
+    """Virtual time for TokenBucket: sleeping advances the clock instantly."""
+
+    def __init__(self):
+        self._now = 0.0
+        self._lock = threading.Lock()
+        self.slept = 0.0
+        self.grants = []
+
+    def now(self) -> float:
+        with self._lock:
+            return self._now
+
+    def sleep(self, seconds: float) -> None:
+        # Like a real sleep, always lets some time pass (float rounding can ask for ~0)
+        seconds = max(seconds, 1e-6)
+        with self._lock:
+            self._now += seconds
+            self.slept += seconds
+
+
+def _source(stand_in, cache_dir, icaos, **kwargs):
+    kwargs.setdefault("requests_per_second", None)
+    return AirfieldDirectoryAPISource(
+        cache_dir=cache_dir,
+        icaos=icaos,
+        base_url=stand_in.base_url,
+        timeout=5,
+        **kwargs,
+    )
+
+
+def _expire(cache_dir: Path) -> None:
+    old = time.time() - 30 * 86400
+    for path in cache_dir.glob("airport_*.json"):
+        os.utime(path, (old, old))
+
+
+@pytest.mark.unit
+class TestAirfieldDirectoryAPISource:
+    """Pooled, concurrent, conditional downloads."""
+
+    def test_concurrent_download(self, stand_in, temp_dir):
+        icaos = [f"T{i:03d}" for i in range(40)]
+        stand_in.versions = {icao: 1 for icao in icaos}
+        stand_in.delay = 0.02
+
+        source = _source(stand_in, temp_dir, icaos, max_workers=8)
+        assert source.get_icaos() == set(icaos)
+        assert [r.review_id for r in source.get_reviews()] == [f"{icao}-1" for icao in icaos]
+        assert source.get_fee_data("T000")["bands"] == {"fee_band_750_1199kg": 10.0}
+        assert 1 < stand_in.max_in_flight <= 8
+        assert all(count == 1 for count in stand_in.requests.values())
+
+    def test_missing_airport_and_retry(self, stand_in, temp_dir):
+        stand_in.versions = {"EGKB": 1}
+        stand_in.fail_next["EGKB"] = 2
+
+        source = _source(stand_in, temp_dir, ["EGKB", "ZZZZ"], max_retries=3)
+        assert source.get_icaos() == {"EGKB"}
+        assert stand_in.requests["EGKB"] == 3
+        assert stand_in.requests["ZZZZ"] == 1  # 404 is not retried
+
+    def test_fresh_cache_skips_network(self, stand_in, temp_dir):
+        stand_in.versions = {"EGKB": 1}
+        _source(stand_in, temp_dir, ["EGKB"]).get_reviews()
+
+        source = _source(stand_in, temp_dir, ["EGKB"])
+        assert len(source.get_reviews()) == 1
+        assert stand_in.requests["EGKB"] == 1
+
+    def test_expired_cache_revalidates(self, stand_in, temp_dir):
+        stand_in.versions = {"EGKB": 1, "LFPG": 1}
+        _source(stand_in, temp_dir, ["EGKB", "LFPG"]).get_reviews()
+        assert (temp_dir / "airport_EGKB.validators.json").exists()
+
+        _expire(temp_dir)
+        stand_in.versions["LFPG"] = 2
+        source = _source(stand_in, temp_dir, ["EGKB", "LFPG"])
+        texts = {r.icao: r.review_text for r in source.get_reviews()}
+
+        assert stand_in.not_modified == Counter({"EGKB": 1})
+        assert texts == {"EGKB": "Nice field v1", "LFPG": "Nice field v2"}
+        # 304 refreshes the entry, so the next run is served from cache
+        _source(stand_in, temp_dir, ["EGKB"]).get_reviews()
+        assert stand_in.requests["EGKB"] == 2
+
+    def test_force_refresh_downloads(self, stand_in, temp_dir):
+        stand_in.versions = {"EGKB": 1}
+        _source(stand_in, temp_dir, ["EGKB"]).get_reviews()
+
+        source = _source(stand_in, temp_dir, ["EGKB"])
+        source.set_force_refresh(True)
+        source.get_reviews()
+        assert stand_in.requests["EGKB"] == 2
+        assert not stand_in.not_modified
+
+    def test_rate_limit_per_host(self, stand_in, temp_dir):
+        icaos = [f"T{i:03d}" for i in range(12)]
+        stand_in.versions = {icao: 1 for icao in icaos}
+        clock = _FakeClock()
+
+        source = _source(stand_in, temp_dir, icaos, max_workers=6, requests_per_second=20)
+        limiter = TokenBucket(20, capacity=1, clock=clock.now, sleep=clock.sleep)
+        source._host_limiters[urlsplit(stand_in.base_url).netloc] = limiter
+        acquire = limiter.acquire
+
+        def recorded_acquire(tokens=1.0):
+            acquire(tokens)
+            clock.grants.append(clock.now())
+
+        limiter.acquire = recorded_acquire
+        source.get_reviews()
+
+        # One request per 1/20 s of (virtual) time, across all worker threads
+        grants = sorted(clock.grants)
+        assert len(grants) == len(icaos) == sum(stand_in.requests.values())
+        for k, granted_at in enumerate(grants):
+            assert granted_at >= k / 20 - 1e-9
+        assert clock.slept >= (len(icaos) - 1) / 20 - 1e-9
+        assert source._limiter_for(stand_in.base_url) is limiter
+        assert len(source._host_limiters) == 1
@@ -0,0 +1,156 @@
+"""
+Tests for the GA friendliness build pipeline (builder.py).
+
+Builds use the mock LLM, so they run offline and give deterministic tags
+and summaries.
+"""
+
+import csv
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from shared.ga_friendliness import (
+    CSVReviewSource,
+    GAFriendlinessBuilder,
+    GAFriendlinessSettings,
+    GAMetaStorage,
+)
+from shared.ga_review_agent import SummaryGenerator
+
+REVIEW_TEXTS = [
+    "Friendly staff, cheap landing fees and the restaurant on site is excellent.",
+    "Expensive fuel and complex paperwork, but the runway is great for IFR.",
+    "Simple bureaucracy, no fuel available. Hotel within walking distance.",
+]
+
+# Deliberately unsorted: the build processes airports in ICAO order
+ICAOS = ["LFPT", "EGKB", "EDNY", "LFAT", "EHRD", "LSGS", "EBOS", "LFRG", "EGTF", "LOWI", "ESSB", "LIML"]
+
+
+class _RecordingSummarizer:
+    """Mock-LLM SummaryGenerator that records calls and can fail on one airport."""
+
+    def __init__(self, fail_on: Optional[str] = None):
+        self.inner = SummaryGenerator(mock_llm=True)
+        self.fail_on = fail_on
+        self.icaos: List[str] = []
+
+    def generate_summary(self, icao, extractions, stats=None):
+        if icao == self.fail_on:
+            raise RuntimeError("interrupted")
+        self.icaos.append(icao)
+        return self.inner.generate_summary(icao, extractions, stats)
+
+
+@pytest.fixture
+def review_source(temp_dir: Path) -> CSVReviewSource:
+    path = temp_dir / "reviews.csv"
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["icao", "review_text", "review_id", "rating", "timestamp"])
+        for i, icao in enumerate(ICAOS):
+            for j in range(1 + i % 3):
+                writer.writerow([
+                    icao, REVIEW_TEXTS[(i + j) % 3], f"{icao}-{j}", 3 + j, f"2024-0{1 + j}-1{i % 10}T10:00:00Z",
+                ])
+    return CSVReviewSource(path)
+
+
+def _build(
+    temp_dir: Path,
+    name: str,
+    review_source: CSVReviewSource,
+    sample_ontology,
+    sample_personas,
+    summarizer: Optional[_RecordingSummarizer] = None,
+    resume: bool = False,
+    **settings: Any,
+):
+    builder = GAFriendlinessBuilder(
+        settings=GAFriendlinessSettings(
+            ga_meta_db_path=temp_dir / f"{name}.db",
+            cache_dir=temp_dir / "cache",
+            use_mock_llm=True,
+            llm_cache_enabled=False,
+            write_batch_size=3,
+            **settings,
+        ),
+        ontology=sample_ontology,
+        personas=sample_personas,
+        summarizer=summarizer or _RecordingSummarizer(),
+    )
+    try:
+        return builder.build(review_source, resume=resume)
+    finally:
+        builder.close()
+
+
+def _dump(db_path: Path) -> Dict[str, list]:
+    """Written rows in write order, without wall-clock timestamps."""
+    conn = sqlite3.connect(db_path)
+    try:
+        return {
+            "stats": conn.execute("SELECT * FROM ga_airfield_stats ORDER BY rowid").fetchall(),
+            "tags": conn.execute(
+                "SELECT icao, review_id, aspect, label, confidence, timestamp FROM ga_review_ner_tags ORDER BY rowid"
+            ).fetchall(),
+            "summaries": conn.execute(
+                "SELECT icao, summary_text, tags_json FROM ga_review_summary ORDER BY rowid"
+            ).fetchall(),
+        }
+    finally:
+        conn.close()
+
+
+class TestBuild:
+    def test_parallel_matches_serial(self, temp_dir, review_source, sample_ontology, sample_personas):
+        serial = _build(temp_dir, "serial", review_source, sample_ontology, sample_personas)
+        parallel = _build(
+            temp_dir, "parallel", review_source, sample_ontology, sample_personas, build_workers=2
+        )
+
+        assert serial.success and parallel.success
+        for field in ("total_airports", "successful_airports", "failed_airports", "skipped_airports",
+                      "total_reviews", "total_extractions"):
+            assert getattr(parallel.metrics, field) == getattr(serial.metrics, field), field
+        assert serial.metrics.successful_airports == len(ICAOS)
+
+        expected = _dump(temp_dir / "serial.db")
+        assert [row[0] for row in expected["stats"]] == sorted(ICAOS)
+        assert expected["tags"] and len(expected["summaries"]) == len(ICAOS)
+        assert _dump(temp_dir / "parallel.db") == expected
+
+    @pytest.mark.parametrize("build_workers", [1, 2])
+    def test_resume_after_interruption(
+        self, temp_dir, review_source, sample_ontology, sample_personas, build_workers
+    ):
+        ordered = sorted(ICAOS)
+        _build(temp_dir, "reference", review_source, sample_ontology, sample_personas)
+
+        # Fails on the 8th airport; the last commit covered the first 6
+        interrupted = _build(
+            temp_dir, "resumed", review_source, sample_ontology, sample_personas,
+            summarizer=_RecordingSummarizer(fail_on=ordered[7]),
+            failure_mode="fail_fast", build_workers=build_workers,
+        )
+        assert not interrupted.success
+        storage = GAMetaStorage(temp_dir / "resumed.db")
+        try:
+            assert storage.get_last_successful_icao() == ordered[5]
+        finally:
+            storage.close()
+        assert [row[0] for row in _dump(temp_dir / "resumed.db")["stats"]] == ordered[:6]
+
+        summarizer = _RecordingSummarizer()
+        resumed = _build(
+            temp_dir, "resumed", review_source, sample_ontology, sample_personas,
+            summarizer=summarizer, resume=True, build_workers=build_workers,
+        )
+        assert resumed.success
+        assert resumed.metrics.total_airports == len(ICAOS) - 6
+        # Committed airports are not processed again
+        assert summarizer.icaos == ordered[6:]
+        assert _dump(temp_dir / "resumed.db") == _dump(temp_dir / "reference.db")
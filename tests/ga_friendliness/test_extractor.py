@@ -139,3 +139,253 @@ class TestExtractorValidation:
         for aspect in result.aspects:
             assert sample_ontology.validate_label(aspect.aspect, aspect.label)
 
+
+
+class _FakeResponse:
+    def __init__(self, content):
+        self.content = content
+
+
+class _FakeChain:
+    """Stands in for a LangChain chain; replies via a callable on the inputs."""
+
+    def __init__(self, reply):
+        self.reply = reply
+        self.calls = []
+
+    def invoke(self, inputs):
+        self.calls.append(inputs)
+        return _FakeResponse(self.reply(inputs))
+
+
+def _live_extractor(sample_ontology, chain, packed_chain=None, **kwargs):
+    """Extractor exercising the real LLM code path against fake chains."""
+    extractor = ReviewExtractor(
+        ontology=sample_ontology, mock_llm=True, retry_min_wait=0, retry_max_wait=0, **kwargs
+    )
+    extractor.mock_llm = False
+    extractor._chain = chain
+    extractor._packed_chain = packed_chain
+    return extractor
+
+
+@pytest.mark.unit
+class TestConcurrentExtraction:
+    """Tests for concurrent, rate-limited and packed extraction."""
+
+    def test_batch_order_preserved(self, sample_ontology):
+        import json
+        import time
+
+        def reply(inputs):
+            # Later reviews answer first
+            time.sleep(0.01 * (5 - int(inputs["review_text"].split()[-1]) % 5))
+            label = "cheap" if "cheap" in inputs["review_text"] else "expensive"
+            return json.dumps({"aspects": [{"aspect": "cost", "label": label, "confidence": 0.9}]})
+
+        chain = _FakeChain(reply)
+        extractor = _live_extractor(sample_ontology, chain, max_concurrency=4)
+        reviews = [
+            (f"{'cheap' if i % 2 else 'expensive'} review {i}", f"r{i}", None)
+            for i in range(10)
+        ]
+
+        results = extractor.extract_batch(reviews)
+
+        assert [r.review_id for r in results] == [f"r{i}" for i in range(10)]
+        assert [r.aspects[0].label for r in results] == [
+            "cheap" if i % 2 else "expensive" for i in range(10)
+        ]
+        assert extractor.get_token_usage()["total_calls"] == 10
+
+    def test_retry_then_success(self, sample_ontology):
+        attempts = []
+
+        def reply(inputs):
+            attempts.append(1)
+            if len(attempts) < 2:
+                raise RuntimeError("rate limited")
+            return '{"aspects": []}'
+
+        extractor = _live_extractor(sample_ontology, _FakeChain(reply), max_retries=3)
+        result = extractor.extract("Some review", "r1")
+
+        assert result.aspects == []
+        assert len(attempts) == 2
+
+    def test_exhausted_retries_yield_empty_extraction(self, sample_ontology):
+        def reply(inputs):
+            raise RuntimeError("down")
+
+        extractor = _live_extractor(sample_ontology, _FakeChain(reply), max_retries=2)
+        results = extractor.extract_batch([("Review", "r1", "2024-01-01")])
+
+        assert results[0].review_id == "r1"
+        assert results[0].aspects == []
+        assert results[0].timestamp == "2024-01-01"
+
+    def test_packed_reviews_single_call(self, sample_ontology):
+        import json
+
+        def packed_reply(inputs):
+            lines = inputs["reviews_block"].splitlines()
+            return json.dumps({"reviews": [
+                {"index": i, "aspects": [{"aspect": "cost", "label": "cheap", "confidence": 0.8}]}
+                for i in range(len(lines))
+            ]})
+
+        single = _FakeChain(lambda inputs: '{"aspects": []}')
+        packed = _FakeChain(packed_reply)
+        extractor = _live_extractor(sample_ontology, single, packed, pack_size=3, pack_max_chars=50)
+        reviews = [(f"short {i}", f"r{i}", None) for i in range(5)] + [("x" * 100, "long", None)]
+
+        results = extractor.extract_batch(reviews)
+
+        assert [r.review_id for r in results] == ["r0", "r1", "r2", "r3", "r4", "long"]
+        assert len(packed.calls) == 2  # 3 + 2 short reviews
+        assert len(single.calls) == 1  # long review on its own
+        assert all(r.aspects[0].label == "cheap" for r in results[:5])
+        assert results[5].aspects == []
+
+    def test_incomplete_pack_falls_back(self, sample_ontology):
+        single = _FakeChain(lambda inputs: '{"aspects": []}')
+        packed = _FakeChain(lambda inputs: '{"reviews": [{"index": 0, "aspects": []}]}')
+        extractor = _live_extractor(sample_ontology, single, packed, pack_size=2, max_retries=1)
+
+        results = extractor.extract_batch([("a", "r0", None), ("b", "r1", None)])
+
+        assert [r.review_id for r in results] == ["r0", "r1"]
+        assert len(single.calls) == 2
+
+    def test_mock_packing_matches_unpacked(self, sample_ontology):
+        reviews = [
+            ("Cheap fees and friendly staff.", "r1", None),
+            ("Expensive but excellent.", "r2", None),
+            ("Terrible, rude people.", "r3", None),
+        ]
+        plain = ReviewExtractor(ontology=sample_ontology, mock_llm=True)
+        packed = ReviewExtractor(ontology=sample_ontology, mock_llm=True, pack_size=2, max_concurrency=2)
+
+        assert packed.extract_batch(reviews) == plain.extract_batch(reviews)
+
+
+@pytest.mark.unit
+class TestTokenBucket:
+    """Tests for the token-bucket rate limiter."""
+
+    def test_blocks_until_refilled(self):
+        from shared.ga_friendliness.ratelimit import TokenBucket
+
+        now = [0.0]
+        sleeps = []
+
+        def sleep(seconds):
+            sleeps.append(seconds)
+            now[0] += seconds
+
+        bucket = TokenBucket(rate=2.0, capacity=2, clock=lambda: now[0], sleep=sleep)
+        bucket.acquire()
+        bucket.acquire()
+        assert sleeps == []
+
+        bucket.acquire()
+        assert sleeps == [pytest.approx(0.5)]
+        assert not bucket.try_acquire()
+
+    def test_per_minute(self):
+        from shared.ga_friendliness.ratelimit import TokenBucket
+
+        bucket = TokenBucket.per_minute(120)
+        assert bucket.rate == pytest.approx(2.0)
+
+    def test_invalid_rate(self):
+        from shared.ga_friendliness.ratelimit import TokenBucket
+
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+
+
+@pytest.mark.unit
+class TestLLMResultCache:
+    """Tests for content-hash caching of extractions and summaries."""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        from shared.ga_friendliness import LLMResultCache
+
+        cache = LLMResultCache(tmp_path / "llm_cache.sqlite")
+        yield cache
+        cache.close()
+
+    @staticmethod
+    def _cost_chain():
+        return _FakeChain(
+            lambda inputs: '{"aspects": [{"aspect": "cost", "label": "cheap", "confidence": 0.9}]}'
+        )
+
+    def test_rebuild_skips_llm(self, sample_ontology, cache):
+        reviews = [("Cheap fuel", "r1", None), ("Cheap fees", "r2", "2024-01-01")]
+
+        first_chain = self._cost_chain()
+        first = _live_extractor(sample_ontology, first_chain, cache=cache).extract_batch(reviews)
+        second_chain = self._cost_chain()
+        second = _live_extractor(sample_ontology, second_chain, cache=cache).extract_batch(reviews)
+
+        assert len(first_chain.calls) == 2
+        assert second_chain.calls == []
+        assert second == first
+        assert second[1].timestamp == "2024-01-01"
+
+    def test_only_changed_reviews_call_llm(self, sample_ontology, cache):
+        _live_extractor(sample_ontology, self._cost_chain(), cache=cache).extract_batch(
+            [("Cheap fuel", "r1", None)]
+        )
+        chain = self._cost_chain()
+        _live_extractor(sample_ontology, chain, cache=cache).extract_batch(
+            [("Cheap fuel", "r1", None), ("New review", "r2", None)]
+        )
+
+        assert [c["review_text"] for c in chain.calls] == ["New review"]
+
+    def test_ontology_change_invalidates(self, sample_ontology, cache):
+        reviews = [("Cheap fuel", "r1", None)]
+        _live_extractor(sample_ontology, self._cost_chain(), cache=cache).extract_batch(reviews)
+
+        changed = sample_ontology.model_copy(update={"version": "2.0"})
+        chain = self._cost_chain()
+        _live_extractor(changed, chain, cache=cache).extract_batch(reviews)
+
+        assert len(chain.calls) == 1
+
+    def test_failures_not_cached(self, sample_ontology, cache):
+        def fail(inputs):
+            raise RuntimeError("down")
+
+        reviews = [("Cheap fuel", "r1", None)]
+        _live_extractor(sample_ontology, _FakeChain(fail), cache=cache, max_retries=1).extract_batch(reviews)
+        chain = self._cost_chain()
+        _live_extractor(sample_ontology, chain, cache=cache).extract_batch(reviews)
+
+        assert len(chain.calls) == 1
+        assert cache.stats()["entries"] == {"extraction": 1}
+
+    def test_summary_cached_by_extraction_set(self, cache):
+        from unittest.mock import patch
+
+        from shared.ga_friendliness.models import AspectLabel
+        from shared.ga_review_agent import SummaryGenerator
+
+        extractions = [
+            ReviewExtraction(review_id="a", aspects=[AspectLabel(aspect="cost", label="cheap", confidence=0.9)]),
+            ReviewExtraction(review_id="b", aspects=[AspectLabel(aspect="staff", label="positive", confidence=0.8)]),
+        ]
+        summarizer = SummaryGenerator(mock_llm=True, cache=cache)
+
+        with patch.object(summarizer, "_call_llm", wraps=summarizer._call_llm) as call:
+            first = summarizer.generate_summary("EGTF", extractions)
+            # Same set in a different order is a cache hit
+            second = summarizer.generate_summary("EGTF", list(reversed(extractions)))
+            summarizer.generate_summary("EGTF", extractions[:1])
+
+        assert second == first
+        assert call.call_count == 2
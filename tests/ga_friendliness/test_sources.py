@@ -0,0 +1,298 @@
+"""
+Unit tests for review/AIP sources: bulk preload and streaming parsing.
+"""
+
+import csv
+import gzip
+import json
+import os
+import sqlite3
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import List
+from unittest.mock import patch
+
+import pytest
+
+from shared.ga_friendliness import (
+    AirfieldDirectorySource,
+    AirportsDatabaseSource,
+    CSVReviewSource,
+)
+from shared.ga_friendliness.builder import aip_fields_from_airport, aip_fields_from_data
+from shared.ga_friendliness.streaming import (
+    ReviewOffsetIndex,
+    file_signature,
+    iter_json_members,
+)
+
+
+APPROACH_CYCLE = ["ILS", "RNP", "VOR", "NDB", None, "rnav"]
+TRAFFIC_CYCLE = ["IFR/VFR", "VFR", "IFR", None]
+
+
+def _make_airports_db(path: Path, n_airports: int) -> None:
+    """Synthetic airports.db with the columns AirportsDatabaseSource reads."""
+    conn = sqlite3.connect(path)
+    conn.executescript(
+        """
+        CREATE TABLE airports (icao_code TEXT);
+        CREATE TABLE aip_entries (
+            airport_icao TEXT, std_field_id INTEGER, value TEXT, source_priority INTEGER
+        );
+        CREATE TABLE procedures (airport_icao TEXT, procedure_type TEXT, approach_type TEXT);
+        CREATE INDEX idx_aip_airport ON aip_entries (airport_icao);
+        CREATE INDEX idx_proc_airport ON procedures (airport_icao);
+        """
+    )
+    for i in range(n_airports):
+        icao = f"T{i:03d}"
+        conn.execute("INSERT INTO airports VALUES (?)", (icao,))
+        traffic = TRAFFIC_CYCLE[i % len(TRAFFIC_CYCLE)]
+        if traffic:
+            # Lower-priority source disagrees; the best one must win
+            conn.execute("INSERT INTO aip_entries VALUES (?, 207, 'VFR', 1)", (icao,))
+            conn.execute("INSERT INTO aip_entries VALUES (?, 207, ?, 5)", (icao, traffic))
+        if i % 3 == 0:
+            conn.execute("INSERT INTO aip_entries VALUES (?, 501, 'Hotel at AD', 1)", (icao,))
+        if i % 4 == 0:
+            conn.execute("INSERT INTO aip_entries VALUES (?, 502, 'Restaurant in vicinity', 1)", (icao,))
+        conn.execute("INSERT INTO aip_entries VALUES (?, 999, 'unrelated', 1)", (icao,))
+        for j in range(i % 4):
+            approach = APPROACH_CYCLE[(i + j) % len(APPROACH_CYCLE)]
+            procedure_type = "APPROACH" if j % 2 else "approach"
+            conn.execute("INSERT INTO procedures VALUES (?, ?, ?)", (icao, procedure_type, approach))
+        if i % 5 == 2:
+            # Typed, but not an approach: counts for approach types, not for the IFR score
+            conn.execute("INSERT INTO procedures VALUES (?, 'departure', 'RNAV')", (icao,))
+    conn.commit()
+    conn.close()
+
+
+@pytest.fixture
+def airports_db_path(temp_dir: Path) -> Path:
+    path = temp_dir / "airports.db"
+    _make_airports_db(path, 300)
+    return path
+
+
+def _metadata(source: AirportsDatabaseSource, icaos):
+    return {
+        icao: (
+            source.get_ifr_score(icao),
+            source.get_hotel_info(icao),
+            source.get_restaurant_info(icao),
+            source._get_best_approach_type(icao),
+        )
+        for icao in icaos
+    }
+
+
+@pytest.mark.unit
+class TestAirportsDatabasePreload:
+    """Bulk preload must return exactly what the per-airport queries return."""
+
+    def test_preload_matches_queries(self, airports_db_path):
+        icaos = sorted(AirportsDatabaseSource(airports_db_path).get_all_icaos()) + ["ZZZZ"]
+
+        per_query = AirportsDatabaseSource(airports_db_path)
+        bulk = AirportsDatabaseSource(airports_db_path, preload=True)
+
+        assert _metadata(bulk, icaos) == _metadata(per_query, icaos)
+        assert bulk.is_preloaded and not per_query.is_preloaded
+        assert (
+            bulk.get_airports_with_hospitality_fields()
+            == per_query.get_airports_with_hospitality_fields()
+        )
+
+    def test_best_source_priority_wins(self, airports_db_path):
+        source = AirportsDatabaseSource(airports_db_path)
+        source.preload()
+
+        assert source._get_aip_field("T000", AirportsDatabaseSource.STD_FIELD_IFR_VFR) == "IFR/VFR"
+        assert source.get_ifr_score("t000") == AirportsDatabaseSource.IFR_SCORE_PERMITTED
+
+    def test_aip_data_matches_airport_model(self, airports_db_path):
+        """Builder AIP fields from the preload equal those from euro_aip Airport objects."""
+        conn = sqlite3.connect(airports_db_path)
+        airports = {
+            icao: SimpleNamespace(
+                aip_entries=[
+                    SimpleNamespace(std_field_id=field, value=value)
+                    for field, value in conn.execute(
+                        "SELECT std_field_id, value FROM aip_entries WHERE airport_icao = ? "
+                        "ORDER BY source_priority DESC",
+                        (icao,),
+                    )
+                ],
+                procedures=[
+                    SimpleNamespace(procedure_type=procedure_type, approach_type=approach_type)
+                    for procedure_type, approach_type in conn.execute(
+                        "SELECT procedure_type, approach_type FROM procedures WHERE airport_icao = ?",
+                        (icao,),
+                    )
+                ],
+            )
+            for (icao,) in conn.execute("SELECT icao_code FROM airports").fetchall()
+        }
+        conn.close()
+
+        source = AirportsDatabaseSource(airports_db_path)
+        for icao, airport in airports.items():
+            assert aip_fields_from_data(*source.get_aip_data(icao)) == aip_fields_from_airport(airport), icao
+        assert source.get_aip_data("ZZZZ") is None
+        assert {aip_fields_from_data(*source.get_aip_data(icao))["aip_ifr_available"] for icao in airports} == {
+            0, 1, 2, 3, 4,
+        }
+
+    def test_preloaded_lookups_skip_sql(self, airports_db_path):
+        source = AirportsDatabaseSource(airports_db_path)
+        source.preload()
+        source.close()
+
+        # Connection closed: any query would reopen it, lookups must not
+        source.get_airport_metadata("T005")
+        assert source._conn is None
+
+    def test_preload_issues_constant_queries(self, airports_db_path):
+        icaos = sorted(AirportsDatabaseSource(airports_db_path).get_all_icaos())
+
+        def traced(source: AirportsDatabaseSource) -> List[str]:
+            statements: List[str] = []
+            source._get_connection().set_trace_callback(statements.append)
+            return statements
+
+        per_query = AirportsDatabaseSource(airports_db_path)
+        query_statements = traced(per_query)
+        expected = _metadata(per_query, icaos)
+
+        bulk = AirportsDatabaseSource(airports_db_path)
+        bulk_statements = traced(bulk)
+        bulk.preload()
+        assert _metadata(bulk, icaos) == expected
+
+        # Per-airport lookups query once per airport; preload is a fixed number of scans
+        assert len(query_statements) >= len(icaos)
+        assert 0 < len(bulk_statements) <= 3
+
+
+def _make_export(path: Path, n_airports: int) -> dict:
+    """Synthetic airfield.directory export with awkward JSON (escapes, nesting, unicode)."""
+    pireps = {}
+    for i in range(n_airports):
+        icao = f"E{i:03d}" if i % 5 else f"e{i:03d}"  # Some lower-case keys
+        pireps[icao] = {
+            f"{icao}#{j}": {
+                "id": f"{icao}-{j}",
+                "content": {"EN": f'Review {j} of {icao}: "quoted" {{brace}} [x]\\ Zürich \n ok'},
+                "ai_generated": j == 2,
+                "rating": j % 5 + 1,
+                "created_at": "2024-01-01T00:00:00Z",
+            }
+            for j in range(i % 4)
+        }
+    data = {
+        "metadata": {"nested": [{"a": "}"}, [1, 2, {"b": "]"}]], "count": n_airports},
+        "pireps": pireps,
+        "airports": [
+            {"icao": f"E{i:03d}", "aerops": {"currency": "EUR", "note": "x\"y"}}
+            for i in range(0, n_airports, 7)
+        ],
+    }
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    return data
+
+
+def _by_icao(source, icaos):
+    return {icao: source.get_reviews_for_icao(icao) for icao in icaos}
+
+
+@pytest.mark.unit
+class TestStreamingReviewSources:
+    """Streaming (offset-indexed) sources must match the in-memory ones."""
+
+    def test_json_members_offsets(self, temp_dir):
+        path = temp_dir / "export.json"
+        data = _make_export(path, 20)
+
+        with open(path, "rb") as f:
+            members = list(iter_json_members(f, ("pireps", "airports"), chunk_size=64))
+        raw_file = path.read_bytes()
+
+        pireps = {key: json.loads(raw) for section, key, _, raw in members if section == "pireps"}
+        assert pireps == data["pireps"]
+        airports = [json.loads(raw) for section, _, _, raw in members if section == "airports"]
+        assert airports == data["airports"]
+        for _, _, offset, raw in members:
+            assert raw_file[offset:offset + len(raw)] == raw
+
+    def test_airfield_directory_streaming_matches(self, temp_dir):
+        path = temp_dir / "export.json"
+        _make_export(path, 60)
+
+        loaded = AirfieldDirectorySource(cache_dir=temp_dir / "c1", export_path=path)
+        streamed = AirfieldDirectorySource(cache_dir=temp_dir / "c2", export_path=path, streaming=True)
+
+        icaos = sorted(loaded.get_icaos())
+        assert sorted(streamed.get_icaos()) == icaos
+        assert _by_icao(streamed, icaos + ["ZZZZ"]) == _by_icao(loaded, icaos + ["ZZZZ"])
+        assert dict(streamed.iter_reviews_by_icao()) == _by_icao(loaded, icaos)
+        assert streamed.get_airport_data("e007") == loaded.get_airport_data("E007")
+        assert streamed.get_airport_data("E001") is None
+        assert streamed._data is None and streamed._reviews is None
+
+    def test_gzip_export(self, temp_dir):
+        path = temp_dir / "export.json"
+        _make_export(path, 30)
+        gz_path = temp_dir / "export.json.gz"
+        gz_path.write_bytes(gzip.compress(path.read_bytes()))
+
+        loaded = AirfieldDirectorySource(cache_dir=temp_dir, export_path=path)
+        streamed = AirfieldDirectorySource(cache_dir=temp_dir, export_path=gz_path, streaming=True)
+
+        assert dict(streamed.iter_reviews_by_icao()) == _by_icao(loaded, sorted(loaded.get_icaos()))
+
+        # Decompressed once into cache_dir; lookups never seek in the gzip stream
+        plain = temp_dir / "export.json.gz.plain"
+        assert plain.read_bytes() == path.read_bytes()
+        mtime = plain.stat().st_mtime_ns
+        again = AirfieldDirectorySource(cache_dir=temp_dir, export_path=gz_path, streaming=True)
+        with patch("gzip.open", side_effect=AssertionError("gzip read")):
+            assert _by_icao(again, ["E007"]) == _by_icao(loaded, ["E007"])
+        assert plain.stat().st_mtime_ns == mtime
+
+    def test_csv_streaming_matches(self, temp_dir):
+        path = temp_dir / "reviews.csv"
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["icao", "review_text", "review_id", "rating"])
+            for i in range(200):
+                text = f'Line one\nline "two" for {i}' if i % 3 == 0 else f"Plain {i}"
+                writer.writerow([f"T{i % 17:03d}", text, f"r{i}", "" if i % 4 else "4.5"])
+            writer.writerow(["", "no icao", "r-x", ""])
+
+        loaded = CSVReviewSource(path)
+        streamed = CSVReviewSource(path, streaming=True)
+
+        icaos = sorted(loaded.get_icaos())
+        assert sorted(streamed.get_icaos()) == icaos
+        assert _by_icao(streamed, icaos) == _by_icao(loaded, icaos)
+        assert [icao for icao, _ in streamed.iter_reviews_by_icao()] == icaos
+        assert streamed._reviews is None
+
+    def test_index_reused_until_source_changes(self, temp_dir):
+        path = temp_dir / "reviews.csv"
+        path.write_text("icao,review_text\nEGKB,Nice\n", encoding="utf-8")
+
+        source = CSVReviewSource(path, streaming=True)
+        assert source.get_icaos() == {"EGKB"}
+        source.close()
+
+        index = ReviewOffsetIndex(source.index_path)
+        assert index.is_current(file_signature(path))
+        index.close()
+
+        path.write_text("icao,review_text\nEGKB,Nice\nLFPG,Busy but fine\n", encoding="utf-8")
+        os.utime(path, ns=(time.time_ns(), time.time_ns() + 10**9))
+        assert CSVReviewSource(path, streaming=True).get_icaos() == {"EGKB", "LFPG"}
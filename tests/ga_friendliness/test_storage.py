@@ -8,6 +8,7 @@ import pytest
 
 from shared.ga_friendliness import (
     GAMetaStorage,
+    BatchWriter,
     AirportStats,
     ReviewExtraction,
     AspectLabel,
@@ -177,6 +178,38 @@ class TestStorageReviewSummary:
         assert "friendly staff" in row[0]
 
 
+@pytest.mark.unit
+class TestStorageChangeLog:
+    """Tests for the summary tables' change log (delta sync)."""
+
+    def test_logs_changed_airports_only(self, temp_storage, sample_airport_stats):
+        """Rewriting identical stats is not logged; content changes are."""
+        from shared.change_log import change_log_head, changed_keys
+
+        temp_storage.write_airfield_stats(sample_airport_stats)
+        temp_storage.write_airfield_stats(sample_airport_stats)
+        _, seq = change_log_head(temp_storage.conn)
+        assert seq == 1
+
+        temp_storage.write_review_summary("LFAT", "Nice", ["friendly"])
+        temp_storage.write_review_summary("LFAT", "Nice", ["friendly"])
+        assert changed_keys(temp_storage.conn, seq) == {"LFAT"}
+        assert change_log_head(temp_storage.conn)[1] == seq + 1
+
+
+@pytest.mark.unit
+class TestStorageHospitality:
+    """Tests for hospitality queries."""
+
+    def test_hospitality_info(self, temp_storage):
+        """Hotel/restaurant codes of all airports in one query."""
+        temp_storage.upsert_aip_only("LFAT", 0, 0, 2, 1, None, None)
+        temp_storage.upsert_aip_only("EGKB", 0, 0, -1, None, None, None)
+
+        assert temp_storage.get_hospitality_info() == {"LFAT": (2, 1), "EGKB": (-1, None)}
+        assert temp_storage.get_icaos_by_hospitality(hotel="vicinity", restaurant="vicinity") == {"LFAT"}
+
+
 @pytest.mark.unit
 class TestStorageMetaInfo:
     """Tests for meta info operations."""
@@ -352,3 +385,98 @@ class TestStorageTransactions:
         
         storage.close()
 
+
+    def test_writes_deferred_until_commit(self, temp_db_path, sample_airport_stats):
+        """Inside a transaction, writes become visible to other connections on commit()."""
+        import sqlite3
+
+        storage = GAMetaStorage(temp_db_path)
+        reader = sqlite3.connect(str(temp_db_path))
+
+        def committed_count():
+            return reader.execute("SELECT COUNT(*) FROM ga_airfield_stats").fetchone()[0]
+
+        with storage.build_profile(), storage:
+            storage.write_airfield_stats(sample_airport_stats)
+            storage.set_last_successful_icao("EGKB")
+            assert committed_count() == 0
+
+            storage.commit()
+            assert committed_count() == 1
+
+        reader.close()
+        storage.close()
+
+    def test_build_profile_restored(self, temp_db_path, sample_airport_stats):
+        """Build PRAGMAs only apply during the build; the file ends in rollback-journal mode."""
+        storage = GAMetaStorage(temp_db_path)
+
+        def pragma(name):
+            return storage.conn.execute(f"PRAGMA {name}").fetchone()[0]
+
+        synchronous = pragma("synchronous")
+        with storage.build_profile():
+            assert pragma("journal_mode") == "wal"
+            assert pragma("synchronous") == 1  # NORMAL
+            storage.write_airfield_stats(sample_airport_stats)
+
+        assert pragma("journal_mode") == "delete"
+        assert pragma("synchronous") == synchronous
+        assert storage.get_airfield_stats("EGKB") is not None
+        storage.close()
+
+
+@pytest.mark.unit
+class TestBatchWriter:
+    """Tests for buffered, executemany-based writes."""
+
+    def _extraction(self, aspect, label):
+        return ReviewExtraction(
+            review_id="r1",
+            aspects=[AspectLabel(aspect=aspect, label=label, confidence=0.9)],
+        )
+
+    def test_buffered_until_flush(self, temp_storage, sample_airport_stats):
+        writer = temp_storage.batch_writer()
+        assert isinstance(writer, BatchWriter)
+
+        writer.write_airfield_stats(sample_airport_stats)
+        writer.set_last_successful_icao("EGKB")
+        assert writer.pending == 2
+        assert temp_storage.get_airfield_stats("EGKB") is None
+
+        writer.flush()
+        assert writer.pending == 0
+        assert temp_storage.get_airfield_stats("EGKB") is not None
+        assert temp_storage.get_last_successful_icao() == "EGKB"
+
+    def test_tags_replaced_per_airport(self, temp_storage):
+        temp_storage.write_review_tags("EGKB", [self._extraction("cost", "expensive")])
+
+        with temp_storage.batch_writer() as writer:
+            writer.write_review_tags("EGKB", [self._extraction("cost", "cheap")])
+            writer.write_review_tags("EGLL", [self._extraction("staff", "positive")])
+
+        egkb = temp_storage.conn.execute(
+            "SELECT label FROM ga_review_ner_tags WHERE icao = 'EGKB'"
+        ).fetchall()
+        assert [row[0] for row in egkb] == ["cheap"]
+        count = temp_storage.conn.execute("SELECT COUNT(*) FROM ga_review_ner_tags").fetchone()[0]
+        assert count == 2
+
+    def test_auto_flush_at_max_pending(self, temp_storage, sample_airport_stats):
+        writer = temp_storage.batch_writer(max_pending=2)
+        writer.write_airfield_stats(sample_airport_stats)
+        assert temp_storage.get_airfield_stats("EGKB") is None
+
+        writer.set_last_successful_icao("EGKB")
+        assert writer.pending == 0
+        assert temp_storage.get_airfield_stats("EGKB") is not None
+
+    def test_discarded_on_exception(self, temp_storage, sample_airport_stats):
+        with pytest.raises(ValueError):
+            with temp_storage.batch_writer() as writer:
+                writer.write_airfield_stats(sample_airport_stats)
+                raise ValueError("Simulated error")
+
+        assert temp_storage.get_airfield_stats("EGKB") is None
@@ -0,0 +1,144 @@
+"""
+Tests for NotificationBatchProcessor serial vs pipelined processing.
+"""
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from shared.ga_notification_agent.batch_processor import NotificationBatchProcessor
+from shared.ga_notification_agent.config import get_notification_config
+from shared.ga_notification_agent.models import (
+    NotificationRule,
+    NotificationType,
+    RuleType,
+)
+
+FIXTURE_PATH = Path(__file__).parent / "fixtures" / "parser_test_cases.json"
+
+
+def _texts():
+    with open(FIXTURE_PATH) as f:
+        return [tc["text"] for tc in json.load(f) if "text" in tc]
+
+
+@pytest.fixture
+def airports_db(tmp_path: Path) -> Path:
+    """airports.db with customs text (field 302) for a few hundred airports."""
+    path = tmp_path / "airports.db"
+    texts = _texts()
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE aip_entries (airport_icao TEXT, std_field_id INTEGER, value TEXT)"
+    )
+    conn.executemany(
+        "INSERT INTO aip_entries VALUES (?, 302, ?)",
+        [(f"T{i:03d}", texts[i % len(texts)]) for i in range(300)],
+    )
+    conn.commit()
+    conn.close()
+    return path
+
+
+def _rows(db_path: Path):
+    conn = sqlite3.connect(db_path)
+    rows = conn.execute(
+        "SELECT icao, rule_type, notification_type, hours_notice, weekday_rules, "
+        "schengen_rules, summary, raw_text, confidence, extraction_method "
+        "FROM ga_notification_requirements ORDER BY icao"
+    ).fetchall()
+    conn.close()
+    return rows
+
+
+def _processor(tmp_path: Path, name: str, use_llm: bool = False) -> NotificationBatchProcessor:
+    config = get_notification_config("default").model_copy(deep=True)
+    config.parsing.use_llm_fallback = use_llm
+    return NotificationBatchProcessor(output_db_path=tmp_path / name, config=config)
+
+
+class _FakeLLM:
+    """Stands in for NotificationParser._parse_with_llm; tracks concurrency and call spacing."""
+
+    def __init__(self, latency: float = 0.05):
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+        self.starts = []
+
+    def __call__(self, icao: str, text: str):
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            self.starts.append(time.monotonic())
+        time.sleep(self.latency)
+        with self.lock:
+            self.active -= 1
+        return [NotificationRule(
+            rule_type=RuleType.CUSTOMS,
+            notification_type=NotificationType.HOURS,
+            hours_notice=24,
+            raw_text="24h notice",
+            confidence=0.85,
+            extraction_method="llm",
+        )]
+
+
+class TestPipelinedProcessing:
+    """Pipelined mode must store exactly what serial mode stores, with fewer commits."""
+
+    def test_pipelined_matches_serial(self, tmp_path, airports_db):
+        serial = _processor(tmp_path, "serial.db")
+        serial_stats = serial.process_airports(airports_db, delay=0)
+
+        pipelined = _processor(tmp_path, "pipelined.db")
+        stats = pipelined.process_airports(airports_db, delay=0, workers=2, batch_size=50)
+
+        assert _rows(tmp_path / "pipelined.db") == _rows(tmp_path / "serial.db")
+        for key in ("total", "success", "failed", "skipped"):
+            assert stats[key] == serial_stats[key]
+        assert stats["total"] == 300
+        assert stats["commits"] == 6
+        assert stats["airports_per_second"] > 0
+
+    def test_llm_fallback_concurrent_and_spaced(self, tmp_path, airports_db):
+        processor = _processor(tmp_path, "llm.db", use_llm=True)
+        fake = _FakeLLM()
+        processor._parser._parse_with_llm = fake
+
+        stats = processor.process_airports(airports_db, delay=0.01, llm_concurrency=4)
+
+        assert stats["llm_calls"] == len(fake.starts) > 0
+        assert 1 < fake.max_active <= 4
+        # Call starts are spaced by `delay` across all LLM threads
+        span = max(fake.starts) - min(fake.starts)
+        assert span >= (len(fake.starts) - 1) * 0.01 * 0.9
+
+        methods = {row[9] for row in _rows(tmp_path / "llm.db")}
+        assert "llm" in methods
+
+    def test_llm_failure_keeps_regex_result(self, tmp_path, airports_db):
+        processor = _processor(tmp_path, "llm_fail.db", use_llm=True)
+        processor._parser._parse_with_llm = lambda icao, text: []
+
+        stats = processor.process_airports(airports_db, delay=0, llm_concurrency=2)
+
+        assert stats["failed"] == 0
+        assert len(_rows(tmp_path / "llm_fail.db")) == 300
+
+    def test_save_results_single_transaction(self, tmp_path):
+        processor = _processor(tmp_path, "save.db")
+        processor.save_results([
+            ("EGKB", {"notification_type": "h24", "confidence": 0.95, "weekday_rules": {"Mon": "24h"}}),
+            ("LFPG", {"notification_type": "on_request", "confidence": 0.9}),
+        ])
+
+        rows = _rows(tmp_path / "save.db")
+        assert [row[0] for row in rows] == ["EGKB", "LFPG"]
+        assert json.loads(rows[0][4]) == {"Mon": "24h"}
@@ -0,0 +1,180 @@
+"""
+Tests for NotificationParser caching, single-pass scanning and parse_batch.
+"""
+from __future__ import annotations
+
+import json
+import re
+from pathlib import Path
+
+import pytest
+
+from shared.ga_notification_agent.config import get_notification_config
+from shared.ga_notification_agent.models import (
+    NotificationRule,
+    NotificationType,
+    RuleType,
+)
+from shared.ga_notification_agent.parse_cache import ParseCache
+from shared.ga_notification_agent.parser import NotificationParser, TextScan
+
+FIXTURE_PATH = Path(__file__).parent / "fixtures" / "parser_test_cases.json"
+
+COMPLEX_TEXT = (
+    "MON-FRI: PPR 24 HR. SAT, SUN and HOL: PPR 48 HR. "
+    "Non-Schengen flights prohibited except if arranged before 1100."
+)
+
+
+def _texts():
+    with open(FIXTURE_PATH) as f:
+        return [tc["text"] for tc in json.load(f) if "text" in tc]
+
+
+def _parser(use_llm: bool = False, **kwargs) -> NotificationParser:
+    config = get_notification_config("default").model_copy(deep=True)
+    config.parsing.use_llm_fallback = use_llm
+    return NotificationParser(config=config, **kwargs)
+
+
+def _llm_rules(icao: str, text: str):
+    return [NotificationRule(
+        rule_type=RuleType.PPR,
+        notification_type=NotificationType.HOURS,
+        hours_notice=48,
+        raw_text="48h PPR",
+        confidence=0.85,
+        extraction_method="llm",
+    )]
+
+
+class TestTextScan:
+    @pytest.mark.parametrize("text", _texts() + [
+        "nonschengen flights: PPR 24 HR",
+        "Extra-Schengen: O/R. Within Schengen: H24",
+        "mon tue Wed thursday FRI prohibited",
+    ])
+    def test_matches_individual_patterns(self, text):
+        parser = _parser(use_cache=False)
+        scan = TextScan(text, parser)
+
+        assert scan.has_h24 == bool(parser.H24_PATTERN.search(text))
+        assert scan.has_hours == bool(parser.HOURS_PATTERN.search(text))
+        assert scan.has_on_request == bool(parser.ON_REQUEST_PATTERN.search(text))
+        assert scan.days == [
+            d.upper() for d in re.findall(r"\b(MON|TUE|WED|THU|FRI|SAT|SUN)\b", text, re.IGNORECASE)
+        ]
+        assert scan.has_schengen_word == bool(re.search(r"\bschengen\b", text, re.IGNORECASE))
+        assert scan.has_prohibited_word == bool(re.search(r"\bprohibited\b", text, re.IGNORECASE))
+
+    def test_schengen_context_without_whole_word(self):
+        parser = _parser(use_cache=False)
+        assert parser._detect_schengen_context("Nonschengen flights only with PPR") == (False, True)
+
+
+class TestParseCache:
+    def test_hit_returns_copy_with_icao(self):
+        parser = _parser()
+        first = parser.parse("EGKB", "PPR 24 HR")
+        again = parser.parse("LFPT", "  PPR 24 HR ")
+
+        assert parser.cache.hits == 1
+        assert again.icao == "LFPT"
+        assert again.rules == first.rules and again.rules is not first.rules
+
+    def test_persists_across_instances(self, tmp_path):
+        path = tmp_path / "cache.db"
+        writer = ParseCache(path)
+        first = _parser(cache=writer).parse("EGKB", COMPLEX_TEXT)
+        writer.close()  # Writes are buffered until flush/close
+
+        cache = ParseCache(path)
+        second = _parser(cache=cache).parse("EGKB", COMPLEX_TEXT)
+        assert cache.hits == 1
+        assert second == first
+
+    def test_config_change_misses(self, tmp_path):
+        path = tmp_path / "cache.db"
+        writer = ParseCache(path)
+        _parser(cache=writer).parse("EGKB", "PPR 24 HR")
+        writer.close()
+
+        config = get_notification_config("default").model_copy(deep=True)
+        config.parsing.use_llm_fallback = False
+        config.parsing.confidence.hours_rules = 0.5
+        cache = ParseCache(path)
+        parsed = NotificationParser(config=config, cache=cache).parse("EGKB", "PPR 24 HR")
+
+        assert cache.hits == 0
+        assert parsed.rules[0].confidence == 0.5
+
+    def test_llm_result_cached_failure_not(self, monkeypatch):
+        parser = _parser(use_llm=True)
+        calls = []
+        monkeypatch.setattr(parser, "_parse_with_llm", lambda icao, text: calls.append(icao) or [])
+
+        parser.parse("EGKB", COMPLEX_TEXT)
+        parser.parse("EGKB", COMPLEX_TEXT)
+        assert len(calls) == 2  # Failed LLM results are retried
+
+        monkeypatch.setattr(parser, "_parse_with_llm", lambda icao, text: calls.append(icao) or _llm_rules(icao, text))
+        parser.parse("EGKB", COMPLEX_TEXT)
+        cached = parser.parse("LFPT", COMPLEX_TEXT)
+        assert len(calls) == 3
+        assert cached.icao == "LFPT" and cached.rules[0].extraction_method == "llm"
+
+    def test_disabled(self):
+        parser = _parser(use_cache=False)
+        parser.parse("EGKB", "H24")
+        assert parser.cache is None
+
+    def test_refresh_reparses_but_writes(self, tmp_path, monkeypatch):
+        path = tmp_path / "cache.db"
+        writer = ParseCache(path)
+        writer.set(_parser().cache_key("PPR 24 HR"), "stale")
+        writer.close()
+
+        cache = ParseCache(path, refresh=True)
+        parser = _parser(cache=cache)
+        calls = []
+        original = parser._parse_regex
+        monkeypatch.setattr(parser, "_parse_regex", lambda *args: calls.append(1) or original(*args))
+        parser.parse_batch([("EGKB", "PPR 24 HR"), ("LFPT", "PPR 24 HR")])
+        parser.parse("EGLL", "PPR 24 HR")  # Stored by this run: a hit
+        cache.close()
+
+        assert len(calls) == 1
+        assert ParseCache(path).get(parser.cache_key("PPR 24 HR")) != "stale"
+
+    def test_buffered_writes_and_memory_level(self, tmp_path):
+        path = tmp_path / "buffered.db"
+        writer = ParseCache(path, max_memory_entries=2, flush_every=3)
+        writer.set_many([("a", "1"), ("b", "2")])
+        assert writer.get("a") == "1"  # Served before it is committed
+        assert ParseCache(path).get("a") is None
+        writer.set("c", "3")  # Third buffered write commits all
+        assert ParseCache(path).get_many(["a", "b", "c"]) == {"a": "1", "b": "2", "c": "3"}
+        writer.close()
+
+        memory_only = ParseCache(max_memory_entries=2)
+        memory_only.set_many([("a", "1"), ("b", "2"), ("c", "3")])
+        assert memory_only.get_many(["a", "b", "c"]) == {"b": "2", "c": "3"}
+        assert len(memory_only) == 2
+
+
+class TestParseBatch:
+    def test_matches_parse_and_dedupes(self, monkeypatch):
+        texts = _texts()
+        airports = [(f"T{i:03d}", texts[i % len(texts)]) for i in range(100)] + [("E000", ""), ("E001", None)]
+        expected = [_parser(use_cache=False).parse(icao, text) for icao, text in airports]
+
+        parser = _parser()
+        parsed_texts = []
+        original = parser.parse
+        monkeypatch.setattr(parser, "parse", lambda icao, text, fid=302: parsed_texts.append(text) or original(icao, text, fid))
+        results = parser.parse_batch(airports)
+
+        assert [r.model_dump() for r in results] == [e.model_dump() for e in expected]
+        assert len(parsed_texts) == len({text or "" for _, text in airports})
+        results[0].rules.clear()
+        assert results[len(texts)].rules == expected[len(texts)].rules
@@ -1,6 +1,7 @@
 import importlib
 from functools import lru_cache
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
@@ -85,3 +86,74 @@ def server_module(tool_context: ToolContext):
     server_mod._tool_context = tool_context
     return server_mod
 
+
+
+def _fake_runway(le: str, he: str, length_ft):
+    return SimpleNamespace(
+        le_ident=le, he_ident=he, length_ft=length_ft, width_ft=100, surface="ASP",
+        lighted=True, closed=False, le_latitude_deg=None, le_longitude_deg=None,
+        le_elevation_ft=None, le_heading_degT=None, le_displaced_threshold_ft=None,
+        he_latitude_deg=None, he_longitude_deg=None, he_elevation_ft=None,
+        he_heading_degT=None, he_displaced_threshold_ft=None,
+    )
+
+
+def _fake_airport(ident: str, country: str, lat: float, lon: float, name: str = None,
+                  runway_ft=3000, procedures=(), entry=False, avgas=False):
+    """Stand-in for a euro_aip Airport with one runway and straight procedure lines."""
+    return SimpleNamespace(
+        ident=ident, name=name or ident, latitude_deg=lat, longitude_deg=lon,
+        iso_country=country, municipality=None, point_of_entry=entry,
+        procedures=list(procedures), runways=[_fake_runway("09", "27", runway_ft)], aip_entries=[],
+        has_hard_runway=True, has_lighted_runway=True, has_soft_runway=False,
+        has_water_runway=False, has_snow_runway=False, longest_runway_length_ft=runway_ft,
+        avgas=avgas,
+        get_procedure_lines=lambda distance_nm: {"procedure_lines": [{
+            "runway_end": "27", "procedure_name": "ILS 27", "approach_type": "ILS",
+            "precision_category": "precision", "start_lat": lat, "start_lon": lon,
+            "end_lat": lat, "end_lon": lon + distance_nm / 60,
+        }]},
+    )
+
+
+def _fake_notification_info(hours_notice, h24=False, summary="PPR", easiness=50.04):
+    """Stand-in for a NotificationInfo."""
+    return SimpleNamespace(
+        notification_type="h24" if h24 else "hours", hours_notice=hours_notice, summary=summary,
+        is_h24=lambda: h24, get_easiness_score=lambda: easiness,
+    )
+
+
+class _FakeGAService:
+    """GAFriendlinessService stand-in serving fixed summaries and hospitality codes."""
+
+    def __init__(self, summaries, hospitality=None):
+        self.summaries = summaries
+        self.hospitality = hospitality or {}
+
+    def get_summaries_batch_dict(self, icaos):
+        return {icao: self.summaries[icao] for icao in icaos if icao in self.summaries}
+
+    def get_hospitality_info(self):
+        return self.hospitality
+
+
+class _FakeNotificationService:
+    """NotificationService stand-in serving fixed NotificationInfo objects."""
+
+    def __init__(self, infos):
+        self.infos = infos
+
+    def get_notification_info_batch(self, icaos):
+        return {icao: self.infos[icao] for icao in icaos if icao in self.infos}
+
+
+@pytest.fixture
+def derived_data_fakes() -> SimpleNamespace:
+    """Airport and derived-data service stand-ins for the precompiled database builders."""
+    return SimpleNamespace(
+        airport=_fake_airport,
+        notification_info=_fake_notification_info,
+        GAService=_FakeGAService,
+        NotificationService=_FakeNotificationService,
+    )
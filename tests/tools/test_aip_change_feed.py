@@ -0,0 +1,147 @@
+"""
+Tests for the airports.db change feed (shared/aip_change_feed.py) and the
+change-feed driven notification sync in tools/data_update.py.
+"""
+from __future__ import annotations
+
+import importlib.util
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from shared.aip_change_feed import AIPChangeFeed, ChangeFeedState
+
+
+def _make_airports_db(path: Path) -> None:
+    conn = sqlite3.connect(path)
+    conn.executescript(
+        """
+        CREATE TABLE aip_entries (
+            airport_icao TEXT, std_field_id INTEGER, value TEXT, source_priority INTEGER
+        );
+        CREATE TABLE aip_entries_changes (
+            airport_icao TEXT, section TEXT, field TEXT, std_field TEXT, std_field_id INTEGER,
+            source TEXT, old_value TEXT, new_value TEXT, changed_at TEXT
+        );
+        CREATE TABLE procedures_changes (
+            airport_icao TEXT, field_name TEXT, source TEXT,
+            old_value TEXT, new_value TEXT, changed_at TEXT
+        );
+        """
+    )
+    conn.executemany(
+        "INSERT INTO aip_entries VALUES (?, 302, ?, 1)",
+        [("EGKB", "H24"), ("LFPT", "PPR 24 HR"), ("EDDF", "O/R")],
+    )
+    conn.commit()
+    conn.close()
+
+
+def _record(path: Path, icao: str, std_field_id: int, changed_at: str, value: str = None) -> None:
+    conn = sqlite3.connect(path)
+    with conn:
+        conn.execute(
+            "INSERT INTO aip_entries_changes (airport_icao, std_field_id, new_value, changed_at) "
+            "VALUES (?, ?, ?, ?)",
+            (icao, std_field_id, value, changed_at),
+        )
+        if value is not None and std_field_id == 302:
+            conn.execute(
+                "UPDATE aip_entries SET value = ? WHERE airport_icao = ? AND std_field_id = 302",
+                (value, icao),
+            )
+    conn.close()
+
+
+@pytest.fixture
+def airports_db(tmp_path: Path) -> Path:
+    path = tmp_path / "airports.db"
+    _make_airports_db(path)
+    _record(path, "EGKB", 302, "2026-01-01 10:00:00")
+    _record(path, "LFPT", 501, "2026-01-01 10:00:00")
+    return path
+
+
+class TestAIPChangeFeed:
+    def test_changes_after_mark_by_field(self, airports_db):
+        _record(airports_db, "lfpt", 302, "2026-01-02 09:00:00")
+        _record(airports_db, "EDDF", 207, "2026-01-02 09:30:00")
+        conn = sqlite3.connect(airports_db)
+        conn.execute("INSERT INTO procedures_changes (airport_icao, changed_at) VALUES ('EGLL', '2026-01-02 10:00:00')")
+        conn.commit()
+        conn.close()
+
+        changes = AIPChangeFeed(airports_db).changes("2026-01-01 10:00:00")
+
+        assert changes.until == "2026-01-02 10:00:00"
+        assert changes.aip_fields == {"LFPT": {302}, "EDDF": {207}}
+        assert changes.icaos(std_field_ids=[302]) == ["LFPT"]
+        assert changes.icaos(std_field_ids=[207, 501], procedures=True) == ["EDDF", "EGLL"]
+
+    def test_no_changes_keeps_mark(self, airports_db):
+        feed = AIPChangeFeed(airports_db)
+        changes = feed.changes(feed.latest())
+        assert changes.is_empty and changes.until == "2026-01-01 10:00:00"
+
+    def test_missing_tables(self, tmp_path):
+        path = tmp_path / "bare.db"
+        sqlite3.connect(path).close()
+        feed = AIPChangeFeed(path)
+        assert feed.latest() is None
+        assert feed.changes("2026-01-01").is_empty
+
+    def test_state_round_trip(self, tmp_path):
+        state = ChangeFeedState(tmp_path / "derived.db", "consumer")
+        assert state.get() is None
+        state.set("2026-01-01 10:00:00")
+        assert ChangeFeedState(tmp_path / "derived.db", "consumer").get() == "2026-01-01 10:00:00"
+        assert ChangeFeedState(tmp_path / "derived.db", "other").get() is None
+        state.set(None)
+        assert state.get() is None
+
+
+@pytest.fixture
+def data_update(tmp_path, airports_db, monkeypatch):
+    path = Path(__file__).resolve().parents[2] / "tools" / "data_update.py"
+    spec = importlib.util.spec_from_file_location("data_update_under_test", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    monkeypatch.setattr(module, "AIRPORTS_DB", airports_db)
+    monkeypatch.setattr(module, "GA_NOTIFICATIONS_DB", tmp_path / "ga_notifications.db")
+    monkeypatch.setattr(module, "NOTIFICATIONS_PARSE_CACHE", tmp_path / "parse_cache.db")
+    return module
+
+
+def _notification_icaos(path: Path):
+    conn = sqlite3.connect(path)
+    rows = conn.execute("SELECT icao, raw_text FROM ga_notification_requirements ORDER BY icao").fetchall()
+    conn.close()
+    return rows
+
+
+class TestNotificationSync:
+    def test_first_run_full_then_only_changed(self, data_update, airports_db, monkeypatch):
+        full_runs = []
+        monkeypatch.setattr(data_update, "update_notifications", lambda full=False: full_runs.append(full))
+        monkeypatch.setenv("OPENAI_API_KEY", "")
+        feed = AIPChangeFeed(airports_db)
+
+        data_update.sync_notifications_from_feed(feed)
+        state = ChangeFeedState(data_update.GA_NOTIFICATIONS_DB, "ga_notifications")
+        assert full_runs == [False]
+        assert state.get() == "2026-01-01 10:00:00"
+
+        # Only LFPT's customs text changes; the hotel change elsewhere is ignored
+        _record(airports_db, "LFPT", 302, "2026-01-03 08:00:00", value="H24")
+        _record(airports_db, "EDDF", 501, "2026-01-03 08:00:00")
+        data_update.sync_notifications_from_feed(feed)
+
+        assert full_runs == [False]
+        assert _notification_icaos(data_update.GA_NOTIFICATIONS_DB) == [("LFPT", "H24")]
+        assert state.get() == "2026-01-03 08:00:00"
+
+        # Nothing new: no processing, mark unchanged
+        data_update.sync_notifications_from_feed(feed)
+        assert _notification_icaos(data_update.GA_NOTIFICATIONS_DB) == [("LFPT", "H24")]
+        assert state.get() == "2026-01-03 08:00:00"
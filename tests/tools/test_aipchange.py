@@ -0,0 +1,199 @@
+"""
+Tests for streaming, pagination and the HTTP endpoint of tools/aipchange.py.
+"""
+from __future__ import annotations
+
+import csv
+import importlib.util
+import io
+import json
+import sqlite3
+import threading
+import urllib.error
+import urllib.parse
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def aipchange():
+    path = Path(__file__).resolve().parents[2] / "tools" / "aipchange.py"
+    spec = importlib.util.spec_from_file_location("aipchange_under_test", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def db_path(tmp_path) -> Path:
+    path = tmp_path / "airports.db"
+    conn = sqlite3.connect(path)
+    conn.executescript(
+        """
+        CREATE TABLE airports (icao_code TEXT PRIMARY KEY, iso_country TEXT);
+        CREATE TABLE aip_entries_changes (
+            airport_icao TEXT, section TEXT, field TEXT, std_field TEXT, std_field_id INTEGER,
+            source TEXT, old_value TEXT, new_value TEXT, changed_at TEXT
+        );
+        CREATE TABLE procedures_changes (
+            airport_icao TEXT, field_name TEXT, source TEXT,
+            old_value TEXT, new_value TEXT, changed_at TEXT
+        );
+        CREATE TABLE runways_changes (
+            airport_icao TEXT, field_name TEXT, source TEXT,
+            old_value TEXT, new_value TEXT, changed_at TEXT
+        );
+        CREATE TABLE airports_changes (
+            airport_icao TEXT, field_name TEXT, source TEXT,
+            old_value TEXT, new_value TEXT, changed_at TEXT
+        );
+        INSERT INTO airports VALUES ('LFAT', 'FR'), ('LFPT', 'FR'), ('EGMC', 'GB');
+        """
+    )
+    airports = ["LFAT", "LFPT", "EGMC"]
+    for i in range(60):
+        # Several changes share each timestamp, across tables
+        changed_at = f"2025-0{1 + i % 3}-{10 + i % 7:02d} 08:00:00"
+        icao = airports[i % 3]
+        conn.execute(
+            "INSERT INTO aip_entries_changes VALUES (?, 'AD 2.2', 'f', 'Customs', ?, 'fr', ?, ?, ?)",
+            (icao, 302 if i % 4 else 205, f"old{i}", f"new{i}", changed_at),
+        )
+        if i % 2:
+            conn.execute(
+                "INSERT INTO procedures_changes VALUES (?, 'approach', 'fr', ?, ?, ?)",
+                (icao, f"old{i}", f"new{i}", changed_at),
+            )
+        if i % 5 == 0:
+            conn.execute(
+                "INSERT INTO runways_changes VALUES (?, 'length', 'fr', ?, ?, ?)",
+                (icao, str(i), str(i + 1), changed_at),
+            )
+    conn.commit()
+    conn.close()
+    return path
+
+
+TYPES = ["aip", "procedures", "runways"]
+RANGE = ("2025-01-01", "2025-04-01")
+
+
+def _all(aipchange, conn, **kwargs):
+    return list(aipchange._iter_changes(conn, TYPES, None, *RANGE, None, **kwargs))
+
+
+def test_merged_stream_is_ordered_and_complete(aipchange, db_path):
+    conn = aipchange._connect(str(db_path))
+    rows = _all(aipchange, conn)
+
+    assert len(rows) == 60 + 30 + 12
+    times = [r["changed_at"] for r in rows]
+    assert times == sorted(times, reverse=True)
+    assert aipchange._query_changes(conn, TYPES, None, *RANGE, None) == rows
+
+
+def test_keyset_pages_cover_everything_once(aipchange, db_path):
+    conn = aipchange._connect(str(db_path))
+    expected = _all(aipchange, conn)
+
+    pages, after = [], None
+    while True:
+        page = aipchange._PageTracker(aipchange._iter_changes(
+            conn, TYPES, None, *RANGE, None, after=after, limit=7
+        ), 7)
+        pages.extend(page)
+        after = page.next_cursor
+        if after is None:
+            break
+
+    assert [(r["change_type"], r["change_id"]) for r in pages] == [
+        (r["change_type"], r["change_id"]) for r in expected
+    ]
+    with pytest.raises(ValueError):
+        aipchange._decode_cursor("garbage")
+
+
+def test_filters_and_indexes(aipchange, db_path):
+    conn = aipchange._connect(str(db_path))
+    assert len(aipchange._ensure_indexes(conn)) == 4
+    assert aipchange._ensure_indexes(conn) == []
+
+    plan = " ".join(
+        row[-1] for row in conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM aip_entries_changes "
+            "WHERE changed_at >= ? AND changed_at < ? ORDER BY changed_at DESC",
+            RANGE,
+        )
+    )
+    assert "idx_aip_entries_changes_changed_at" in plan
+
+    rows = _all(aipchange, conn, country_filter=["fr"], skip_std_field_ids=[205], std_field_ids=[302])
+    assert rows and {r["airport_icao"] for r in rows} == {"LFAT", "LFPT"}
+    assert all(r["change_type"] != "aip" or r["std_field_id"] == 302 for r in rows)
+
+
+def test_stream_writers_match_batch_output(aipchange, db_path):
+    conn = aipchange._connect(str(db_path))
+    rows = _all(aipchange, conn)
+
+    out = io.StringIO()
+    assert aipchange._stream_json(iter(rows), out) == len(rows)
+    assert out.getvalue() == json.dumps(rows, indent=2, ensure_ascii=False)
+    empty = io.StringIO()
+    aipchange._stream_json(iter([]), empty)
+    assert json.loads(empty.getvalue()) == []
+
+    out = io.StringIO()
+    aipchange._stream_csv(iter(rows), out)
+    parsed = list(csv.DictReader(io.StringIO(out.getvalue())))
+    assert len(parsed) == len(rows) and parsed[0]["new_value"] == rows[0]["new_value"]
+
+
+def test_cli_does_not_write_without_create_indexes(aipchange, db_path, monkeypatch, capsys):
+    def index_names():
+        with sqlite3.connect(db_path) as conn:
+            return {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL")}
+
+    mtime = db_path.stat().st_mtime_ns
+    monkeypatch.setattr("sys.argv", ["aipchange", "--database", str(db_path), "--since", "latest", "--summary"])
+    aipchange.main()
+    assert index_names() == set() and db_path.stat().st_mtime_ns == mtime
+
+    monkeypatch.setattr("sys.argv", ["aipchange", "--database", str(db_path), "--create-indexes", "--summary"])
+    aipchange.main()
+    assert len(index_names()) == 4
+
+
+def test_http_changes_endpoint(aipchange, db_path):
+    server = aipchange._make_server(str(db_path), port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base = f"http://127.0.0.1:{server.server_address[1]}/changes"
+
+    def get(query):
+        with urllib.request.urlopen(f"{base}?{query}") as response:
+            return json.load(response)
+
+    try:
+        query = "since=2025-01-01&until=2025-04-01&type=aip,procedures&country=GB"
+        first = get(f"{query}&limit=5")
+        assert len(first["changes"]) == 5 and first["next"]
+        assert {r["airport_icao"] for r in first["changes"]} == {"EGMC"}
+
+        second = get(f"{query}&limit=5&after={urllib.parse.quote(first['next'])}")
+        assert first["changes"] + second["changes"] == get(f"{query}&limit=10")["changes"]
+
+        with urllib.request.urlopen(f"{base}?{query}&limit=5&format=csv") as response:
+            assert response.headers["Content-Type"].startswith("text/csv")
+            assert len(response.read().decode().strip().splitlines()) == 6
+
+        for bad in ("type=bogus", "since=garbage", "since=2025-01-01&until=soon"):
+            with pytest.raises(urllib.error.HTTPError) as excinfo:
+                urllib.request.urlopen(f"{base}?{bad}")
+            assert excinfo.value.code == 400
+            assert json.load(excinfo.value)["error"]
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,149 @@
+"""
+Tests for derived-database change logs (shared/change_log.py) and delta
+versions across served databases (shared/data_delta.py).
+"""
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from shared.change_log import change_log_head, changed_keys, install_change_log
+from shared.data_delta import DataVersion, DeltaSource, LogPosition
+
+
+def _make_derived_db(path: Path) -> None:
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE requirements (id INTEGER PRIMARY KEY AUTOINCREMENT, icao TEXT UNIQUE, "
+        "summary TEXT, hours INTEGER, created_utc TEXT)"
+    )
+    install_change_log(conn, "requirements", ignore_columns=["id", "created_utc"])
+    conn.commit()
+    conn.close()
+
+
+def _write(path: Path, icao: str, summary: str, hours: int = None, stamp: str = "t0") -> None:
+    conn = sqlite3.connect(path)
+    with conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO requirements (icao, summary, hours, created_utc) VALUES (?, ?, ?, ?)",
+            (icao, summary, hours, stamp),
+        )
+    conn.close()
+
+
+def _changes(path: Path, since: int = 0):
+    conn = sqlite3.connect(path)
+    try:
+        return changed_keys(conn, since), change_log_head(conn)[1]
+    finally:
+        conn.close()
+
+
+class TestChangeLog:
+    def test_logs_only_content_changes(self, tmp_path):
+        db = tmp_path / "derived.db"
+        _make_derived_db(db)
+        _write(db, "EGKB", "H24")
+        _write(db, "LFPT", "PPR 24h", 24)
+        assert _changes(db) == ({"EGKB", "LFPT"}, 2)
+
+        # Rebuild rewriting identical content (new id, new timestamp): not logged
+        _write(db, "EGKB", "H24", stamp="t1")
+        _write(db, "LFPT", "PPR 24h", 24, stamp="t1")
+        assert _changes(db, 2) == (set(), 2)
+
+        _write(db, "LFPT", "PPR 48h", 48)
+        conn = sqlite3.connect(db)
+        with conn:
+            conn.execute("UPDATE requirements SET hours = NULL WHERE icao = 'EGKB'")
+            conn.execute("UPDATE requirements SET created_utc = 't2' WHERE icao = 'LFPT'")
+            conn.execute("DELETE FROM requirements WHERE icao = 'LFPT'")
+        conn.close()
+        assert _changes(db, 2) == ({"LFPT"}, 4)
+
+    def test_reinstall_keeps_log_and_epoch(self, tmp_path):
+        db = tmp_path / "derived.db"
+        _make_derived_db(db)
+        _write(db, "EGKB", "H24")
+        conn = sqlite3.connect(db)
+        epoch = change_log_head(conn)[0]
+        install_change_log(conn, "requirements", ignore_columns=["id", "created_utc"])
+        conn.commit()
+        assert change_log_head(conn) == (epoch, 1)
+        conn.close()
+
+    def test_no_log(self, tmp_path):
+        conn = sqlite3.connect(tmp_path / "plain.db")
+        assert change_log_head(conn) == (None, 0)
+        assert changed_keys(conn, 0) == set()
+        conn.close()
+
+
+@pytest.fixture
+def served(tmp_path):
+    airports_db = tmp_path / "airports.db"
+    conn = sqlite3.connect(airports_db)
+    conn.executescript(
+        """
+        CREATE TABLE aip_entries_changes (airport_icao TEXT, std_field_id INTEGER, changed_at TEXT);
+        CREATE TABLE airports_changes (airport_icao TEXT, field_name TEXT, changed_at TEXT);
+        INSERT INTO aip_entries_changes VALUES ('EGKB', 302, '2026-01-01 10:00:00');
+        """
+    )
+    conn.commit()
+    conn.close()
+    ga_db, notifications_db = tmp_path / "ga.db", tmp_path / "notifications.db"
+    _make_derived_db(ga_db)
+    _make_derived_db(notifications_db)
+    return airports_db, ga_db, notifications_db
+
+
+def _source(served, mark):
+    airports_db, ga_db, notifications_db = served
+    return DeltaSource(airports_db, mark, ga_persona_db=ga_db, notifications_db=notifications_db)
+
+
+class TestDeltaSource:
+    def test_version_token_round_trip(self):
+        version = DataVersion("2026-01-01 10:00:00", LogPosition("ab12cd34", 7), LogPosition(None, 0))
+        assert DataVersion.decode(version.encode()) == version
+        with pytest.raises(ValueError):
+            DataVersion.decode("1.garbage")
+        with pytest.raises(ValueError):
+            DataVersion.decode("2." + version.encode()[2:])
+
+    def test_changes_since_version(self, served):
+        airports_db, ga_db, notifications_db = served
+        start = _source(served, "2026-01-01 10:00:00").current_version()
+
+        conn = sqlite3.connect(airports_db)
+        with conn:
+            conn.execute("INSERT INTO aip_entries_changes VALUES ('LFPT', 101, '2026-01-08 10:00:00')")
+            conn.execute("INSERT INTO airports_changes VALUES ('EDDF', 'name', '2026-01-08 10:00:00')")
+            # Recorded after the server loaded its data: not in this delta
+            conn.execute("INSERT INTO aip_entries_changes VALUES ('LOWI', 101, '2026-01-09 10:00:00')")
+        conn.close()
+        _write(ga_db, "EGMC", "good")
+        _write(notifications_db, "LFPT", "O/R")
+
+        source = _source(served, "2026-01-08 10:00:00")
+        delta = source.changes_since(start)
+        assert not delta.reset
+        assert (delta.airports, delta.ga, delta.notifications) == ({"LFPT", "EDDF"}, {"EGMC"}, {"LFPT"})
+
+        assert source.changes_since(delta.version).is_empty
+        assert _source(served, "2026-01-09 10:00:00").changes_since(delta.version).airports == {"LOWI"}
+
+    def test_reset_when_log_restarts_or_client_ahead(self, served):
+        airports_db, ga_db, notifications_db = served
+        version = _source(served, "2026-01-01 10:00:00").current_version()
+
+        assert _source(served, "2025-12-01 00:00:00").changes_since(version).reset
+
+        ga_db.unlink()
+        _make_derived_db(ga_db)
+        delta = _source(served, "2026-01-01 10:00:00").changes_since(version)
+        assert delta.reset and delta.version.ga.epoch != version.ga.epoch
@@ -0,0 +1,95 @@
+"""
+Tests for the offline bundle compiler (shared/offline_bundle.py).
+"""
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+from shared.offline_bundle import (
+    MANIFEST_NAME,
+    collect_airport_rows,
+    load_manifest,
+    write_bundles,
+)
+
+
+def _rows(fakes, lfpt_name: str = "Pontoise"):
+    airports = [
+        fakes.airport("LFPT", "FR", 49.1, 2.0, name=lfpt_name, procedures=["ILS 27"], entry=True),
+        fakes.airport("EGKB", "GB", 51.3, 0.03, entry=True),
+        fakes.airport("LFRG", "FR", 49.4, 0.2, entry=True),
+    ]
+    ga_service = fakes.GAService({
+        "LFPT": {
+            "features": {"ga_cost_score": 0.5}, "persona_scores": {"ifr": 0.9, "vfr": 0.4},
+            "review_count": 3, "last_review_utc": "2026-01-01", "tags": ["cheap"],
+            "summary_text": "Nice", "notification_hassle": None,
+        },
+        "EGKB": {
+            "features": {}, "persona_scores": {"ifr": 0.6, "vfr": 0.8},
+            "review_count": 1, "last_review_utc": None, "tags": None,
+            "summary_text": None, "notification_hassle": None,
+        },
+    })
+    notification_service = fakes.NotificationService({
+        "LFPT": fakes.notification_info(24, summary="PPR 24 HR", easiness=71.43),
+    })
+    return collect_airport_rows(airports, ga_service, notification_service)
+
+
+def _query(path: Path, sql: str, params=()):
+    conn = sqlite3.connect(path)
+    try:
+        return conn.execute(sql, params).fetchall()
+    finally:
+        conn.close()
+
+
+class TestOfflineBundle:
+    def test_bundle_contents_and_indexes(self, tmp_path, derived_data_fakes):
+        manifest = write_bundles(tmp_path, _rows(derived_data_fakes), version="1.abc", countries=["FR", "GB"])
+
+        assert manifest["version"] == "1.abc"
+        assert {k: v["airports"] for k, v in manifest["bundles"].items()} == {"all": 3, "FR": 2, "GB": 1}
+        assert load_manifest(tmp_path) == manifest
+
+        bundle = tmp_path / manifest["bundles"]["all"]["file"]
+        # Spatial index: airports in a bounding box around Paris
+        in_box = _query(
+            bundle,
+            "SELECT a.icao FROM airports_rtree r JOIN airports a ON a.rowid = r.id "
+            "WHERE r.min_lat >= 49 AND r.max_lat <= 50 AND r.min_lon >= 1 AND r.max_lon <= 3",
+        )
+        assert in_box == [("LFPT",)]
+        best_for_vfr = _query(
+            bundle, "SELECT icao FROM ga_persona_scores WHERE persona_id = 'vfr' ORDER BY score DESC"
+        )
+        assert best_for_vfr == [("EGKB",), ("LFPT",)]
+        assert _query(bundle, "SELECT icao, approach_type FROM procedure_lines") == [("LFPT", "ILS")]
+        assert _query(bundle, "SELECT icao, hours_notice, easiness_score FROM notifications") == [
+            ("LFPT", 24, 71.4)
+        ]
+        assert _query(bundle, "SELECT COUNT(*) FROM runways") == [(3,)]
+
+        fr = tmp_path / manifest["bundles"]["FR"]["file"]
+        assert _query(fr, "SELECT icao FROM airports ORDER BY icao") == [("LFPT",), ("LFRG",)]
+        assert _query(fr, "SELECT value FROM bundle_meta WHERE key = 'slice'") == [("FR",)]
+
+    def test_unchanged_slices_keep_hash(self, tmp_path, derived_data_fakes):
+        first = write_bundles(tmp_path, _rows(derived_data_fakes), version="1.a", countries=["FR", "GB"])
+        again = write_bundles(tmp_path, _rows(derived_data_fakes), version="1.b", countries=["FR", "GB"])
+        assert again["bundles"] == first["bundles"]
+
+        changed = write_bundles(tmp_path, _rows(derived_data_fakes, "Cormeilles"), version="1.c", countries=["FR", "GB"])
+        assert changed["bundles"]["GB"] == first["bundles"]["GB"]
+        assert changed["bundles"]["FR"]["sha256"] != first["bundles"]["FR"]["sha256"]
+        assert changed["bundles"]["all"]["file"] != first["bundles"]["all"]["file"]
+
+        # Files of the previous manifest survive one more build
+        files = lambda: {p.name for p in tmp_path.glob("*.db")}
+        assert first["bundles"]["FR"]["file"] in files()
+        write_bundles(tmp_path, _rows(derived_data_fakes, "Cormeilles"), version="1.d", countries=["FR", "GB"])
+        assert first["bundles"]["FR"]["file"] not in files()
+        assert files() == {entry["file"] for entry in changed["bundles"].values()}
+        assert (tmp_path / MANIFEST_NAME).exists()
@@ -0,0 +1,164 @@
+"""
+Tests for the step DAG runner used by tools/data_update.py (shared/pipeline_runner.py).
+"""
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from shared.pipeline_runner import (
+    BLOCKED,
+    FAILED,
+    OK,
+    RESUMED,
+    SKIPPED,
+    PipelineError,
+    PipelineRunner,
+    Step,
+)
+
+
+class Recorder:
+    """Step actions that log their calls and track peak concurrency."""
+
+    def __init__(self):
+        self.calls = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def action(self, name: str, seconds: float = 0.0, write: Path = None, fail: bool = False,
+               barrier: threading.Barrier = None):
+        def run():
+            with self._lock:
+                self.calls.append(name)
+                self.active += 1
+                self.peak = max(self.peak, self.active)
+            try:
+                if barrier is not None:
+                    # Only passes if the other parties are running at the same time
+                    barrier.wait()
+                time.sleep(seconds)
+                if fail:
+                    raise RuntimeError(f"{name} broke")
+                if write is not None:
+                    write.write_text(name)
+            finally:
+                with self._lock:
+                    self.active -= 1
+        return run
+
+
+def _statuses(report):
+    return {name: result.status for name, result in report.results.items()}
+
+
+def test_independent_steps_run_in_parallel(tmp_path):
+    rec = Recorder()
+    both_running = threading.Barrier(2, timeout=5)
+    a, b = tmp_path / "a.json", tmp_path / "b.json"
+    steps = [
+        Step("fetch-a", rec.action("fetch-a", write=a, barrier=both_running), outputs=[a], always_run=True),
+        Step("fetch-b", rec.action("fetch-b", write=b, barrier=both_running), outputs=[b], always_run=True),
+        Step("merge", rec.action("merge"), inputs=[a, b]),
+    ]
+    report = PipelineRunner(steps, tmp_path / "log.json").run("test")
+
+    # Run one after the other, the fetches would break the barrier and fail
+    assert report.success
+    assert not both_running.broken
+    assert rec.peak == 2
+    assert rec.calls[-1] == "merge"
+    assert report.critical_path[-1] == "merge" and len(report.critical_path) == 2
+
+
+def test_resource_limit_serializes(tmp_path):
+    rec = Recorder()
+    steps = [
+        Step(f"write-{i}", rec.action(f"write-{i}", 0.1), resources=["db"]) for i in range(3)
+    ]
+    PipelineRunner(steps, tmp_path / "log.json", resource_limits={"db": 1}).run()
+    assert rec.peak == 1
+
+    rec = Recorder()
+    steps = [
+        Step(f"write-{i}", rec.action(f"write-{i}", 0.2), resources=["db"]) for i in range(3)
+    ]
+    PipelineRunner(steps, tmp_path / "log.json", resource_limits={"db": 2}).run()
+    assert rec.peak == 2
+
+
+def test_skips_when_inputs_unchanged(tmp_path):
+    source, output = tmp_path / "source.txt", tmp_path / "out.txt"
+    source.write_text("v1")
+    rec = Recorder()
+
+    def runner(**kwargs):
+        step = Step("build", rec.action("build", write=output), inputs=[source], outputs=[output])
+        return PipelineRunner([step], tmp_path / "log.json", **kwargs)
+
+    assert _statuses(runner().run()) == {"build": OK}
+    assert _statuses(runner().run()) == {"build": SKIPPED}
+    assert _statuses(runner(force=True).run()) == {"build": OK}
+
+    source.write_text("v2")
+    assert _statuses(runner().run()) == {"build": OK}
+
+    output.unlink()
+    assert _statuses(runner().run()) == {"build": OK}
+    assert rec.calls == ["build"] * 4
+
+
+def test_failure_blocks_downstream_and_resume(tmp_path):
+    mid = tmp_path / "mid.txt"
+    rec = Recorder()
+    fail = {"value": True}
+
+    def flaky():
+        rec.calls.append("transform")
+        if fail["value"]:
+            raise RuntimeError("transform broke")
+        mid.write_text("ok")
+
+    def steps():
+        return [
+            Step("extract", rec.action("extract"), always_run=True),
+            Step("other", rec.action("other"), always_run=True),
+            Step("transform", flaky, after=["extract"], outputs=[mid], always_run=True),
+            Step("load", rec.action("load"), inputs=[mid]),
+        ]
+
+    log = tmp_path / "log.json"
+    report = PipelineRunner(steps(), log).run("nightly")
+    assert not report.success
+    assert _statuses(report) == {"extract": OK, "other": OK, "transform": FAILED, "load": BLOCKED}
+    assert "transform broke" in report.results["transform"].error
+
+    fail["value"] = False
+    rec.calls.clear()
+    report = PipelineRunner(steps(), log, resume=True).run("nightly")
+    assert report.success
+    assert _statuses(report) == {"extract": RESUMED, "other": RESUMED, "transform": OK, "load": OK}
+    assert rec.calls == ["transform", "load"]
+
+    # A different run name does not resume from this log
+    rec.calls.clear()
+    PipelineRunner(steps(), log, resume=True).run("other")
+    assert "extract" in rec.calls
+
+
+def test_invalid_graphs(tmp_path):
+    a, b = tmp_path / "a", tmp_path / "b"
+    noop = lambda: None
+    with pytest.raises(PipelineError, match="cycle"):
+        PipelineRunner(
+            [Step("x", noop, inputs=[a], outputs=[b]), Step("y", noop, inputs=[b], outputs=[a])],
+            tmp_path / "log.json",
+        )
+    with pytest.raises(PipelineError, match="unknown"):
+        PipelineRunner([Step("x", noop, after=["missing"])], tmp_path / "log.json")
+    with pytest.raises(PipelineError, match="Duplicate"):
+        PipelineRunner([Step("x", noop), Step("x", noop)], tmp_path / "log.json")
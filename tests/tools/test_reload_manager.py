@@ -0,0 +1,93 @@
+"""
+Tests for hot data reload (shared/reload_manager.py).
+"""
+from __future__ import annotations
+
+import asyncio
+import os
+from pathlib import Path
+
+from shared.reload_manager import ReloadManager, data_fingerprint
+
+
+def _touch(path: Path, content: str, mtime_ns: int) -> None:
+    path.write_text(content)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+class _Server:
+    """Loads the file content as snapshot; installs it as current."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.current = path.read_text()
+        self.fail = False
+
+    def load(self) -> str:
+        if self.fail:
+            raise ValueError("corrupt")
+        return self.path.read_text()
+
+    def install(self, snapshot: str) -> None:
+        self.current = snapshot
+
+
+class TestReloadManager:
+    def test_fingerprint(self, tmp_path):
+        db = tmp_path / "airports.db"
+        vectors = tmp_path / "vector_db"
+        vectors.mkdir()
+        _touch(db, "v1", 1_000)
+        _touch(vectors / "index.bin", "a", 1_000)
+        first = data_fingerprint([db, vectors, tmp_path / "missing.db"])
+        assert first[2] == (str(tmp_path / "missing.db"), None)
+        assert data_fingerprint([db, vectors, tmp_path / "missing.db"]) == first
+
+        # SQLite WAL and files added to a directory count as changes
+        _touch(tmp_path / "airports.db-wal", "log", 2_000)
+        assert data_fingerprint([db]) != first[:1]
+        _touch(vectors / "index2.bin", "b", 1_000)
+        assert data_fingerprint([vectors]) != first[1:2]
+
+    def test_reload_after_change_settles(self, tmp_path):
+        db = tmp_path / "airports.db"
+        _touch(db, "v1", 1_000)
+        server = _Server(db)
+        manager = ReloadManager([db], server.load, server.install, poll_seconds=0)
+
+        async def run():
+            assert await manager.check() is False
+            _touch(db, "v2", 2_000)
+            # Changed since the last check: wait for the next poll
+            assert await manager.check() is False
+            assert server.current == "v1"
+            assert await manager.check() is True
+            assert server.current == "v2"
+            assert await manager.check() is False
+
+        asyncio.run(run())
+        assert manager.status()["generation"] == 1
+
+    def test_failed_load_keeps_snapshot(self, tmp_path):
+        db = tmp_path / "airports.db"
+        _touch(db, "v1", 1_000)
+        server = _Server(db)
+        manager = ReloadManager([db], server.load, server.install, poll_seconds=0)
+
+        async def run():
+            server.fail = True
+            _touch(db, "broken", 2_000)
+            await manager.check()
+            assert await manager.check() is False
+            assert server.current == "v1"
+            assert "corrupt" in manager.status()["last_error"]
+            # Not retried until the files change again
+            server.fail = False
+            assert await manager.check() is False
+            _touch(db, "v3", 3_000)
+            await manager.check()
+            assert await manager.check() is True
+            assert server.current == "v3"
+            assert manager.status()["last_error"] is None
+
+        asyncio.run(run())
@@ -0,0 +1,156 @@
+"""
+Tests for the route corridor engine (shared/route_corridor.py).
+
+Synthetic airports cover the geometry; the real-model test checks parity with
+EuroAipModel.find_airports_near_route.
+"""
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from shared.route_corridor import EARTH_RADIUS_NM, RouteCorridor, get_route_corridor
+
+
+def _airport(ident: str, lat: float, lon: float) -> SimpleNamespace:
+    return SimpleNamespace(ident=ident, navpoint=SimpleNamespace(latitude=lat, longitude=lon))
+
+
+def _xyz(lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    lat, lon = np.radians(lats), np.radians(lons)
+    return np.column_stack((np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)))
+
+
+@pytest.fixture
+def equator_corridor() -> RouteCorridor:
+    # Route A(0,0) -> B(0,10) -> C(10,10); one degree of latitude is 60nm
+    return RouteCorridor([
+        _airport("AAAA", 0.0, 0.0),
+        _airport("BBBB", 0.0, 10.0),
+        _airport("CCCC", 10.0, 10.0),
+        _airport("NEAR", 0.5, 5.0),     # 30nm off leg 1, halfway
+        _airport("FAR1", 2.0, 5.0),     # 120nm off leg 1
+        _airport("LEG2", 5.0, 10.5),    # ~30nm off leg 2
+        _airport("PAST", 0.0, -0.5),    # 30nm before the start (off the end of leg 1)
+        _airport("DUPE", 0.0, 0.0),     # Same position as AAAA
+        SimpleNamespace(ident="NONAV", navpoint=None),
+    ])
+
+
+class TestRouteCorridor:
+
+    def test_corridor_distances(self, equator_corridor):
+        items = equator_corridor.find_airports_near_route(["AAAA", "BBBB", "CCCC"], 40.0)
+        by_ident = {i["airport"].ident: i for i in items}
+
+        assert "FAR1" not in by_ident
+        assert by_ident["NEAR"]["segment_distance_nm"] == pytest.approx(30.0, abs=0.5)
+        assert by_ident["NEAR"]["closest_segment"] == ["AAAA", "BBBB"]
+        assert by_ident["NEAR"]["enroute_distance_nm"] == pytest.approx(300.0, abs=1.0)
+        assert by_ident["LEG2"]["closest_segment"] == ["BBBB", "CCCC"]
+        assert by_ident["LEG2"]["enroute_distance_nm"] == pytest.approx(900.0, abs=2.0)
+        # Off the end of the first leg: distance to the endpoint, enroute 0
+        assert by_ident["PAST"]["segment_distance_nm"] == pytest.approx(30.0, abs=0.5)
+        assert by_ident["PAST"]["enroute_distance_nm"] == 0.0
+
+    def test_results_sorted_by_segment_distance(self, equator_corridor):
+        items = equator_corridor.find_airports_near_route(["AAAA", "BBBB", "CCCC"], 40.0)
+        distances = [i["segment_distance_nm"] for i in items]
+        assert distances == sorted(distances)
+
+    def test_enroute_limit_pushed_down(self, equator_corridor):
+        items = equator_corridor.find_airports_near_route(
+            ["AAAA", "BBBB", "CCCC"], 40.0, max_enroute_distance_nm=400.0
+        )
+        idents = {i["airport"].ident for i in items}
+        assert "NEAR" in idents
+        assert "LEG2" not in idents
+        assert "CCCC" not in idents
+
+    def test_origin_limit(self, equator_corridor):
+        items = equator_corridor.find_airports_near_route(
+            ["AAAA", "BBBB"], 40.0, max_origin_distance_nm=100.0
+        )
+        idents = {i["airport"].ident for i in items}
+        assert idents == {"AAAA", "DUPE", "PAST"}
+
+    def test_navpoint_and_unknown_route_points(self, equator_corridor):
+        start = SimpleNamespace(latitude=0.0, longitude=0.0, name="START")
+        items = equator_corridor.find_airports_near_route([start, "XXXX", "BBBB"], 40.0)
+        near = next(i for i in items if i["airport"].ident == "NEAR")
+        assert near["closest_segment"] == ["START", "BBBB"]
+
+    def test_single_point_route_is_radius(self, equator_corridor):
+        items = equator_corridor.find_airports_near_route(["AAAA"], 35.0)
+        assert {i["airport"].ident for i in items} == {"AAAA", "DUPE", "PAST"}
+
+    def test_matches_brute_force(self):
+        """Envelope pruning must not drop any airport found by brute force."""
+        rng = np.random.default_rng(42)
+        lats = rng.uniform(35.0, 70.0, 3000)
+        lons = rng.uniform(-15.0, 35.0, 3000)
+        airports = [_airport(f"X{i:04d}", la, lo) for i, (la, lo) in enumerate(zip(lats, lons))]
+        corridor = RouteCorridor(airports)
+
+        route = ["X0000", "X0001", "X0002", "X0003"]
+        items = corridor.find_airports_near_route(route, 60.0)
+        found = {i["airport"].ident for i in items}
+
+        # Brute force: sample each leg densely and take the min distance
+        route_xyz = _xyz(lats[:4], lons[:4])
+        t = np.linspace(0.0, 1.0, 2000)[:, None]
+        samples = np.concatenate([(1 - t) * route_xyz[i] + t * route_xyz[i + 1] for i in range(3)])
+        samples /= np.linalg.norm(samples, axis=1)[:, None]
+        cos_angle = np.clip(_xyz(lats, lons) @ samples.T, -1.0, 1.0)
+        min_nm = np.arccos(cos_angle.max(axis=1)) * EARTH_RADIUS_NM
+        expected = {airports[i].ident for i in np.nonzero(min_nm <= 59.0)[0]}
+
+        assert expected <= found
+
+    def test_multi_leg_matches_brute_force(self):
+        """Eight legs: same airports and distances as scanning every airport."""
+        rng = np.random.default_rng(7)
+        lats = rng.uniform(35.0, 70.0, 5000)
+        lons = rng.uniform(-15.0, 35.0, 5000)
+        airports = [_airport(f"Y{i:05d}", la, lo) for i, (la, lo) in enumerate(zip(lats, lons))]
+        corridor = RouteCorridor(airports)
+        route = [f"Y{i:05d}" for i in range(9)]
+
+        items = corridor.find_airports_near_route(route, 50.0)
+        by_ident = {i["airport"].ident: i for i in items}
+
+        points = _xyz(lats, lons)
+        route_xyz = _xyz(lats[:9], lons[:9])
+        t = np.linspace(0.0, 1.0, 1500)[:, None]
+        min_nm = np.full(len(airports), np.inf)
+        for leg in range(8):
+            samples = (1 - t) * route_xyz[leg] + t * route_xyz[leg + 1]
+            samples /= np.linalg.norm(samples, axis=1)[:, None]
+            cos_angle = np.clip(points @ samples.T, -1.0, 1.0)
+            min_nm = np.minimum(min_nm, np.arccos(cos_angle.max(axis=1)) * EARTH_RADIUS_NM)
+
+        assert {airports[i].ident for i in np.nonzero(min_nm <= 49.0)[0]} <= set(by_ident)
+        assert set(by_ident) <= {airports[i].ident for i in np.nonzero(min_nm <= 51.0)[0]}
+        for i in np.nonzero(min_nm <= 50.0)[0]:
+            item = by_ident.get(airports[i].ident)
+            if item is not None:
+                assert item["segment_distance_nm"] == pytest.approx(min_nm[i], abs=1.0)
+
+
+def test_corridor_parity_with_model(tool_context):
+    """Corridor results agree with EuroAipModel.find_airports_near_route."""
+    model = tool_context.model
+    route = ["EGTF", "LFPO", "LFMD"]
+    corridor = get_route_corridor(model)
+    assert get_route_corridor(model) is corridor
+
+    new = {i["airport"].ident: i for i in corridor.find_airports_near_route(route, 30.0)}
+    legacy = {i["airport"].ident: i for i in model.find_airports_near_route(route, 30.0)}
+
+    # Ignore airports sitting on the corridor edge (different earth radius / rounding)
+    core_new = {k for k, v in new.items() if v["segment_distance_nm"] < 29.0}
+    core_legacy = {k for k, v in legacy.items() if float(v.get("segment_distance_nm") or 0.0) < 29.0}
+    assert core_new <= set(legacy)
+    assert core_legacy <= set(new)
@@ -0,0 +1,171 @@
+"""
+Tests for the multi-stop route planner (shared/route_planner.py).
+
+Synthetic stop nodes cover the search; the real-context test runs the
+plan_multi_stop_route tool end to end.
+"""
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from shared.route_corridor import EARTH_RADIUS_NM
+from shared.route_planner import MAX_LEG_NM, ReachabilityGraph, StopNode, get_reachability_graph
+
+
+def _node(ident: str, lat: float, lon: float, **attrs) -> StopNode:
+    return StopNode(ident=ident, latitude=lat, longitude=lon, **attrs)
+
+
+@pytest.fixture
+def equator_graph() -> ReachabilityGraph:
+    # Along the equator one degree of longitude is 60nm
+    nodes = [
+        _node("S010", 0.0, 1.0),
+        _node("S020", 0.0, 2.0),
+        _node("S030", 0.0, 3.0),
+        _node("S040", 0.0, 4.0),
+        _node("S050", 0.0, 5.0),
+        _node("D025", 1.5, 2.5),    # Detour: reachable but off the direct line
+        _node("ISLE", 20.0, 20.0),  # Unreachable from anything
+    ]
+    return ReachabilityGraph(nodes, max_leg_nm=130.0)
+
+
+ORIGIN = _node("ORIG", 0.0, 0.0)
+DEST = _node("DEST", 0.0, 6.0)
+
+
+class TestReachabilityGraph:
+
+    def test_edges_within_range(self, equator_graph):
+        assert len(equator_graph) == 7
+        # S010..S050 link to neighbours 1 and 2 degrees away; ISLE has none
+        idx = {n.ident: i for i, n in enumerate(equator_graph.nodes)}
+        isle = idx["ISLE"]
+        assert equator_graph._indptr[isle + 1] - equator_graph._indptr[isle] == 0
+        assert np.all(equator_graph._distances <= 130.0)
+
+    def test_direct_when_in_range(self, equator_graph):
+        plan = equator_graph.plan(ORIGIN, _node("NEAR", 0.0, 2.0))
+        assert [n.ident for n in plan.nodes] == ["ORIG", "NEAR"]
+        assert plan.stops == []
+
+    def test_fewest_stops(self, equator_graph):
+        plan = equator_graph.plan(ORIGIN, DEST, objective="fewest_stops")
+        # 360nm with 130nm legs needs at least 3 legs (2 stops)
+        assert len(plan.stops) == 2
+        assert all(d <= 130.0 + 1e-6 for d in plan.leg_distances_nm)
+        assert plan.total_distance_nm == pytest.approx(360.0, abs=1.0)
+
+    def test_shortest_distance_prefers_straight_line(self, equator_graph):
+        plan = equator_graph.plan(ORIGIN, DEST, objective="shortest_distance")
+        assert "D025" not in [n.ident for n in plan.stops]
+        assert plan.total_distance_nm == pytest.approx(360.0, abs=1.0)
+
+    def test_max_stops(self, equator_graph):
+        assert equator_graph.plan(ORIGIN, DEST, max_stops=1) is None
+        plan = equator_graph.plan(ORIGIN, DEST, max_stops=2)
+        assert plan is not None and len(plan.stops) == 2
+
+    def test_unreachable(self, equator_graph):
+        assert equator_graph.plan(ORIGIN, _node("FARX", 0.0, 40.0)) is None
+
+    def test_unknown_objective(self, equator_graph):
+        with pytest.raises(ValueError):
+            equator_graph.plan(ORIGIN, DEST, objective="scenic")
+
+    def test_matches_exhaustive_bfs(self):
+        """Fewest-stops result agrees with a plain BFS on a random graph."""
+        rng = np.random.default_rng(3)
+        nodes = [
+            _node(f"R{i:04d}", la, lo)
+            for i, (la, lo) in enumerate(zip(rng.uniform(40, 55, 800), rng.uniform(-5, 20, 800)))
+        ]
+        graph = ReachabilityGraph(nodes, max_leg_nm=150.0)
+        origin, dest = _node("ORIG", 41.0, -4.0), _node("DEST", 54.0, 19.0)
+        plan = graph.plan(origin, dest)
+        assert plan is not None
+
+        # BFS over the same graph (origin/destination attached by distance)
+        from_origin = graph._distances_to(origin)
+        to_dest = graph._distances_to(dest)
+        frontier = set(np.nonzero(from_origin <= 150.0)[0].tolist())
+        seen = set(frontier)
+        legs = 1
+        while frontier and not any(to_dest[i] <= 150.0 for i in frontier):
+            nxt = set()
+            for i in frontier:
+                nxt.update(graph._indices[graph._indptr[i]:graph._indptr[i + 1]].tolist())
+            frontier = nxt - seen
+            seen |= frontier
+            legs += 1
+        assert len(plan.leg_distances_nm) == legs + 1
+
+    def test_edges_match_brute_force(self):
+        """Longitude pruning keeps exactly the pairs within range, also across the antimeridian."""
+        rng = np.random.default_rng(7)
+        lats = np.concatenate([rng.uniform(35, 70, 300), rng.uniform(60, 75, 50)])
+        lons = np.concatenate([rng.uniform(-10, 30, 300), rng.uniform(170, 190, 50)])
+        lons = (lons + 180.0) % 360.0 - 180.0
+        nodes = [_node(f"R{i:04d}", la, lo) for i, (la, lo) in enumerate(zip(lats, lons))]
+        graph = ReachabilityGraph(nodes, max_leg_nm=400.0)
+
+        xyz = graph._xyz
+        angles = np.arccos(np.clip(xyz @ xyz.T, -1.0, 1.0)) * EARTH_RADIUS_NM
+        np.fill_diagonal(angles, np.inf)
+        expected = set(zip(*np.nonzero(angles <= 400.0)))
+        edges = {
+            (i, int(j))
+            for i in range(len(graph))
+            for j in graph._indices[graph._indptr[i]:graph._indptr[i + 1]]
+        }
+        assert edges == expected
+
+    def test_leg_range_capped(self):
+        with pytest.raises(ValueError):
+            ReachabilityGraph([], max_leg_nm=MAX_LEG_NM + 1)
+
+
+class _Model:
+    """Weak-referenceable stand-in for the model (graphs are cached per model)."""
+
+
+def test_graph_cache_bounded_by_size(monkeypatch):
+    import shared.route_planner as route_planner
+
+    rng = np.random.default_rng(5)
+    airports = [
+        SimpleNamespace(ident=f"A{i:03d}", name=None, navpoint=SimpleNamespace(latitude=la, longitude=lo))
+        for i, (la, lo) in enumerate(zip(rng.uniform(45, 50, 200), rng.uniform(0, 5, 200)))
+    ]
+    model = _Model()
+    model.airports = airports
+    ctx = SimpleNamespace(model=model, notification_service=None)
+
+    first = get_reachability_graph(ctx, 100.0)
+    monkeypatch.setattr(route_planner, "GRAPH_CACHE_MAX_BYTES", first.nbytes + 1)
+    assert get_reachability_graph(ctx, 100.0) is first
+    get_reachability_graph(ctx, 120.0)
+    # Both do not fit the budget: the least recently used graph is evicted
+    assert get_reachability_graph(ctx, 100.0) is not first
+
+
+def test_plan_multi_stop_route_tool(tool_context):
+    from shared.airport_tools import plan_multi_stop_route
+
+    result = plan_multi_stop_route(
+        tool_context, "EGTF", "LGAV", max_leg_time_hours=3, aircraft_type="C172",
+        filters={"has_avgas": True},
+    )
+    assert result["found"]
+    assert result["route"][0] == "EGTF" and result["route"][-1] == "LGAV"
+    assert result["count"] == len(result["route"]) - 2 >= 1
+    max_leg = result["filter_profile"]["max_leg_distance_nm"]
+    assert all(leg["distance_nm"] <= max_leg + 0.1 for leg in result["legs"])
+    assert result["visualization"]["type"] == "route_with_markers"
+
+    missing = plan_multi_stop_route(tool_context, "EGTF", "LGAV", max_leg_time_hours=3)
+    assert missing["missing_info"][0]["key"] == "cruise_speed"
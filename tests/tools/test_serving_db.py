@@ -0,0 +1,144 @@
+"""
+Tests for the denormalized serving database (shared/serving_db.py).
+"""
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from shared.serving_db import ServingDB, build_serving_db
+
+
+@pytest.fixture
+def serving(tmp_path: Path, derived_data_fakes):
+    fakes = derived_data_fakes
+    path = tmp_path / "serving.db"
+    airports = [
+        fakes.airport("LFPT", "FR", 49.1, 2.0, runway_ft=5000, entry=True, avgas=True),
+        fakes.airport("EGKB", "GB", 51.3, 0.03, runway_ft=5900),
+        fakes.airport("LFRG", "FR", 49.4, 0.2, runway_ft=None),
+    ]
+    ga_service = fakes.GAService(
+        {
+            "LFPT": {
+                "features": {"ga_cost_score": 0.5}, "persona_scores": {"ifr_touring": 0.9, "vfr_budget": 0.4},
+                "review_count": 3, "last_review_utc": None, "tags": None,
+                "summary_text": "Nice", "notification_hassle": None,
+            },
+        },
+        hospitality={"LFPT": (2, 1), "LFRG": (1, 0)},
+    )
+    notification_service = fakes.NotificationService({
+        "LFPT": fakes.notification_info(24, summary="x" * 120),
+        "EGKB": fakes.notification_info(None, h24=True),
+    })
+    assert build_serving_db(path, airports, ga_service, notification_service, version="1.v") == 3
+    db = ServingDB(path)
+    yield db
+    db.close()
+
+
+class TestServingDB:
+    def test_meta_and_batches(self, serving):
+        assert serving.version == "1.v"
+        assert serving.personas == ["ifr_touring", "vfr_budget"]
+        assert serving.ga_summaries(["LFPT", "EGKB"])["LFPT"]["persona_scores"]["ifr_touring"] == 0.9
+        notifications = serving.notification_summaries(["LFPT", "EGKB", "LFRG"])
+        assert set(notifications) == {"LFPT", "EGKB"}
+        assert notifications["LFPT"]["summary"] == "x" * 100 + "..."
+        assert notifications["EGKB"]["is_h24"] is True
+
+    def test_query_filters_and_order(self, serving):
+        assert [r["ident"] for r in serving.query()] == ["EGKB", "LFPT", "LFRG"]
+        assert [r["ident"] for r in serving.query(country="FR")] == ["LFPT", "LFRG"]
+        assert [r["ident"] for r in serving.query(point_of_entry=False)] == ["EGKB", "LFRG"]
+        assert [r["ident"] for r in serving.query(fuel_type="avgas")] == ["LFPT"]
+        assert [r["ident"] for r in serving.query(hotel="vicinity")] == ["LFPT", "LFRG"]
+        assert [r["ident"] for r in serving.query(hotel="at_airport", restaurant="vicinity")] == ["LFPT"]
+        assert serving.query(hotel="unknown") == []
+        assert [r["ident"] for r in serving.query(bbox=(50.0, 49.0, 3.0, 1.0))] == ["LFPT"]
+        assert [r["ident"] for r in serving.query(limit=1, offset=1)] == ["LFPT"]
+
+        lfpt = serving.query(country="FR", limit=1)[0]
+        assert lfpt["point_of_entry"] == 1 and lfpt["runway_count"] == 1
+        assert lfpt["ga"]["review_count"] == 3 and lfpt["notification"]["hours_notice"] == 24
+        bare = serving.query(country="FR", limit=1, include_ga=False, include_notification=False)[0]
+        assert bare["ga"] is None and bare["notification"] is None
+
+    def test_denormalized_columns(self, serving):
+        rows = serving._execute(
+            "SELECT ident, max_notice_hours, score_vfr_budget FROM airport_serving ORDER BY ident"
+        )
+        assert [tuple(r) for r in rows] == [("EGKB", 0, None), ("LFPT", 24, 0.4), ("LFRG", None, None)]
+
+    @pytest.mark.parametrize("filters", [
+        {},
+        {"country": "FR"},
+        {"point_of_entry": True},
+        {"point_of_entry": False},
+        {"has_procedures": False},
+        {"has_aip_data": True},
+        {"has_hard_runway": False},
+        {"fuel_type": "avgas"},
+        {"country": "FR", "limit": 1, "offset": 1},
+    ])
+    def test_query_reads_index_in_order(self, serving, filters):
+        sql, params = serving._query_sql(**filters)
+        plan = " / ".join(row["detail"] for row in serving._execute(f"EXPLAIN QUERY PLAN {sql}", params))
+        assert "USING INDEX idx_serving_" in plan or "USING COVERING INDEX idx_serving_" in plan, plan
+        assert "TEMP B-TREE" not in plan, plan
+
+
+@pytest.fixture(scope="module")
+def list_branches(tool_context, tmp_path_factory):
+    """_list_airports with a model-only snapshot and with a serving database built from it."""
+    from web.server.api import airports as airports_api
+
+    path = tmp_path_factory.mktemp("serving") / "serving.db"
+    build_serving_db(
+        path,
+        tool_context.model.airports.all(),
+        tool_context.ga_friendliness_service,
+        tool_context.notification_service,
+    )
+    serving = ServingDB(path)
+    model_snapshot = airports_api._DataSnapshot(
+        tool_context.model, None, tool_context.ga_friendliness_service, tool_context.notification_service
+    )
+    yield airports_api._list_airports, model_snapshot, model_snapshot._replace(serving_db=serving)
+    serving.close()
+
+
+class TestServingParity:
+    """The airports list returns the same page from the serving database as from the model."""
+
+    @pytest.mark.parametrize("filters", [
+        {},
+        {"limit": 50, "offset": 200},
+        {"country": "FR"},
+        {"country": "FR", "limit": 25, "offset": 25},
+        {"country": "GB", "has_procedures": True},
+        {"has_procedures": False, "limit": 100, "offset": 100},
+        {"has_aip_data": True, "has_hard_runway": False},
+        {"point_of_entry": True},
+        {"point_of_entry": False, "country": "DE"},
+        {"fuel_type": "avgas"},
+        {"hotel": "vicinity"},
+        {"hotel": "at_airport", "restaurant": "vicinity"},
+        {"bounds": (52.0, 48.0, 3.0, -2.0), "limit": 100},
+        {"include_ga": False, "include_notification": False, "offset": 10},
+    ])
+    def test_same_airports_as_model(self, list_branches, filters):
+        list_airports, model_snapshot, serving_snapshot = list_branches
+        params = dict(
+            country=None, has_procedures=None, has_aip_data=None, has_hard_runway=None,
+            point_of_entry=None, fuel_type=None, hotel=None, restaurant=None,
+            aip_field=None, aip_value=None, aip_operator="contains",
+            limit=1000, offset=0, include_ga=True, include_notification=True, bounds=None,
+        )
+        params.update(filters)
+
+        expected = list_airports(model_snapshot, **params)
+        actual = list_airports(serving_snapshot, **params)
+        assert [a.model_dump() for a in actual] == [a.model_dump() for a in expected]
@@ -0,0 +1,93 @@
+"""
+Tests for single-flight request coalescing (shared/single_flight.py).
+"""
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from shared.single_flight import SingleFlight, single_flight_stats
+
+
+class TestSingleFlight:
+    def test_concurrent_threads_share_one_call(self):
+        group = SingleFlight("test.threads")
+        release = threading.Event()
+        calls = []
+
+        def compute():
+            calls.append(1)
+            release.wait(5)
+            return {"airports": ["LFPT"]}
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(group.do("key", compute)))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        while group.stats()["coalesced"] < 3:
+            time.sleep(0.001)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert all(result == ({"airports": ["LFPT"]}, True) for result in results)
+        assert single_flight_stats()["test.threads"] == {"executions": 1, "coalesced": 3}
+
+        # Finished calls are not cached
+        assert group.do("key", lambda: "again") == ("again", False)
+
+    def test_async_run_shares_result_and_errors(self):
+        group = SingleFlight("test.async")
+        calls = []
+
+        def compute(value):
+            calls.append(value)
+            threading.Event().wait(0.05)
+            if value == "bad":
+                raise ValueError("bad data")
+            return value
+
+        async def run():
+            first = await asyncio.gather(
+                group.run("a", lambda: compute("a")),
+                group.run("a", lambda: compute("a")),
+                group.run("b", lambda: compute("b")),
+            )
+            assert first == [("a", True), ("a", True), ("b", False)]
+
+            errors = await asyncio.gather(
+                group.run("bad", lambda: compute("bad")),
+                group.run("bad", lambda: compute("bad")),
+                return_exceptions=True,
+            )
+            assert all(isinstance(e, ValueError) for e in errors)
+
+        asyncio.run(run())
+        assert sorted(calls) == ["a", "b", "bad"]
+        assert group.stats() == {"executions": 3, "coalesced": 2}
+
+    def test_cancelled_leader_does_not_cancel_others(self):
+        group = SingleFlight("test.cancel")
+
+        def compute():
+            threading.Event().wait(0.05)
+            return 42
+
+        async def run():
+            leader = asyncio.ensure_future(group.run("k", compute))
+            await asyncio.sleep(0)
+            follower = asyncio.ensure_future(group.run("k", compute))
+            await asyncio.sleep(0)
+            leader.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await leader
+            assert await follower == (42, True)
+
+        asyncio.run(run())
@@ -9,6 +9,9 @@ Overview
 - Slices by airport(s), date/range, change type(s), fields, std_field_id, and country.
 - Outputs as a formatted table (default), CSV, or JSON.
 - If --since is omitted, defaults to the latest date with changes (that full day).
+- Rows are streamed newest first: each change table is read through an index on
+  (changed_at, airport_icao[, std_field_id]) and the per-table cursors are merged,
+  so CSV/JSON exports of multi-month ranges run in constant memory.
 
 Database path resolution
 - --database if provided
@@ -24,6 +27,14 @@ Key options
 - Country filter: --country-filter FR,GB (by airports.iso_country).
 - Output: --format table|csv|json; --group-by airport|field|none (table); --plain-text to disable colors.
 - Summary: --summary prints counts by type, top airports, and top fields (table format).
+- Paging: --limit N returns at most N rows and logs the cursor of the next page;
+  pass it back with --after CURSOR (keyset pagination, stable while new changes arrive).
+- HTTP: --serve [HOST:]PORT serves read-only change history at GET /changes
+  (query parameters: since, until, type, airport, country, field, std_field_id,
+  all_fields, limit, after, format=json|csv).
+- Indexes: --create-indexes adds the (changed_at, airport_icao) indexes the
+  queries above rely on (writes to the database; run once after a data build).
+  Without them queries still work, by scanning the change tables.
 - Field filtering: By default, skips low-value fields (Elevation/temp, Geoid undulation, Magnetic variation).
   Use --all-fields to include them.
 
@@ -40,15 +51,27 @@ Examples
     python tools/aipchange.py --aip --since latest --format json --output changes.json
 - Plain table (no colors):
     python tools/aipchange.py --aip --since latest --plain-text
+- Stream 6 months of changes to CSV (stdout), first page of 500 rows:
+    python tools/aipchange.py --aip --procedures --since 2025-01-01 --until 2025-07-01 --format csv --output - --limit 500
+- Serve change history:
+    python tools/aipchange.py --serve 127.0.0.1:8765
+    curl 'http://127.0.0.1:8765/changes?since=30d&type=aip,procedures&country=FR&limit=100'
+- Create the change table indexes once:
+    python tools/aipchange.py --create-indexes --since latest --summary
 """
 
 import sys
 import argparse
+import heapq
+import itertools
 import logging
 import os
 import sqlite3
 from datetime import datetime, timedelta
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from urllib.parse import parse_qs, urlparse
 from collections import defaultdict
 import csv
 import json
@@ -67,12 +90,24 @@ logger = logging.getLogger(__name__)
 # 205: Magnetic Variation / Annual Change
 SKIP_STD_FIELD_IDS = [203, 204, 205]
 
+# HTTP page size (default and maximum rows per /changes response)
+HTTP_DEFAULT_LIMIT = 1000
+HTTP_MAX_LIMIT = 10000
+
+CSV_COLUMNS = [
+    'airport_icao', 'change_type', 'changed_at', 'change_date',
+    'section', 'field', 'std_field', 'std_field_id', 'source',
+    'old_value', 'new_value'
+]
+
 CHANGE_TABLES = {
     'aip': {
         'table': 'aip_entries_changes',
         'date_col': 'changed_at',
+        'index_columns': ['changed_at', 'airport_icao', 'std_field_id'],
         'select': '''
             SELECT 
+                rowid AS change_id,
                 airport_icao,
                 {date_expr} AS change_date,
                 changed_at,
@@ -91,8 +126,10 @@ CHANGE_TABLES = {
     'procedures': {
         'table': 'procedures_changes',
         'date_col': 'changed_at',
+        'index_columns': ['changed_at', 'airport_icao'],
         'select': '''
             SELECT 
+                rowid AS change_id,
                 airport_icao,
                 {date_expr} AS change_date,
                 changed_at,
@@ -111,28 +148,32 @@ CHANGE_TABLES = {
     'runways': {
         'table': 'runways_changes',
         'date_col': 'changed_at',
+        'index_columns': ['changed_at', 'airport_icao'],
         'select': '''
             SELECT 
-                rc.airport_icao,
+                rowid AS change_id,
+                airport_icao,
                 {date_expr} AS change_date,
-                rc.changed_at,
+                changed_at,
                 'runways' AS change_type,
-                rc.field_name,
+                field_name,
                 NULL AS section,
-                rc.field_name AS field,
+                field_name AS field,
                 NULL AS std_field,
                 NULL AS std_field_id,
-                rc.source,
-                rc.old_value,
-                rc.new_value
-            FROM runways_changes rc
+                source,
+                old_value,
+                new_value
+            FROM runways_changes
         '''
     },
     'airport': {
         'table': 'airports_changes',
         'date_col': 'changed_at',
+        'index_columns': ['changed_at', 'airport_icao'],
         'select': '''
             SELECT 
+                rowid AS change_id,
                 airport_icao,
                 {date_expr} AS change_date,
                 changed_at,
@@ -150,6 +191,9 @@ CHANGE_TABLES = {
     }
 }
 
+# Tie-break between tables for rows with the same changed_at (part of the page cursor)
+CHANGE_TYPE_ORDER = list(CHANGE_TABLES)
+
 
 def _resolve_db_path(path: Optional[str]) -> str:
     if path is None or path == '':
@@ -162,12 +206,43 @@ def _resolve_db_path(path: Optional[str]) -> str:
     return path
 
 
-def _connect(db_path: str) -> sqlite3.Connection:
-    conn = sqlite3.connect(db_path)
+def _connect(db_path: str, read_only: bool = False) -> sqlite3.Connection:
+    if read_only:
+        conn = sqlite3.connect(f"{Path(db_path).resolve().as_uri()}?mode=ro", uri=True)
+    else:
+        conn = sqlite3.connect(db_path)
     conn.row_factory = sqlite3.Row
     return conn
 
 
+def _ensure_indexes(conn: sqlite3.Connection, types: Optional[Sequence[str]] = None) -> List[str]:
+    """
+    Create the (changed_at, airport_icao[, std_field_id]) index on each change table.
+
+    Date-range scans, newest-first ordering, MAX(changed_at) and keyset pages
+    all use it. Missing tables are skipped; on a read-only database a warning
+    is logged and queries fall back to table scans. Returns the indexes created.
+    """
+    tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    created: List[str] = []
+    for t in types or CHANGE_TABLES:
+        meta = CHANGE_TABLES[t]
+        name = f"idx_{meta['table']}_changed_at"
+        if meta['table'] not in tables or name in indexes:
+            continue
+        try:
+            conn.execute(f"CREATE INDEX {name} ON {meta['table']} ({', '.join(meta['index_columns'])})")
+        except sqlite3.OperationalError as e:
+            logger.warning(f"Could not create index {name} ({e}); {meta['table']} queries will scan the table")
+            continue
+        created.append(name)
+    if created:
+        conn.commit()
+        logger.info(f"Created change table indexes: {', '.join(created)}")
+    return created
+
+
 def _parse_relative_dates(since: Optional[str], until: Optional[str], conn: sqlite3.Connection, types: Sequence[str]) -> Tuple[Optional[str], Optional[str]]:
     """
     Interpret relative date tokens:
@@ -208,7 +283,8 @@ def _get_latest_change_date(conn: sqlite3.Connection, types: Sequence[str]) -> O
     dates: List[str] = []
     for t in types:
         meta = CHANGE_TABLES[t]
-        sql = f"SELECT DATE(MAX({meta['date_col']})) AS d FROM {meta['table']}"
+        # Bare MAX() subquery so SQLite answers it from the changed_at index
+        sql = f"SELECT DATE((SELECT MAX({meta['date_col']}) FROM {meta['table']})) AS d"
         row = conn.execute(sql).fetchone()
         if row and row['d']:
             dates.append(row['d'])
@@ -259,7 +335,55 @@ def _build_where_clauses(
     return where, params
 
 
-def _query_changes(
+def _encode_cursor(row: Dict[str, Any]) -> str:
+    """Page cursor for the position after `row`."""
+    return f"{row['changed_at']}|{row['change_type']}|{row['change_id']}"
+
+
+def _decode_cursor(cursor: str) -> Tuple[str, str, int]:
+    try:
+        changed_at, change_type, change_id = cursor.rsplit('|', 2)
+        if change_type not in CHANGE_TABLES:
+            raise ValueError(change_type)
+        return changed_at, change_type, int(change_id)
+    except ValueError:
+        raise ValueError(f"Invalid page cursor: {cursor!r}") from None
+
+
+def _keyset_clause(type_key: str, after: Tuple[str, str, int]) -> Tuple[str, List[Any]]:
+    """
+    Rows of one table that come after the cursor.
+
+    Order is changed_at DESC, then CHANGE_TYPE_ORDER, then rowid DESC, so
+    within a table only changed_at (and rowid for the cursor's own table)
+    need comparing -- a range condition the changed_at index serves.
+    """
+    changed_at, after_type, after_id = after
+    table = CHANGE_TABLES[type_key]['table']
+    col = f"{table}.{CHANGE_TABLES[type_key]['date_col']}"
+    rank, after_rank = CHANGE_TYPE_ORDER.index(type_key), CHANGE_TYPE_ORDER.index(after_type)
+    if rank > after_rank:
+        return f"{col} <= ?", [changed_at]
+    if rank < after_rank:
+        return f"{col} < ?", [changed_at]
+    return f"({col} < ? OR ({col} = ? AND {table}.rowid < ?))", [changed_at, changed_at, after_id]
+
+
+def _country_airports(conn: sqlite3.Connection, country_filter: Sequence[str]) -> str:
+    """Materialize the airports of the given countries once, for all change tables."""
+    conn.execute("CREATE TEMP TABLE IF NOT EXISTS change_filter_airports (icao TEXT PRIMARY KEY)")
+    conn.execute("DELETE FROM temp.change_filter_airports")
+    placeholders = ','.join(['?'] * len(country_filter))
+    conn.execute(
+        f"INSERT OR IGNORE INTO temp.change_filter_airports "
+        f"SELECT icao_code FROM airports WHERE iso_country IN ({placeholders})",
+        [c.strip().upper() for c in country_filter],
+    )
+    conn.commit()
+    return "temp.change_filter_airports"
+
+
+def _iter_changes(
     conn: sqlite3.Connection,
     types: Sequence[str],
     airports: Optional[Sequence[str]],
@@ -269,8 +393,22 @@ def _query_changes(
     std_field_ids: Optional[Sequence[int]] = None,
     country_filter: Optional[Sequence[str]] = None,
     skip_std_field_ids: Optional[Sequence[int]] = None,
-) -> List[Dict[str, Any]]:
-    all_rows: List[Dict[str, Any]] = []
+    after: Optional[str] = None,
+    limit: Optional[int] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream changes newest first (see CHANGE_TYPE_ORDER for ties).
+
+    One ordered cursor per change table, k-way merged; rows are fetched as
+    they are consumed, so memory does not grow with the date range.
+
+    Args:
+        after: Cursor from a previous page (_encode_cursor of its last row)
+        limit: Stop after this many rows
+    """
+    keyset = _decode_cursor(after) if after else None
+    country_table = _country_airports(conn, country_filter) if country_filter else None
+    streams = []
     for t in types:
         meta = CHANGE_TABLES[t]
         # Normalize date expression to a DATE() string for grouping/printing
@@ -288,25 +426,74 @@ def _query_changes(
             placeholders = ','.join(['?'] * len(skip_std_field_ids))
             extra_clauses.append(f"(std_field_id IS NULL OR std_field_id NOT IN ({placeholders}))")
             extra_params.extend(skip_std_field_ids)
-        # country filter via airports table
-        if country_filter:
-            placeholders = ','.join(['?'] * len(country_filter))
-            extra_clauses.append(
-                f"airport_icao IN (SELECT icao_code FROM airports WHERE iso_country IN ({placeholders}))"
-            )
-            extra_params.extend([c.strip().upper() for c in country_filter])
+        # country filter via the pre-built airport set
+        if country_table:
+            extra_clauses.append(f"airport_icao IN {country_table}")
+        if keyset:
+            clause, clause_params = _keyset_clause(t, keyset)
+            extra_clauses.append(clause)
+            extra_params.extend(clause_params)
         if extra_clauses:
             where = (where + (" AND " if where else "WHERE ") + " AND ".join(extra_clauses))
         sql = f"""
             {select_sql}
             {where}
-            ORDER BY changed_at DESC
+            ORDER BY {meta['table']}.{meta['date_col']} DESC, {meta['table']}.rowid DESC
         """
-        for row in conn.execute(sql, params + extra_params).fetchall():
-            all_rows.append(dict(row))
-    # Sort across types by changed_at desc
-    all_rows.sort(key=lambda r: r['changed_at'], reverse=True)
-    return all_rows
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        streams.append(dict(row) for row in conn.execute(sql, params + extra_params))
+
+    rank = {t: i for i, t in enumerate(CHANGE_TYPE_ORDER)}
+    merged = heapq.merge(
+        *streams,
+        key=lambda r: (r['changed_at'] or '', -rank[r['change_type']], r['change_id']),
+        reverse=True,
+    )
+    return itertools.islice(merged, limit) if limit is not None else merged
+
+
+def _query_changes(
+    conn: sqlite3.Connection,
+    types: Sequence[str],
+    airports: Optional[Sequence[str]],
+    since: Optional[str],
+    until: Optional[str],
+    fields: Optional[Sequence[str]],
+    std_field_ids: Optional[Sequence[int]] = None,
+    country_filter: Optional[Sequence[str]] = None,
+    skip_std_field_ids: Optional[Sequence[int]] = None,
+) -> List[Dict[str, Any]]:
+    """All matching changes as a list (see _iter_changes to stream)."""
+    return list(_iter_changes(
+        conn, types, airports, since, until, fields,
+        std_field_ids=std_field_ids,
+        country_filter=country_filter,
+        skip_std_field_ids=skip_std_field_ids,
+    ))
+
+
+class _PageTracker:
+    """Passes rows through, remembering the count and last row (for the next cursor)."""
+
+    def __init__(self, rows: Iterable[Dict[str, Any]], limit: Optional[int] = None):
+        self.rows = rows
+        self.limit = limit
+        self.count = 0
+        self.last: Optional[Dict[str, Any]] = None
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for row in self.rows:
+            self.count += 1
+            self.last = row
+            yield row
+
+    @property
+    def next_cursor(self) -> Optional[str]:
+        """Cursor of the next page, if this page was full."""
+        if self.limit is None or self.count < self.limit or self.last is None:
+            return None
+        return _encode_cursor(self.last)
 
 
 class _Ansi:
@@ -346,11 +533,21 @@ def _format_change_line(r: Dict[str, Any], c: _Ansi) -> str:
     return f"{ts}\t{type_str}\t{airport_str}\t{field_str}\t{old_v} {arrow} {new_v}"
 
 
-def _print_table(rows: List[Dict[str, Any]], group_by: str = 'airport', plain_text: bool = False) -> None:
+def _print_table(rows: Iterable[Dict[str, Any]], group_by: str = 'airport', plain_text: bool = False) -> None:
+    c = _Ansi(enabled=sys.stdout.isatty() and not plain_text)
+    if group_by == 'none':
+        # flat: printed as streamed
+        count = 0
+        for r in rows:
+            print(_format_change_line(r, c))
+            count += 1
+        if not count:
+            logger.info("No changes found.")
+        return
+    rows = list(rows)
     if not rows:
         logger.info("No changes found.")
         return
-    c = _Ansi(enabled=sys.stdout.isatty() and not plain_text)
     if group_by == 'airport':
         grouped: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
         for r in rows:
@@ -370,18 +567,15 @@ def _print_table(rows: List[Dict[str, Any]], group_by: str = 'airport', plain_te
             print(c.bold(header))
             for r in grouped[field]:
                 print(_format_change_line(r, c))
-    else:
-        # flat
-        for r in rows:
-            print(_format_change_line(r, c))
 
 
-def _print_summary(rows: List[Dict[str, Any]]) -> None:
-    total = len(rows)
+def _print_summary(rows: Iterable[Dict[str, Any]]) -> None:
+    total = 0
     by_type: Dict[str, int] = defaultdict(int)
     by_airport: Dict[str, int] = defaultdict(int)
     by_field: Dict[str, int] = defaultdict(int)
     for r in rows:
+        total += 1
         by_type[r['change_type']] += 1
         by_airport[r['airport_icao']] += 1
         field = r.get('field_name') or r.get('field') or ''
@@ -398,35 +592,202 @@ def _print_summary(rows: List[Dict[str, Any]]) -> None:
         print(f"  {f}: {n}")
 
 
-def _write_csv(rows: List[Dict[str, Any]], path: str) -> None:
-    with open(path, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.writer(f)
-        writer.writerow([
-            'airport_icao', 'change_type', 'changed_at', 'change_date',
-            'section', 'field', 'std_field', 'std_field_id', 'source',
-            'old_value', 'new_value'
-        ])
-        for r in rows:
-            writer.writerow([
-                r.get('airport_icao'),
-                r.get('change_type'),
-                r.get('changed_at'),
-                r.get('change_date'),
-                r.get('section'),
-                r.get('field'),
-                r.get('std_field'),
-                r.get('std_field_id'),
-                r.get('source'),
-                r.get('old_value'),
-                r.get('new_value'),
-            ])
-    logger.info(f"Wrote CSV to {path} ({len(rows)} rows)")
-
-
-def _write_json(rows: List[Dict[str, Any]], path: str) -> None:
-    with open(path, 'w', encoding='utf-8') as f:
-        json.dump(rows, f, indent=2, ensure_ascii=False)
-    logger.info(f"Wrote JSON to {path} ({len(rows)} rows)")
+def _stream_csv(rows: Iterable[Dict[str, Any]], out) -> int:
+    """Write rows as CSV to a text stream; returns the row count."""
+    writer = csv.writer(out)
+    writer.writerow(CSV_COLUMNS)
+    count = 0
+    for r in rows:
+        writer.writerow([r.get(col) for col in CSV_COLUMNS])
+        count += 1
+    return count
+
+
+def _stream_json(rows: Iterable[Dict[str, Any]], out) -> int:
+    """Write rows as a JSON array (same layout as json.dump indent=2), one row at a time."""
+    out.write('[')
+    count = 0
+    for r in rows:
+        out.write(',\n  ' if count else '\n  ')
+        out.write(json.dumps(r, indent=2, ensure_ascii=False).replace('\n', '\n  '))
+        count += 1
+    out.write('\n]' if count else ']')
+    return count
+
+
+def _write_stream(rows: Iterable[Dict[str, Any]], path: str, writer, label: str) -> None:
+    if path == '-':
+        count = writer(rows, sys.stdout)
+        sys.stdout.write('\n')
+    else:
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            count = writer(rows, f)
+    logger.info(f"Wrote {label} to {path} ({count} rows)")
+
+
+def _write_csv(rows: Iterable[Dict[str, Any]], path: str) -> None:
+    _write_stream(rows, path, _stream_csv, 'CSV')
+
+
+def _write_json(rows: Iterable[Dict[str, Any]], path: str) -> None:
+    _write_stream(rows, path, _stream_json, 'JSON')
+
+
+def _split_values(groups: Optional[Iterable[str]]) -> List[str]:
+    """Flatten comma-separated and repeated option values."""
+    values: List[str] = []
+    for grp in groups or []:
+        values.extend([v.strip() for v in grp.split(',') if v.strip()])
+    return values
+
+
+def _resolve_date_range(
+    since: Optional[str],
+    until: Optional[str],
+    conn: sqlite3.Connection,
+    types: Sequence[str],
+) -> Tuple[Optional[str], Optional[str]]:
+    """
+    [since, until) for a query: relative tokens resolved, a single day when
+    until is omitted, the latest change day when since is omitted.
+
+    Returns (None, None) when there are no changes at all. Raises ValueError
+    for a since/until that is neither a date nor a relative token.
+    """
+    since, until = _parse_relative_dates(since, until, conn, types)
+    if not since:
+        latest_date = _get_latest_change_date(conn, types)
+        if not latest_date:
+            return None, None
+        since = latest_date
+        logger.info(f"No --since provided, defaulting to latest change day: {since}")
+    d = _parse_date(since, 'since')
+    if until:
+        _parse_date(until, 'until')
+    else:
+        # if user provides a full date, default to that single day
+        until = (d + timedelta(days=1)).date().isoformat()
+    return since, until
+
+
+def _parse_date(value: str, name: str) -> datetime:
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        raise ValueError(
+            f"Invalid {name} {value!r}: use YYYY-MM-DD, today, yesterday, Nd or latest"
+        ) from None
+
+
+class _TextOut:
+    """Text-stream adapter over a binary socket file (UTF-8)."""
+
+    def __init__(self, raw):
+        self.raw = raw
+
+    def write(self, text: str) -> None:
+        self.raw.write(text.encode('utf-8'))
+
+
+class _ChangesHandler(BaseHTTPRequestHandler):
+    """GET /changes: read-only change history, streamed as JSON or CSV."""
+
+    db_path: str = ''
+
+    def do_GET(self) -> None:
+        url = urlparse(self.path)
+        if url.path.rstrip('/') != '/changes':
+            self._send_json_error(404, "Use /changes")
+            return
+        conn = _connect(self.db_path, read_only=True)
+        try:
+            self._send_changes(conn, parse_qs(url.query))
+        finally:
+            conn.close()
+
+    def _send_changes(self, conn: sqlite3.Connection, query: Dict[str, List[str]]) -> None:
+        def values(name: str) -> List[str]:
+            return _split_values(query.get(name))
+
+        def value(name: str) -> Optional[str]:
+            found = values(name)
+            return found[-1] if found else None
+
+        try:
+            types = values('type') or ['aip']
+            unknown = [t for t in types if t not in CHANGE_TABLES]
+            if unknown:
+                raise ValueError(f"Unknown type(s): {', '.join(unknown)}")
+            limit = int(value('limit') or HTTP_DEFAULT_LIMIT)
+            if not 1 <= limit <= HTTP_MAX_LIMIT:
+                raise ValueError(f"limit must be between 1 and {HTTP_MAX_LIMIT}")
+            fmt = value('format') or 'json'
+            if fmt not in ('json', 'csv'):
+                raise ValueError("format must be json or csv")
+            std_field_ids = [int(v) for v in values('std_field_id')] or None
+            after = value('after')
+            if after:
+                _decode_cursor(after)
+            since, until = _resolve_date_range(value('since'), value('until'), conn, types)
+        except ValueError as e:
+            self._send_json_error(400, str(e))
+            return
+
+        rows = _PageTracker([], limit)
+        if since:
+            rows = _PageTracker(_iter_changes(
+                conn=conn,
+                types=types,
+                airports=values('airport') or None,
+                since=since,
+                until=until,
+                fields=values('field') or None,
+                std_field_ids=std_field_ids,
+                country_filter=values('country') or None,
+                skip_std_field_ids=None if value('all_fields') in ('1', 'true') else SKIP_STD_FIELD_IDS,
+                after=after,
+                limit=limit,
+            ), limit)
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/csv; charset=utf-8' if fmt == 'csv' else 'application/json')
+        self.end_headers()
+        out = _TextOut(self.wfile)
+        if fmt == 'csv':
+            # Page with format=json to get cursors
+            _stream_csv(rows, out)
+        else:
+            out.write(f'{{"since": {json.dumps(since)}, "until": {json.dumps(until)}, "changes": ')
+            _stream_json(rows, out)
+            out.write(f', "next": {json.dumps(rows.next_cursor)}}}\n')
+
+    def _send_json_error(self, code: int, message: str) -> None:
+        body = json.dumps({"error": message}).encode('utf-8')
+        self.send_response(code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.info(f"{self.address_string()} {format % args}")
+
+
+def _make_server(db_path: str, host: str = '127.0.0.1', port: int = 8765) -> ThreadingHTTPServer:
+    handler = type('ChangesHandler', (_ChangesHandler,), {'db_path': db_path})
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def serve(db_path: str, address: str) -> None:
+    """Serve GET /changes on [HOST:]PORT until interrupted."""
+    host, _, port = address.rpartition(':')
+    server = _make_server(db_path, host or '127.0.0.1', int(port))
+    logger.info(f"Serving change history from {db_path} on http://{server.server_address[0]}:{server.server_address[1]}/changes")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
 
 
 def main():
@@ -448,12 +809,16 @@ def main():
     parser.add_argument('-f', '--fields', help='Filter by field name(s) (std_field for AIP; field_name for others). Comma-separated or repeatable.', nargs='*')
     parser.add_argument('--group-by', choices=['airport', 'field', 'none'], default='airport', help='Grouping for table output')
     parser.add_argument('--format', choices=['table', 'csv', 'json'], default='table', help='Output format')
-    parser.add_argument('--output', help='Output file for CSV/JSON formats')
+    parser.add_argument('--output', help='Output file for CSV/JSON formats (- for stdout)')
     parser.add_argument('--std-field-id', help='Filter AIP changes by std_field_id (comma-separated or repeatable)', nargs='*')
     parser.add_argument('--country-filter', help='Filter by ISO country code(s) (e.g. FR, GB). Comma-separated or repeatable.', nargs='*')
     parser.add_argument('--summary', help='Show summary counts instead of detailed rows (table format only)', action='store_true')
     parser.add_argument('--plain-text', help='Disable ANSI colors/styles in table output', action='store_true')
     parser.add_argument('--all-fields', help='Include all fields (do not skip low-value fields like magnetic variation)', action='store_true')
+    parser.add_argument('--limit', type=int, help='Return at most N rows (newest first) and log the cursor of the next page')
+    parser.add_argument('--after', help='Page cursor from a previous --limit run')
+    parser.add_argument('--serve', metavar='[HOST:]PORT', help='Serve read-only change history over HTTP (GET /changes)')
+    parser.add_argument('--create-indexes', help='Create the change table indexes if missing (writes to the database)', action='store_true')
     parser.add_argument('-v', '--verbose', help='Verbose output', action='store_true')
 
     args = parser.parse_args()
@@ -463,7 +828,16 @@ def main():
 
     # Resolve DB
     db_path = _resolve_db_path(args.database)
-    conn = _connect(db_path)
+    if args.create_indexes:
+        conn = _connect(db_path)
+        _ensure_indexes(conn)
+        conn.close()
+    conn = _connect(db_path, read_only=True)
+
+    if args.serve:
+        conn.close()
+        serve(db_path, args.serve)
+        return
 
     # Determine which types to include
     selected_types: List[str] = []
@@ -481,59 +855,23 @@ def main():
         selected_types = ['aip']
 
     # Normalize fields option
-    fields: Optional[List[str]] = None
-    if args.fields:
-        combined: List[str] = []
-        for grp in args.fields:
-            combined.extend([f.strip() for f in grp.split(',') if f.strip()])
-        fields = combined or None
-    std_field_ids: Optional[List[int]] = None
-    if args.std_field_id:
-        combined_ids: List[int] = []
-        for grp in args.std_field_id:
-            for part in grp.split(','):
-                part = part.strip()
-                if part.isdigit():
-                    combined_ids.append(int(part))
-        std_field_ids = combined_ids or None
-    country_filter: Optional[List[str]] = None
-    if args.country_filter:
-        combined_countries: List[str] = []
-        for grp in args.country_filter:
-            combined_countries.extend([c.strip().upper() for c in grp.split(',') if c.strip()])
-        country_filter = combined_countries or None
+    fields = _split_values(args.fields) or None
+    std_field_ids = [int(v) for v in _split_values(args.std_field_id) if v.isdigit()] or None
+    country_filter = [c.upper() for c in _split_values(args.country_filter)] or None
 
     # Date handling: default to latest change date across selected types
-    since = args.since
-    until = args.until
-    since, until = _parse_relative_dates(since, until, conn, selected_types)
+    try:
+        since, until = _resolve_date_range(args.since, args.until, conn, selected_types)
+    except ValueError as e:
+        parser.error(str(e))
     if not since:
-        latest_date = _get_latest_change_date(conn, selected_types)
-        if latest_date:
-            since = latest_date
-            # until is next day exclusive
-            try:
-                d = datetime.fromisoformat(latest_date)
-            except ValueError:
-                d = datetime.strptime(latest_date, '%Y-%m-%d')
-            until = (d + timedelta(days=1)).date().isoformat()
-            logger.info(f"No --since provided, defaulting to latest change day: {since}")
-        else:
-            logger.info("No changes found in database.")
-            print("No changes found.")
-            return
-    else:
-        if not until:
-            # if user provides a full date, default to that single day
-            try:
-                d = datetime.fromisoformat(since)
-            except ValueError:
-                d = datetime.strptime(since, '%Y-%m-%d')
-            until = (d + timedelta(days=1)).date().isoformat()
-
-    # Query
+        logger.info("No changes found in database.")
+        print("No changes found.")
+        return
+
+    # Query (streamed; only grouped table output holds all rows)
     skip_ids = None if args.all_fields else SKIP_STD_FIELD_IDS
-    rows = _query_changes(
+    rows = _PageTracker(_iter_changes(
         conn=conn,
         types=selected_types,
         airports=args.airports or None,
@@ -543,7 +881,9 @@ def main():
         std_field_ids=std_field_ids,
         country_filter=country_filter,
         skip_std_field_ids=skip_ids,
-    )
+        after=args.after,
+        limit=args.limit,
+    ), args.limit)
 
     # Output
     if args.format == 'table':
@@ -563,6 +903,9 @@ def main():
             sys.exit(1)
         _write_json(rows, args.output)
 
+    if rows.next_cursor:
+        logger.info(f"More changes may follow; next page: --after '{rows.next_cursor}'")
+
     conn.close()
 
 if __name__ == '__main__':
@@ -71,6 +71,7 @@ import json
 import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field, asdict
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
@@ -878,15 +879,16 @@ Format your response as JSON:
         if self.verbose:
             print(f"  Stage 2: Identifying outlier countries for each question...", file=sys.stderr)
 
+        # Outliers for all differing questions in one pass
+        outlier_results = self.answer_comparer.find_outliers(
+            [diff.question_id for diff in differences],
+            countries,
+            top_n=5
+        )
+
         # Build focused prompt with pre-identified differences
         diff_sections = []
-        for diff in differences:
-            # Find outliers for this question
-            outlier_result = self.answer_comparer.find_outliers_for_question(
-                diff.question_id,
-                countries,
-                top_n=5
-            )
+        for diff, outlier_result in zip(differences, outlier_results):
 
             section_lines = [
                 f"## Question: {diff.question_text}",
@@ -1283,6 +1285,20 @@ def parse_topics_file(file_path: Path) -> List[str]:
 # Main CLI
 # =============================================================================
 
+def run_concurrently(fn, items: List[Any], max_workers: int) -> List[Any]:
+    """
+    Call fn(index, item) for each item on a bounded thread pool.
+
+    Results are returned in input order; each call reports its own progress,
+    so partial output appears as soon as any item finishes.
+    """
+    if max_workers <= 1 or len(items) <= 1:
+        return [fn(i, item) for i, item in enumerate(items, 1)]
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [pool.submit(fn, i, item) for i, item in enumerate(items, 1)]
+        return [future.result() for future in futures]
+
+
 def cmd_identify(args, rules_manager, rules_rag):
     """Run identify command."""
     identifier = QuestionIdentifier(
@@ -1360,11 +1376,11 @@ def cmd_video_script(args, rules_manager, rules_rag, llm):
     output_dir = args.output_dir or (project_root / "tmp" / "video_scripts")
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    all_segments = []
     filter_method = getattr(args, 'filter_method', 'none')
     max_questions = getattr(args, 'max_questions', 10)
 
-    for i, topic in enumerate(topics, 1):
+    def process_topic(i: int, topic: str) -> Optional[VideoSegment]:
+        """Identify, filter and analyze one topic; writes its files as soon as it is done."""
         print(f"[{i}/{len(topics)}] Processing: {topic[:60]}...", file=sys.stderr)
 
         # Extract countries mentioned in topic
@@ -1384,7 +1400,7 @@ def cmd_video_script(args, rules_manager, rules_rag, llm):
 
         if not question_ids:
             print(f"  No matching questions found, skipping", file=sys.stderr)
-            continue
+            return None
 
         original_count = len(question_ids)
         print(f"  Found {original_count} questions", file=sys.stderr)
@@ -1418,8 +1434,6 @@ def cmd_video_script(args, rules_manager, rules_rag, llm):
         segment.questions_before_filter = original_count
         segment.questions_after_filter = len(question_ids)
 
-        all_segments.append(segment)
-
         # Save individual file
         safe_name = re.sub(r'[^\w\s-]', '', topic)[:50].strip().replace(' ', '_').lower()
 
@@ -1451,6 +1465,11 @@ def cmd_video_script(args, rules_manager, rules_rag, llm):
             }, f, indent=2, ensure_ascii=False)
 
         print(f"  Saved: {md_file.name}, {script_file.name}, {json_file.name}", file=sys.stderr)
+        return segment
+
+    # Topics are independent: run them concurrently (LLM calls dominate), keep input order
+    results = run_concurrently(process_topic, topics, args.concurrency)
+    all_segments = [segment for segment in results if segment is not None]
 
     # Save combined output
     if len(all_segments) > 1:
@@ -1564,7 +1583,7 @@ def cmd_cross_country(args, rules_manager, llm):
 
     print(f"Analyzing {len(question_ids)} questions...", file=sys.stderr)
 
-    for i, qid in enumerate(question_ids, 1):
+    def process_question(i: int, qid: str) -> None:
         q = rules_manager.question_map.get(qid, {})
         print(f"[{i}/{len(question_ids)}] {q.get('question_text', qid)[:60]}...", file=sys.stderr)
 
@@ -1591,6 +1610,8 @@ def cmd_cross_country(args, rules_manager, llm):
 
         print(f"  Saved: {md_file.name}", file=sys.stderr)
 
+    run_concurrently(process_question, question_ids, args.concurrency)
+
 
 def main():
     """Main entry point."""
@@ -1608,6 +1629,8 @@ def main():
                        help="LLM model (default: gpt-4o-mini)")
     parser.add_argument("--verbose", "-v", action="store_true",
                        help="Verbose output")
+    parser.add_argument("--concurrency", type=int, default=4,
+                       help="Topics/questions analyzed in parallel (default: 4)")
 
     subparsers = parser.add_subparsers(dest="command", help="Command to run")
 
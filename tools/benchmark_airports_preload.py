@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Benchmark the AIP metadata lookups of the GA friendliness build over every
+airport in airports.db.
+
+Compares the per-airport accessors (one query per field), the euro_aip
+model path (load_model + aip_fields_from_airport) and the preloaded maps
+the builder uses (preload + aip_fields_from_data), each from a fresh
+AirportsDatabaseSource. Reports how many airports get the same builder
+fields from the model and from the preload.
+
+Usage:
+    python tools/benchmark_airports_preload.py --airports-db data/airports.db
+    python tools/benchmark_airports_preload.py --repeat 5 --limit 500
+"""
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from shared.ga_friendliness import AirportsDatabaseSource
+from shared.ga_friendliness.builder import aip_fields_from_airport, aip_fields_from_data
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark AIP metadata lookups over airports.db",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument(
+        "--airports-db",
+        type=Path,
+        default=Path("data/airports.db"),
+        help="Path to airports.db (default: data/airports.db)",
+    )
+    parser.add_argument(
+        "--limit",
+        type=int,
+        help="Only look up the first N airports (default: all)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Timing runs per variant; the best is reported (default: 3)",
+    )
+    parser.add_argument(
+        "--skip-model",
+        action="store_true",
+        help="Skip the euro_aip model path (slow on large databases)",
+    )
+    return parser.parse_args()
+
+
+def best_of(repeat: int, run: Callable[[], Any]) -> Tuple[float, Any]:
+    """Fastest wall time over `repeat` runs, and the last run's result."""
+    best = float("inf")
+    result: Any = None
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        result = run()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def per_query(db_path: Path, icaos: List[str]) -> Dict[str, tuple]:
+    """Per-airport accessors without preload."""
+    source = AirportsDatabaseSource(db_path)
+    try:
+        return {
+            icao: (source.get_ifr_score(icao), source.get_hotel_info(icao), source.get_restaurant_info(icao))
+            for icao in icaos
+        }
+    finally:
+        source.close()
+
+
+def from_model(db_path: Path, icaos: List[str]) -> Optional[Dict[str, Optional[dict]]]:
+    """euro_aip model path; None if euro_aip is not available."""
+    source = AirportsDatabaseSource(db_path)
+    try:
+        results: Dict[str, Optional[dict]] = {}
+        for icao in icaos:
+            airport = source.get_airport(icao)
+            if source._euro_aip_model is False:
+                return None
+            results[icao] = aip_fields_from_airport(airport) if airport else None
+        return results
+    finally:
+        source.close()
+
+
+def from_preload(db_path: Path, icaos: List[str]) -> Dict[str, Optional[dict]]:
+    """Preloaded maps, as the builder reads them."""
+    source = AirportsDatabaseSource(db_path)
+    try:
+        results: Dict[str, Optional[dict]] = {}
+        for icao in icaos:
+            data = source.get_aip_data(icao)
+            results[icao] = aip_fields_from_data(*data) if data else None
+        return results
+    finally:
+        source.close()
+
+
+def main() -> int:
+    """Main entry point."""
+    args = parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    if not args.airports_db.exists():
+        print(f"Airports database not found: {args.airports_db}", file=sys.stderr)
+        return 1
+
+    source = AirportsDatabaseSource(args.airports_db)
+    icaos = sorted(icao for icao in source.get_all_icaos() if icao)
+    source.close()
+    if args.limit:
+        icaos = icaos[:args.limit]
+    print(f"{len(icaos)} airports from {args.airports_db}, best of {args.repeat}:")
+
+    timings: List[Tuple[str, float]] = []
+    seconds, _ = best_of(args.repeat, lambda: per_query(args.airports_db, icaos))
+    timings.append(("per-airport queries", seconds))
+
+    model_results = None
+    if not args.skip_model:
+        seconds, model_results = best_of(args.repeat, lambda: from_model(args.airports_db, icaos))
+        if model_results is None:
+            print("  euro_aip not available, skipping the model path")
+        else:
+            timings.append(("euro_aip model", seconds))
+
+    seconds, preload_results = best_of(args.repeat, lambda: from_preload(args.airports_db, icaos))
+    timings.append(("preload", seconds))
+
+    baseline = timings[0][1]
+    for name, seconds in timings:
+        print(
+            f"  {name:<22} {seconds * 1000:9.1f} ms  "
+            f"{seconds / max(1, len(icaos)) * 1e6:9.1f} us/airport  "
+            f"{baseline / seconds:6.1f}x"
+        )
+
+    if model_results is not None:
+        same = sum(model_results[icao] == preload_results[icao] for icao in icaos)
+        print(f"  Same builder fields as the model: {same}/{len(icaos)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Benchmark NotificationParser over every customs text (std_field_id 302)
+in airports.db.
+
+Compares the per-airport baseline (no cache) with parse_batch on a cold
+and a warm cache, and checks that all three give identical results.
+Regex-only: the LLM fallback is disabled so timings measure the parser.
+
+Usage:
+    python tools/benchmark_notification_parser.py --airports-db data/airports.db
+    python tools/benchmark_notification_parser.py --repeat 5 --cache-db /tmp/parse_cache.db
+"""
+
+import argparse
+import logging
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from shared.ga_notification_agent import NotificationParser, ParseCache
+from shared.ga_notification_agent.config import get_notification_config
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark notification parsing over airports.db",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument(
+        "--airports-db",
+        type=Path,
+        default=Path("data/airports.db"),
+        help="Path to airports.db (default: data/airports.db)",
+    )
+    parser.add_argument(
+        "--cache-db",
+        type=Path,
+        help="Persistent parse cache to use (default: a temporary file)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Timing runs per variant; the best is reported (default: 3)",
+    )
+    parser.add_argument(
+        "--config",
+        type=str,
+        default="default",
+        help="Config name to use (default: default)",
+    )
+    return parser.parse_args()
+
+
+def load_texts(airports_db: Path) -> List[Tuple[str, str]]:
+    """(icao, text) for every std_field_id 302 entry."""
+    conn = sqlite3.connect(airports_db)
+    try:
+        rows = conn.execute(
+            "SELECT airport_icao, value FROM aip_entries "
+            "WHERE std_field_id = 302 AND value IS NOT NULL ORDER BY airport_icao"
+        ).fetchall()
+    finally:
+        conn.close()
+    return [(icao, value) for icao, value in rows]
+
+
+def best_of(repeat: int, run: Callable[[], list]) -> Tuple[float, list]:
+    """Fastest wall time over `repeat` runs, and the last run's result."""
+    best = float("inf")
+    result: list = []
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        result = run()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main() -> int:
+    """Main entry point."""
+    args = parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    if not args.airports_db.exists():
+        print(f"Airports database not found: {args.airports_db}", file=sys.stderr)
+        return 1
+
+    airports = load_texts(args.airports_db)
+    if not airports:
+        print("No std_field_id 302 texts found", file=sys.stderr)
+        return 1
+    distinct = len({text for _, text in airports})
+    print(f"{len(airports)} texts ({distinct} distinct) from {args.airports_db}")
+
+    config = get_notification_config(args.config)
+
+    baseline_parser = NotificationParser(config=config, use_llm_fallback=False, use_cache=False)
+    baseline_seconds, expected = best_of(
+        args.repeat, lambda: [baseline_parser.parse(icao, text) for icao, text in airports]
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_path = args.cache_db or Path(tmp) / "parse_cache.db"
+
+        def cold_run() -> list:
+            cache = ParseCache(cache_path)
+            cache.clear()
+            parser = NotificationParser(config=config, use_llm_fallback=False, cache=cache)
+            try:
+                return parser.parse_batch(airports)
+            finally:
+                cache.close()
+
+        cold_seconds, cold = best_of(args.repeat, cold_run)
+
+        # Warm: a fresh process would start here, with only the on-disk cache
+        def warm_run() -> list:
+            cache = ParseCache(cache_path)
+            parser = NotificationParser(config=config, use_llm_fallback=False, cache=cache)
+            try:
+                return parser.parse_batch(airports)
+            finally:
+                cache.close()
+
+        warm_seconds, warm = best_of(args.repeat, warm_run)
+
+    expected_dump = [parsed.model_dump() for parsed in expected]
+    identical = (
+        [parsed.model_dump() for parsed in cold] == expected_dump
+        and [parsed.model_dump() for parsed in warm] == expected_dump
+    )
+
+    def report(label: str, seconds: float) -> None:
+        print(
+            f"  {label:<28} {seconds * 1000:9.1f} ms  "
+            f"{len(airports) / seconds:10.0f} texts/s  "
+            f"{baseline_seconds / seconds:6.1f}x"
+        )
+
+    print(f"Best of {args.repeat}:")
+    report("parse() per airport", baseline_seconds)
+    report("parse_batch, cold cache", cold_seconds)
+    report("parse_batch, warm cache", warm_seconds)
+    print(f"Results identical: {identical}")
+    return 0 if identical else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Benchmark rules retrieval: InMemoryVectorIndex.query vs ChromaDB
+Collection.query on the "aviation_rules" collection.
+
+Query vectors are stored embeddings with a little noise, so no embedding
+API calls are made. Each query runs unfiltered and with a country filter,
+and the top-k ids of both backends are compared.
+
+Usage:
+    python tools/benchmark_rules_index.py --vector-db cache/rules_vector_db
+    python tools/benchmark_rules_index.py --queries 500 --top-k 20 --countries FR,DE,GB
+"""
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from shared.aviation_agent.rules_rag import InMemoryVectorIndex
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark the in-memory rules index against ChromaDB",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument(
+        "--vector-db",
+        type=Path,
+        default=Path("cache/rules_vector_db"),
+        help="Path to the ChromaDB directory (default: cache/rules_vector_db)",
+    )
+    parser.add_argument(
+        "--queries",
+        type=int,
+        default=200,
+        help="Number of query vectors (default: 200)",
+    )
+    parser.add_argument(
+        "--top-k",
+        type=int,
+        default=10,
+        help="Results per query (default: 10)",
+    )
+    parser.add_argument(
+        "--countries",
+        type=str,
+        default="FR,DE",
+        help="Comma-separated countries for the filtered run (default: FR,DE)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Timing runs per variant; the best is reported (default: 3)",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Random seed for query sampling (default: 0)",
+    )
+    return parser.parse_args()
+
+
+def load_collection(vector_db: Path) -> Any:
+    """Open the aviation_rules collection of a local ChromaDB."""
+    import chromadb
+    from chromadb.config import Settings
+
+    client = chromadb.PersistentClient(
+        path=str(vector_db), settings=Settings(anonymized_telemetry=False)
+    )
+    return client.get_collection(name="aviation_rules", embedding_function=None)
+
+
+def sample_queries(index: InMemoryVectorIndex, count: int, seed: int) -> List[List[float]]:
+    """Stored embeddings plus small Gaussian noise."""
+    rng = np.random.default_rng(seed)
+    rows = rng.integers(0, len(index), size=count)
+    base = index._matrix[rows]
+    noise = rng.normal(scale=0.01, size=base.shape).astype(np.float32)
+    return (base + noise).tolist()
+
+
+def best_of(repeat: int, run: Callable[[], list]) -> Tuple[float, list]:
+    """Fastest wall time over `repeat` runs, and the last run's result."""
+    best = float("inf")
+    result: list = []
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        result = run()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def run_queries(source: Any, queries: List[List[float]], top_k: int, where: Optional[Dict[str, Any]]) -> list:
+    """One query() call per vector, as RulesRAG issues them."""
+    return [
+        source.query(
+            query_embeddings=[query],
+            n_results=top_k,
+            where=where,
+            include=["documents", "metadatas", "distances"],
+        )["ids"][0]
+        for query in queries
+    ]
+
+
+def main() -> int:
+    """Main entry point."""
+    args = parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    if not args.vector_db.exists():
+        print(f"Vector database not found: {args.vector_db}", file=sys.stderr)
+        return 1
+
+    collection = load_collection(args.vector_db)
+    start = time.perf_counter()
+    index = InMemoryVectorIndex.from_collection(collection)
+    export_seconds = time.perf_counter() - start
+    if not len(index):
+        print("Collection is empty", file=sys.stderr)
+        return 1
+    print(
+        f"{len(index)} vectors, dim {index.dimension}, space {index.space} "
+        f"(exported in {export_seconds * 1000:.0f} ms) from {args.vector_db}"
+    )
+
+    queries = sample_queries(index, args.queries, args.seed)
+    countries = [c.strip().upper() for c in args.countries.split(",") if c.strip()]
+    filters = [("unfiltered", None)]
+    if countries:
+        filters.append((f"country in {','.join(countries)}", {"country_code": {"$in": countries}}))
+
+    print(f"{len(queries)} queries, top {args.top_k}, best of {args.repeat}:")
+    for label, where in filters:
+        chroma_seconds, expected = best_of(
+            args.repeat, lambda: run_queries(collection, queries, args.top_k, where)
+        )
+        index_seconds, actual = best_of(
+            args.repeat, lambda: run_queries(index, queries, args.top_k, where)
+        )
+        same_ids = sum(set(a) == set(e) for a, e in zip(actual, expected))
+        same_order = sum(a == e for a, e in zip(actual, expected))
+
+        print(f"  {label}")
+        for name, seconds in (("Collection.query", chroma_seconds), ("InMemoryVectorIndex.query", index_seconds)):
+            print(
+                f"    {name:<28} {seconds * 1000:9.1f} ms  "
+                f"{seconds / len(queries) * 1e6:9.1f} us/query  "
+                f"{chroma_seconds / seconds:6.1f}x"
+            )
+        print(f"    Same top-{args.top_k} ids: {same_ids}/{len(queries)}, same order: {same_order}/{len(queries)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -87,6 +87,24 @@ def parse_args() -> argparse.Namespace:
         default="https://airfield.directory/airfield",
         help="Base URL for airfield.directory API (default: https://airfield.directory/airfield)",
     )
+    source_group.add_argument(
+        "--download-workers",
+        type=int,
+        default=8,
+        help="Concurrent downloads with --download-api (default: 8)",
+    )
+    source_group.add_argument(
+        "--download-rps",
+        type=float,
+        default=10.0,
+        help="Max API requests per second with --download-api (default: 10)",
+    )
+    source_group.add_argument(
+        "--stream",
+        action="store_true",
+        help="Stream --export/--csv through an on-disk per-ICAO offset index "
+             "instead of loading the whole file (bounded memory)",
+    )
     source_group.add_argument(
         "--airports-db",
         type=Path,
@@ -150,6 +168,12 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Update only AIP-derived fields (IFR, night, hotel, restaurant) without processing reviews. Much faster than full rebuild. Requires --airports-db.",
     )
+    proc_group.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for per-airport computation (default: 1, in-process)",
+    )
     
     # LLM options
     llm_group = parser.add_argument_group("LLM options")
@@ -169,6 +193,28 @@ def parse_args() -> argparse.Namespace:
         type=str,
         help="OpenAI API key (defaults to OPENAI_API_KEY env var)",
     )
+    llm_group.add_argument(
+        "--llm-concurrency",
+        type=int,
+        default=4,
+        help="Max concurrent LLM extraction calls (default: 4)",
+    )
+    llm_group.add_argument(
+        "--llm-rpm",
+        type=float,
+        help="Rate limit for LLM calls in requests per minute (default: unlimited)",
+    )
+    llm_group.add_argument(
+        "--pack-reviews",
+        type=int,
+        default=1,
+        help="Pack up to N short reviews into one LLM call (default: 1, no packing)",
+    )
+    llm_group.add_argument(
+        "--no-llm-cache",
+        action="store_true",
+        help="Ignore cached extractions/summaries and always call the LLM",
+    )
     
     # Failure handling
     parser.add_argument(
@@ -215,6 +261,8 @@ def create_source(args: argparse.Namespace) -> "ReviewSource":
             filter_ai_generated=True,
             max_cache_age_days=7,
             base_url=args.api_base_url,
+            max_workers=args.download_workers,
+            requests_per_second=args.download_rps,
         )
         if args.force_refresh:
             source.set_force_refresh(True)
@@ -228,6 +276,7 @@ def create_source(args: argparse.Namespace) -> "ReviewSource":
         source = AirfieldDirectorySource(
             cache_dir=args.cache_dir,
             export_path=args.export,
+            streaming=args.stream,
         )
         if args.force_refresh:
             source.set_force_refresh(True)
@@ -238,7 +287,7 @@ def create_source(args: argparse.Namespace) -> "ReviewSource":
             logger.error(f"CSV file not found: {args.csv}")
             sys.exit(1)
         
-        sources.append(CSVReviewSource(args.csv))
+        sources.append(CSVReviewSource(args.csv, streaming=args.stream))
     
     if args.json_dir:
         if not args.json_dir.exists():
@@ -287,6 +336,11 @@ def main() -> int:
         llm_model=args.llm_model,
         llm_api_key=args.api_key,
         use_mock_llm=args.mock_llm,
+        llm_concurrency=args.llm_concurrency,
+        llm_requests_per_minute=args.llm_rpm,
+        llm_pack_reviews=args.pack_reviews,
+        llm_cache_enabled=not args.no_llm_cache,
+        build_workers=args.workers,
         failure_mode=args.failure_mode,
         source_version=f"build-{datetime.now().strftime('%Y%m%d')}",
     )
@@ -475,6 +529,11 @@ def main() -> int:
         print(f"Skipped: {result.metrics.skipped_airports}")
         print(f"Total reviews: {result.metrics.total_reviews}")
         print(f"Total extractions: {result.metrics.total_extractions}")
+        if result.metrics.llm_cache_hits or result.metrics.llm_cache_misses:
+            print(
+                f"LLM cache: {result.metrics.llm_cache_hits} hits, "
+                f"{result.metrics.llm_cache_misses} misses"
+            )
         if result.metrics.duration_seconds:
             print(f"Duration: {result.metrics.duration_seconds:.1f} seconds")
         
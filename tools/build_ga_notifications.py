@@ -27,9 +27,16 @@ Usage:
     # Changed-only: only process airports where AIP text changed
     python tools/build_ga_notifications.py --changed
 
-    # Force rebuild specific airports (even if unchanged)
+    # Force rebuild specific airports (even if unchanged; re-parses instead of
+    # reading the parse cache, and stores the new results)
     python tools/build_ga_notifications.py --icaos LFRG --force
 
+    # Pipelined full rebuild: regex on all CPUs, 8 concurrent LLM calls
+    python tools/build_ga_notifications.py --workers 0 --llm-concurrency 8 --delay 0.1
+
+    # Re-parse everything, ignoring previously cached parse results
+    python tools/build_ga_notifications.py --no-parse-cache
+
 Configuration:
     Uses configs/ga_notification_agent/default.json for behavior settings.
     Set OPENAI_API_KEY environment variable for LLM fallback on complex rules.
@@ -37,6 +44,7 @@ Configuration:
 
 import argparse
 import logging
+import os
 import sys
 from pathlib import Path
 
@@ -46,6 +54,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from shared.ga_notification_agent import NotificationParser
 from shared.ga_notification_agent.batch_processor import NotificationBatchProcessor
 from shared.ga_notification_agent.config import get_notification_config
+from shared.ga_notification_agent.parse_cache import ParseCache
 
 logging.basicConfig(
     level=logging.INFO,
@@ -118,7 +127,8 @@ def parse_args() -> argparse.Namespace:
     proc_group.add_argument(
         "--force", "-f",
         action="store_true",
-        help="Force reprocessing even if data unchanged (use with --icaos)",
+        help="Force reprocessing even if data unchanged (use with --icaos); "
+             "parse results are recomputed, not read from the parse cache",
     )
     proc_group.add_argument(
         "--delay",
@@ -126,6 +136,35 @@ def parse_args() -> argparse.Namespace:
         default=0.5,
         help="Delay between processing (seconds, default: 0.5)",
     )
+    proc_group.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Processes for regex parsing (0 = all CPUs; >1 enables pipelined mode)",
+    )
+    proc_group.add_argument(
+        "--llm-concurrency",
+        type=int,
+        default=1,
+        help="Concurrent LLM fallback calls (>1 enables pipelined mode)",
+    )
+    proc_group.add_argument(
+        "--batch-size",
+        type=int,
+        default=100,
+        help="Airports written per database commit (default: 100)",
+    )
+    proc_group.add_argument(
+        "--parse-cache",
+        type=Path,
+        default=Path("data/ga_notifications_parse_cache.db"),
+        help="Parse result cache, reused across runs (default: data/ga_notifications_parse_cache.db)",
+    )
+    proc_group.add_argument(
+        "--no-parse-cache",
+        action="store_true",
+        help="Parse every text, without reading or writing the parse cache",
+    )
     proc_group.add_argument(
         "--config",
         type=str,
@@ -253,9 +292,12 @@ def main() -> int:
     args.output.parent.mkdir(parents=True, exist_ok=True)
 
     # Create processor
+    parse_cache = None if args.no_parse_cache else ParseCache(args.parse_cache, refresh=args.force)
     processor = NotificationBatchProcessor(
         output_db_path=args.output,
         config=config,
+        parse_cache=parse_cache,
+        use_parse_cache=not args.no_parse_cache,
     )
 
     # Process airports
@@ -267,6 +309,9 @@ def main() -> int:
             limit=args.limit,
             delay=args.delay,
             mode=mode,
+            workers=args.workers or os.cpu_count() or 1,
+            llm_concurrency=args.llm_concurrency,
+            batch_size=args.batch_size,
         )
 
         # Print summary
@@ -279,6 +324,10 @@ def main() -> int:
         print(f"Skipped (no rules): {stats['skipped']}")
         if stats.get('unchanged'):
             print(f"Unchanged (skipped): {stats['unchanged']}")
+        print(f"LLM calls: {stats['llm_calls']}")
+        if parse_cache is not None:
+            print(f"Parse cache: {len(parse_cache)} entries ({args.parse_cache})")
+        print(f"Elapsed: {stats['elapsed_seconds']}s ({stats['airports_per_second']} airports/s, {stats['commits']} commits)")
         print(f"Output: {args.output}")
 
         return 0 if stats['failed'] == 0 else 1
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+CLI tool for building the offline data bundles for the mobile apps.
+
+Compiles airports, runways, procedure lines, GA persona scores and
+notification summaries into indexed SQLite bundles plus a manifest.json
+with hashes (see shared/offline_bundle.py). Served by the web server from
+OFFLINE_BUNDLE_DIR at /api/sync/bundle.
+
+Usage:
+    # All airports plus one slice per country
+    python tools/build_offline_bundle.py
+
+    # Only some country slices
+    python tools/build_offline_bundle.py --countries FR,GB,DE
+
+    # Single bundle with all airports
+    python tools/build_offline_bundle.py --no-country-slices
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from shared.offline_bundle import collect_airport_rows, write_bundles
+from shared.serving_db import load_snapshot
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Build offline data bundles for the mobile apps",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+
+    # Source options
+    source_group = parser.add_argument_group("Source options")
+    source_group.add_argument(
+        "--airports-db",
+        type=Path,
+        default=Path("data/airports.db"),
+        help="Path to airports.db source database (default: data/airports.db)",
+    )
+    source_group.add_argument(
+        "--ga-persona-db",
+        type=Path,
+        default=Path("data/ga_persona.db"),
+        help="Path to ga_persona.db (default: data/ga_persona.db; skipped if missing)",
+    )
+    source_group.add_argument(
+        "--notifications-db",
+        type=Path,
+        default=Path("data/ga_notifications.db"),
+        help="Path to ga_notifications.db (default: data/ga_notifications.db; skipped if missing)",
+    )
+
+    # Output options
+    output_group = parser.add_argument_group("Output options")
+    output_group.add_argument(
+        "--output", "-o",
+        type=Path,
+        default=Path("data/bundles"),
+        help="Bundle directory (default: data/bundles)",
+    )
+    output_group.add_argument(
+        "--countries",
+        type=str,
+        help="Comma-separated ISO country codes to slice (default: every country)",
+    )
+    output_group.add_argument(
+        "--no-country-slices",
+        action="store_true",
+        help="Only build the bundle with all airports",
+    )
+    output_group.add_argument(
+        "--procedure-distance",
+        type=float,
+        default=10.0,
+        help="Procedure line length in nautical miles (default: 10)",
+    )
+
+    parser.add_argument(
+        "--verbose", "-v",
+        action="store_true",
+        help="Verbose output",
+    )
+
+    return parser.parse_args()
+
+
+def main() -> int:
+    """Main entry point."""
+    args = parse_args()
+
+    if args.verbose:
+        logging.getLogger().setLevel(logging.DEBUG)
+
+    if not args.airports_db.exists():
+        logger.error(f"Airports database not found: {args.airports_db}")
+        return 1
+
+    context, version = load_snapshot(args.airports_db, args.ga_persona_db, args.notifications_db)
+    if not context.ga_friendliness_service:
+        logger.warning(f"GA persona database not available ({args.ga_persona_db}), no GA scores")
+    if not context.notification_service:
+        logger.warning(f"Notifications database not available ({args.notifications_db}), no notifications")
+
+    rows = collect_airport_rows(
+        context.model.airports.all(),
+        ga_service=context.ga_friendliness_service,
+        notification_service=context.notification_service,
+        procedure_distance_nm=args.procedure_distance,
+    )
+
+    if args.no_country_slices:
+        countries = []
+    elif args.countries:
+        countries = [c.strip().upper() for c in args.countries.split(",") if c.strip()]
+    else:
+        countries = sorted({r.country for r in rows if r.country})
+
+    manifest = write_bundles(args.output, rows, version=version.encode(), countries=countries)
+    logger.info(
+        f"Wrote {len(manifest['bundles'])} bundles for {len(rows)} airports to {args.output} "
+        f"(version {manifest['version']})"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
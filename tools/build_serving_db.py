@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+CLI tool for compiling the web API's serving database.
+
+Denormalizes airports.db, ga_persona.db and ga_notifications.db into one row
+per airport (summary fields, persona scores, hospitality codes, notification
+summary) so the airports API answers from a single indexed table (see
+shared/serving_db.py). The web server uses it from SERVING_DB when its data
+version matches the loaded data.
+
+Usage:
+    python tools/build_serving_db.py
+    python tools/build_serving_db.py --output /srv/flyfun/serving.db
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from shared.serving_db import build_serving_db, load_snapshot
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Compile the web API serving database",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+
+    # Source options
+    source_group = parser.add_argument_group("Source options")
+    source_group.add_argument(
+        "--airports-db",
+        type=Path,
+        default=Path("data/airports.db"),
+        help="Path to airports.db source database (default: data/airports.db)",
+    )
+    source_group.add_argument(
+        "--ga-persona-db",
+        type=Path,
+        default=Path("data/ga_persona.db"),
+        help="Path to ga_persona.db (default: data/ga_persona.db; skipped if missing)",
+    )
+    source_group.add_argument(
+        "--notifications-db",
+        type=Path,
+        default=Path("data/ga_notifications.db"),
+        help="Path to ga_notifications.db (default: data/ga_notifications.db; skipped if missing)",
+    )
+
+    # Output options
+    parser.add_argument(
+        "--output", "-o",
+        type=Path,
+        default=Path("data/serving.db"),
+        help="Output database path (default: data/serving.db)",
+    )
+    parser.add_argument(
+        "--verbose", "-v",
+        action="store_true",
+        help="Verbose output",
+    )
+
+    return parser.parse_args()
+
+
+def main() -> int:
+    """Main entry point."""
+    args = parse_args()
+
+    if args.verbose:
+        logging.getLogger().setLevel(logging.DEBUG)
+
+    if not args.airports_db.exists():
+        logger.error(f"Airports database not found: {args.airports_db}")
+        return 1
+
+    context, version = load_snapshot(args.airports_db, args.ga_persona_db, args.notifications_db)
+    if not context.ga_friendliness_service:
+        logger.warning(f"GA persona database not available ({args.ga_persona_db}), no GA data")
+    if not context.notification_service:
+        logger.warning(f"Notifications database not available ({args.notifications_db}), no notifications")
+
+    count = build_serving_db(
+        args.output,
+        context.model.airports.all(),
+        ga_service=context.ga_friendliness_service,
+        notification_service=context.notification_service,
+        version=version.encode(),
+    )
+    logger.info(f"Wrote {count} airports to {args.output} (version {version.encode()})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
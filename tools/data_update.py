@@ -8,13 +8,30 @@ Consolidates all data update commands for different update schedules:
   - autorouter: Fetch AIP from autorouter for given countries → syncs derived data
   - aip:        Sync all AIP-derived data (notifications, hospitality fields)
   - reviews:    Update GA friendliness from reviews (run weekly/monthly)
+  - weekly:     web + reviews in one pipeline
+
+Modes run as a step DAG (shared/pipeline_runner.py): independent steps run in
+parallel (e.g. France/UK/Norway downloads, notifications vs GA persona sync),
+steps whose input files are unchanged since their last run are skipped, and
+per-step timings go to tmp/pipeline/run_log.json (--resume continues a failed
+run, --force disables skipping). Every pipeline ends by recompiling, when any
+database changed, the web API's serving database (data/serving.db) and the
+offline bundles for the mobile apps (data/bundles).
+
+AIP-derived data is synced incrementally from the change feed in airports.db
+(aip_entries_changes, procedures_changes): each derived database stores a
+high-water mark and only airports changed since then are reprocessed. Use
+--full (or ICAO prefixes) to process whole scopes instead.
 
 Usage:
     python tools/data_update.py initial           # Full initial build
     python tools/data_update.py web               # Fetch web sources + sync derived
     python tools/data_update.py autorouter ED LO  # Fetch autorouter + sync derived
     python tools/data_update.py aip               # Sync AIP-derived data only
+    python tools/data_update.py aip --full        # Rebuild AIP-derived data
     python tools/data_update.py reviews           # Update reviews/GA friendliness
+    python tools/data_update.py weekly --jobs 6   # Web + derived + reviews
+    python tools/data_update.py weekly --resume   # Continue a failed weekly run
 
 Environment:
     Set OPENAI_API_KEY for LLM-based review processing
@@ -31,6 +48,7 @@ import subprocess
 import sys
 import urllib.request
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 
 # =============================================================================
@@ -40,11 +58,24 @@ from pathlib import Path
 SCRIPT_DIR = Path(__file__).parent.resolve()
 PROJECT_ROOT = SCRIPT_DIR.parent
 
+# For in-process change-feed syncs (shared.*)
+sys.path.insert(0, str(PROJECT_ROOT))
+
 # Database paths
 AIRPORTS_DB = Path(os.environ.get("AIRPORTS_DB", PROJECT_ROOT / "data" / "airports.db"))
 GA_PERSONA_DB = PROJECT_ROOT / "data" / "ga_persona.db"
 GA_NOTIFICATIONS_DB = PROJECT_ROOT / "data" / "ga_notifications.db"
 WORLDAIRPORTS_DB = PROJECT_ROOT / "data" / "world_airports.db"
+NOTIFICATIONS_PARSE_CACHE = PROJECT_ROOT / "data" / "ga_notifications_parse_cache.db"
+
+# Compiled serving data: web API serving database (SERVING_DB) and offline
+# bundles for the mobile apps (OFFLINE_BUNDLE_DIR)
+SERVING_DB = PROJECT_ROOT / "data" / "serving.db"
+BUNDLE_DIR = PROJECT_ROOT / "data" / "bundles"
+
+# AIP fields each derived database is computed from (change-feed filters)
+NOTIFICATION_STD_FIELDS = [302]  # Customs and immigration
+GA_PERSONA_AIP_STD_FIELDS = [207, 501, 502]  # IFR/VFR traffic, hotels, restaurants
 
 # Airfield.directory export (for reviews) - intermediate files in tmp/
 AIRFIELD_EXPORT_URL = "https://airfield-directory-pirep-export.s3.amazonaws.com/airfield-directory-pireps-export-latest.json.gz"
@@ -54,6 +85,26 @@ AIRFIELD_EXPORT = PROJECT_ROOT / "tmp" / "airfield_export.json"
 # Cache directory
 CACHE_DIR = PROJECT_ROOT / "cache"
 
+# Pipeline scratch files and run log
+PIPELINE_DIR = PROJECT_ROOT / "tmp" / "pipeline"
+PIPELINE_LOG = PIPELINE_DIR / "run_log.json"
+
+# Web AIP sources (aipexport.py flag per source), downloaded in parallel
+WEB_SOURCES = {
+    "france": "--france-web",
+    "uk": "--uk-web",
+    "norway": "--norway-web",
+}
+
+# Max concurrent pipeline steps per shared resource
+RESOURCE_LIMITS = {
+    "airports_db": 1,  # Single writer of airports.db
+    "ga_notifications_db": 1,
+    "ga_persona_db": 1,
+    "web": 3,  # Concurrent downloads from web sources
+    "autorouter": 2,  # Concurrent autorouter API clients
+}
+
 # =============================================================================
 # LOGGING SETUP
 # =============================================================================
@@ -90,6 +141,7 @@ def ensure_directories() -> None:
     CACHE_DIR.mkdir(parents=True, exist_ok=True)
     AIRPORTS_DB.parent.mkdir(parents=True, exist_ok=True)
     AIRFIELD_EXPORT.parent.mkdir(parents=True, exist_ok=True)
+    PIPELINE_DIR.mkdir(parents=True, exist_ok=True)
 
 
 def download_reviews() -> bool:
@@ -157,8 +209,29 @@ def download_reviews() -> bool:
 # =============================================================================
 
 
-def fetch_web_sources() -> None:
-    """Fetch AIP data from web sources (France, UK, Norway)."""
+def prefetch_aip_source(flags: list[str], output: Path, airports: list[str] = ()) -> None:
+    """Download one AIP source into the shared cache, without touching airports.db.
+
+    Lets independent sources download in parallel; the step that merges them
+    into airports.db then reads everything from cache (--never-refresh).
+
+    Args:
+        flags: aipexport.py source flags (e.g. ["--france-web"])
+        output: JSON export of the source's model (the step's output file)
+        airports: Optional ICAOs to fetch (default: all the source offers)
+    """
+    output.parent.mkdir(parents=True, exist_ok=True)
+    args = ["python", "tools/aipexport.py", *flags, "--json", str(output), "-c", str(CACHE_DIR)]
+    args.extend(airports)
+    run_command(args)
+
+
+def fetch_web_sources(never_refresh: bool = False) -> None:
+    """Fetch AIP data from web sources (France, UK, Norway).
+
+    Args:
+        never_refresh: Use cached downloads only (after prefetch_aip_source)
+    """
     log_section("Fetching AIP from Web Sources")
 
     args = ["python", "tools/aipexport.py"]
@@ -169,7 +242,7 @@ def fetch_web_sources() -> None:
         args.extend(["--database", str(AIRPORTS_DB)])
 
     # Enable web sources (France, UK, Norway)
-    args.extend(["--france-web", "--uk-web", "--norway-web"])
+    args.extend(WEB_SOURCES.values())
 
     # WorldAirports for metadata enrichment
     if WORLDAIRPORTS_DB.exists():
@@ -184,6 +257,8 @@ def fetch_web_sources() -> None:
 
     # Cache directory
     args.extend(["-c", str(CACHE_DIR)])
+    if never_refresh:
+        args.append("--never-refresh")
 
     run_command(args)
     logger.info("Web sources fetch complete")
@@ -199,14 +274,16 @@ def fetch_web_sources() -> None:
         logger.info("No changes to display")
 
 
-def update_reviews() -> None:
-    """Update GA friendliness from reviews."""
-    log_section("Updating GA Friendliness / Reviews")
-
-    # Step 1: Download latest reviews
+def download_reviews_or_fail() -> None:
+    """download_reviews(), raising on failure (pipeline step)."""
     if not download_reviews():
         raise RuntimeError("Failed to download reviews")
 
+
+def build_reviews() -> None:
+    """Update ga_persona.db from the downloaded, filtered review export."""
+    log_section("Updating GA Friendliness / Reviews")
+
     args = ["python", "tools/build_ga_friendliness.py"]
 
     # Output database
@@ -251,20 +328,125 @@ def update_aip_fields_only() -> None:
     logger.info("AIP fields update complete")
 
 
+def sync_notifications_from_feed(feed, full: bool = False) -> None:
+    """Reprocess notification requirements for airports whose field 302 changed.
+
+    Falls back to update_notifications() over everything when there is no
+    high-water mark yet (or full=True).
+    """
+    from shared.aip_change_feed import ChangeFeedState
+    from shared.ga_notification_agent import NotificationBatchProcessor, ParseCache
+
+    log_section("Syncing GA Notification Requirements (change feed)")
+
+    state = ChangeFeedState(GA_NOTIFICATIONS_DB, "ga_notifications")
+    mark = state.get()
+    if full or mark is None:
+        latest = feed.latest()
+        logger.info("No change-feed mark yet, processing all airports" if mark is None else "Full rebuild requested")
+        update_notifications(full=full)
+        if latest:
+            state.set(latest)
+        return
+
+    changes = feed.changes(
+        mark, std_field_ids=NOTIFICATION_STD_FIELDS, procedures=False, runways=False, airports=False
+    )
+    icaos = changes.icaos(std_field_ids=NOTIFICATION_STD_FIELDS)
+    if icaos:
+        parse_cache = ParseCache(NOTIFICATIONS_PARSE_CACHE)
+        try:
+            processor = NotificationBatchProcessor(
+                output_db_path=GA_NOTIFICATIONS_DB, parse_cache=parse_cache
+            )
+            stats = processor.process_airports(
+                airports_db_path=AIRPORTS_DB, icaos=icaos, mode="changed"
+            )
+        finally:
+            parse_cache.close()
+        logger.info(
+            f"Notifications: {len(icaos)} changed airports, {stats['success']} updated, "
+            f"{stats['failed']} failed, {stats['unchanged']} with unchanged text"
+        )
+        if stats["failed"]:
+            raise RuntimeError(f"Notification sync failed for {stats['failed']} airports")
+    else:
+        logger.info("Notifications: no relevant changes")
+    state.set(changes.until)
+
+
+def sync_aip_fields_from_feed(feed, full: bool = False) -> None:
+    """Update AIP-derived fields in ga_persona.db for airports whose inputs changed.
+
+    Inputs are the IFR/VFR, hotel and restaurant fields plus procedures (best
+    approach type). Falls back to update_aip_fields_only() when there is no
+    high-water mark yet (or full=True).
+    """
+    from shared.aip_change_feed import ChangeFeedState
+    from shared.ga_friendliness import AirportsDatabaseSource, get_settings
+    from shared.ga_friendliness.builder import GAFriendlinessBuilder
+
+    log_section("Syncing AIP Fields in GA Persona DB (change feed)")
+
+    state = ChangeFeedState(GA_PERSONA_DB, "ga_persona_aip")
+    mark = state.get()
+    if full or mark is None:
+        latest = feed.latest()
+        logger.info("No change-feed mark yet, processing all airports" if mark is None else "Full rebuild requested")
+        update_aip_fields_only()
+        if latest:
+            state.set(latest)
+        return
+
+    changes = feed.changes(
+        mark, std_field_ids=GA_PERSONA_AIP_STD_FIELDS, procedures=True, runways=False, airports=False
+    )
+    icaos = changes.icaos(std_field_ids=GA_PERSONA_AIP_STD_FIELDS, procedures=True)
+    if icaos:
+        builder = GAFriendlinessBuilder(settings=get_settings(ga_meta_db_path=GA_PERSONA_DB))
+        airports_db = AirportsDatabaseSource(AIRPORTS_DB)
+        try:
+            result = builder.update_aip_only(airports_db=airports_db, icaos=icaos)
+        finally:
+            airports_db.close()
+        logger.info(
+            f"GA persona AIP fields: {len(icaos)} changed airports, "
+            f"{result.metrics.successful_airports} updated, {result.metrics.failed_airports} failed"
+        )
+        if not result.success:
+            raise RuntimeError("GA persona AIP field sync failed")
+    else:
+        logger.info("GA persona AIP fields: no relevant changes")
+    state.set(changes.until)
+
+
 def sync_aip_derived(prefixes: list[str] = None, full: bool = False) -> None:
     """Sync all AIP-derived data: notifications and hospitality fields.
 
     This should be called after any AIP data update (web or autorouter).
+    Without prefixes, only airports recorded in the airports.db change feed
+    since the last sync are reprocessed (see shared/aip_change_feed.py).
 
     Args:
-        prefixes: Optional list of ICAO prefixes to limit sync scope.
-        full: If True, do full rebuild (for initial setup). Default uses --changed mode.
+        prefixes: Optional list of ICAO prefixes to limit sync scope (processes
+                  the whole scope in --changed mode; change-feed marks untouched).
+        full: If True, do full rebuild (for initial setup).
     """
-    log_section("Syncing AIP-Derived Data")
-
     if not AIRPORTS_DB.exists():
         raise RuntimeError(f"airports.db not found: {AIRPORTS_DB}")
 
+    if not prefixes:
+        from shared.aip_change_feed import AIPChangeFeed
+
+        feed = AIPChangeFeed(AIRPORTS_DB)
+        sync_notifications_from_feed(feed, full=full)
+        if GA_PERSONA_DB.exists():
+            sync_aip_fields_from_feed(feed, full=full)
+        logger.info("AIP-derived data sync complete")
+        return
+
+    log_section("Syncing AIP-Derived Data")
+
     # 1. Update notification requirements
     update_notifications(prefixes=prefixes, full=full)
 
@@ -275,8 +457,24 @@ def sync_aip_derived(prefixes: list[str] = None, full: bool = False) -> None:
     logger.info("AIP-derived data sync complete")
 
 
-def run_autorouter(prefixes: list[str]) -> None:
-    """Run autorouter on all airports with AIP entries matching given prefixes."""
+def autorouter_airports(prefixes: list[str]) -> list[str]:
+    """Airports with AIP entries matching the ICAO prefixes."""
+    if not AIRPORTS_DB.exists():
+        raise RuntimeError(f"airports.db not found: {AIRPORTS_DB}")
+
+    conditions = " OR ".join("airport_icao LIKE ?" for _ in prefixes)
+    query = f"SELECT DISTINCT airport_icao FROM aip_entries WHERE {conditions} ORDER BY airport_icao"
+    with sqlite3.connect(AIRPORTS_DB) as conn:
+        return [row[0] for row in conn.execute(query, [f"{p}%" for p in prefixes])]
+
+
+def run_autorouter(prefixes: list[str], never_refresh: bool = False) -> None:
+    """Run autorouter on all airports with AIP entries matching given prefixes.
+
+    Args:
+        prefixes: ICAO prefixes (countries)
+        never_refresh: Use cached downloads only (after prefetch_aip_source)
+    """
     if not prefixes:
         print("Usage: autorouter <icao_prefix> [prefix2] [prefix3] ...")
         print("Example: autorouter ED           (for Germany)")
@@ -291,17 +489,7 @@ def run_autorouter(prefixes: list[str]) -> None:
 
     log_section(f"Running Autorouter for: {' '.join(prefixes)}")
 
-    if not AIRPORTS_DB.exists():
-        raise RuntimeError(f"airports.db not found: {AIRPORTS_DB}")
-
-    # Build SQL query for all prefixes
-    conditions = " OR ".join(f"airport_icao LIKE '{p}%'" for p in prefixes)
-    query = f"SELECT DISTINCT airport_icao FROM aip_entries WHERE {conditions} ORDER BY airport_icao"
-
-    # Query airports
-    with sqlite3.connect(AIRPORTS_DB) as conn:
-        cursor = conn.execute(query)
-        airports = [row[0] for row in cursor.fetchall()]
+    airports = autorouter_airports(prefixes)
 
     if not airports:
         raise RuntimeError(f"No airports found with AIP entries matching: {' '.join(prefixes)}")
@@ -316,6 +504,8 @@ def run_autorouter(prefixes: list[str]) -> None:
         "--database-storage", str(AIRPORTS_DB),
         "-c", str(CACHE_DIR),
     ]
+    if never_refresh:
+        args.append("--never-refresh")
 
     # Add all airport ICAOs
     args.extend(airports)
@@ -326,6 +516,38 @@ def run_autorouter(prefixes: list[str]) -> None:
     logger.info(f"Processed: {len(airports)} airports")
 
 
+def build_serving_db() -> None:
+    """Recompile the web API serving database from the current databases."""
+    log_section("Building Serving Database")
+
+    args = [
+        "python", "tools/build_serving_db.py",
+        "--airports-db", str(AIRPORTS_DB),
+        "--ga-persona-db", str(GA_PERSONA_DB),
+        "--notifications-db", str(GA_NOTIFICATIONS_DB),
+        "--output", str(SERVING_DB),
+    ]
+
+    run_command(args)
+    logger.info("Serving database complete")
+
+
+def build_offline_bundle() -> None:
+    """Rebuild the offline bundles from the current databases."""
+    log_section("Building Offline Bundles")
+
+    args = [
+        "python", "tools/build_offline_bundle.py",
+        "--airports-db", str(AIRPORTS_DB),
+        "--ga-persona-db", str(GA_PERSONA_DB),
+        "--notifications-db", str(GA_NOTIFICATIONS_DB),
+        "--output", str(BUNDLE_DIR),
+    ]
+
+    run_command(args)
+    logger.info("Offline bundles complete")
+
+
 def update_notifications(prefixes: list[str] = None, full: bool = False) -> None:
     """Update notification requirements from AIP data.
 
@@ -362,29 +584,202 @@ def update_notifications(prefixes: list[str] = None, full: bool = False) -> None
     logger.info("Notification requirements update complete")
 
 
-def initial_build() -> None:
-    """Full initial build from scratch."""
-    log_section("INITIAL BUILD - Full Setup")
+# =============================================================================
+# PIPELINES
+# =============================================================================
+
+
+def web_fetch_steps() -> list:
+    """Parallel per-source downloads, then one merge into airports.db."""
+    from shared.pipeline_runner import Step
+
+    prefetched = []
+    steps = []
+    for name, flag in WEB_SOURCES.items():
+        output = PIPELINE_DIR / f"web_{name}.json"
+        prefetched.append(output)
+        steps.append(Step(
+            name=f"prefetch-{name}",
+            action=partial(prefetch_aip_source, [flag], output),
+            outputs=[output],
+            resources=["web"],
+            always_run=True,  # Remote content: nothing local tells us it changed
+        ))
+    steps.append(Step(
+        name="fetch-web",
+        action=partial(fetch_web_sources, never_refresh=True),
+        inputs=prefetched,  # Skipped when every source downloaded the same data
+        outputs=[AIRPORTS_DB],
+        resources=["airports_db"],
+        signature=" ".join(WEB_SOURCES.values()),
+    ))
+    return steps
+
+
+def autorouter_steps(prefixes: list[str]) -> list:
+    """Parallel per-prefix autorouter downloads, then one merge into airports.db."""
+    from shared.pipeline_runner import Step
+
+    if not prefixes:
+        run_autorouter(prefixes)  # Prints usage and exits
+
+    prefetched = []
+    steps = []
+    for prefix in prefixes:
+        airports = autorouter_airports([prefix])
+        if not airports:
+            logger.warning(f"No airports with AIP entries matching {prefix}")
+            continue
+        output = PIPELINE_DIR / f"autorouter_{prefix}.json"
+        prefetched.append(output)
+        steps.append(Step(
+            name=f"prefetch-autorouter-{prefix}",
+            action=partial(prefetch_aip_source, ["--autorouter"], output, airports),
+            outputs=[output],
+            resources=["autorouter"],
+            always_run=True,
+        ))
+    steps.append(Step(
+        name="fetch-autorouter",
+        action=partial(run_autorouter, prefixes, never_refresh=True),
+        inputs=prefetched,
+        outputs=[AIRPORTS_DB],
+        resources=["airports_db"],
+        signature=",".join(prefixes),
+    ))
+    return steps
+
+
+def aip_derived_steps(prefixes: list[str] = None, full: bool = False) -> list:
+    """Notifications and GA persona AIP fields: independent, so run in parallel."""
+    from shared.aip_change_feed import AIPChangeFeed
+    from shared.pipeline_runner import Step
+
+    if prefixes:
+        # Whole-scope runs per prefix (see sync_aip_derived)
+        return [Step(
+            name="sync-aip-derived",
+            action=partial(sync_aip_derived, prefixes=prefixes, full=full),
+            inputs=[AIRPORTS_DB],
+            outputs=[GA_NOTIFICATIONS_DB],
+            resources=["ga_notifications_db", "ga_persona_db"],
+            signature=f"prefixes={','.join(prefixes)} full={full}",
+        )]
+
+    def sync_aip_fields() -> None:
+        if GA_PERSONA_DB.exists():
+            sync_aip_fields_from_feed(AIPChangeFeed(AIRPORTS_DB), full=full)
+        else:
+            logger.info(f"{GA_PERSONA_DB} not built yet, skipping AIP field sync")
+
+    return [
+        Step(
+            name="sync-notifications",
+            action=lambda: sync_notifications_from_feed(AIPChangeFeed(AIRPORTS_DB), full=full),
+            inputs=[AIRPORTS_DB],
+            outputs=[GA_NOTIFICATIONS_DB],
+            resources=["ga_notifications_db"],
+            signature=f"full={full}",
+        ),
+        Step(
+            name="sync-aip-fields",
+            action=sync_aip_fields,
+            inputs=[AIRPORTS_DB],
+            resources=["ga_persona_db"],
+            signature=f"full={full}",
+        ),
+    ]
+
+
+def review_steps() -> list:
+    """Download reviews (independent of AIP fetches), then rebuild from them."""
+    from shared.pipeline_runner import Step
+
+    return [
+        Step(
+            name="download-reviews",
+            action=download_reviews_or_fail,
+            outputs=[AIRFIELD_EXPORT],
+            resources=["web"],
+            always_run=True,
+        ),
+        Step(
+            name="build-reviews",
+            action=build_reviews,
+            # airports.db: runs after any AIP fetch in the same pipeline
+            inputs=[AIRFIELD_EXPORT, AIRPORTS_DB],
+            outputs=[GA_PERSONA_DB],
+            resources=["ga_persona_db"],
+        ),
+    ]
 
-    logger.info("This will build all data from scratch")
-    logger.info("  - AIP data from France, UK, Norway web sources")
-    logger.info("  - GA notification requirements")
-    logger.info("  - GA friendliness database")
 
-    # Step 1: Fetch AIP data from web sources
-    fetch_web_sources()
+def serving_steps(after: list) -> list:
+    """Compiled serving data, once every database update of the pipeline is done."""
+    from shared.pipeline_runner import Step
+
+    after = [step.name for step in after]
+    return [
+        Step(
+            name="build-serving-db",
+            action=build_serving_db,
+            inputs=[AIRPORTS_DB, GA_PERSONA_DB, GA_NOTIFICATIONS_DB],
+            outputs=[SERVING_DB],
+            after=after,
+        ),
+        Step(
+            name="build-bundle",
+            action=build_offline_bundle,
+            inputs=[AIRPORTS_DB, GA_PERSONA_DB, GA_NOTIFICATIONS_DB],
+            outputs=[BUNDLE_DIR / "manifest.json"],
+            after=after,
+        ),
+    ]
 
-    # Step 2: Sync all AIP-derived data (notifications, hospitality fields)
-    sync_aip_derived(full=True)
 
-    # Step 3: Build GA friendliness (subjective scoring from reviews)
-    update_reviews()
+def pipeline_steps(mode: str, extra_args: list[str], full: bool = False) -> list:
+    """Step DAG for a data_update mode."""
+    if mode == "initial":
+        steps = web_fetch_steps() + aip_derived_steps(full=True) + review_steps()
+    elif mode == "web":
+        steps = web_fetch_steps() + aip_derived_steps(full=full)
+    elif mode == "autorouter":
+        steps = autorouter_steps(extra_args) + aip_derived_steps()
+    elif mode == "aip":
+        steps = aip_derived_steps(prefixes=extra_args or None, full=full)
+    elif mode == "reviews":
+        steps = review_steps()
+    elif mode == "weekly":
+        steps = web_fetch_steps() + aip_derived_steps(full=full) + review_steps()
+    else:
+        raise ValueError(f"No pipeline for mode: {mode}")
+    return steps + serving_steps(after=steps)
+
+
+def run_pipeline(
+    mode: str,
+    extra_args: list[str],
+    full: bool = False,
+    jobs: int = 4,
+    resume: bool = False,
+    force: bool = False,
+) -> bool:
+    """Run a mode's step DAG and print per-step timings."""
+    from shared.pipeline_runner import PipelineRunner
+
+    runner = PipelineRunner(
+        pipeline_steps(mode, extra_args, full=full),
+        state_path=PIPELINE_LOG,
+        max_workers=jobs,
+        resource_limits=RESOURCE_LIMITS,
+        resume=resume,
+        force=force,
+    )
+    report = runner.run(run_name=" ".join([mode, *extra_args]))
 
-    log_section("INITIAL BUILD COMPLETE")
-    logger.info(f"Databases created:")
-    logger.info(f"  - {AIRPORTS_DB}")
-    logger.info(f"  - {GA_NOTIFICATIONS_DB}")
-    logger.info(f"  - {GA_PERSONA_DB}")
+    log_section(f"PIPELINE SUMMARY ({mode})")
+    print(report.format())
+    return report.success
 
 
 # =============================================================================
@@ -401,24 +796,28 @@ Modes:
   initial       Full build from scratch (first time setup)
   web           Fetch AIP from web sources (FR, UK, NO) → syncs derived data
   autorouter    Fetch AIP from autorouter for countries → syncs derived data
-  aip           Sync all AIP-derived data (notifications, hospitality fields)
+  aip           Sync AIP-derived data changed since the last sync (change feed)
   reviews       Update GA friendliness/reviews (run weekly/monthly)
+  weekly        web + AIP-derived sync + reviews, as one parallel pipeline
   notifications Update notification requirements only (subset of 'aip')
 
 Examples:
   python tools/data_update.py initial
   python tools/data_update.py web                  # Fetch web + sync derived
   python tools/data_update.py autorouter ED LO     # Fetch autorouter + sync derived
-  python tools/data_update.py aip                  # Sync all AIP-derived data
+  python tools/data_update.py aip                  # Sync changed AIP-derived data
+  python tools/data_update.py aip --full           # Rebuild all AIP-derived data
   python tools/data_update.py aip LF EG            # Sync for specific countries
   python tools/data_update.py reviews
+  python tools/data_update.py weekly --jobs 6      # Full weekly update
+  python tools/data_update.py weekly --resume      # Continue a failed run
   python tools/data_update.py notifications LF EG  # Notifications only
         """,
     )
 
     parser.add_argument(
         "mode",
-        choices=["initial", "web", "autorouter", "aip", "reviews", "notifications"],
+        choices=["initial", "web", "autorouter", "aip", "reviews", "weekly", "notifications"],
         help="Update mode to run",
     )
     parser.add_argument(
@@ -426,29 +825,47 @@ Examples:
         nargs="*",
         help="Additional arguments (e.g., ICAO prefixes for autorouter/aip/notifications)",
     )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="web/aip: rebuild AIP-derived data for all airports instead of syncing changes",
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=4,
+        help="Pipeline steps run in parallel (default: 4; 1 = sequential)",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue the last failed run of this mode, skipping its completed steps",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Run every step even if its inputs are unchanged since the last run",
+    )
 
     args = parser.parse_args()
 
     ensure_directories()
 
-    if args.mode == "initial":
-        initial_build()
-    elif args.mode == "web":
-        fetch_web_sources()
-        sync_aip_derived()
-    elif args.mode == "autorouter":
-        run_autorouter(args.args)
-        # Sync derived data for the same prefixes
-        if args.args:
-            sync_aip_derived(prefixes=args.args)
-    elif args.mode == "aip":
-        # Sync all AIP-derived data (optional prefix filter)
-        sync_aip_derived(prefixes=args.args if args.args else None)
-    elif args.mode == "reviews":
-        update_reviews()
-    elif args.mode == "notifications":
+    if args.mode == "notifications":
         # Optional prefixes for filtering (e.g., "LF" for France)
         update_notifications(args.args if args.args else None)
+        return
+
+    ok = run_pipeline(
+        args.mode,
+        args.args,
+        full=args.full,
+        jobs=args.jobs,
+        resume=args.resume,
+        force=args.force,
+    )
+    if not ok:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -1,7 +1,8 @@
 #!/usr/bin/env python3
 
 from fastapi import APIRouter, Query, HTTPException, Request, Path, Body
-from typing import List, Optional, Dict, Any, Union, TypeAlias
+from fastapi.concurrency import run_in_threadpool
+from typing import List, NamedTuple, Optional, Dict, Any, Tuple, Union, TypeAlias
 import logging
 
 from euro_aip.models.euro_aip_model import EuroAipModel
@@ -11,8 +12,12 @@ from .models import AirportSummary, AirportDetail, AIPEntryResponse, GAFriendlyS
 from .ga_friendliness import get_service as get_ga_service
 from . import notifications
 from shared.airport_tools import find_airports_near_location
+from shared.route_corridor import get_route_corridor
+from shared.route_planner import MAX_LEG_NM, OBJECTIVES as ROUTE_PLAN_OBJECTIVES, StopNode, get_reachability_graph
 from shared.tool_context import ToolContext
 from shared.filtering import FilterEngine
+from shared.serving_db import ServingDB, notification_summary_dict
+from shared.single_flight import SingleFlight
 
 # Type alias for route airports (can be ICAO codes or NavPoint objects)
 Route: TypeAlias = List[Union[str, NavPoint]]
@@ -23,6 +28,10 @@ router = APIRouter()
 
 # Global model reference
 model: Optional[EuroAipModel] = None
+# Compiled serving database matching the model's data (None = join per request)
+serving_db: Optional[ServingDB] = None
+# Coalesces identical concurrent airport list requests
+_airport_lists = SingleFlight("airports.list")
 
 def set_model(m: EuroAipModel):
     """Set the global model reference."""
@@ -30,32 +39,82 @@ def set_model(m: EuroAipModel):
     model = m
 
 
-def _get_notification_summaries_batch(icaos: List[str]) -> Dict[str, NotificationSummary]:
+def set_serving_db(db: Optional[ServingDB]):
+    """Set the serving database (None = compute summaries from the services)."""
+    global serving_db
+    serving_db = db
+
+
+class _DataSnapshot(NamedTuple):
+    """The loaded model and services, read once so a request sees one consistent set."""
+
+    model: Optional[EuroAipModel]
+    serving_db: Optional[ServingDB]
+    ga_service: Optional[Any]
+    notification_service: Optional[Any]
+
+    @property
+    def key(self) -> Tuple[int, ...]:
+        """Identity of the snapshot, for single-flight keys."""
+        return tuple(id(part) for part in self)
+
+
+def _current_snapshot() -> _DataSnapshot:
+    """Snapshot of the module globals (swapped as a whole by data reloads)."""
+    try:
+        notification_service = notifications.get_notification_service()
+    except RuntimeError:
+        notification_service = None
+    return _DataSnapshot(model, serving_db, get_ga_service(), notification_service)
+
+
+def _get_notification_summaries_batch(
+    icaos: List[str], snapshot: Optional[_DataSnapshot] = None
+) -> Dict[str, NotificationSummary]:
     """
     Get notification summaries for a batch of airports.
 
     Returns a dict mapping ICAO -> NotificationSummary.
     """
+    snapshot = snapshot or _current_snapshot()
     try:
-        notification_service = notifications.get_notification_service()
-        notification_infos = notification_service.get_notification_info_batch(icaos)
-
-        result = {}
-        for icao, info in notification_infos.items():
-            result[icao] = NotificationSummary(
-                notification_type=info.notification_type,
-                hours_notice=info.hours_notice,
-                is_h24=info.is_h24(),
-                is_on_request=info.notification_type == "on_request",
-                easiness_score=round(info.get_easiness_score(), 1),
-                summary=info.summary[:100] + "..." if len(info.summary) > 100 else info.summary,
-            )
-        return result
+        if snapshot.notification_service is None:
+            return {}
+        if snapshot.serving_db:
+            return {
+                icao: NotificationSummary(**summary)
+                for icao, summary in snapshot.serving_db.notification_summaries(icaos).items()
+            }
+        notification_infos = snapshot.notification_service.get_notification_info_batch(icaos)
+        return {
+            icao: NotificationSummary(**notification_summary_dict(info))
+            for icao, info in notification_infos.items()
+        }
     except (RuntimeError, AttributeError):
         # Notification service not available
         return {}
 
 
+def _get_ga_summaries_batch(
+    icaos: List[str], snapshot: Optional[_DataSnapshot] = None
+) -> Dict[str, GAFriendlySummary]:
+    """
+    Get GA summaries (all persona scores) for a batch of airports.
+
+    Returns a dict mapping ICAO -> GAFriendlySummary; empty if GA is disabled.
+    """
+    snapshot = snapshot or _current_snapshot()
+    ga_service = snapshot.ga_service
+    if not ga_service or not ga_service.enabled:
+        return {}
+    if snapshot.serving_db:
+        return {
+            icao: GAFriendlySummary(**summary)
+            for icao, summary in snapshot.serving_db.ga_summaries(icaos).items()
+        }
+    return ga_service.get_summaries_batch(icaos)
+
+
 def _matches_aip_field(airport: Airport, field_name: str, value: Optional[str] = None, operator: str = "contains") -> bool:
     """
     Check if an airport matches AIP field criteria.
@@ -139,36 +198,110 @@ async def get_airports(
     bbox: Optional[str] = Query(None, description="Bounding box: north,south,east,west (decimal degrees)")
 ):
     """Get a list of airports with optional filtering."""
-    if not model:
+    snapshot = _current_snapshot()
+    if not snapshot.model:
         raise HTTPException(status_code=500, detail="Model not loaded")
     
     # Validate offset against actual data size
-    if offset >= model.airports.count():
+    if offset >= snapshot.model.airports.count():
         raise HTTPException(status_code=400, detail="Offset too large")
 
-    # Start with queryable collection
-    airports = model.airports
-
-    # Apply bounding box filter if provided (viewport-based loading)
+    bounds = None
     if bbox:
         try:
             parts = bbox.split(",")
             if len(parts) != 4:
                 raise HTTPException(status_code=400, detail="bbox must have 4 values: north,south,east,west")
-            north, south, east, west = map(float, parts)
-
-            # Validate bounds
-            if south > north:
-                raise HTTPException(status_code=400, detail="bbox south must be <= north")
-
-            # Filter airports within bounding box
-            airports = airports.filter(lambda a:
-                a.navpoint is not None and
-                south <= a.navpoint.latitude <= north and
-                west <= a.navpoint.longitude <= east
-            )
+            bounds = tuple(map(float, parts))
         except ValueError:
             raise HTTPException(status_code=400, detail="bbox values must be valid numbers")
+        # Validate bounds
+        if bounds[1] > bounds[0]:
+            raise HTTPException(status_code=400, detail="bbox south must be <= north")
+
+    # Identical concurrent requests (map loads after a deploy) share one computation;
+    # requests on different snapshots (before/after a reload) never do
+    key = (
+        snapshot.key, country, has_procedures, has_aip_data, has_hard_runway, point_of_entry,
+        fuel_type, hotel, restaurant, aip_field, aip_value, aip_operator, limit, offset,
+        include_ga, include_notification, bounds,
+    )
+    result, _ = await _airport_lists.run(key, lambda: _list_airports(
+        snapshot,
+        country=country,
+        has_procedures=has_procedures,
+        has_aip_data=has_aip_data,
+        has_hard_runway=has_hard_runway,
+        point_of_entry=point_of_entry,
+        fuel_type=fuel_type,
+        hotel=hotel,
+        restaurant=restaurant,
+        aip_field=aip_field,
+        aip_value=aip_value,
+        aip_operator=aip_operator,
+        limit=limit,
+        offset=offset,
+        include_ga=include_ga,
+        include_notification=include_notification,
+        bounds=bounds,
+    ))
+    return result
+
+
+def _list_airports(
+    snapshot: _DataSnapshot,
+    country: Optional[str],
+    has_procedures: Optional[bool],
+    has_aip_data: Optional[bool],
+    has_hard_runway: Optional[bool],
+    point_of_entry: Optional[bool],
+    fuel_type: Optional[str],
+    hotel: Optional[str],
+    restaurant: Optional[str],
+    aip_field: Optional[str],
+    aip_value: Optional[str],
+    aip_operator: str,
+    limit: int,
+    offset: int,
+    include_ga: bool,
+    include_notification: bool,
+    bounds: Optional[Tuple[float, float, float, float]],
+) -> List[AirportSummary]:
+    """Airports list for get_airports(); runs in a worker thread on the given snapshot."""
+    serving_db = snapshot.serving_db
+    ga_service = snapshot.ga_service
+    ga_enabled = bool(ga_service and ga_service.enabled)
+
+    # Everything but AIP field filters is a query on the serving database
+    if serving_db and not aip_field:
+        rows = serving_db.query(
+            country=country,
+            has_procedures=has_procedures,
+            has_aip_data=has_aip_data,
+            has_hard_runway=has_hard_runway,
+            point_of_entry=point_of_entry,
+            fuel_type=fuel_type,
+            hotel=hotel if ga_enabled else None,
+            restaurant=restaurant if ga_enabled else None,
+            bbox=bounds,
+            limit=limit,
+            offset=offset,
+            include_ga=include_ga and ga_enabled,
+            include_notification=include_notification,
+        )
+        return [AirportSummary(**row) for row in rows]
+
+    # Start with queryable collection
+    airports = snapshot.model.airports
+
+    # Apply bounding box filter if provided (viewport-based loading)
+    if bounds:
+        north, south, east, west = bounds
+        airports = airports.filter(lambda a:
+            a.navpoint is not None and
+            south <= a.navpoint.latitude <= north and
+            west <= a.navpoint.longitude <= east
+        )
 
     # Apply filters using modern query API
     if country:
@@ -207,8 +340,7 @@ async def get_airports(
 
     # Apply hospitality filtering (hotel/restaurant)
     if hotel or restaurant:
-        ga_service = get_ga_service()
-        if ga_service and ga_service.enabled:
+        if ga_enabled:
             matching_icaos = ga_service.get_icaos_by_hospitality(hotel=hotel, restaurant=restaurant)
             if matching_icaos:
                 airports = airports.filter(lambda a: a.ident in matching_icaos)
@@ -221,8 +353,9 @@ async def get_airports(
         airports = airports.filter(lambda a: _matches_aip_field(a, aip_field, aip_value, aip_operator))
     
     # Always sort by longest runway length (descending) to prioritize larger airports
-    # Airports without runway data will be sorted last
-    airports = airports.order_by(lambda a: a.longest_runway_length_ft or 0, reverse=True)
+    # Airports without runway data will be sorted last; ties by ICAO, as the
+    # serving database orders them, so pages are the same on both paths
+    airports = airports.order_by(lambda a: (-(a.longest_runway_length_ft or 0), a.ident))
 
     # Apply pagination and get results
     airports = airports.skip(offset).take(limit).all()
@@ -233,14 +366,12 @@ async def get_airports(
     # Get GA data if requested and service is available
     ga_data: Dict[str, GAFriendlySummary] = {}
     if include_ga:
-        ga_service = get_ga_service()
-        if ga_service and ga_service.enabled:
-            ga_data = ga_service.get_summaries_batch(icaos)
+        ga_data = _get_ga_summaries_batch(icaos, snapshot)
 
     # Get notification data if requested
     notification_data: Dict[str, NotificationSummary] = {}
     if include_notification:
-        notification_data = _get_notification_summaries_batch(icaos)
+        notification_data = _get_notification_summaries_batch(icaos, snapshot)
 
     # Convert to response format using factory methods
     return [
@@ -309,8 +440,12 @@ async def get_airports_near_route(
     # Resolve effective segment distance (support legacy query param)
     effective_segment_distance_nm = legacy_distance_nm if legacy_distance_nm is not None else segment_distance_nm
     
-    # Find airports near the route
-    nearby_airports = model.find_airports_near_route(route_airports, effective_segment_distance_nm)
+    # Find airports near the route (enroute limit pushed down into the corridor search)
+    nearby_airports = get_route_corridor(model).find_airports_near_route(
+        route_airports,
+        effective_segment_distance_nm,
+        max_origin_distance_nm=enroute_distance_max_nm,
+    )
 
     # Build filters dict for FilterEngine
     filters: Dict[str, Any] = {}
@@ -330,11 +465,6 @@ async def get_airports_near_route(
         filters["hotel"] = hotel
     if restaurant:
         filters["restaurant"] = restaurant
-    # Trip distance filter (enroute distance from first airport)
-    if enroute_distance_max_nm is not None:
-        first_route_item = route_airports[0]
-        if isinstance(first_route_item, str):
-            filters["trip_distance"] = {"from": first_route_item, "max": enroute_distance_max_nm}
 
     # Create ToolContext for FilterEngine (provides access to GA service for hospitality filters)
     ctx = ToolContext(model=model, ga_friendliness_service=get_ga_service())
@@ -361,9 +491,7 @@ async def get_airports_near_route(
     # Get GA data if requested and service is available
     ga_data: Dict[str, GAFriendlySummary] = {}
     if include_ga:
-        ga_service = get_ga_service()
-        if ga_service and ga_service.enabled:
-            ga_data = ga_service.get_summaries_batch(icaos)
+        ga_data = _get_ga_summaries_batch(icaos)
 
     # Get notification data if requested
     notification_data: Dict[str, NotificationSummary] = {}
@@ -406,6 +534,102 @@ async def get_airports_near_route(
         'airports': result
     }
 
+@router.get("/route-plan")
+async def plan_route(
+    request: Request,
+    from_icao: str = Query(..., alias="from", description="Departure airport ICAO code", max_length=4),
+    to_icao: str = Query(..., alias="to", description="Destination airport ICAO code", max_length=4),
+    max_leg_nm: float = Query(..., description="Maximum leg distance (NM)", ge=10.0, le=MAX_LEG_NM),
+    optimize: str = Query("fewest_stops", description="fewest_stops or shortest_distance", max_length=20),
+    max_stops: Optional[int] = Query(None, description="Maximum number of intermediate stops", ge=0, le=20),
+    max_hours_notice: Optional[int] = Query(None, description="Max hours of prior notice at stops", ge=0),
+    country: Optional[str] = Query(None, description="Stops restricted to ISO country code", max_length=3),
+    has_hard_runway: Optional[bool] = Query(None, description="Stops must have hard runways"),
+    point_of_entry: Optional[bool] = Query(None, description="Stops must be border crossing airports"),
+    fuel_type: Optional[str] = Query(None, description="Stops must have fuel type: avgas, jet_a", max_length=10),
+    include_large_airports: bool = Query(False, description="Allow large commercial airports as stops"),
+):
+    """Plan a multi-stop route where no leg exceeds max_leg_nm, with stops matching the filters."""
+    if not model:
+        raise HTTPException(status_code=500, detail="Model not loaded")
+    if optimize not in ROUTE_PLAN_OBJECTIVES:
+        raise HTTPException(status_code=400, detail=f"Invalid optimize value: {optimize}")
+
+    endpoints = []
+    for icao in (from_icao.strip().upper(), to_icao.strip().upper()):
+        airport = model.airports.get(icao)
+        if not airport or getattr(airport, "navpoint", None) is None:
+            raise HTTPException(status_code=404, detail=f"Airport {icao} not found")
+        endpoints.append(airport)
+
+    filters: Dict[str, Any] = {}
+    if not include_large_airports:
+        filters["exclude_large_airports"] = True
+    if country:
+        filters["country"] = country
+    if has_hard_runway is not None:
+        filters["has_hard_runway"] = has_hard_runway
+    if point_of_entry is not None:
+        filters["point_of_entry"] = point_of_entry
+    if fuel_type:
+        filters["fuel_type"] = fuel_type
+
+    try:
+        notification_service = notifications.get_notification_service()
+    except (RuntimeError, AttributeError):
+        notification_service = None
+    ctx = ToolContext(
+        model=model,
+        ga_friendliness_service=get_ga_service(),
+        notification_service=notification_service,
+    )
+
+    def build_and_plan():
+        graph = get_reachability_graph(ctx, max_leg_nm, filters=filters, max_hours_notice=max_hours_notice)
+        plan = graph.plan(
+            StopNode.from_airport(endpoints[0]),
+            StopNode.from_airport(endpoints[1]),
+            objective=optimize,
+            max_stops=max_stops,
+        )
+        return graph, plan
+
+    # A cold graph build takes seconds; keep it off the event loop
+    graph, plan = await run_in_threadpool(build_and_plan)
+
+    if plan is None:
+        return {
+            'found': False,
+            'route': [],
+            'stops': [],
+            'legs': [],
+            'max_leg_nm': max_leg_nm,
+            'filters_applied': filters,
+        }
+
+    stop_icaos = [node.ident for node in plan.stops]
+    notification_data = _get_notification_summaries_batch(stop_icaos) if stop_icaos else {}
+    stops = []
+    for node in plan.stops:
+        stops.append({
+            'airport': AirportSummary.from_airport(node.airport, None, notification_data.get(node.ident)).model_dump(),
+            'stop_attributes': node.attributes(),
+        })
+
+    return {
+        'found': True,
+        'route': [node.ident for node in plan.nodes],
+        'stops': stops,
+        'legs': [
+            {'from': a.ident, 'to': b.ident, 'distance_nm': round(d, 1)}
+            for a, b, d in zip(plan.nodes[:-1], plan.nodes[1:], plan.leg_distances_nm)
+        ],
+        'total_distance_nm': round(plan.total_distance_nm, 1),
+        'max_leg_nm': max_leg_nm,
+        'graph_nodes': len(graph),
+        'filters_applied': filters,
+    }
+
 @router.get("/locate")
 async def locate_airports(
     request: Request,
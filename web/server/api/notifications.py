@@ -16,7 +16,7 @@ router = APIRouter(prefix="/api/notifications", tags=["notifications"])
 _notification_service: Optional[NotificationService] = None
 
 
-def set_notification_service(service: NotificationService):
+def set_notification_service(service: Optional[NotificationService]):
     """Set the notification service instance."""
     global _notification_service
     _notification_service = service
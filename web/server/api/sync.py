@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+
+"""
+Delta sync API endpoints.
+
+Clients keep the airport list loaded from /api/airports/ and refresh it with
+/api/sync/delta?since=<version>, which returns only the airports, GA summaries
+and notification summaries that changed since that version, plus the new
+version token. Get the token for a full load from /api/sync/version (before
+fetching /api/airports/).
+
+Offline clients instead download prebuilt bundles (tools/build_offline_bundle.py):
+/api/sync/bundle returns the manifest, /api/sync/bundle/<file> the bundle
+files, and the manifest's version continues with /api/sync/delta.
+"""
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import FileResponse
+from pathlib import Path
+from pydantic import BaseModel
+from typing import Any, Dict, Iterable, List, Optional, Set
+import logging
+
+from shared.data_delta import DataVersion, DeltaSource
+from shared.offline_bundle import BUNDLE_FILE_PATTERN, load_manifest
+
+from . import airports as airports_api
+from . import notifications
+from .ga_friendliness import get_service as get_ga_service
+from .models import AirportSummary
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+# Global delta source and bundle directory (set by web server startup)
+_delta_source: Optional[DeltaSource] = None
+_bundle_dir: Optional[Path] = None
+
+
+def set_delta_source(source: Optional[DeltaSource]):
+    """Set the delta source (None disables delta sync)."""
+    global _delta_source
+    _delta_source = source
+
+
+def set_bundle_dir(bundle_dir: Optional[Path]):
+    """Set the offline bundle directory (None disables bundle downloads)."""
+    global _bundle_dir
+    _bundle_dir = Path(bundle_dir) if bundle_dir else None
+
+
+def _get_source() -> DeltaSource:
+    if _delta_source is None:
+        raise HTTPException(status_code=503, detail="Delta sync not available")
+    return _delta_source
+
+
+class VersionResponse(BaseModel):
+    version: str
+
+
+def _section(
+    items: Dict[str, Dict[str, Any]],
+    changed: Iterable[str],
+    compact: bool,
+) -> Dict[str, Any]:
+    """
+    Changed records of one kind, plus the changed ICAOs that no longer have one.
+
+    Compact encoding sends field names once ({"columns", "rows"}) instead of
+    repeating them in every record.
+    """
+    removed = sorted(set(changed) - set(items))
+    if not compact:
+        return {"items": items, "removed": removed}
+    columns: List[str] = []
+    for record in items.values():
+        columns = list(record)
+        break
+    return {
+        "columns": ["icao"] + columns,
+        "rows": [[icao] + [record[c] for c in columns] for icao, record in sorted(items.items())],
+        "removed": removed,
+    }
+
+
+def _airport_summaries(icaos: Set[str]) -> Dict[str, Dict[str, Any]]:
+    model = airports_api.model
+    if not model:
+        raise HTTPException(status_code=500, detail="Model not loaded")
+    if not icaos:
+        return {}
+    found = model.airports.filter(lambda a: a.ident in icaos).all()
+    return {
+        airport.ident: AirportSummary.from_airport(airport).model_dump(
+            mode="json", exclude={"ident", "ga", "notification"}
+        )
+        for airport in found
+    }
+
+
+def _ga_summaries(icaos: Set[str]) -> Optional[Dict[str, Dict[str, Any]]]:
+    """Changed GA summaries (None if GA data is not served)."""
+    ga_service = get_ga_service()
+    if not ga_service or not ga_service.enabled:
+        return None
+    if not icaos:
+        return {}
+    return {
+        icao: summary.model_dump(mode="json")
+        for icao, summary in airports_api._get_ga_summaries_batch(sorted(icaos)).items()
+    }
+
+
+def _notification_summaries(icaos: Set[str]) -> Optional[Dict[str, Dict[str, Any]]]:
+    """Changed notification summaries (None if notifications are not served)."""
+    try:
+        notifications.get_notification_service()
+    except RuntimeError:
+        return None
+    if not icaos:
+        return {}
+    return {
+        icao: summary.model_dump(mode="json")
+        for icao, summary in airports_api._get_notification_summaries_batch(sorted(icaos)).items()
+    }
+
+
+@router.get("/version", response_model=VersionResponse)
+async def get_version():
+    """Current data version: store it with a full /api/airports/ load."""
+    return VersionResponse(version=_get_source().current_version().encode())
+
+
+@router.get("/delta")
+async def get_delta(
+    since: str = Query(..., description="Data version the client has (from /version or a previous delta)", max_length=512),
+    include_ga: bool = Query(True, description="Include changed GA friendliness summaries"),
+    include_notification: bool = Query(True, description="Include changed notification summaries"),
+    format: str = Query("compact", description="compact (columns + rows) or full (records by ICAO)", pattern="^(compact|full)$"),
+):
+    """
+    Changes since a data version.
+
+    Returns the new `version` and, per kind of data, the records to upsert
+    and the ICAOs to drop (`removed`). Airport summaries omit `ga` and
+    `notification`, which come in their own sections so a notification
+    change does not resend the airport. Airports that appeared in airports.db
+    changes also resend their GA and notification summaries (they may be new
+    to the client). `reset: true` means the client's version cannot be
+    continued: reload /api/airports/ and use the returned version.
+    """
+    source = _get_source()
+    try:
+        client_version = DataVersion.decode(since)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    delta = source.changes_since(client_version)
+    compact = format == "compact"
+    response: Dict[str, Any] = {
+        "version": delta.version.encode(),
+        "reset": delta.reset,
+    }
+    if delta.reset:
+        return response
+
+    response["airports"] = _section(_airport_summaries(delta.airports), delta.airports, compact)
+    if include_ga:
+        changed = delta.ga | delta.airports
+        summaries = _ga_summaries(changed)
+        if summaries is not None:
+            response["ga"] = _section(summaries, changed, compact)
+    if include_notification:
+        changed = delta.notifications | delta.airports
+        summaries = _notification_summaries(changed)
+        if summaries is not None:
+            response["notifications"] = _section(summaries, changed, compact)
+    return response
+
+
+@router.get("/bundle")
+async def get_bundle_manifest():
+    """
+    Offline bundle manifest: data version and, per slice ("all" or a country
+    code), the bundle file with its sha256 and size. Download only slices
+    whose sha256 differs from the local copy.
+    """
+    manifest = load_manifest(_bundle_dir) if _bundle_dir else None
+    if manifest is None:
+        raise HTTPException(status_code=404, detail="No offline bundle available")
+    return manifest
+
+
+@router.get("/bundle/{file_name}")
+async def get_bundle_file(file_name: str):
+    """Bundle file named in the manifest (content-addressed, cacheable forever)."""
+    if _bundle_dir is None or not BUNDLE_FILE_PATTERN.match(file_name):
+        raise HTTPException(status_code=404, detail="Bundle not found")
+    path = _bundle_dir / file_name
+    if not path.is_file():
+        raise HTTPException(status_code=404, detail="Bundle not found")
+    return FileResponse(
+        path,
+        media_type="application/vnd.sqlite3",
+        filename=file_name,
+        headers={"Cache-Control": "public, max-age=31536000, immutable"},
+    )
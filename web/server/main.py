@@ -3,7 +3,8 @@
 import sys
 import os
 from pathlib import Path
-from typing import Optional
+from dataclasses import dataclass
+from typing import Any, Optional
 
 # Add the flyfun-apps package to the path (before importing shared)
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
@@ -28,6 +29,7 @@ from contextlib import asynccontextmanager
 import uvicorn
 import logging
 from datetime import datetime
+import sqlite3
 import time
 
 from euro_aip.models.euro_aip_model import EuroAipModel
@@ -39,9 +41,15 @@ from security_config import (
 )
 
 # Import API routes
-from api import airports, procedures, filters, statistics, rules, aviation_agent_chat, ga_friendliness, notifications, briefing
+from api import airports, procedures, filters, statistics, rules, aviation_agent_chat, ga_friendliness, notifications, briefing, sync
 
-from shared.tool_context import ToolContext
+from shared.aip_change_feed import AIPChangeFeed
+from shared.aviation_agent.config import use_tool_context
+from shared.data_delta import DeltaSource
+from shared.reload_manager import ReloadManager, watched_data_files
+from shared.serving_db import ServingDB
+from shared.single_flight import single_flight_stats
+from shared.tool_context import ToolContext, get_tool_context_settings
 
 # Configure logging with file output (and optionally stderr for debugger)
 # Use /app/logs in Docker, /tmp/flyfun-logs for local development
@@ -114,85 +122,173 @@ def check_rate_limit(client_ip: str) -> bool:
     request_counts[client_ip] = (count + 1, timestamp)
     return True
 
+def _open_serving_db(path: Optional[Path], delta_source: Optional[DeltaSource]) -> Optional[ServingDB]:
+    """The serving database at path if its data version matches the loaded data."""
+    if not path or not path.exists():
+        return None
+    if delta_source is None:
+        logger.warning(f"Serving database {path} not used: data version unknown")
+        return None
+    try:
+        serving = ServingDB(path)
+    except (sqlite3.Error, ValueError) as e:
+        logger.warning(f"Serving database {path} not used: {e}")
+        return None
+    expected = delta_source.current_version().encode()
+    if serving.version != expected:
+        logger.warning(f"Serving database {path} is stale (built for {serving.version}, data is {expected}); not used")
+        serving.close()
+        return None
+    logger.info(f"Serving database enabled: {path}")
+    return serving
+
+
+@dataclass
+class _Services:
+    """One snapshot of the loaded data and the services built on it."""
+    tool_context: ToolContext
+    web_ga_service: Optional[Any]
+    delta_source: Optional[DeltaSource]
+    serving_db: Optional[ServingDB]
+
+
+def _load_services() -> _Services:
+    """Load the data and build the services; used at startup and on data reload."""
+    # Data version of airports.db, read before loading so changes recorded
+    # meanwhile are re-sent by the next delta rather than skipped
+    sync_settings = get_tool_context_settings()
+    try:
+        airports_mark = AIPChangeFeed(sync_settings.airports_db).latest()
+    except Exception as e:
+        logger.warning(f"Could not read airports.db change tables, delta sync disabled: {e}")
+        airports_mark = None
+        sync_settings = None
+
+    # Create ToolContext with all services using centralized configuration
+    logger.info("Initializing ToolContext with all services...")
+    tool_context = ToolContext.create(
+        load_airports=True,
+        load_rules=True,
+        load_notifications=True,
+        load_ga_friendliness=True
+    )
+
+    # Apply custom logic to model
+    tool_context.model.remove_airports_by_country("RU")
+    logger.info(f"Loaded model with {tool_context.model.airports.count()} airports")
+
+    # ToolContext.create() already calls load_rules(), but check anyway
+    if tool_context.rules_manager and not tool_context.rules_manager.loaded:
+        if not tool_context.rules_manager.load_rules():
+            logger.warning("No rules loaded")
+
+    # Wrap the base GA service in the web API wrapper class for API response models
+    web_ga_service = None
+    if tool_context.ga_friendliness_service:
+        from api.ga_friendliness import GAFriendlinessService as WebGAFriendlinessService
+        # The web API wrapper extends the base service and adds methods that return API models
+        web_ga_service = WebGAFriendlinessService(
+            db_path=tool_context.ga_friendliness_service.db_path,
+            readonly=tool_context.ga_friendliness_service.readonly
+        )
+
+    # Delta sync over airports.db changes and the derived databases' change logs
+    delta_source = None
+    if sync_settings is not None:
+        delta_source = DeltaSource(
+            sync_settings.airports_db,
+            airports_mark,
+            ga_persona_db=sync_settings.ga_meta_db if tool_context.ga_friendliness_service else None,
+            notifications_db=sync_settings.ga_notifications_db if tool_context.notification_service else None,
+        )
+        logger.info(f"Delta sync enabled (airports.db changes up to {airports_mark})")
+
+    # Serving database, only if compiled from exactly the data just loaded
+    serving_db = _open_serving_db(get_tool_context_settings().serving_db, delta_source)
+
+    return _Services(tool_context, web_ga_service, delta_source, serving_db)
+
+
+def _install_services(services: _Services) -> None:
+    """
+    Make a snapshot current for all API routes.
+
+    Runs on the event loop without awaiting, so no request sees a mix of two
+    snapshots; requests already running keep the references they read.
+    """
+    global _tool_context
+    tool_context = services.tool_context
+
+    # Make model available to API routes (extract from ToolContext)
+    airports.set_model(tool_context.model)
+    procedures.set_model(tool_context.model)
+    filters.set_model(tool_context.model)
+    statistics.set_model(tool_context.model)
+    briefing.set_model(tool_context.model)
+
+    # Extract and distribute rules manager from ToolContext
+    if tool_context.rules_manager:
+        rules.set_rules_manager(tool_context.rules_manager)
+        logger.info("Rules manager initialized")
+    else:
+        logger.warning("Rules manager not available")
+
+    # Extract and distribute GA friendliness service
+    ga_friendliness.set_service(services.web_ga_service)
+    if services.web_ga_service is None:
+        logger.info("GA Friendliness service not configured")
+    elif services.web_ga_service.enabled:
+        logger.info("GA Friendliness service enabled (readonly)")
+    else:
+        logger.info("GA Friendliness service disabled")
+
+    # Extract and distribute notification service
+    # (None explicitly so the API knows it's not available instead of creating one lazily)
+    notifications.set_notification_service(tool_context.notification_service)
+    if tool_context.notification_service:
+        logger.info("Notification service initialized")
+    else:
+        logger.info("Notification service not available")
+
+    sync.set_delta_source(services.delta_source)
+    sync.set_bundle_dir(get_tool_context_settings().offline_bundle_dir)
+    airports.set_serving_db(services.serving_db)
+
+    # Aviation agent requests use the same snapshot
+    use_tool_context(tool_context)
+    _tool_context = tool_context
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan context manager for FastAPI app."""
-    global _tool_context
-    
     # Startup
     logger.info("Starting up Euro AIP Airport Explorer...")
     
     try:
-        # Create ToolContext with all services using centralized configuration
-        logger.info("Initializing ToolContext with all services...")
-        _tool_context = ToolContext.create(
-            load_airports=True,
-            load_rules=True,
-            load_notifications=True,
-            load_ga_friendliness=True
-        )
-        
-        # Apply custom logic to model
-        _tool_context.model.remove_airports_by_country("RU")
-        logger.info(f"Loaded model with {_tool_context.model.airports.count()} airports")
-        
-        # All derived fields are now updated automatically in load_model()
-        logger.info("Model loaded with all derived fields updated")
-        
-        # Make model available to API routes (extract from ToolContext)
-        airports.set_model(_tool_context.model)
-        procedures.set_model(_tool_context.model)
-        filters.set_model(_tool_context.model)
-        statistics.set_model(_tool_context.model)
-        briefing.set_model(_tool_context.model)
-
-        # Extract and distribute rules manager from ToolContext
-        if _tool_context.rules_manager:
-            # ToolContext.create() already calls load_rules(), but check anyway
-            if not _tool_context.rules_manager.loaded:
-                if not _tool_context.rules_manager.load_rules():
-                    logger.warning("No rules loaded")
-            rules.set_rules_manager(_tool_context.rules_manager)
-            logger.info("Rules manager initialized")
-        else:
-            logger.warning("Rules manager not available")
-
-        # Extract and distribute GA friendliness service
-        # Wrap the base service in the web API wrapper class for API response models
-        if _tool_context.ga_friendliness_service:
-            from api.ga_friendliness import GAFriendlinessService as WebGAFriendlinessService
-            # The web API wrapper extends the base service and adds methods that return API models
-            web_ga_service = WebGAFriendlinessService(
-                db_path=_tool_context.ga_friendliness_service.db_path,
-                readonly=_tool_context.ga_friendliness_service.readonly
-            )
-            ga_friendliness.set_service(web_ga_service)
-            if web_ga_service.enabled:
-                logger.info("GA Friendliness service enabled (readonly)")
-            else:
-                logger.info("GA Friendliness service disabled")
-        else:
-            logger.info("GA Friendliness service not configured")
-            ga_friendliness.set_service(None)
-
-        # Extract and distribute notification service
-        if _tool_context.notification_service:
-            notifications.set_notification_service(_tool_context.notification_service)
-            logger.info("Notification service initialized")
-        else:
-            logger.info("Notification service not available")
-            # Set None explicitly so API knows it's not available (instead of lazy creation)
-
+        _install_services(_load_services())
         logger.info("Application startup complete")
         
     except Exception as e:
         logger.error(f"Failed to initialize services: {e}", exc_info=True)
         raise
+
+    # Hot reload when tools/data_update.py rewrites the data files
+    settings = get_tool_context_settings()
+    reload_manager = ReloadManager(
+        watched_data_files(settings),
+        load=_load_services,
+        install=_install_services,
+        poll_seconds=settings.data_reload_interval,
+    )
+    app.state.reload_manager = reload_manager
+    reload_manager.start()
     
     yield
     
     # Shutdown
     logger.info("Shutting down Euro AIP Airport Explorer...")
+    await reload_manager.stop()
     # ToolContext and its services will be cleaned up automatically
 
 # Create FastAPI app with lifespan context manager
@@ -306,6 +402,9 @@ app.include_router(ga_friendliness.router, prefix="/api/ga", tags=["ga-friendlin
 # Briefing API - parse ForeFlight PDFs and other briefing sources
 app.include_router(briefing.router, prefix="/api/briefing", tags=["briefing"])
 
+# Delta sync API - changes since a client's data version
+app.include_router(sync.router, prefix="/api/sync", tags=["sync"])
+
 # Serve static files for client assets
 client_dir = Path(__file__).parent.parent / "client"
 
@@ -354,11 +453,14 @@ async def read_root():
     return FileResponse(str(html_file))
 
 @app.get("/health")
-async def health_check():
+async def health_check(request: Request):
     """Health check endpoint."""
+    reload_manager = getattr(request.app.state, "reload_manager", None)
     return {
         "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": datetime.utcnow().isoformat(),
+        "data_reload": reload_manager.status() if reload_manager else None,
+        "coalescing": single_flight_stats(),
     }
 
 if __name__ == "__main__":